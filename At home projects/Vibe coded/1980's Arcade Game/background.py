@@ -0,0 +1,112 @@
+import numpy
+import pygame
+
+
+class Layer:
+    """One layer of the background. `dirty` is set whenever its pixels change.
+
+    The base layer is empty: update() changes nothing and render() draws
+    nothing. Subclasses override whichever they need.
+    """
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.dirty = True
+
+    def update(self):
+        pass
+
+    def render(self, target):
+        self.dirty = False
+
+
+class StarfieldLayer(Layer):
+    """Scrolling starfield kept as NumPy arrays and blitted in one batch."""
+    def __init__(self, width, height, count=100, move_every=6, color=(0, 0, 0), seed=None):
+        super().__init__(width, height)
+        self.rng = numpy.random.default_rng(seed)
+        self.x = self.rng.integers(0, width + 1, count)
+        self.y = self.rng.integers(0, height + 1, count)
+        self.speed = self.rng.integers(1, 4, count)
+        self.move_every = move_every
+        self.color = color
+        self.timer = 0
+        self.sprites = {speed: self.make_sprite(speed) for speed in (1, 2, 3)}
+
+    def make_sprite(self, radius):
+        brightness = min(255, 150 + radius * 50)
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+        sprite.set_colorkey((0, 0, 0))
+        pygame.draw.circle(sprite, (brightness, brightness, brightness), (radius, radius), radius)
+        return sprite
+
+    def update(self):
+        # Stars drift left one step every `move_every` frames
+        self.timer += 1
+        if self.timer < self.move_every:
+            return
+        self.timer = 0
+        self.x -= self.speed
+        wrapped = self.x < 0
+        if wrapped.any():
+            self.x[wrapped] = self.width
+            self.y[wrapped] = self.rng.integers(0, self.height + 1, int(wrapped.sum()))
+        self.dirty = True
+
+    def render(self, target):
+        target.fill(self.color)
+        sprites = self.sprites
+        target.blits([(sprites[s], (x - s, y - s))
+                      for x, y, s in zip(self.x.tolist(), self.y.tolist(), self.speed.tolist())],
+                     doreturn=False)
+        self.dirty = False
+
+
+class ScanlineLayer(Layer):
+    """CRT scanline overlay, rendered once into an alpha surface."""
+    def __init__(self, width, height, spacing=4, color=(0, 0, 0, 255)):
+        super().__init__(width, height)
+        self.overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        for y in range(0, height, spacing):
+            self.overlay.fill(color, (0, y, width, 1))
+
+    def render(self, target):
+        target.blit(self.overlay, (0, 0))
+        self.dirty = False
+
+
+class BackgroundCompositor:
+    """Stacks background layers into one cached surface.
+
+    Layers are re-composited only when one of them is dirty; otherwise drawing
+    the whole background costs a single blit.
+    """
+    def __init__(self, width, height, stars=100, seed=None):
+        self.width = width
+        self.height = height
+        self.layers = {
+            "stars": StarfieldLayer(width, height, stars, seed=seed),
+            "scanlines": ScanlineLayer(width, height),
+        }
+        self.cache = pygame.Surface((width, height))
+        self.recomposites = 0
+
+    @property
+    def dirty(self):
+        return any(layer.dirty for layer in self.layers.values())
+
+    def mark_dirty(self, name=None):
+        for layer_name, layer in self.layers.items():
+            if name is None or layer_name == name:
+                layer.dirty = True
+
+    def update(self):
+        for layer in self.layers.values():
+            layer.update()
+
+    def draw(self, target):
+        if self.dirty:
+            for layer in self.layers.values():
+                layer.render(self.cache)
+            self.recomposites += 1
+        target.blit(self.cache, (0, 0))
@@ -0,0 +1,162 @@
+"""Headless batch battle simulator for Pokemon balance tuning.
+
+Plays the game's battle rules (pokemon_data tables and formulas) for many
+battles at once. Every battle of every matchup is a slot in a set of NumPy
+arrays, and each turn is a handful of array operations over the battles
+still running. A matchup is a player species and level, a wild species and
+level, and a policy: which move the player uses, and after how many
+attacks (if ever) they start throwing balls instead. For each matchup it
+reports how often the player wins, catches and loses, and the mean turns.
+
+    python battle_sim.py [--battles N] [--player SPECIES] [--levels A-B] [--seed S] [--csv PATH]
+"""
+import csv
+import os
+import sys
+import time
+from itertools import product
+
+import numpy
+
+from pokemon_data import (MOVES, SPECIES, STARTER, WILD_LEVELS, WILD_SPECIES, catch_chance, damage,
+                          stats)
+
+WIN, CATCH, LOSE = 1, 2, 3
+NEVER = 1 << 30  # "attacks before catching" for a policy that never throws
+MAX_TURNS = 1000
+
+
+def policies(species):
+    """(move, attacks before catching) policies worth comparing for a species.
+
+    Each move on its own, each move once and then catch, and catch at once.
+    """
+    moves = SPECIES[species]["moves"]
+    return [(move, NEVER) for move in moves] + [(move, 1) for move in moves] + [(moves[0], 0)]
+
+
+def policy_name(policy):
+    move, attacks = policy
+    if attacks == NEVER:
+        return move
+    if attacks == 0:
+        return "catch"
+    return f"{move} x{attacks}, catch"
+
+
+def matchups(players, player_levels, wilds, wild_levels):
+    """Every (player, player level, wild, wild level, policy) combination."""
+    return [(player, level, wild, wild_level, policy)
+            for player, level, wild, wild_level in product(players, player_levels, wilds, wild_levels)
+            for policy in policies(player)]
+
+
+def simulate(matchup_list, battles, seed=0):
+    """Play `battles` battles of each matchup.
+
+    Returns a dict of per-matchup arrays: "win", "catch" and "lose" rates
+    and mean "turns".
+    """
+    rng = numpy.random.default_rng(seed)
+    count = len(matchup_list)
+    columns = {name: numpy.empty(count, numpy.int64) for name in
+               ("p_hp", "p_att", "p_def", "w_hp", "w_att", "w_def", "power", "attacks", "w_moves")}
+    max_moves = max(len(SPECIES[m[2]]["moves"]) for m in matchup_list)
+    w_powers = numpy.zeros((count, max_moves), numpy.int64)
+    for i, (player, level, wild, wild_level, (move, attacks)) in enumerate(matchup_list):
+        columns["p_hp"][i], columns["p_att"][i], columns["p_def"][i] = stats(player, level)
+        columns["w_hp"][i], columns["w_att"][i], columns["w_def"][i] = stats(wild, wild_level)
+        columns["power"][i] = MOVES[move][1]
+        columns["attacks"][i] = attacks
+        wild_moves = SPECIES[wild]["moves"]
+        columns["w_moves"][i] = len(wild_moves)
+        w_powers[i, :len(wild_moves)] = [MOVES[name][1] for name in wild_moves]
+
+    # One slot per battle; matchup i owns slots [i * battles, (i + 1) * battles)
+    matchup = numpy.repeat(numpy.arange(count), battles)
+    p_hp = columns["p_hp"][matchup]
+    w_hp = columns["w_hp"][matchup]
+    w_max = w_hp.astype(float)
+    player_damage = damage(columns["power"], columns["p_att"], columns["w_def"])[matchup]
+    wild_damage = damage(w_powers, columns["w_att"][:, None], columns["p_def"][:, None])
+    attacks = columns["attacks"][matchup]
+    w_moves = columns["w_moves"][matchup]
+    outcome = numpy.zeros(len(matchup), numpy.int8)
+    turns = numpy.zeros(len(matchup), numpy.int32)
+
+    live = numpy.arange(len(matchup))
+    for turn in range(MAX_TURNS):
+        if not len(live):
+            break
+        turns[live] += 1
+        throwing = attacks[live] <= turn
+
+        # Attack: a fainted wild pokemon ends the battle before it can hit back
+        hitting = live[~throwing]
+        w_hp[hitting] -= player_damage[hitting]
+        won = hitting[w_hp[hitting] <= 0]
+        outcome[won] = WIN
+
+        # Throw a ball: chance rises as the wild pokemon's HP falls
+        throws = live[throwing]
+        caught = throws[rng.random(len(throws)) < catch_chance(w_hp[throws], w_max[throws])]
+        outcome[caught] = CATCH
+
+        # The wild pokemon picks a random move against everyone still fighting
+        live = live[outcome[live] == 0]
+        move = (rng.random(len(live)) * w_moves[live]).astype(numpy.int64)
+        p_hp[live] -= wild_damage[matchup[live], move]
+        outcome[live[p_hp[live] <= 0]] = LOSE
+        live = live[outcome[live] == 0]
+
+    totals = numpy.full(count, float(battles))
+    return {
+        "win": numpy.bincount(matchup, outcome == WIN, count) / totals,
+        "catch": numpy.bincount(matchup, outcome == CATCH, count) / totals,
+        "lose": numpy.bincount(matchup, outcome == LOSE, count) / totals,
+        "turns": numpy.bincount(matchup, turns, count) / totals,
+    }
+
+
+def write_csv(path, matchup_list, results):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["player", "level", "wild", "wild_level", "policy", "win", "catch", "lose", "turns"])
+        for i, (player, level, wild, wild_level, policy) in enumerate(matchup_list):
+            writer.writerow([player, level, wild, wild_level, policy_name(policy),
+                             *(f"{results[key][i]:.4f}" for key in ("win", "catch", "lose", "turns"))])
+
+
+def main(argv):
+    options = {"--battles": "10000", "--player": STARTER[0], "--levels": f"{STARTER[1]}-{STARTER[1]}",
+               "--seed": "0", "--csv": None}
+    args = iter(argv)
+    for arg in args:
+        if arg not in options:
+            print(__doc__.strip().splitlines()[-1].strip())
+            return 2
+        options[arg] = next(args)
+    low, _, high = options["--levels"].partition("-")
+    levels = range(int(low), int(high or low) + 1)
+    battles = int(options["--battles"])
+
+    matchup_list = matchups([options["--player"]], levels, WILD_SPECIES, range(WILD_LEVELS[0], WILD_LEVELS[1] + 1))
+    start = time.perf_counter()
+    results = simulate(matchup_list, battles, int(options["--seed"]))
+    seconds = time.perf_counter() - start
+
+    print(f"{'player':>10} {'wild':>10} {'policy':>22} {'win':>6} {'catch':>6} {'lose':>6} {'turns':>6}")
+    for i, (player, level, wild, wild_level, policy) in enumerate(matchup_list):
+        print(f"{player:>6} L{level:<3d} {wild:>6} L{wild_level:<3d} {policy_name(policy):>22}"
+              f" {results['win'][i]:6.1%} {results['catch'][i]:6.1%} {results['lose'][i]:6.1%}"
+              f" {results['turns'][i]:6.2f}")
+    total = battles * len(matchup_list)
+    print(f"{total} battles over {len(matchup_list)} matchups in {seconds:.2f} s ({total / seconds:,.0f} battles/s)")
+    if options["--csv"]:
+        write_csv(options["--csv"], matchup_list, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
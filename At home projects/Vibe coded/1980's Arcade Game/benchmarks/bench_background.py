@@ -0,0 +1,85 @@
+"""Background frame-time benchmark.
+
+Times the old draw_80s_background path (100 pygame.draw.circle calls plus one
+pygame.draw.line per scanline, every frame) against BackgroundCompositor at
+1024x768 and at 4K. Both draw into an offscreen surface, so no window is
+needed.
+
+Run from the game folder:  python benchmarks/bench_background.py [frames]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from background import BackgroundCompositor
+
+SIZES = [(1024, 768), (3840, 2160)]
+
+
+class LegacyBackground:
+    """The per-frame drawing GameEngine.draw_80s_background used to do."""
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.stars = [(random.randint(0, width), random.randint(0, height),
+                       random.randint(1, 3)) for _ in range(100)]
+        self.star_timer = 0
+
+    def draw(self, screen):
+        screen.fill((0, 0, 0))
+        self.star_timer += 1
+        if self.star_timer > 5:
+            self.star_timer = 0
+            for i in range(len(self.stars)):
+                x, y, speed = self.stars[i]
+                x -= speed
+                if x < 0:
+                    x = self.width
+                    y = random.randint(0, self.height)
+                self.stars[i] = (x, y, speed)
+        for x, y, speed in self.stars:
+            brightness = min(255, 150 + speed * 50)
+            color = (int(brightness), int(brightness), int(brightness))
+            pygame.draw.circle(screen, color, (int(x), int(y)), speed)
+        for y in range(0, self.height, 4):
+            pygame.draw.line(screen, (0, 0, 0), (0, y), (self.width, y), 1)
+
+
+def frame_times(draw, frames):
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return sum(times) / len(times), times[len(times) // 2], times[int(len(times) * 0.99) - 1]
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    for width, height in SIZES:
+        screen = pygame.Surface((width, height))
+        legacy = LegacyBackground(width, height)
+        compositor = BackgroundCompositor(width, height)
+
+        def draw_new():
+            compositor.update()
+            compositor.draw(screen)
+
+        old = frame_times(lambda: legacy.draw(screen), frames)
+        new = frame_times(draw_new, frames)
+        print(f"{width}x{height}  ({frames} frames)")
+        print(f"  legacy      mean {old[0] * 1000:7.3f} ms  p50 {old[1] * 1000:7.3f} ms  p99 {old[2] * 1000:7.3f} ms")
+        print(f"  compositor  mean {new[0] * 1000:7.3f} ms  p50 {new[1] * 1000:7.3f} ms  p99 {new[2] * 1000:7.3f} ms"
+              f"  ({old[0] / new[0]:.1f}x, {compositor.recomposites} recomposites)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Breakout brick-field benchmark.
+
+Bounces a ball around walls of growing size and times one frame of brick
+work: the collision test, the "level cleared" check and drawing the wall.
+The old code kept a list of Brick objects, scanned a copy of it with
+colliderect, ran all(brick.destroyed ...) and drew every brick each frame.
+BrickField only tests the cells under the ball's swept box, keeps a
+counter and blits one cached surface.
+
+Run from the game folder:  python benchmarks/bench_breakout.py [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+
+from games.breakout import BrickField, generate_layout
+
+SIZE = (1024, 768)
+WALLS = [(10, 5, 70, 20, 5), (40, 20, 20, 10, 2), (120, 60, 6, 4, 1), (300, 120, 2, 2, 1)]
+WHITE = (255, 255, 255)
+
+
+class LegacyBrick:
+    """The old Brick: one object and two draw calls per brick."""
+    def __init__(self, rect, color):
+        self.rect = rect
+        self.color = color
+        self.destroyed = False
+
+    def draw(self, surface):
+        if not self.destroyed:
+            pygame.draw.rect(surface, self.color, self.rect)
+            pygame.draw.rect(surface, WHITE, self.rect, 1)
+
+
+def legacy_frame(bricks, ball, surface):
+    for brick in bricks[:]:
+        if not brick.destroyed and ball.colliderect(brick.rect):
+            brick.destroyed = True
+            break
+    cleared = all(brick.destroyed for brick in bricks)
+    for brick in bricks:
+        brick.draw(surface)
+    return cleared
+
+
+def field_frame(field, ball, dx, dy, surface):
+    hit = field.sweep(ball, dx, dy)
+    if hit:
+        field.break_cell(hit[2])
+    cleared = not field.remaining
+    field.draw(surface)
+    return cleared
+
+
+def ball_path(frames, field):
+    # A ball bouncing diagonally through the wall area
+    x, y, dx, dy = 200.0, 300.0, 7.0, -5.0
+    for _ in range(frames):
+        x += dx
+        y += dy
+        if not 0 < x < field.rect.right - 16:
+            dx = -dx
+        if not 0 < y < field.rect.bottom + 50:
+            dy = -dy
+        yield pygame.Rect(int(x), int(y), 16, 16), dx, dy
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    surface = pygame.Surface(SIZE)
+    print(f"{'bricks':>7} {'old ms':>8} {'field ms':>9} {'speedup':>8}")
+    for cols, rows, width, height, gap in WALLS:
+        layout = generate_layout(cols, rows, seed=1, fill=1.0)
+        field = BrickField(0, 0, layout, width, height, gap)
+        bricks = [LegacyBrick(field.cell_rect(cell), field.colors[cell]) for cell in range(len(field.colors))]
+
+        start = time.perf_counter()
+        for ball, _, _ in ball_path(frames, field):
+            legacy_frame(bricks, ball, surface)
+        old = (time.perf_counter() - start) / frames
+
+        start = time.perf_counter()
+        for ball, dx, dy in ball_path(frames, field):
+            field_frame(field, ball, dx, dy, surface)
+        new = (time.perf_counter() - start) / frames
+        print(f"{cols * rows:7d} {old * 1000:8.3f} {new * 1000:9.3f} {old / new:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Bullet collision stress benchmark.
+
+Runs Asteroids-style bullet-vs-asteroid hit tests at growing entity counts,
+once with the old nested loop (math.sqrt against every asteroid) and once
+through a SpatialHash rebuilt each step, and prints the cost per step so
+the scaling is visible.
+
+Run from the game folder:  python benchmarks/bench_broadphase.py [steps]
+"""
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from broadphase import SpatialHash, circles_overlap
+
+WIDTH, HEIGHT = 1024, 768
+COUNTS = [50, 100, 200, 400, 800, 1600]
+
+
+def make_scene(count, rng):
+    asteroids = [(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), rng.uniform(10, 50)) for _ in range(count)]
+    bullets = [(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)) for _ in range(count)]
+    return asteroids, bullets
+
+
+def nested(asteroids, bullets):
+    hits = 0
+    for bx, by in bullets:
+        for ax, ay, size in asteroids:
+            if math.sqrt((bx - ax) ** 2 + (by - ay) ** 2) < size:
+                hits += 1
+                break
+    return hits
+
+
+def hashed(asteroids, bullets, grid, candidates):
+    grid.clear()
+    for asteroid in asteroids:
+        grid.insert_circle(asteroid, asteroid[0], asteroid[1], asteroid[2])
+    hits = 0
+    for bx, by in bullets:
+        for ax, ay, size in grid.query_circle(bx, by, 0, candidates):
+            if circles_overlap(bx, by, 0, ax, ay, size):
+                hits += 1
+                break
+    return hits
+
+
+def per_step(run, steps):
+    start = time.perf_counter()
+    for _ in range(steps):
+        result = run()
+    return (time.perf_counter() - start) / steps, result
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rng = random.Random(1)
+    grid = SpatialHash(64)
+    candidates = []
+    print(f"{'entities':>9} {'nested ms':>10} {'grid ms':>9} {'speedup':>8}")
+    for count in COUNTS:
+        asteroids, bullets = make_scene(count, rng)
+        old, old_hits = per_step(lambda: nested(asteroids, bullets), max(1, steps * 50 // count))
+        new, new_hits = per_step(lambda: hashed(asteroids, bullets, grid, candidates), steps)
+        assert old_hits == new_hits
+        print(f"{count:9d} {old * 1000:10.2f} {new * 1000:9.2f} {old / new:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Entity update benchmark.
+
+Steps N asteroids and N bullets the way the games used to (an Asteroid
+object per rock and a dict per bullet, moved with math.cos/math.radians and
+wrapped with if-chains) and with EntityPool's vectorized passes, at growing
+N. Bullets expire and respawn continuously so slot recycling is exercised.
+A second table times bullet-vs-asteroid contacts for a few bullets against
+many asteroids and for two large pools, with a grid rebuilt from the whole
+field every call against EntityPool.contacts.
+
+Run from the game folder:  python benchmarks/bench_entities.py [steps]
+"""
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from broadphase import SpatialHash, circles_overlap
+from entities import EntityPool
+
+WIDTH, HEIGHT = 1024, 768
+COUNTS = [100, 1000, 5000, 20000]
+CONTACTS = [(5, 50), (5, 2000), (16, 5000), (1000, 1000), (3000, 3000)]
+
+
+class LegacyAsteroid:
+    def __init__(self, rng):
+        self.x = rng.uniform(0, WIDTH)
+        self.y = rng.uniform(0, HEIGHT)
+        self.angle = rng.uniform(0, 2 * math.pi)
+        self.speed = rng.uniform(1, 3)
+
+    def update(self):
+        self.x += math.cos(self.angle) * self.speed
+        self.y += math.sin(self.angle) * self.speed
+        if self.x < 0: self.x = WIDTH
+        if self.x > WIDTH: self.x = 0
+        if self.y < 0: self.y = HEIGHT
+        if self.y > HEIGHT: self.y = 0
+
+
+def legacy_step(asteroids, bullets, rng):
+    for asteroid in asteroids:
+        asteroid.update()
+    for bullet in bullets[:]:
+        bullet['x'] += math.cos(math.radians(bullet['angle'])) * bullet['speed']
+        bullet['y'] += math.sin(math.radians(bullet['angle'])) * bullet['speed']
+        bullet['life'] -= 1
+        if bullet['life'] <= 0:
+            bullets.remove(bullet)
+            bullets.append({'x': WIDTH / 2, 'y': HEIGHT / 2, 'angle': rng.uniform(0, 360), 'speed': 10, 'life': 60})
+
+
+def pool_step(asteroids, bullets):
+    asteroids.update()
+    before = bullets.count
+    bullets.update()
+    for _ in range(before - bullets.count):
+        angle = math.radians(360 * random.random())
+        bullets.spawn(WIDTH / 2, HEIGHT / 2, math.cos(angle) * 10, math.sin(angle) * 10, life=60)
+
+
+def legacy_contacts(bullets, asteroids, grid):
+    grid.clear()
+    asteroids.insert_into(grid)
+    found = []
+    pairs = []
+    for i in bullets.indices().tolist():
+        x, y, r = float(bullets.x[i]), float(bullets.y[i]), float(bullets.radius[i])
+        for j in grid.query_circle(x, y, r, found):
+            if circles_overlap(x, y, r, asteroids.x[j], asteroids.y[j], asteroids.radius[j]):
+                pairs.append((i, j))
+    pairs.sort()
+    return pairs
+
+
+def contact_pools(shots, rocks, rng):
+    bounds = (0, 0, WIDTH, HEIGHT)
+    bullets = EntityPool(shots, bounds)
+    asteroids = EntityPool(rocks, bounds)
+    for _ in range(shots):
+        bullets.spawn(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), radius=2)
+    for _ in range(rocks):
+        asteroids.spawn(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), radius=rng.uniform(10, 50))
+    return bullets, asteroids
+
+
+def timed(step, steps):
+    start = time.perf_counter()
+    for _ in range(steps):
+        step()
+    return (time.perf_counter() - start) / steps
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    rng = random.Random(1)
+    bounds = (0, 0, WIDTH, HEIGHT)
+    print(f"{'entities':>9} {'legacy ms':>10} {'pool ms':>8} {'speedup':>8}")
+    for count in COUNTS:
+        asteroids = [LegacyAsteroid(rng) for _ in range(count)]
+        bullets = [{'x': WIDTH / 2, 'y': HEIGHT / 2, 'angle': rng.uniform(0, 360), 'speed': 10,
+                    'life': rng.randint(1, 60)} for _ in range(count)]
+        old = timed(lambda: legacy_step(asteroids, bullets, rng), max(1, steps // 10))
+
+        rock_pool = EntityPool(count, bounds, wrap=True)
+        bullet_pool = EntityPool(count, bounds, wrap=True)
+        for rock in asteroids:
+            rock_pool.spawn(rock.x, rock.y, math.cos(rock.angle) * rock.speed, math.sin(rock.angle) * rock.speed)
+        for bullet in bullets:
+            angle = math.radians(bullet['angle'])
+            bullet_pool.spawn(bullet['x'], bullet['y'], math.cos(angle) * 10, math.sin(angle) * 10, bullet['life'])
+        new = timed(lambda: pool_step(rock_pool, bullet_pool), steps)
+        print(f"{count * 2:9d} {old * 1000:10.2f} {new * 1000:8.3f} {old / new:7.1f}x")
+
+    print(f"\n{'contacts':>11} {'grid ms':>8} {'pool ms':>8} {'speedup':>8}")
+    for shots, rocks in CONTACTS:
+        bullets, asteroids = contact_pools(shots, rocks, rng)
+        grid = SpatialHash(64)
+        assert legacy_contacts(bullets, asteroids, grid) == bullets.contacts(asteroids, grid)
+        repeats = max(1, steps // 10)
+        old = timed(lambda: legacy_contacts(bullets, asteroids, grid), repeats)
+        new = timed(lambda: bullets.contacts(asteroids, grid), repeats)
+        print(f"{shots:5d}x{rocks:<5d} {old * 1000:8.2f} {new * 1000:8.2f} {old / new:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Per-game simulation benchmark.
+
+Runs every game headless (dummy SDL drivers, seeded RNG, seeded random key
+input) for a fixed number of simulation ticks and reports ticks per second,
+p50/p99 update and draw times, and allocation pressure: generation-0 GC
+collections and net allocated-block growth per 1000 ticks. Recorded
+.replay files can be given too; they are played back as workloads.
+
+Run from the game folder:
+    python benchmarks/bench_games.py [ticks] [--no-draw] [GAME ...] [FILE.replay ...]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from headless import GAMES, run_game
+from replay import play
+
+
+def main(argv):
+    ticks = 2000
+    draw = True
+    games = []
+    replays = []
+    for arg in argv:
+        if arg.endswith(".replay"):
+            replays.append(arg)
+        elif arg == "--no-draw":
+            draw = False
+        elif arg.isdigit():
+            ticks = int(arg)
+        else:
+            games.append(arg.upper())
+
+    print(f"{ticks} ticks per game, seed 0{'' if draw else ', update only'}")
+    print(f"{'game':15s} {'ticks/s':>9s} {'upd p50':>9s} {'upd p99':>9s} {'draw p50':>9s} {'draw p99':>9s}"
+          f" {'gc0/1k':>7s} {'blocks/1k':>9s}")
+    for path in replays:
+        engine, ticks, seconds, matches = play(path, draw=draw)
+        print(f"{os.path.basename(path)}: {engine.last_game} {ticks / seconds:.0f} ticks/s"
+              f"{'' if matches else '  (DIVERGED from recording)'}")
+    for game in games or ([] if replays else GAMES):
+        s = run_game(game, ticks, seed=0, draw=draw).summary()
+        print(f"{game:15s} {s['ticks_per_second']:9.0f}"
+              f" {s['update_p50'] * 1000:7.3f}ms {s['update_p99'] * 1000:7.3f}ms"
+              f" {s['draw_p50'] * 1000:7.3f}ms {s['draw_p99'] * 1000:7.3f}ms"
+              f" {s['gc_per_1k_ticks']:7.1f} {s['blocks_per_1k_ticks']:9.0f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
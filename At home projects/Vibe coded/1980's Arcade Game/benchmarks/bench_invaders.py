@@ -0,0 +1,100 @@
+"""Space Invaders formation benchmark.
+
+Times one step of invader work (move, wall check, landing check, picking a
+shooter, drawing) at growing formation sizes, with the old list of Invader
+objects (each moved, tested and drawn on its own, the alive list rebuilt
+for every shot) and with InvaderFormation (one offset, a cached bounding
+box and bottom-row shooters, one blit).
+
+Run from the game folder:  python benchmarks/bench_invaders.py [steps]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+
+from game_engine import Config
+from games.space_invaders import InvaderFormation
+
+BOUNDARIES = pygame.Rect(50, 50, 924, 668)
+PLAYER_TOP = 678
+SIZES = [(10, 5), (20, 8), (40, 16), (80, 24)]
+
+
+class LegacyInvader:
+    """The old Invader: a Rect and an alive flag per invader."""
+    def __init__(self, x, y, size, color):
+        self.rect = pygame.Rect(x, y, size, size)
+        self.color = color
+        self.alive = True
+
+    def draw(self, surface):
+        if self.alive:
+            pygame.draw.rect(surface, self.color, self.rect)
+
+
+def legacy_step(invaders, state, rng, surface):
+    move_down = False
+    for invader in invaders:
+        if invader.alive:
+            invader.rect.x += state["direction"]
+            if (invader.rect.right >= BOUNDARIES.right and state["direction"] > 0) or \
+               (invader.rect.left <= BOUNDARIES.left and state["direction"] < 0):
+                move_down = True
+    if move_down:
+        state["direction"] *= -1
+    alive_invaders = [inv for inv in invaders if inv.alive]
+    shooter = rng.choice(alive_invaders)
+    landed = any(inv.alive and inv.rect.bottom >= PLAYER_TOP for inv in invaders)
+    for invader in invaders:
+        invader.draw(surface)
+    return shooter, landed
+
+
+def formation_step(formation, state, rng, surface):
+    formation.move(state["direction"])
+    block = formation.rect
+    if (block.right >= BOUNDARIES.right and state["direction"] > 0) or \
+       (block.left <= BOUNDARIES.left and state["direction"] < 0):
+        state["direction"] *= -1
+    shooter = formation.shooter(rng)
+    landed = block.bottom >= PLAYER_TOP
+    formation.draw(surface)
+    return shooter, landed
+
+
+def per_step(run, steps):
+    start = time.perf_counter()
+    for _ in range(steps):
+        run()
+    return (time.perf_counter() - start) / steps
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    surface = pygame.Surface((Config.WIDTH, Config.HEIGHT))
+    print(f"{'invaders':>9} {'old ms':>8} {'new ms':>8} {'speedup':>8}")
+    for cols, rows in SIZES:
+        size = min(30, (BOUNDARIES.width // cols) - 2)
+        rng = random.Random(1)
+        formation = InvaderFormation(BOUNDARIES.left, BOUNDARIES.top, cols, rows, size, 2)
+        invaders = [LegacyInvader(BOUNDARIES.left + c * (size + 2), BOUNDARIES.top + r * (size + 2), size,
+                                  Config.COLORS["RED"]) for r in range(rows) for c in range(cols)]
+        # Shoot a third of them down first
+        for cell in rng.sample(range(cols * rows), cols * rows // 3):
+            formation.kill(cell)
+            invaders[cell].alive = False
+        old_state, new_state = {"direction": 1}, {"direction": 1}
+        old = per_step(lambda: legacy_step(invaders, old_state, rng, surface), steps)
+        new = per_step(lambda: formation_step(formation, new_state, rng, surface), steps)
+        print(f"{cols * rows:9d} {old * 1000:8.3f} {new * 1000:8.3f} {old / new:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
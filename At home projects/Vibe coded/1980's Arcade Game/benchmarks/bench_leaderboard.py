@@ -0,0 +1,110 @@
+"""Leaderboard insert benchmark.
+
+Times the old add_high_score path (append, re-sort, truncate and rewrite the
+whole global_high_scores.json per score) against Leaderboard, which appends
+one log line per score and compacts in the background. Both write into a
+temporary folder. A second table times the in-memory rank index alone:
+bisect.insort into one sorted list against SortedScores, for games that
+already hold up to a few million scores.
+
+Run from the game folder:  python benchmarks/bench_leaderboard.py [scores]
+"""
+import bisect
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from leaderboard import Leaderboard, SortedScores
+
+INDEX_SIZES = [10000, 100000, 1000000, 4000000]
+GAMES = ["PONG", "SNAKE", "BREAKOUT", "SPACE_INVADERS", "TETRIS", "ASTEROIDS", "PLATFORMER", "POKEMON"]
+
+
+class LegacyLeaderboard:
+    """What SaveSystem.add_high_score used to do for the global file."""
+    def __init__(self, path):
+        self.path = path
+        self.data = {"high_scores": {g: [] for g in GAMES}}
+
+    def add(self, game, name, score):
+        scores = self.data["high_scores"][game]
+        scores.append({"name": name, "score": score, "date": "2024-01-01 00:00"})
+        scores.sort(key=lambda x: x["score"], reverse=True)
+        self.data["high_scores"][game] = scores[:10]
+        with open(self.path, "w") as f:
+            json.dump(self.data, f, indent=2)
+
+
+def legacy_insert(scores, score):
+    bisect.insort(scores, score)
+
+
+def index_inserts(size, rng, inserts=20000):
+    """Seconds per insert into a legacy list and a SortedScores already holding `size` scores."""
+    start = sorted(rng.randrange(100000) for _ in range(size))
+    new_scores = [rng.randrange(100000) for _ in range(inserts)]
+    legacy = list(start)
+    began = time.perf_counter()
+    for score in new_scores:
+        legacy_insert(legacy, score)
+    old = (time.perf_counter() - began) / inserts
+    index = SortedScores(start)
+    began = time.perf_counter()
+    for score in new_scores:
+        index.add(score)
+    new = (time.perf_counter() - began) / inserts
+    assert list(index) == legacy
+    return old, new
+
+
+def timed(add, scores):
+    times = []
+    for game, name, score in scores:
+        start = time.perf_counter()
+        add(game, name, score)
+        times.append(time.perf_counter() - start)
+    total = sum(times)
+    times.sort()
+    return total, times[len(times) // 2], times[int(len(times) * 0.99) - 1]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(1)
+    scores = [(rng.choice(GAMES), f"P{rng.randrange(5000)}", rng.randrange(100000)) for _ in range(count)]
+    folder = tempfile.mkdtemp()
+    try:
+        legacy = LegacyLeaderboard(os.path.join(folder, "legacy.json"))
+        old = timed(legacy.add, scores[:min(count, 5000)])
+        board = Leaderboard(folder, GAMES)
+        new = timed(lambda g, n, s: board.add(g, n, s, "2024-01-01 00:00"), scores)
+        board.flush()
+
+        start = time.perf_counter()
+        reloaded = Leaderboard(folder, GAMES)
+        load = time.perf_counter() - start
+        start = time.perf_counter()
+        for game, _, score in scores[:10000]:
+            reloaded.qualifies(game, score)
+            reloaded.rank(game, score)
+        queries = (time.perf_counter() - start) / min(count, 10000)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    print(f"legacy      {min(count, 5000)} inserts  p50 {old[1] * 1e6:8.1f} us  p99 {old[2] * 1e6:8.1f} us")
+    print(f"leaderboard {count} inserts  p50 {new[1] * 1e6:8.1f} us  p99 {new[2] * 1e6:8.1f} us")
+    print(f"reload {load * 1000:.1f} ms, qualify+rank {queries * 1e6:.2f} us")
+
+    print(f"\n{'scores held':>11} {'insort us':>10} {'blocked us':>11} {'speedup':>8}")
+    for size in INDEX_SIZES:
+        old, new = index_inserts(size, rng)
+        print(f"{size:11d} {old * 1e6:10.2f} {new * 1e6:11.2f} {old / new:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Sound effect mixer benchmark.
+
+Replays a stream of effect triggers at 60 frames a second: brick and
+paddle beeps, explosions and the occasional power-up, at increasing rates.
+The old SoundSystem called Sound.play() for each, which takes any free
+channel of pygame's 8 and silently loses the sound when none is free. The
+channel pool applies per-effect cooldowns and voice limits and lets a
+power-up take a beep's channel. Both run on a simulated clock; the table
+shows voices started per second, the mean number playing (the mixer's
+work), and how many power-ups were lost.
+
+Run from the game folder:  python benchmarks/bench_mixer.py [seconds]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+
+from mixer import ChannelPool
+from sound_bank import SoundBank
+
+CHANNELS = 8
+FRAME_MS = 1000 // 60
+# Triggers per second of each effect in each scene
+SCENES = {
+    "quiet": {"beep1": 4, "beep3": 2, "explosion": 0.5, "powerup": 0.2},
+    "busy": {"beep1": 30, "beep2": 20, "beep3": 10, "explosion": 4, "powerup": 1},
+    "heavy": {"beep1": 60, "beep2": 60, "beep3": 60, "explosion": 20, "powerup": 2},
+}
+
+
+class LegacyMixer:
+    """What Sound.play() did: the first free channel, or nothing."""
+    def __init__(self, channels, clock):
+        self.clock = clock
+        self.ends = [0] * channels
+        self.played = 0
+        self.lost = {}
+
+    def play(self, name, sound):
+        now = self.clock()
+        for i, end in enumerate(self.ends):
+            if end <= now:
+                self.ends[i] = now + int(sound.get_length() * 1000)
+                self.played += 1
+                return i
+        self.lost[name] = self.lost.get(name, 0) + 1
+        return None
+
+    def load(self):
+        now = self.clock()
+        return sum(1 for end in self.ends if end > now)
+
+
+def triggers(scene, seconds, seed=1):
+    """Per-frame lists of effect names."""
+    rng = random.Random(seed)
+    frames = seconds * 60
+    return [[name for name, rate in scene.items() for _ in range(int(rate / 60 + rng.random()))]
+            for _ in range(frames)]
+
+
+def run(mixer, frames, sounds, clock):
+    load = 0
+    powerups = 0
+    for frame, names in enumerate(frames):
+        clock.now = frame * FRAME_MS
+        for name in names:
+            channel = mixer.play(name, sounds[name])
+            if name == "powerup" and channel is None:
+                powerups += 1
+        load += mixer.load()
+    return load / len(frames), powerups
+
+
+class Clock:
+    now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def main():
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    pygame.mixer.init()
+    bank = SoundBank()
+    sounds = {name: bank.get(name) for name in bank.effects}
+
+    print(f"{'scene':>6} {'triggers/s':>10} {'old voices/s':>12} {'new voices/s':>12} {'old mean':>8} "
+          f"{'new mean':>8} {'old lost power-ups':>18} {'new lost':>8} {'us/play':>7}")
+    for scene_name, scene in SCENES.items():
+        frames = triggers(scene, seconds)
+        count = sum(len(names) for names in frames)
+
+        clock = Clock()
+        legacy = LegacyMixer(CHANNELS, clock)
+        old_mean, old_lost = run(legacy, frames, sounds, clock)
+
+        clock = Clock()
+        pool = ChannelPool(CHANNELS, clock=clock)
+        start = time.perf_counter()
+        new_mean, new_lost = run(pool, frames, sounds, clock)
+        per_play = (time.perf_counter() - start) / count
+        pool.stop()
+
+        print(f"{scene_name:>6} {count / seconds:10.1f} {legacy.played / seconds:12.1f} {pool.played / seconds:12.1f} "
+              f"{old_mean:8.2f} {new_mean:8.2f} {old_lost:18d} {new_lost:8d} {per_play * 1e6:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Platformer level-size benchmark.
+
+Generates levels from one screen to thousands of tiles wide and times one
+frame of level work: player collision, enemy updates and drawing the
+level. The old code kept a list of Platform rects (one per run of solid
+tiles here), tested the player and every enemy against all of them
+(building two Rects per platform per enemy) and drew every platform.
+The tile map looks only at the tiles around each rect, updates the
+enemies in the chunks near the camera and blits cached chunk surfaces.
+
+Run from the game folder:  python benchmarks/bench_platformer.py [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+
+from game_engine import Config
+from games.platformer import Enemy
+from tilemap import TILE, ChunkCache, Level, generate_level
+
+WIDTHS = [32, 256, 1024, 4096, 16384]
+BROWN = Config.COLORS["BROWN"]
+
+
+def platform_runs(tilemap):
+    """The level as the old Platform rects: one per horizontal run of solid tiles."""
+    rects = []
+    for row in range(tilemap.rows):
+        col = 0
+        while col < tilemap.cols:
+            if tilemap.is_solid(col, row):
+                start = col
+                while col < tilemap.cols and tilemap.is_solid(col, row):
+                    col += 1
+                rects.append(pygame.Rect(start * TILE, row * TILE, (col - start) * TILE, TILE))
+            col += 1
+    return rects
+
+
+def legacy_frame(platforms, enemies, player, surface):
+    for platform in platforms:
+        if player.colliderect(platform):
+            pass
+    for enemy in enemies:
+        enemy.x += 2
+        for platform in platforms:
+            if enemy.colliderect(pygame.Rect(platform.left, platform.top, 1, platform.height)) or \
+               enemy.colliderect(pygame.Rect(platform.right - 1, platform.top, 1, platform.height)):
+                break
+        enemy.x -= 2
+    for platform in platforms:
+        pygame.draw.rect(surface, BROWN, platform)
+
+
+def tile_frame(tilemap, chunks, enemies, player, camera_x, surface):
+    tilemap.move(player, 0, 1)
+    first = tilemap.chunk_of(camera_x) - 1
+    for c in range(first, tilemap.chunk_of(camera_x + Config.WIDTH) + 2):
+        for enemy in enemies.get(c, ()):
+            enemy.update(tilemap)
+    chunks.draw(surface, camera_x)
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    surface = pygame.Surface((Config.WIDTH, Config.HEIGHT))
+    print(f"{'tiles wide':>10} {'platforms':>9} {'old ms':>8} {'tiles ms':>9} {'speedup':>8}")
+    for width in WIDTHS:
+        level = Level(generate_level(width, seed=1))
+        tilemap = level.tilemap
+        platforms = platform_runs(tilemap)
+        legacy_enemies = [pygame.Rect(x, y - 30, 40, 30) for spawns in level.enemies.values() for x, y in spawns]
+        enemies = {chunk: [Enemy(x, y - 30) for x, y in spawns] for chunk, spawns in level.enemies.items()}
+        player = pygame.Rect(level.start[0], level.start[1] - 50, 30, 50)
+
+        # The old loop is quadratic in level size, so wide levels get fewer frames
+        old_frames = max(2, frames * 256 // width)
+        start = time.perf_counter()
+        for _ in range(old_frames):
+            legacy_frame(platforms, legacy_enemies, player, surface)
+        old = (time.perf_counter() - start) / old_frames
+
+        chunks = ChunkCache(tilemap, BROWN, Config.WIDTH)
+        start = time.perf_counter()
+        for frame in range(frames):
+            # Scroll right a few pixels a frame, streaming chunks in and out
+            tile_frame(tilemap, chunks, enemies, player, min(frame * 4, tilemap.width - Config.WIDTH), surface)
+        new = (time.perf_counter() - start) / frames
+        print(f"{width:10d} {len(platforms):9d} {old * 1000:8.3f} {new * 1000:9.3f} {old / new:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
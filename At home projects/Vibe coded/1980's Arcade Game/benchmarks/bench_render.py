@@ -0,0 +1,75 @@
+"""Render target benchmark.
+
+Times the per-frame full-screen CPU work (the background blit every frame
+starts with, plus composing the frame for the display) for displays from
+1024x768 to 4K. Filling a display without scaling means drawing at its
+resolution, so the old cost grows with the monitor. The render target
+always draws at Config.WIDTH x HEIGHT and leaves the stretch to SDL's
+SCALED renderer, on the GPU, optionally with the CRT mask multiplied over
+the frame first. The dummy video driver has no GPU, so the SDL stretch is
+timed separately: it is a software fallback here.
+
+Run from the game folder:  python benchmarks/bench_render.py [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from background import BackgroundCompositor
+from render_target import RenderTarget
+
+SIZE = (1024, 768)
+DISPLAYS = [(1024, 768), (1920, 1080), (2560, 1440), (3840, 2160)]
+TARGETS = [("canvas", False), ("CRT", True)]
+
+
+class LegacyDisplay:
+    """Drawing straight onto a display-sized surface, as set_mode at the monitor size would."""
+    def __init__(self, size):
+        self.surface = pygame.Surface(size)
+        self.background = BackgroundCompositor(*size, seed=1)
+
+    def frame(self):
+        self.background.draw(self.surface)
+
+
+def time_frames(frame, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame()
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pygame.display.init()
+
+    new = {}
+    stretch = {}
+    for name, crt in TARGETS:
+        target = RenderTarget(SIZE, scaled=True, crt=crt)
+        background = BackgroundCompositor(*SIZE, seed=1)
+
+        def frame():
+            background.draw(target.canvas)
+            target.compose()
+        new[name] = time_frames(frame, frames)
+        stretch[name] = time_frames(pygame.display.flip, frames)
+
+    print(f"{'display':>10} {'old ms':>8} " + " ".join(f"{name + ' ms':>15}" for name, _ in TARGETS))
+    for size in DISPLAYS:
+        old = time_frames(LegacyDisplay(size).frame, frames)
+        print(f"{size[0]:>5}x{size[1]:<4} {old * 1000:8.3f} "
+              + " ".join(f"{new[name] * 1000:15.3f}" for name, _ in TARGETS))
+    window = "x".join(map(str, pygame.display.get_window_size()))
+    print(f"{'SDL stretch to ' + window + ' (software here)':>28} "
+          + " ".join(f"{stretch[name] * 1000:15.3f}" for name, _ in TARGETS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Save backend benchmark.
+
+Creates the same set of profiles and scores in the JSON SaveSystem and in
+SQLiteSaveSystem (each in its own temporary folder), then times the calls
+the menus make: listing users, loading a profile on a fresh start, the
+global high-score table, and the qualify/rank checks on the game-over
+screen.
+
+Run from the game folder:  python benchmarks/bench_saves.py [profiles] [scores]
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from game_engine import SaveSystem
+from sqlite_saves import GAMES, SQLiteSaveSystem
+
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - start) / calls
+
+
+def fill(saves, names, scores):
+    start = time.perf_counter()
+    for name in names:
+        saves.create_user(name)
+    for game, name, score in scores:
+        saves.add_high_score(game, name, score)
+    saves.flush()
+    return time.perf_counter() - start
+
+
+def measure(label, open_saves, names, scores):
+    folder = tempfile.mkdtemp()
+    try:
+        saves = open_saves(folder)
+        build = fill(saves, names, scores)
+        close(saves)
+
+        start = time.perf_counter()
+        saves = open_saves(folder)
+        startup = time.perf_counter() - start
+        rng = random.Random(2)
+        results = {
+            "list_users": per_call(lambda i: saves.list_users(), 20),
+            "load_user (cold)": per_call(lambda i: saves.load_user(names[i]), min(len(names), 200)),
+            "get_all_high_scores": per_call(lambda i: saves.get_all_high_scores(), 20),
+            "qualifies + rank_for": per_call(lambda i: (saves.qualifies("TETRIS", rng.randrange(100000)),
+                                                        saves.rank_for("TETRIS", rng.randrange(100000))), 200),
+        }
+        close(saves)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    print(f"{label}: build {build:.2f} s, startup {startup * 1000:.1f} ms")
+    for name, seconds in results.items():
+        print(f"  {name:22s} {seconds * 1e6:10.1f} us")
+
+
+def close(saves):
+    if isinstance(saves, SaveSystem):
+        saves.store.close()
+        saves.leaderboard.flush()
+    else:
+        saves.close()
+
+
+def main():
+    profiles = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    rng = random.Random(1)
+    names = [f"Player{i:05d}" for i in range(profiles)]
+    scores = [(rng.choice(GAMES), rng.choice(names), rng.randrange(100000)) for _ in range(count)]
+    print(f"{profiles} profiles, {count} scores")
+    measure("json", lambda folder: SaveSystem(folder, write_delay=60), names, scores)
+    measure("sqlite", SQLiteSaveSystem, names, scores)
+
+
+if __name__ == "__main__":
+    main()
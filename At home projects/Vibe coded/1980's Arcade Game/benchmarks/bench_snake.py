@@ -0,0 +1,118 @@
+"""Snake tick benchmark on a filling board.
+
+Runs a snake around a Hamiltonian cycle of the 45 x 32 board at growing
+lengths, up to a nearly full board. It times each tick (move plus collision
+check) and each food placement, with the old list-of-Rects snake
+(list.insert, a colliderect scan, trial-and-error food) and with the
+occupancy-grid Snake.
+
+Run from the game folder:  python benchmarks/bench_snake.py [ticks]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+
+from games.snake import Food, Snake
+
+BOUNDARIES = pygame.Rect(50, 50, 924, 668)
+FILLS = [0.1, 0.5, 0.9, 0.99]
+MAX_TRIES = 200
+
+
+def hamiltonian_cycle(cols, rows):
+    """Serpentine over columns 1.., then back up column 0 (rows must be even)."""
+    cycle = []
+    for row in range(rows):
+        cells = range(1, cols) if row % 2 == 0 else range(cols - 1, 0, -1)
+        cycle.extend((col, row) for col in cells)
+    cycle.extend((0, row) for row in range(rows - 1, -1, -1))
+    return cycle
+
+
+class LegacySnake:
+    """The old Snake: Rect segments, list.insert, full colliderect scan."""
+    def __init__(self, rects):
+        self.body = list(rects)
+
+    def move(self, head):
+        self.body.insert(0, head)
+        self.body.pop()
+
+    def collided(self):
+        return any(self.body[0].colliderect(segment) for segment in self.body[1:])
+
+    def place_food(self, rng, rect):
+        # The old loop had no limit (its food grid is offset half a cell from
+        # the snake's, so a crowded board could hang the game); stop at MAX_TRIES
+        for _ in range(MAX_TRIES):
+            rect.topleft = (rng.randrange(BOUNDARIES.left, BOUNDARIES.right - 20, 20),
+                            rng.randrange(BOUNDARIES.top, BOUNDARIES.bottom - 20, 20))
+            if not any(rect.colliderect(segment) for segment in self.body):
+                return True
+        return False
+
+
+def grid_snake(length, cycle):
+    snake = Snake(BOUNDARIES)
+    snake.reset()
+    snake.remove_tail()
+    for col, row in cycle[:length]:  # tail first, so cycle[length - 1] ends up the head
+        snake.add_head(row * snake.cols + col)
+    return snake
+
+
+def timed(run, count):
+    start = time.perf_counter()
+    for i in range(count):
+        run(i)
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    template = Snake(BOUNDARIES)
+    cols, rows = template.cols, template.rows
+    cycle = hamiltonian_cycle(cols, rows)
+    size = len(cycle)
+    rng = random.Random(1)
+    print(f"{'length':>7} {'legacy tick us':>15} {'grid tick us':>13} {'legacy food us':>15} {'grid food us':>13}")
+    for fill in FILLS:
+        length = int(size * fill)
+
+        # Head is cycle[length - 1] moving towards cycle[length]
+        rects = [template.cell_rect(row * cols + col) for col, row in reversed(cycle[:length])]
+        legacy = LegacySnake(rects)
+        legacy_tick = timed(lambda i: (legacy.move(template.cell_rect(
+            cycle[(length + i) % size][1] * cols + cycle[(length + i) % size][0])), legacy.collided()), ticks)
+        food_rect = pygame.Rect(0, 0, 20, 20)
+        placed = []
+        legacy_food = timed(lambda i: placed.append(legacy.place_food(rng, food_rect)), max(1, ticks // 50))
+        gave_up = placed.count(False)
+
+        snake = grid_snake(length, cycle)
+        directions = {(1, 0): "RIGHT", (-1, 0): "LEFT", (0, 1): "DOWN", (0, -1): "UP"}
+
+        def tick(i):
+            col, row = cycle[(length + i) % size]
+            head_row, head_col = divmod(snake.body[0], cols)
+            snake.direction = directions[(col - head_col, row - head_row)]
+            snake.move()
+
+        grid_tick = timed(tick, ticks)
+        assert snake.alive
+        food = Food(snake)
+        grid_food = timed(lambda i: food.respawn(snake), ticks)
+        note = f"  (legacy gave up {gave_up}/{len(placed)} times)" if gave_up else ""
+        print(f"{length:7d} {legacy_tick * 1e6:15.1f} {grid_tick * 1e6:13.2f} {legacy_food * 1e6:15.1f}"
+              f" {grid_food * 1e6:13.2f}{note}")
+
+
+if __name__ == "__main__":
+    main()
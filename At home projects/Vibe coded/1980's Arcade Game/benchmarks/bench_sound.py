@@ -0,0 +1,141 @@
+"""Sound synthesis benchmark.
+
+Compares the old per-sample Python loop with the vectorized synth module,
+measures how long `import game_engine` takes in a fresh interpreter, now and
+for the baseline game_engine.py (taken from git into a temporary folder),
+and times the SoundBank loading every effect with an empty (cold) and a
+filled (hot) disk cache. Outside a git checkout the baseline is estimated
+by importing today's module and then running the legacy synthesis its
+import did.
+
+Run from the game folder:  python benchmarks/bench_sound.py
+"""
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import synth
+
+
+def legacy_render(spec):
+    # The loop SoundSystem used before synth.py existed
+    n = synth.n_samples(spec)
+    buf = numpy.zeros((n, 2), dtype=numpy.int16)
+    for s in range(n):
+        t = float(s) / spec.sample_rate
+        if spec.sweep_type == "linear":
+            freq = spec.frequency + spec.sweep * t
+        elif spec.sweep_type == "exponential":
+            freq = spec.frequency + spec.sweep * math.exp(-spec.sweep_rate * t)
+        else:
+            freq = spec.frequency
+        if spec.decay:
+            value = synth.MAX_SAMPLE * math.exp(-spec.decay * t) * math.sin(2 * math.pi * freq * t)
+        else:
+            value = synth.MAX_SAMPLE * math.sin(2 * math.pi * freq * t)
+        buf[s][0] = int(round(value))
+        buf[s][1] = int(round(value))
+    return buf
+
+
+def time_all(render, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for spec in synth.EFFECTS.values():
+            render(spec)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# The commit before synth.py, whose game_engine.py synthesized every effect at import
+BASELINE = "2e19bf4"
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run after `import game_engine` in the timed region to estimate the baseline
+# import: SoundSystem() synthesized every effect with the loop
+LEGACY_IMPORT = ("import pygame, synth; from bench_sound import legacy_render; "
+                 "[pygame.sndarray.make_sound(legacy_render(spec)) for spec in synth.EFFECTS.values()]")
+
+
+def import_time(extra="", repeats=3, folder=GAME_DIR):
+    path = [os.path.dirname(os.path.abspath(__file__)), os.environ.get("PYTHONPATH")]
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1", PYTHONPATH=os.pathsep.join(filter(None, path)))
+    code = f"import time\nt = time.perf_counter()\nimport game_engine\n{extra}\nprint(time.perf_counter() - t)"
+    best = float("inf")
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", code], cwd=folder, env=env,
+                             capture_output=True, text=True, check=True)
+        best = min(best, float(out.stdout.strip().splitlines()[-1]))
+    return best
+
+
+def baseline_import_time():
+    """Import time of the baseline game_engine.py, or None outside a git checkout."""
+    try:
+        source = subprocess.run(["git", "show", f"{BASELINE}:./game_engine.py"], cwd=GAME_DIR,
+                                capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    folder = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(folder, "game_engine.py"), "wb") as f:
+            f.write(source)
+        return import_time(folder=folder)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def bank_times():
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+    pygame.mixer.init()
+    from sound_bank import SoundBank
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        results = []
+        for label in ("cold", "hot"):
+            bank = SoundBank(cache_dir=cache_dir)
+            start = time.perf_counter()
+            bank.preload()
+            results.append((label, time.perf_counter() - start, bank.synthesized, bank.cache_hits))
+    return results
+
+
+def main():
+    for name, spec in synth.EFFECTS.items():
+        if not numpy.array_equal(legacy_render(spec), synth.render(spec)):
+            print(f"MISMATCH: {name}")
+            sys.exit(1)
+    print("All effects bit-identical to the legacy loop")
+
+    legacy = time_all(legacy_render, 3)
+    vectorized = time_all(synth.render, 20)
+    print(f"Synthesis (5 effects)  legacy loop: {legacy * 1000:8.2f} ms")
+    print(f"Synthesis (5 effects)  vectorized:  {vectorized * 1000:8.2f} ms  ({legacy / vectorized:.0f}x)")
+
+    before = baseline_import_time()
+    label = f"{BASELINE}:"
+    if before is None:
+        before = import_time(LEGACY_IMPORT)
+        label = "estimate:"
+    after = import_time()
+    print(f"import game_engine  {label:<9} {before * 1000:8.2f} ms")
+    print(f"import game_engine  {'now:':<9} {after * 1000:8.2f} ms")
+
+    for label, elapsed, synthesized, hits in bank_times():
+        print(f"SoundBank {label} start: {elapsed * 1000:8.2f} ms  "
+              f"(synthesized {synthesized}, cache hits {hits})")
+
+
+if __name__ == "__main__":
+    main()
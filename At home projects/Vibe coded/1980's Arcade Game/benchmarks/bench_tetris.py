@@ -0,0 +1,126 @@
+"""Tetris core benchmark.
+
+Compares the old list-of-color-strings board (get_positions per probe,
+zip rotation, row-copying line clears) with the bitboard TetrisBoard on
+collision probes and on whole random games played through simulate().
+
+Run from the game folder:  python benchmarks/bench_tetris.py [pieces]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tetris_core import PIECES, ROTATIONS, SHAPES, TetrisBoard
+
+
+class LegacyPiece:
+    def __init__(self, shape, x, y):
+        self.shape = shape
+        self.x = x
+        self.y = y
+
+    def rotate(self):
+        self.shape = [list(row) for row in zip(*self.shape[::-1])]
+
+    def get_positions(self):
+        positions = []
+        for y, row in enumerate(self.shape):
+            for x, cell in enumerate(row):
+                if cell:
+                    positions.append((self.x + x, self.y + y))
+        return positions
+
+
+class LegacyBoard:
+    """The old TetrisGame board logic."""
+    def __init__(self):
+        self.board = [[None for _ in range(10)] for _ in range(20)]
+        self.score = 0
+        self.game_over = False
+
+    def valid_move(self, piece, x_offset=0, y_offset=0):
+        for x, y in piece.get_positions():
+            x += x_offset
+            y += y_offset
+            if x < 0 or x >= 10 or y >= 20 or (y >= 0 and self.board[y][x] is not None):
+                return False
+        return True
+
+    def lock_piece(self, piece):
+        for x, y in piece.get_positions():
+            self.board[y][x] = "RED"
+        lines = 0
+        for y in range(20):
+            if all(self.board[y]):
+                lines += 1
+                for y2 in range(y, 0, -1):
+                    self.board[y2] = self.board[y2 - 1][:]
+                self.board[0] = [None for _ in range(10)]
+        self.score += [0, 100, 300, 500, 800][lines]
+
+    def play(self, moves):
+        placed = 0
+        for name, rotation, x in moves:
+            piece = LegacyPiece(SHAPES[name], x, 0)
+            for _ in range(rotation):
+                piece.rotate()
+            if not self.valid_move(piece):
+                self.game_over = True
+                break
+            while self.valid_move(piece, 0, 1):
+                piece.y += 1
+            self.lock_piece(piece)
+            placed += 1
+        return placed
+
+
+def random_moves(rng, count):
+    moves = []
+    for _ in range(count):
+        name = rng.choice(PIECES)
+        rotation = rng.randrange(4)
+        x = rng.randrange(10 - ROTATIONS[name][rotation].width + 1)
+        moves.append((name, rotation, x))
+    return moves
+
+
+def placements_per_second(play, moves):
+    # Play random games back to back until `moves` runs out (a game ends
+    # on the first move that does not fit, which is used up)
+    remaining = iter(moves)
+    placed = games = 0
+    start = time.perf_counter()
+    while placed + games < len(moves):
+        placed += play(remaining)
+        games += 1
+    return placed / (time.perf_counter() - start), games
+
+
+def main():
+    pieces = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(1)
+    moves = random_moves(rng, pieces)
+
+    legacy = LegacyBoard()
+    legacy_piece = LegacyPiece(SHAPES["T"], 3, 5)
+    board = TetrisBoard()
+    probes = 200000
+    start = time.perf_counter()
+    for _ in range(probes):
+        legacy.valid_move(legacy_piece, 1, 1)
+    legacy_probe = (time.perf_counter() - start) / probes
+    start = time.perf_counter()
+    for _ in range(probes):
+        board.fits("T", 0, 4, 6)
+    probe = (time.perf_counter() - start) / probes
+    print(f"collision probe  legacy {legacy_probe * 1e9:6.0f} ns  bitboard {probe * 1e9:6.0f} ns")
+
+    legacy_rate, legacy_games = placements_per_second(lambda remaining: LegacyBoard().play(remaining), moves[:pieces // 10])
+    rate, games = placements_per_second(lambda remaining: TetrisBoard(colors=False).simulate(remaining), moves)
+    print(f"placements/s     legacy {legacy_rate:8.0f}  bitboard {rate:8.0f}  ({games} random games)")
+
+
+if __name__ == "__main__":
+    main()
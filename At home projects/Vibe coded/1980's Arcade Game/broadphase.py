@@ -0,0 +1,119 @@
+"""Collision broadphase shared by the games.
+
+SpatialHash buckets objects into a uniform grid so a query only looks at
+objects in the cells it overlaps, instead of every object on screen. The
+exact tests (circles_overlap, circle_hits_rect, pygame.Rect.colliderect)
+then run on that short candidate list. compact() and swap_remove() take
+objects out of a list without list.remove's search and shuffle.
+"""
+
+
+class SpatialHash:
+    """Uniform-grid spatial hash, rebuilt each step from moving objects.
+
+    Cells are kept between clear() calls, so a rebuild does not allocate once
+    the grid has warmed up. An object spanning several cells is reported once
+    per query.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}  # (cx, cy) -> list of item indices
+        self.used = []  # cells holding something, emptied by clear()
+        self.items = []
+        self.marks = []  # marks[i] == stamp once item i is reported by the current query
+        self.stamp = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def clear(self):
+        for cell in self.used:
+            cell.clear()
+        self.used.clear()
+        self.items.clear()
+
+    def insert_rect(self, item, left, top, width, height):
+        index = len(self.items)
+        self.items.append(item)
+        if index == len(self.marks):
+            self.marks.append(0)
+        size = self.cell_size
+        cells = self.cells
+        x0, x1 = int(left // size), int((left + width) // size)
+        for cy in range(int(top // size), int((top + height) // size) + 1):
+            for cx in range(x0, x1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cell = cells[(cx, cy)] = []
+                if not cell:
+                    self.used.append(cell)
+                cell.append(index)
+        return index
+
+    def insert(self, item, rect):
+        """Insert with a pygame.Rect (or any (left, top, width, height)) as its bounds."""
+        return self.insert_rect(item, *rect)
+
+    def insert_circle(self, item, x, y, radius):
+        return self.insert_rect(item, x - radius, y - radius, 2 * radius, 2 * radius)
+
+    def query_rect(self, left, top, width, height, out=None):
+        """Items whose cells overlap the rect (candidates only; run an exact test on them)."""
+        out = [] if out is None else out
+        out.clear()
+        self.stamp += 1
+        stamp = self.stamp
+        marks = self.marks
+        items = self.items
+        size = self.cell_size
+        cells = self.cells
+        x0, x1 = int(left // size), int((left + width) // size)
+        for cy in range(int(top // size), int((top + height) // size) + 1):
+            for cx in range(x0, x1 + 1):
+                cell = cells.get((cx, cy))
+                if not cell:
+                    continue
+                for index in cell:
+                    if marks[index] != stamp:
+                        marks[index] = stamp
+                        out.append(items[index])
+        return out
+
+    def query(self, rect, out=None):
+        return self.query_rect(*rect, out=out)
+
+    def query_circle(self, x, y, radius, out=None):
+        return self.query_rect(x - radius, y - radius, 2 * radius, 2 * radius, out)
+
+
+def circles_overlap(ax, ay, ar, bx, by, br):
+    dx = ax - bx
+    dy = ay - by
+    reach = ar + br
+    return dx * dx + dy * dy < reach * reach
+
+
+def circle_hits_rect(x, y, radius, rect):
+    # Distance from the centre to the nearest point of the rect
+    nx = min(max(x, rect.left), rect.right)
+    ny = min(max(y, rect.top), rect.bottom)
+    dx = x - nx
+    dy = y - ny
+    return dx * dx + dy * dy < radius * radius
+
+
+def compact(items, keep):
+    """Remove, in place and keeping order, every item for which keep(item) is false."""
+    kept = 0
+    for item in items:
+        if keep(item):
+            items[kept] = item
+            kept += 1
+    del items[kept:]
+
+
+def swap_remove(items, index):
+    """Remove items[index] in O(1) by moving the last item into its place (order changes)."""
+    last = items.pop()
+    if index < len(items):
+        items[index] = last
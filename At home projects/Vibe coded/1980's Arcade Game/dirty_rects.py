@@ -0,0 +1,89 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """Opt-in dirty-rectangle presentation.
+
+    A game's static playfield (background, boundaries, grid lines, bricks...)
+    is drawn once into `static`. Each frame the renderer restores the regions
+    drawn on the previous frame from that cache, the game draws its moving
+    objects and reports their rects with mark(), and only the union of old
+    and new regions is pushed to the display.
+    """
+    MAX_RECTS = 256  # beyond this a single bounding rect is cheaper to update
+
+    def __init__(self, size):
+        self.static = pygame.Surface(size)
+        self.static_key = None
+        self.rects = []
+        self.prev_rects = []
+        self.needs_full = True
+        self.frames = 0
+        self.full_frames = 0
+        self.pixels_updated = 0
+
+    def set_static(self, key, build):
+        """Rebuild the static layer with build(surface) when key changes."""
+        if key != self.static_key:
+            build(self.static)
+            self.static_key = key
+            self.needs_full = True
+
+    def invalidate_static(self):
+        self.static_key = None
+
+    def patch_static(self, rect, build):
+        """Redraw only rect of the static layer with build(surface), clipped.
+
+        The region is repainted from the patched cache on the next frame.
+        """
+        if self.static_key is None:
+            return  # rebuilt in full next frame anyway
+        rect = pygame.Rect(rect)
+        self.static.set_clip(rect)
+        build(self.static)
+        self.static.set_clip(None)
+        self.prev_rects.append(rect)
+
+    def reset(self):
+        # Next frame repaints everything (e.g. after a full-redraw screen)
+        self.static_key = None
+        self.prev_rects = []
+        self.needs_full = True
+
+    def begin(self, screen):
+        if self.needs_full:
+            screen.blit(self.static, (0, 0))
+        else:
+            static = self.static
+            screen.blits([(static, rect, rect) for rect in self.prev_rects], doreturn=False)
+
+    def restore(self, screen, rect):
+        """Repaint rect from the static layer now (for regions that just emptied)."""
+        rect = pygame.Rect(rect)
+        screen.blit(self.static, rect, rect)
+        self.rects.append(rect)
+
+    def mark(self, rect):
+        self.rects.append(pygame.Rect(rect))
+
+    def mark_all(self, rects):
+        self.rects.extend(pygame.Rect(rect) for rect in rects)
+
+    def present(self, target):
+        """Show the frame on a RenderTarget, passing it the changed regions."""
+        self.frames += 1
+        if self.needs_full:
+            target.present()
+            self.full_frames += 1
+            self.pixels_updated += self.static.get_width() * self.static.get_height()
+            self.needs_full = False
+        else:
+            update = self.prev_rects + self.rects
+            if len(update) > self.MAX_RECTS:
+                update = [update[0].unionall(update[1:])]
+            if update:
+                target.present(update)
+                self.pixels_updated += sum(rect.width * rect.height for rect in update)
+        self.prev_rects = self.rects
+        self.rects = []
@@ -0,0 +1,169 @@
+import numpy
+
+from broadphase import SpatialHash, circles_overlap
+
+
+class EntityPool:
+    """Struct-of-arrays pool of moving entities (bullets, asteroids, particles).
+
+    Positions, velocities, lifetimes, radii and alive flags live in
+    preallocated NumPy arrays, and update() moves, wraps and expires every
+    entity in a few vectorized passes. Dead slots go on a free list and are
+    reused by spawn(), so a steady stream of short-lived entities does not
+    allocate. The pool doubles in size if it ever runs out of slots.
+
+    Entities outside `bounds` (left, top, right, bottom) wrap around when
+    `wrap` is set and expire otherwise. `fields` adds per-entity arrays,
+    e.g. {"shape": (8, 2)} gives an 8x2 float array per slot as pool.shape.
+    """
+    DENSE_PAIRS = 1 << 17  # contacts() uses one overlap mask up to this many pairs
+
+    def __init__(self, capacity=64, bounds=None, wrap=False, fields=None):
+        self.bounds = bounds
+        self.wrap = wrap
+        self.field_shapes = dict(fields or {})
+        self.capacity = 0
+        self.high = 0  # slots [0, high) have been used at least once
+        self.count = 0
+        self.free = []
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        old = self.capacity
+        for name in ("x", "y", "vx", "vy", "life", "radius"):
+            self.resize(name, capacity, (), float)
+        self.resize("alive", capacity, (), bool)
+        self.resize("mask", capacity, (), bool)  # scratch for update()
+        for name, shape in self.field_shapes.items():
+            self.resize(name, capacity, shape, float)
+        self.capacity = capacity
+        # Hand out low slots first so the live range stays compact
+        self.free = list(range(capacity - 1, old - 1, -1)) + self.free
+
+    def resize(self, name, capacity, shape, dtype):
+        array = numpy.zeros((capacity,) + tuple(shape), dtype)
+        if self.capacity:
+            array[:self.capacity] = getattr(self, name)
+        setattr(self, name, array)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.alive[:] = False
+        self.free = list(range(self.capacity - 1, -1, -1))
+        self.high = 0
+        self.count = 0
+
+    def spawn(self, x, y, vx=0.0, vy=0.0, life=numpy.inf, radius=0.0):
+        """Claim a free slot and return its index."""
+        if not self.free:
+            self.allocate(self.capacity * 2)
+        i = self.free.pop()
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = life
+        self.radius[i] = radius
+        self.alive[i] = True
+        if i >= self.high:
+            self.high = i + 1
+        self.count += 1
+        return i
+
+    def kill(self, i):
+        if self.alive[i]:
+            self.alive[i] = False
+            self.free.append(int(i))
+            self.count -= 1
+
+    def kill_mask(self, mask):
+        """Kill every live entity where mask (over slots [0, high)) is set."""
+        dead = numpy.flatnonzero(mask & self.alive[:len(mask)])
+        if len(dead):
+            self.alive[dead] = False
+            self.free.extend(dead.tolist())
+            self.count -= len(dead)
+
+    def indices(self):
+        """Slots of the live entities, in slot order."""
+        return numpy.flatnonzero(self.alive[:self.high])
+
+    def update(self):
+        """Move everything one step, count lifetimes down, then wrap or expire."""
+        h = self.high
+        if not self.count:
+            return
+        x, y, life, mask = self.x[:h], self.y[:h], self.life[:h], self.mask[:h]
+        x += self.vx[:h]
+        y += self.vy[:h]
+        life -= 1
+        numpy.less_equal(life, 0, out=mask)
+        if self.bounds:
+            left, top, right, bottom = self.bounds
+            if self.wrap:
+                numpy.subtract(x, left, out=x)
+                numpy.mod(x, right - left, out=x)
+                numpy.add(x, left, out=x)
+                numpy.subtract(y, top, out=y)
+                numpy.mod(y, bottom - top, out=y)
+                numpy.add(y, top, out=y)
+            else:
+                mask |= (x < left) | (x > right) | (y < top) | (y > bottom)
+        mask &= self.alive[:h]
+        if mask.any():
+            self.kill_mask(mask)
+
+    # Collision queries (squared distances, live entities only)
+    def overlapping(self, x, y, radius=0.0):
+        """Slots, in order, of live entities whose circle overlaps the circle at (x, y)."""
+        h = self.high
+        dx = self.x[:h] - x
+        dy = self.y[:h] - y
+        reach = self.radius[:h] + radius
+        return numpy.flatnonzero((dx * dx + dy * dy < reach * reach) & self.alive[:h])
+
+    def insert_into(self, grid):
+        """Rebuild `grid` (a broadphase.SpatialHash) with the live slots' circles."""
+        grid.clear()
+        live = self.indices()
+        for i, x, y, radius in zip(live.tolist(), self.x[live].tolist(), self.y[live].tolist(),
+                                   self.radius[live].tolist()):
+            grid.insert_circle(i, x, y, radius)
+
+    def contacts(self, other, grid=None):
+        """Overlapping (mine, theirs) pairs of live slots, sorted.
+
+        Usually one vectorized overlap mask over both pools' live slots: a
+        few bullets against thousands of asteroids is a handful of array
+        passes. Only when both pools are large (more than DENSE_PAIRS
+        pairs) does the smaller one go into `grid` (a broadphase.SpatialHash,
+        made if not given), with each entity of the larger one queried
+        against just the cells it touches.
+        """
+        mine = self.indices()
+        theirs = other.indices()
+        if not len(mine) or not len(theirs):
+            return []
+        if len(mine) * len(theirs) <= self.DENSE_PAIRS:
+            dx = self.x[mine, None] - other.x[theirs]
+            dy = self.y[mine, None] - other.y[theirs]
+            reach = self.radius[mine, None] + other.radius[theirs]
+            rows, cols = numpy.nonzero(dx * dx + dy * dy < reach * reach)
+            return list(zip(mine[rows].tolist(), theirs[cols].tolist()))
+
+        grid = SpatialHash() if grid is None else grid
+        small, large, flip = (self, other, False) if len(mine) <= len(theirs) else (other, self, True)
+        small.insert_into(grid)
+        sx, sy, sradius = small.x.tolist(), small.y.tolist(), small.radius.tolist()
+        candidates = []
+        pairs = []
+        live = large.indices()
+        for i, x, y, radius in zip(live.tolist(), large.x[live].tolist(), large.y[live].tolist(),
+                                   large.radius[live].tolist()):
+            for j in grid.query_circle(x, y, radius, candidates):
+                if circles_overlap(x, y, radius, sx[j], sy[j], sradius[j]):
+                    pairs.append((i, j) if flip else (j, i))
+        pairs.sort()
+        return pairs
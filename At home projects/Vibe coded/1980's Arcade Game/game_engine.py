@@ -1,21 +1,68 @@
 import pygame
 import random
 import sys
-import math
-import json
 import os
 import time
+import atexit
 from datetime import datetime
+from functools import partial
+from profile_store import ProfileStore
+from leaderboard import NON_PROFILE_FILES, Leaderboard
+from mixer import ChannelPool
+from text_cache import FontRegistry, TextCache
+from background import BackgroundCompositor
+from dirty_rects import DirtyRectRenderer
+from render_target import RenderTarget
+from timestep import FixedTimestep
+from input_sources import KeyboardInput
+from replay import RecordingInput, ReplayWriter, rng_fingerprint
+from profiler import FrameProfiler
+from games import GAMES, UNLOCK_SCORES, load as load_game, starters
 
 # Initialize Pygame
 pygame.init()
 pygame.mixer.init()
 
+# Gameplay randomness. GameEngine reseeds it whenever a game starts, so a
+# fixed GameEngine seed makes every game play out the same way.
+rng = random.Random()
+
 # --- Config ---
 class Config:
     WIDTH = 1024
     HEIGHT = 768
-    FPS = 60
+    FPS = 60  # display frame cap
+    # Game logic runs in fixed steps, independent of the display rate.
+    # States not listed in SIM_RATES step at SIM_RATE Hz.
+    SIM_RATE = 60
+    SIM_RATES = {"PONG": 120, "SNAKE": 10}
+    # Opt-in: games with a cached static playfield only push changed regions
+    # to the display (the starfield is frozen while this is active)
+    DIRTY_RECTS = False
+    # Save backend: "json" (one file per player) or "sqlite" (SAVES/arcade.db,
+    # imports the JSON profiles the first time it is used)
+    SAVE_BACKEND = "json"
+    # Write a replay of every game played to SAVES/replays (see replay.py)
+    RECORD_REPLAYS = False
+    # Frame profiler overlay (toggle with F3, F4 exports SAVES/profiles)
+    PROFILER = False
+    # Seconds the main menu sits idle before the CPU plays a Tetris demo (0 = never)
+    ATTRACT_DELAY = 30
+    # Breakout wall size as (columns, rows) for a generated level; None plays the classic 10 x 5 wall
+    BREAKOUT_GRID = None
+    # Space Invaders waves to clear to win; each is bigger and faster than the last
+    INVADER_WAVES = 5
+    # Platformer level: a file in levels/, or a width in tiles for a generated level
+    PLATFORMER_LEVEL = "level1.txt"
+    # Display. Games always draw at WIDTH x HEIGHT; their layouts are in those pixels, so there
+    # is no lower logical resolution. SCALED_DISPLAY lets SDL stretch the frame to the window or
+    # monitor on the GPU; it is implied by FULLSCREEN.
+    SCALED_DISPLAY = False
+    FULLSCREEN = False
+    SMOOTH_SCALING = False  # filtered upscaling instead of whole pixels
+    CRT_MASK = False  # scanlines, aperture grille and vignette over the output
+    # Mixer channels shared by all sound effects
+    SOUND_CHANNELS = 8
     COLORS = {
         "WHITE": (255, 255, 255),
         "BLACK": (0, 0, 0),
@@ -42,41 +89,28 @@ class Config:
         "POKEMON": 8,
         "HIGH_SCORES": 9,
         "GAME_OVER": 10,
-        "PLAYER_SELECT": 11
+        "PLAYER_SELECT": 11,
+        "ATTRACT": 12  # CPU Tetris demo shown when the main menu sits idle
     }
 
 # Save System
 class SaveSystem:
-    def __init__(self, saves_dir="SAVES"):
+    def __init__(self, saves_dir="SAVES", write_delay=1.0):
         self.saves_dir = saves_dir
         # Ensure saves folder exists
         os.makedirs(self.saves_dir, exist_ok=True)
 
-        # Global leaderboard file (keeps aggregated top scores across users)
-        self.global_file = os.path.join(self.saves_dir, "global_high_scores.json")
+        # Save files are read once and written behind on a background thread
+        self.store = ProfileStore(delay=write_delay)
+        atexit.register(self.flush)
 
         # Games list used by the engine
-        self._games = ["PONG", "SNAKE", "BREAKOUT", "SPACE_INVADERS",
-                       "TETRIS", "ASTEROIDS", "PLATFORMER", "POKEMON"]
-
-        # Create global file if missing
-        if not os.path.exists(self.global_file):
-            initial = {"high_scores": {g: [] for g in self._games}}
-            try:
-                with open(self.global_file, "w") as f:
-                    json.dump(initial, f, indent=2)
-            except Exception:
-                pass
-
-        # Load global data
-        self._load_global()
-
-    def _load_global(self):
-        try:
-            with open(self.global_file, "r") as f:
-                self.global_data = json.load(f)
-        except Exception:
-            self.global_data = {"high_scores": {g: [] for g in self._games}}
+        self._games = list(GAMES)
+
+        # Global leaderboard: append-only score log plus an indexed snapshot.
+        # global_high_scores.json is kept as the readable top-10 view.
+        self.leaderboard = Leaderboard(self.saves_dir, self._games)
+        self.global_file = self.leaderboard.view_path
 
     def list_users(self):
         """Return list of usernames (json filenames without extension) from SAVES folder."""
@@ -85,7 +119,7 @@ class SaveSystem:
             for fname in os.listdir(self.saves_dir):
                 if not fname.lower().endswith(".json"):
                     continue
-                if os.path.abspath(os.path.join(self.saves_dir, fname)) == os.path.abspath(self.global_file):
+                if fname in NON_PROFILE_FILES:
                     continue
                 users.append(os.path.splitext(fname)[0])
         except Exception:
@@ -101,7 +135,7 @@ class SaveSystem:
         return os.path.join(self.saves_dir, f"{safe}.json")
 
     def user_exists(self, name):
-        return os.path.exists(self._user_file(name))
+        return self.store.contains(self._user_file(name))
 
     def create_user(self, name):
         """Create a new user file. Returns True on success, False if user exists or failed."""
@@ -113,37 +147,21 @@ class SaveSystem:
             "created": datetime.now().strftime("%Y-%m-%d %H:%M"),
             "games_played": 0,
             "total_score": 0,
-            "unlocked_games": ["PONG", "SNAKE", "BREAKOUT", "SPACE_INVADERS", "TETRIS", "ASTEROIDS", "PLATFORMER", "POKEMON"],
+            "unlocked_games": list(self._games),
             "pokemon_collection": [],
             "high_scores": {g: [] for g in self._games}
         }
 
-        try:
-            with open(self._user_file(name), "w") as f:
-                json.dump(data, f, indent=2)
-            return True
-        except Exception:
-            return False
+        # New users are written immediately so they show up in list_users
+        return self.store.put(self._user_file(name), data, write_through=True)
 
     def load_user(self, name):
-        """Load a user's data. Returns dict or None."""
-        try:
-            path = self._user_file(name)
-            if not os.path.exists(path):
-                return None
-            with open(path, "r") as f:
-                return json.load(f)
-        except Exception:
-            return None
+        """Load a user's data (cached after the first read). Returns dict or None."""
+        return self.store.load(self._user_file(name))
 
     def save_user(self, name, data):
-        """Save a user's data dict to file. Returns True/False."""
-        try:
-            with open(self._user_file(name), "w") as f:
-                json.dump(data, f, indent=2)
-            return True
-        except Exception:
-            return False
+        """Schedule a user's data dict to be written. Returns True."""
+        return self.store.put(self._user_file(name), data)
 
     def get_player_data(self, name):
         """Ensure user exists and return their data dict."""
@@ -158,138 +176,121 @@ class SaveSystem:
                     "created": datetime.now().strftime("%Y-%m-%d %H:%M"),
                     "games_played": 0,
                     "total_score": 0,
-                    "unlocked_games": ["PONG", "SNAKE", "BREAKOUT"],
+                    "unlocked_games": starters(),
                     "pokemon_collection": [],
                     "high_scores": {g: [] for g in self._games}
                 }
             data = self.load_user(name)
         # Ensure high_scores key exists
-        if "high_scores" not in data:
-            data["high_scores"] = {g: [] for g in self._games}
+        with self.store.lock:
+            if "high_scores" not in data:
+                data["high_scores"] = {g: [] for g in self._games}
         return data
 
-    def save_global(self):
-        try:
-            with open(self.global_file, "w") as f:
-                json.dump(self.global_data, f, indent=2)
-            return True
-        except Exception:
-            return False
+    def flush(self):
+        """Write all pending changes to disk now (call before exiting)."""
+        self.leaderboard.flush()
+        return self.store.flush()
 
     def add_high_score(self, game, player_name, score):
         """Add high score both to global leaderboard and to the player's file."""
         if game not in self._games:
             return
 
-        # Add to global leaderboard
+        # Add to global leaderboard (one appended log line)
         entry = {"name": player_name, "score": score, "date": datetime.now().strftime("%Y-%m-%d %H:%M")}
-        self.global_data.setdefault("high_scores", {}).setdefault(game, []).append(entry)
-        self.global_data["high_scores"][game].sort(key=lambda x: x["score"], reverse=True)
-        self.global_data["high_scores"][game] = self.global_data["high_scores"][game][:10]
-        self.save_global()
+        self.leaderboard.add(game, player_name, score, entry["date"])
 
         # Also record in user's personal file
         user = self.get_player_data(player_name)
-        user.setdefault("high_scores", {}).setdefault(game, []).append(entry)
-        user["high_scores"][game].sort(key=lambda x: x["score"], reverse=True)
-        user["high_scores"][game] = user["high_scores"][game][:10]
-        self.save_user(player_name, user)
+        with self.store.lock:
+            scores = user.setdefault("high_scores", {}).setdefault(game, [])
+            if len(scores) < 10 or score > scores[-1]["score"]:
+                # The list is kept sorted, so insert in place instead of re-sorting
+                pos = len(scores)
+                while pos > 0 and scores[pos - 1]["score"] < score:
+                    pos -= 1
+                scores.insert(pos, entry)
+                del scores[10:]
+                self.save_user(player_name, user)
+
+    def qualifies(self, game, score):
+        """True if score would enter the game's global top 10."""
+        return self.leaderboard.qualifies(game, score)
+
+    def rank_for(self, game, score):
+        """Return (rank, total): where score places among every recorded score."""
+        return self.leaderboard.rank(game, score), self.leaderboard.count(game) + 1
 
     def get_all_high_scores(self):
         """Return the aggregated global high scores dict."""
-        return self.global_data.get("high_scores", {g: [] for g in self._games})
+        return self.leaderboard.all_top()
 
     def update_player_stats(self, name, score):
         """Update player's overall stats and unlock games when thresholds reached."""
         user = self.get_player_data(name)
-        user["games_played"] = user.get("games_played", 0) + 1
-        user["total_score"] = user.get("total_score", 0) + score
-
-        # Unlock games based on total score
-        unlocked = set(user.get("unlocked_games", []))
-        if user["total_score"] >= 5000:
-            unlocked.add("SPACE_INVADERS")
-        if user["total_score"] >= 10000:
-            unlocked.add("TETRIS")
-        if user["total_score"] >= 20000:
-            unlocked.add("ASTEROIDS")
-        if user["total_score"] >= 50000:
-            unlocked.add("PLATFORMER")
-        if user["total_score"] >= 100000:
-            unlocked.add("POKEMON")
-
-        user["unlocked_games"] = sorted(list(unlocked))
+        with self.store.lock:
+            user["games_played"] = user.get("games_played", 0) + 1
+            user["total_score"] = user.get("total_score", 0) + score
+
+            # Unlock games based on total score
+            unlocked = set(user.get("unlocked_games", []))
+            for game, threshold in UNLOCK_SCORES.items():
+                if user["total_score"] >= threshold:
+                    unlocked.add(game)
+
+            user["unlocked_games"] = sorted(list(unlocked))
         self.save_user(name, user)
 
+def create_save_system(backend="json", saves_dir="SAVES"):
+    """Return the save backend named by Config.SAVE_BACKEND."""
+    if backend == "sqlite":
+        from sqlite_saves import SQLiteSaveSystem
+        return SQLiteSaveSystem(saves_dir)
+    return SaveSystem(saves_dir)
+
 # Sound System
 class SoundSystem:
-    def __init__(self):
-        self.sounds = {}
-        self.create_sounds()
-    
-    def create_sounds(self):
-        # Create simple beep sounds programmatically
+    SOUND_NAMES = ["beep1", "beep2", "beep3", "explosion", "powerup"]
+
+    def __init__(self, cache_dir=os.path.join("SAVES", "sound_cache"), channels=None):
+        # Effects play on a fixed channel pool with per-effect voice limits (see mixer.py)
+        self.mixer = ChannelPool(channels or Config.SOUND_CHANNELS)
+        # Effects are synthesized lazily on first play and cached on disk
         try:
-            import numpy
-            self.sounds["beep1"] = self.generate_beep(440, 100)  # A
-            self.sounds["beep2"] = self.generate_beep(523, 100)  # C
-            self.sounds["beep3"] = self.generate_beep(659, 100)  # E
-            self.sounds["explosion"] = self.generate_explosion()
-            self.sounds["powerup"] = self.generate_powerup()
-        except:
+            from sound_bank import SoundBank
+            self.bank = SoundBank(cache_dir=cache_dir)
+        except ImportError:
             # Fallback silent sounds if numpy not available
-            silent_sound = pygame.mixer.Sound(buffer=bytearray([]))
-            for sound_name in ["beep1", "beep2", "beep3", "explosion", "powerup"]:
-                self.sounds[sound_name] = silent_sound
-    
-    def generate_beep(self, frequency, duration):
-        sample_rate = 22050
-        n_samples = int(round(duration * 0.001 * sample_rate))
-        import numpy
-        buf = numpy.zeros((n_samples, 2), dtype=numpy.int16)
-        max_sample = 2**(16 - 1) - 1
-        for s in range(n_samples):
-            t = float(s) / sample_rate
-            buf[s][0] = int(round(max_sample * math.sin(2 * math.pi * frequency * t)))
-            buf[s][1] = int(round(max_sample * math.sin(2 * math.pi * frequency * t)))
-        return pygame.sndarray.make_sound(buf)
-    
-    def generate_explosion(self):
-        # Simple explosion-like sound
-        sample_rate = 22050
-        duration = 500
-        n_samples = int(round(duration * 0.001 * sample_rate))
-        import numpy
-        buf = numpy.zeros((n_samples, 2), dtype=numpy.int16)
-        max_sample = 2**(16 - 1) - 1
-        for s in range(n_samples):
-            t = float(s) / sample_rate
-            freq = 100 + 900 * math.exp(-5 * t)
-            buf[s][0] = int(round(max_sample * math.exp(-3 * t) * math.sin(2 * math.pi * freq * t)))
-            buf[s][1] = int(round(max_sample * math.exp(-3 * t) * math.sin(2 * math.pi * freq * t)))
-        return pygame.sndarray.make_sound(buf)
-    
-    def generate_powerup(self):
-        sample_rate = 22050
-        duration = 300
-        n_samples = int(round(duration * 0.001 * sample_rate))
-        import numpy
-        buf = numpy.zeros((n_samples, 2), dtype=numpy.int16)
-        max_sample = 2**(16 - 1) - 1
-        for s in range(n_samples):
-            t = float(s) / sample_rate
-            freq = 200 + 600 * t
-            buf[s][0] = int(round(max_sample * math.exp(-2 * t) * math.sin(2 * math.pi * freq * t)))
-            buf[s][1] = int(round(max_sample * math.exp(-2 * t) * math.sin(2 * math.pi * freq * t)))
-        return pygame.sndarray.make_sound(buf)
-    
+            self.bank = None
+        self.silent_sound = None
+
+    @property
+    def sounds(self):
+        """Effects that have been loaded so far."""
+        return self.bank.sounds if self.bank else {}
+
+    def get_sound(self, sound_name):
+        if self.bank:
+            return self.bank.get(sound_name)
+        if sound_name in self.SOUND_NAMES:
+            if self.silent_sound is None:
+                self.silent_sound = pygame.mixer.Sound(buffer=bytearray([]))
+            return self.silent_sound
+        return None
+
     def play(self, sound_name):
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        sound = self.get_sound(sound_name)
+        if sound:
+            self.mixer.play(sound_name, sound)
 
 # Create sound system
 sound_system = SoundSystem()
 
+# Shared fonts and rendered-text cache
+fonts = FontRegistry()
+text_cache = TextCache(fonts)
+
 # Enhanced Button with 80s style
 class RetroButton:
     def __init__(self, x, y, width, height, text, color, hover_color, font_size=24, bevel=True):
@@ -299,39 +300,55 @@ class RetroButton:
         self.hover_color = Config.COLORS[hover_color] if isinstance(hover_color, str) else hover_color
         self.is_hovered = False
         self.bevel = bevel
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
+        self.font = fonts.get(font_size)
         self.clicked = False
-        
-    def draw(self, surface):
+        self.looks = {}  # pre-rendered surfaces for the normal and hover states
+
+    LOOK_PADDING = 2  # bevel lines reach slightly past the rect
+
+    def render_look(self, hovered):
+        """Render the button in one state onto its own transparent surface."""
+        pad = self.LOOK_PADDING
+        look = pygame.Surface((self.rect.width + pad * 2, self.rect.height + pad * 2), pygame.SRCALPHA)
+        rect = pygame.Rect(pad, pad, self.rect.width, self.rect.height)
+
         # Draw button with 80s style bevel
         if self.bevel:
             # Main button
-            pygame.draw.rect(surface, self.hover_color if self.is_hovered else self.color, self.rect)
-            
+            pygame.draw.rect(look, self.hover_color if hovered else self.color, rect)
+
             # Bevel effect
-            if self.is_hovered:
+            if hovered:
                 # Pressed look
-                pygame.draw.line(surface, Config.COLORS["BLACK"], self.rect.topleft, self.rect.topright, 2)
-                pygame.draw.line(surface, Config.COLORS["BLACK"], self.rect.topleft, self.rect.bottomleft, 2)
-                pygame.draw.line(surface, Config.COLORS["WHITE"], self.rect.bottomleft, self.rect.bottomright, 2)
-                pygame.draw.line(surface, Config.COLORS["WHITE"], self.rect.topright, self.rect.bottomright, 2)
+                pygame.draw.line(look, Config.COLORS["BLACK"], rect.topleft, rect.topright, 2)
+                pygame.draw.line(look, Config.COLORS["BLACK"], rect.topleft, rect.bottomleft, 2)
+                pygame.draw.line(look, Config.COLORS["WHITE"], rect.bottomleft, rect.bottomright, 2)
+                pygame.draw.line(look, Config.COLORS["WHITE"], rect.topright, rect.bottomright, 2)
             else:
                 # Raised look
-                pygame.draw.line(surface, Config.COLORS["WHITE"], self.rect.topleft, self.rect.topright, 2)
-                pygame.draw.line(surface, Config.COLORS["WHITE"], self.rect.topleft, self.rect.bottomleft, 2)
-                pygame.draw.line(surface, Config.COLORS["BLACK"], self.rect.bottomleft, self.rect.bottomright, 2)
-                pygame.draw.line(surface, Config.COLORS["BLACK"], self.rect.topright, self.rect.bottomright, 2)
+                pygame.draw.line(look, Config.COLORS["WHITE"], rect.topleft, rect.topright, 2)
+                pygame.draw.line(look, Config.COLORS["WHITE"], rect.topleft, rect.bottomleft, 2)
+                pygame.draw.line(look, Config.COLORS["BLACK"], rect.bottomleft, rect.bottomright, 2)
+                pygame.draw.line(look, Config.COLORS["BLACK"], rect.topright, rect.bottomright, 2)
         else:
             # Simple button
-            color = self.hover_color if self.is_hovered else self.color
-            pygame.draw.rect(surface, color, self.rect)
-            pygame.draw.rect(surface, Config.COLORS["WHITE"], self.rect, 2)
-        
+            color = self.hover_color if hovered else self.color
+            pygame.draw.rect(look, color, rect)
+            pygame.draw.rect(look, Config.COLORS["WHITE"], rect, 2)
+
         # Draw text
         text_color = Config.COLORS["BLACK"] if self.color in [Config.COLORS["YELLOW"], Config.COLORS["WHITE"]] else Config.COLORS["WHITE"]
-        text_surface = self.font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        text_surface = text_cache.render(self.text, self.font_size, text_color)
+        text_rect = text_surface.get_rect(center=rect.center)
+        look.blit(text_surface, text_rect)
+        return look
+
+    def draw(self, surface):
+        look = self.looks.get(self.is_hovered)
+        if look is None:
+            look = self.looks[self.is_hovered] = self.render_look(self.is_hovered)
+        surface.blit(look, (self.rect.x - self.LOOK_PADDING, self.rect.y - self.LOOK_PADDING))
 
     def check_hover(self, pos):
         self.is_hovered = self.rect.collidepoint(pos)
@@ -342,6 +359,43 @@ class RetroButton:
             return True
         return False
 
+class UIScreen:
+    """Retained widget tree for one menu screen.
+
+    build(ui) adds the screen's widgets once; the tree is rebuilt only when
+    the key passed to ensure() changes (e.g. the player's data was updated).
+    """
+    def __init__(self, build):
+        self.build = build
+        self.key = None
+        self.built = False
+        self.widgets = {}
+
+    def ensure(self, key=None):
+        if not self.built or key != self.key:
+            self.widgets = {}
+            self.build(self)
+            self.key = key
+            self.built = True
+        return self
+
+    def add(self, name, widget):
+        self.widgets[name] = widget
+        return widget
+
+    def update(self, mouse_pos, mouse_click):
+        """Refresh hover states and return the name of the clicked widget, if any."""
+        clicked = None
+        for name, widget in self.widgets.items():
+            widget.check_hover(mouse_pos)
+            if clicked is None and widget.is_clicked(mouse_pos, mouse_click):
+                clicked = name
+        return clicked
+
+    def draw(self, surface):
+        for widget in self.widgets.values():
+            widget.draw(surface)
+
 # Base game objects
 class GameObject:
     def __init__(self, x, y, width, height, color):
@@ -372,813 +426,50 @@ class MovableObject(GameObject):
         self.rect.y += self.velocity.y
 
 class Paddle(MovableObject):
-    def __init__(self, x, y, width, height, color, speed):
-        super().__init__(x, y, width, height, color, speed)
-        self.score = 0
-        
-    def ai_move(self, ball, boundaries):
-        if ball.rect.centery < self.rect.centery and self.rect.top > boundaries.top:
-            self.rect.y -= self.speed
-        elif ball.rect.centery > self.rect.centery and self.rect.bottom < boundaries.bottom:
-            self.rect.y += self.speed
-
-class RoundBall:
-    def __init__(self, x, y, radius, color, speed):
-        self.rect = pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
-        self.radius = radius
-        self.color = Config.COLORS[color] if isinstance(color, str) else color
-        self.speed_x = speed * random.choice([-1, 1])
-        self.speed_y = random.uniform(-speed/2, speed/2)
-        self.base_speed = speed
-        self.max_speed = speed * 2  # Add maximum speed limit
-
-
-    
-    def update(self, paddles, boundaries):
-            # Store previous position for collision check
-            prev_x = self.rect.x
-            prev_y = self.rect.y
-            
-            # Update position
-            self.rect.x += self.speed_x
-            self.rect.y += self.speed_y
-
-            # Boundary collision
-            if self.rect.top <= boundaries.top or self.rect.bottom >= boundaries.bottom:
-                self.speed_y *= -1
-                self.rect.y = prev_y  # Restore position to prevent sticking
-                sound_system.play("beep1")
-
-            # Paddle collision with speed increase
-            for paddle in paddles:
-                if self.rect.colliderect(paddle.rect):
-                    # Restore position to prevent phasing through
-                    self.rect.x = prev_x
-                    
-                    # Increase speed but cap it
-                    speed_multiplier = 1.05  # Reduced from 1.1
-                    new_speed = abs(self.speed_x) * speed_multiplier
-                    if new_speed > self.max_speed:
-                        new_speed = self.max_speed
-                    
-                    self.speed_x = -new_speed if self.speed_x > 0 else new_speed
-                    
-                    # Adjust angle based on where ball hits paddle
-                    relative_intersect_y = (paddle.rect.centery - self.rect.centery) / (paddle.rect.height / 2)
-                    self.speed_y = -relative_intersect_y * 4  # Reduced from 5
-                    sound_system.play("beep2")
-
-            # Score
-            if self.rect.left <= boundaries.left:
-                paddles[1].score += 1
-                self.reset()
-                return True
-            elif self.rect.right >= boundaries.right:
-                paddles[0].score += 1
-                self.reset()
-                return True
-            return False
-
-
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, self.color, self.rect.center, self.radius)
-
-class BreakoutBall:
-    def __init__(self, x, y, radius, color, speed):
-        self.rect = pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
-        self.radius = radius
-        self.color = Config.COLORS[color] if isinstance(color, str) else color
-        self.speed_x = 0
-        self.speed_y = -speed  # Start moving upward
-        self.base_speed = speed
-
-    def reset(self):
-        self.rect.center = (Config.WIDTH // 2, Config.HEIGHT // 2 + 100)
-        self.speed_x = random.choice([-self.base_speed, self.base_speed])
-        self.speed_y = -self.base_speed  # Always start moving up
-
-    def update(self, paddle, bricks, boundaries):
-        self.rect.x += self.speed_x
-        self.rect.y += self.speed_y
-
-        # Boundary collision
-        if self.rect.left <= boundaries.left or self.rect.right >= boundaries.right:
-            self.speed_x *= -1
-            sound_system.play("beep1")
-
-        if self.rect.top <= boundaries.top:
-            self.speed_y *= -1
-            sound_system.play("beep1")
-
-        # Paddle collision
-        if self.rect.colliderect(paddle.rect):
-            self.speed_y = -abs(self.speed_y)  # Always bounce upward
-            # Adjust angle based on where ball hits paddle
-            relative_intersect_x = (paddle.rect.centerx - self.rect.centerx) / (paddle.rect.width / 2)
-            self.speed_x = -relative_intersect_x * 5
-            sound_system.play("beep2")
-
-        # Brick collision
-        brick_hit = False
-        for brick in bricks[:]:
-            if not brick.destroyed and self.rect.colliderect(brick.rect):
-                brick.destroyed = True
-                self.speed_y *= -1
-                brick_hit = True
-                sound_system.play("beep3")
-                break
-                
-        return brick_hit
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, self.color, self.rect.center, self.radius)
-
-class Snake:
-    def __init__(self):
-        self.reset()
-
-    def reset(self):
-        self.body = [pygame.Rect(100, 100, 20, 20)]
-        self.direction = "RIGHT"
-        self.grow = False
+    def __init__(self, x, y, width, height, color, speed, step=1.0):
+        # speed is per 60 Hz frame; step is the fraction of one such frame per update
+        super().__init__(x, y, width, height, color, speed * step)
         self.score = 0
+        # Sub-pixel vertical position, and the one before this step (for interpolation)
+        self.y = float(self.rect.y)
+        self.prev_y = self.y
 
-    def move(self):
-        head = self.body[0].copy()
-
-        if self.direction == "UP":
-            head.y -= 20
-        elif self.direction == "DOWN":
-            head.y += 20
-        elif self.direction == "LEFT":
-            head.x -= 20
-        elif self.direction == "RIGHT":
-            head.x += 20
-
-        self.body.insert(0, head)
-
-        if not self.grow:
-            self.body.pop()
-        else:
-            self.grow = False
-
-    def check_collision(self, boundaries):
-        # Wall collision
-        if (self.body[0].left < boundaries.left or
-            self.body[0].right > boundaries.right or
-            self.body[0].top < boundaries.top or
-            self.body[0].bottom > boundaries.bottom):
-            return True
-
-        # Self collision
-        for segment in self.body[1:]:
-            if self.body[0].colliderect(segment):
-                return True
-
-        return False
-
-    def check_food(self, food):
-        if self.body[0].colliderect(food.rect):
-            self.grow = True
-            self.score += 10
-            return True
-        return False
-
-    def draw(self, surface):
-        for i, segment in enumerate(self.body):
-            color = Config.COLORS["GREEN"] if i == 0 else Config.COLORS["BLUE"]
-            pygame.draw.rect(surface, color, segment)
-            pygame.draw.rect(surface, Config.COLORS["WHITE"], segment, 1)
-
-class Food:
-    def __init__(self, boundaries):
-        self.boundaries = boundaries
-        self.rect = pygame.Rect(0, 0, 20, 20)
-        self.respawn()
-
-    def respawn(self):
-        x = random.randrange(self.boundaries.left, self.boundaries.right - 20, 20)
-        y = random.randrange(self.boundaries.top, self.boundaries.bottom - 20, 20)
-        self.rect.topleft = (x, y)
-
-    def draw(self, surface):
-        pygame.draw.rect(surface, Config.COLORS["RED"], self.rect)
-
-class Brick:
-    def __init__(self, x, y, width, height, color):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.color = Config.COLORS[color] if isinstance(color, str) else color
-        self.destroyed = False
-
-    def draw(self, surface):
-        if not self.destroyed:
-            pygame.draw.rect(surface, self.color, self.rect)
-            pygame.draw.rect(surface, Config.COLORS["WHITE"], self.rect, 1)
-
-class Invader:
-    def __init__(self, x, y, size, color):
-        self.rect = pygame.Rect(x, y, size, size)
-        self.color = Config.COLORS[color] if isinstance(color, str) else color
-        self.alive = True
-
-    def draw(self, surface):
-        if self.alive:
-            pygame.draw.rect(surface, self.color, self.rect)
-
-class PlayerShip:
-    def __init__(self, x, y, width, height, color, speed):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.color = Config.COLORS[color] if isinstance(color, str) else color
-        self.speed = speed
-        self.lives = 3
-        self.score = 0
+    def begin_step(self):
+        self.prev_y = self.y
 
     def move(self, direction, boundaries):
-        if direction == "LEFT" and self.rect.left > boundaries.left:
-            self.rect.x -= self.speed
-        if direction == "RIGHT" and self.rect.right < boundaries.right:
-            self.rect.x += self.speed
-
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, self.rect)
-
-class Bullet:
-    def __init__(self, x, y, width, height, color, speed):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.color = Config.COLORS[color] if isinstance(color, str) else color
-        self.speed = speed
-        self.active = True
-
-    def update(self, boundaries):
-        self.rect.y += self.speed
-        if self.rect.bottom < boundaries.top or self.rect.top > boundaries.bottom:
-            self.active = False
-
-    def draw(self, surface):
-        if self.active:
-            pygame.draw.rect(surface, self.color, self.rect)
-
-# Tetris Game Implementation
-class TetrisPiece:
-    def __init__(self, shape, x, y):
-        self.shape = shape
-        self.x = x
-        self.y = y
-        self.color = random.choice(["RED", "GREEN", "BLUE", "YELLOW", "PURPLE", "CYAN", "ORANGE"])
-
-    def rotate(self):
-        # Transpose the shape matrix and reverse each row to rotate 90 degrees
-        self.shape = [list(row) for row in zip(*self.shape[::-1])]
-
-    def get_positions(self):
-        positions = []
-        for y, row in enumerate(self.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    positions.append((self.x + x, self.y + y))
-        return positions
-
-class TetrisGame:
-    def __init__(self):
-        self.reset()
-
-    def reset(self):
-        self.board = [[None for _ in range(10)] for _ in range(20)]
-        self.current_piece = self.new_piece()
-        self.next_piece = self.new_piece()
-        self.score = 0
-        self.game_over = False
-        self.fall_time = 0
-        self.fall_speed = 500  # milliseconds
-
-    def new_piece(self):
-        shapes = [
-            [[1, 1, 1, 1]],  # I
-            [[1, 1], [1, 1]],  # O
-            [[1, 1, 1], [0, 1, 0]],  # T
-            [[1, 1, 1], [1, 0, 0]],  # L
-            [[1, 1, 1], [0, 0, 1]],  # J
-            [[0, 1, 1], [1, 1, 0]],  # S
-            [[1, 1, 0], [0, 1, 1]]   # Z
-        ]
-        shape = random.choice(shapes)
-        return TetrisPiece(shape, 3, 0)
-
-    def valid_move(self, piece, x_offset=0, y_offset=0):
-        for x, y in piece.get_positions():
-            x += x_offset
-            y += y_offset
-            if x < 0 or x >= 10 or y >= 20 or (y >= 0 and self.board[y][x] is not None):
-                return False
-        return True
-
-    def lock_piece(self, piece):
-        for x, y in piece.get_positions():
-            if y < 0:
-                self.game_over = True
-                return
-            self.board[y][x] = piece.color
-
-        # Check for completed lines
-        lines_cleared = 0
-        for y in range(20):
-            if all(self.board[y]):
-                lines_cleared += 1
-                # Remove the line
-                for y2 in range(y, 0, -1):
-                    self.board[y2] = self.board[y2-1][:]
-                self.board[0] = [None for _ in range(10)]
-
-        # Update score
-        if lines_cleared == 1:
-            self.score += 100
-        elif lines_cleared == 2:
-            self.score += 300
-        elif lines_cleared == 3:
-            self.score += 500
-        elif lines_cleared == 4:
-            self.score += 800
-
-    def update(self, current_time):
-        if self.game_over:
-            return
-
-        # Move piece down automatically
-        if current_time - self.fall_time > self.fall_speed:
-            self.fall_time = current_time
-            if self.valid_move(self.current_piece, 0, 1):
-                self.current_piece.y += 1
-            else:
-                self.lock_piece(self.current_piece)
-                self.current_piece = self.next_piece
-                self.next_piece = self.new_piece()
-
-    def move(self, dx):
-        if self.valid_move(self.current_piece, dx, 0):
-            self.current_piece.x += dx
-
-    def rotate_piece(self):
-        original_shape = self.current_piece.shape
-        self.current_piece.rotate()
-        if not self.valid_move(self.current_piece):
-            self.current_piece.shape = original_shape
-
-    def draw(self, surface, x, y, cell_size=20):
-        # Draw board
-        for row in range(20):
-            for col in range(10):
-                rect = pygame.Rect(x + col * cell_size, y + row * cell_size, cell_size, cell_size)
-                if self.board[row][col]:
-                    pygame.draw.rect(surface, Config.COLORS[self.board[row][col]], rect)
-                pygame.draw.rect(surface, Config.COLORS["WHITE"], rect, 1)
-
-        # Draw current piece
-        if not self.game_over:
-            for pos_x, pos_y in self.current_piece.get_positions():
-                if pos_y >= 0:
-                    rect = pygame.Rect(x + pos_x * cell_size, y + pos_y * cell_size, cell_size, cell_size)
-                    pygame.draw.rect(surface, Config.COLORS[self.current_piece.color], rect)
-                    pygame.draw.rect(surface, Config.COLORS["WHITE"], rect, 1)
-
-        # Draw next piece preview
-        for pos_x, pos_y in self.next_piece.get_positions():
-            rect = pygame.Rect(x + 11 * cell_size + pos_x * cell_size, y + 2 * cell_size + pos_y * cell_size, cell_size, cell_size)
-            pygame.draw.rect(surface, Config.COLORS[self.next_piece.color], rect)
-            pygame.draw.rect(surface, Config.COLORS["WHITE"], rect, 1)
-
-# Asteroids Game Implementation
-class Asteroid:
-    def __init__(self, x, y, size, speed):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.speed = speed
-        self.angle = random.uniform(0, 2 * math.pi)
-        self.vertices = self.generate_vertices()
-
-    def generate_vertices(self):
-        vertices = []
-        for i in range(8):
-            angle = 2 * math.pi * i / 8
-            distance = self.size + random.uniform(-self.size/3, self.size/3)
-            x = self.x + math.cos(angle) * distance
-            y = self.y + math.sin(angle) * distance
-            vertices.append((x, y))
-        return vertices
-
-    def update(self):
-        self.x += math.cos(self.angle) * self.speed
-        self.y += math.sin(self.angle) * self.speed
-        
-        # Wrap around screen
-        if self.x < 0: self.x = Config.WIDTH
-        if self.x > Config.WIDTH: self.x = 0
-        if self.y < 0: self.y = Config.HEIGHT
-        if self.y > Config.HEIGHT: self.y = 0
+        if direction == "UP" and self.rect.top > boundaries.top:
+            self.set_y(self.y - self.speed)
+        elif direction == "DOWN" and self.rect.bottom < boundaries.bottom:
+            self.set_y(self.y + self.speed)
+        else:
+            super().move(direction, boundaries)
 
-    def draw(self, surface):
-        pygame.draw.polygon(surface, Config.COLORS["WHITE"], self.vertices, 2)
+    def ai_move(self, ball, boundaries):
+        if ball.rect.centery < self.rect.centery and self.rect.top > boundaries.top:
+            self.set_y(self.y - self.speed)
+        elif ball.rect.centery > self.rect.centery and self.rect.bottom < boundaries.bottom:
+            self.set_y(self.y + self.speed)
 
-class AsteroidsShip:
-    def __init__(self, x, y):
-        self.x = x
+    def set_y(self, y):
         self.y = y
-        self.angle = 0
-        self.speed = 0
-        self.rotation_speed = 5
-        self.acceleration = 0.1
-        self.max_speed = 5
-        self.bullets = []
-        self.lives = 3
-
-    def rotate(self, direction):
-        self.angle += direction * self.rotation_speed
-
-    def accelerate(self):
-        self.speed += self.acceleration
-        if self.speed > self.max_speed:
-            self.speed = self.max_speed
-
-    def decelerate(self):
-        self.speed -= self.acceleration
-        if self.speed < 0:
-            self.speed = 0
-
-    def shoot(self):
-        bullet_x = self.x + math.cos(math.radians(self.angle)) * 20
-        bullet_y = self.y + math.sin(math.radians(self.angle)) * 20
-        self.bullets.append({
-            'x': bullet_x,
-            'y': bullet_y,
-            'angle': self.angle,
-            'speed': 10,
-            'life': 60  # frames
-        })
+        self.rect.y = round(y)
 
-    def update(self):
-        # Update position
-        self.x += math.cos(math.radians(self.angle)) * self.speed
-        self.y += math.sin(math.radians(self.angle)) * self.speed
-        
-        # Wrap around screen
-        if self.x < 0: self.x = Config.WIDTH
-        if self.x > Config.WIDTH: self.x = 0
-        if self.y < 0: self.y = Config.HEIGHT
-        if self.y > Config.HEIGHT: self.y = 0
-        
-        # Update bullets
-        for bullet in self.bullets[:]:
-            bullet['x'] += math.cos(math.radians(bullet['angle'])) * bullet['speed']
-            bullet['y'] += math.sin(math.radians(bullet['angle'])) * bullet['speed']
-            bullet['life'] -= 1
-            
-            # Remove old bullets
-            if bullet['life'] <= 0:
-                self.bullets.remove(bullet)
-            
-            # Wrap bullets around screen
-            if bullet['x'] < 0: bullet['x'] = Config.WIDTH
-            if bullet['x'] > Config.WIDTH: bullet['x'] = 0
-            if bullet['y'] < 0: bullet['y'] = Config.HEIGHT
-            if bullet['y'] > Config.HEIGHT: bullet['y'] = 0
+    def draw_rect(self, alpha=1.0):
+        rect = self.rect.copy()
+        rect.y = round(self.prev_y + (self.y - self.prev_y) * alpha)
+        return rect
 
-    def draw(self, surface):
-        # Draw ship
-        points = [
-            (self.x + math.cos(math.radians(self.angle)) * 20, 
-             self.y + math.sin(math.radians(self.angle)) * 20),
-            (self.x + math.cos(math.radians(self.angle + 150)) * 15, 
-             self.y + math.sin(math.radians(self.angle + 150)) * 15),
-            (self.x + math.cos(math.radians(self.angle - 150)) * 15, 
-             self.y + math.sin(math.radians(self.angle - 150)) * 15)
-        ]
-        pygame.draw.polygon(surface, Config.COLORS["WHITE"], points, 2)
-        
-        # Draw bullets
-        for bullet in self.bullets:
-            pygame.draw.circle(surface, Config.COLORS["WHITE"], (int(bullet['x']), int(bullet['y'])), 2)
-
-# Platformer Game (Mario-like)
-class PlatformerPlayer:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 30, 50)
-        self.velocity = pygame.math.Vector2(0, 0)
-        self.speed = 5
-        self.jump_power = 12
-        self.gravity = 0.5
-        self.is_jumping = False
-        self.facing_right = True
-        self.lives = 3
-        self.score = 0
-        self.coins = 0
-        
-    def update(self, platforms, enemies, coins):
-        # Apply gravity
-        self.velocity.y += self.gravity
-        
-        # Update position
-        self.rect.x += self.velocity.x
-        self.rect.y += self.velocity.y
-        
-        # Check platform collisions
-        on_ground = False
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                # Landing on top of platform
-                if self.velocity.y > 0 and self.rect.bottom > platform.rect.top and self.rect.top < platform.rect.top:
-                    self.rect.bottom = platform.rect.top
-                    self.velocity.y = 0
-                    on_ground = True
-                # Hitting platform from below
-                elif self.velocity.y < 0 and self.rect.top < platform.rect.bottom and self.rect.bottom > platform.rect.bottom:
-                    self.rect.top = platform.rect.bottom
-                    self.velocity.y = 0
-                # Hitting platform from sides
-                elif self.velocity.x > 0 and self.rect.right > platform.rect.left and self.rect.left < platform.rect.left:
-                    self.rect.right = platform.rect.left
-                elif self.velocity.x < 0 and self.rect.left < platform.rect.right and self.rect.right > platform.rect.right:
-                    self.rect.left = platform.rect.right
-        
-        # Check enemy collisions
-        for enemy in enemies[:]:
-            if self.rect.colliderect(enemy.rect):
-                # Jumping on enemy
-                if self.velocity.y > 0 and self.rect.bottom < enemy.rect.top + 10:
-                    enemies.remove(enemy)
-                    self.velocity.y = -self.jump_power * 0.7
-                    self.score += 100
-                    sound_system.play("beep2")
-                else:
-                    self.lives -= 1
-                    self.rect.x = 100
-                    self.rect.y = 100
-                    self.velocity = pygame.math.Vector2(0, 0)
-                    sound_system.play("explosion")
-        
-        # Check coin collisions
-        for coin in coins[:]:
-            if self.rect.colliderect(coin.rect):
-                coins.remove(coin)
-                self.coins += 1
-                self.score += 50
-                sound_system.play("powerup")
-        
-        # Reset jumping state
-        if on_ground:
-            self.is_jumping = False
-        
-        # Screen boundaries
-        if self.rect.left < 0:
-            self.rect.left = 0
-        if self.rect.right > Config.WIDTH:
-            self.rect.right = Config.WIDTH
-        if self.rect.bottom > Config.HEIGHT:
-            self.rect.bottom = Config.HEIGHT
-            self.velocity.y = 0
-            on_ground = True
-        
-        return self.lives > 0
-    
-    def jump(self):
-        if not self.is_jumping:
-            self.velocity.y = -self.jump_power
-            self.is_jumping = True
-            sound_system.play("beep1")
-    
-    def draw(self, surface):
-        # Draw player as a simple character
-        color = Config.COLORS["RED"] if self.facing_right else Config.COLORS["PINK"]
-        pygame.draw.rect(surface, color, self.rect)
-        
-        # Draw eyes
-        eye_x = self.rect.right - 10 if self.facing_right else self.rect.left + 10
-        pygame.draw.circle(surface, Config.COLORS["WHITE"], (eye_x, self.rect.top + 15), 5)
-
-class Platform:
-    def __init__(self, x, y, width, height, color="BROWN"):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.color = Config.COLORS[color] if isinstance(color, str) else color
-    
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, self.rect)
-
-class Enemy:
-    def __init__(self, x, y, speed=2):
-        self.rect = pygame.Rect(x, y, 40, 30)
-        self.speed = speed
-        self.direction = 1
-    
-    def update(self, platforms):
-        self.rect.x += self.speed * self.direction
-        
-        # Change direction at edges or when hitting a wall
-        change_dir = False
-        if self.rect.left <= 0 or self.rect.right >= Config.WIDTH:
-            change_dir = True
-        
-        for platform in platforms:
-            if (self.direction > 0 and self.rect.colliderect(pygame.Rect(platform.rect.left, platform.rect.top, 1, platform.rect.height)) or
-                self.direction < 0 and self.rect.colliderect(pygame.Rect(platform.rect.right - 1, platform.rect.top, 1, platform.rect.height))):
-                change_dir = True
-        
-        if change_dir:
-            self.direction *= -1
-    
-    def draw(self, surface):
-        pygame.draw.rect(surface, Config.COLORS["GREEN"], self.rect)
-        # Draw spikes
-        for i in range(3):
-            x = self.rect.left + 10 + i * 10
-            points = [(x, self.rect.top), (x + 5, self.rect.top - 10), (x + 10, self.rect.top)]
-            pygame.draw.polygon(surface, Config.COLORS["RED"], points)
-
-class Coin:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 20, 20)
-    
-    def draw(self, surface):
-        pygame.draw.circle(surface, Config.COLORS["YELLOW"], self.rect.center, 10)
-        pygame.draw.circle(surface, Config.COLORS["ORANGE"], self.rect.center, 7)
-
-# Pokemon-like RPG
-class PokemonPlayer:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 40, 40)
-        self.speed = 3
-        self.direction = "DOWN"
-        self.pokemon = []
-        self.current_pokemon = None
-        self.badges = 0
-    
-    def move(self, direction, boundaries):
-        self.direction = direction
-        if direction == "UP" and self.rect.top > boundaries.top:
-            self.rect.y -= self.speed
-        elif direction == "DOWN" and self.rect.bottom < boundaries.bottom:
-            self.rect.y += self.speed
-        elif direction == "LEFT" and self.rect.left > boundaries.left:
-            self.rect.x -= self.speed
-        elif direction == "RIGHT" and self.rect.right < boundaries.right:
-            self.rect.x += self.speed
-    
-    def draw(self, surface):
-        # Draw player as a simple character
-        color = Config.COLORS["RED"]
-        pygame.draw.rect(surface, color, self.rect)
-        
-        # Draw face based on direction
-        if self.direction == "UP":
-            pygame.draw.circle(surface, Config.COLORS["BLACK"], (self.rect.centerx, self.rect.top + 10), 5)
-        elif self.direction == "DOWN":
-            pygame.draw.circle(surface, Config.COLORS["BLACK"], (self.rect.centerx, self.rect.bottom - 10), 5)
-        elif self.direction == "LEFT":
-            pygame.draw.circle(surface, Config.COLORS["BLACK"], (self.rect.left + 10, self.rect.centery), 5)
-        elif self.direction == "RIGHT":
-            pygame.draw.circle(surface, Config.COLORS["BLACK"], (self.rect.right - 10, self.rect.centery), 5)
-
-class Pokemon:
-    def __init__(self, name, type, level=5):
-        self.name = name
-        self.type = type
-        self.level = level
-        self.hp = 20 + level * 5
-        self.max_hp = 20 + level * 5
-        self.attack = 5 + level
-        self.defense = 5 + level
-        self.moves = []
-        
-        # Assign moves based on type
-        if type == "FIRE":
-            self.moves = [("Ember", 25), ("Fire Spin", 35)]
-            self.color = Config.COLORS["RED"]
-        elif type == "WATER":
-            self.moves = [("Water Gun", 25), ("Bubble", 35)]
-            self.color = Config.COLORS["BLUE"]
-        elif type == "GRASS":
-            self.moves = [("Vine Whip", 25), ("Razor Leaf", 35)]
-            self.color = Config.COLORS["GREEN"]
-        elif type == "ELECTRIC":
-            self.moves = [("Thunder Shock", 25), ("Thunderbolt", 35)]
-            self.color = Config.COLORS["YELLOW"]
-    
-    def draw(self, surface, x, y, size=50):
-        rect = pygame.Rect(x, y, size, size)
-        pygame.draw.rect(surface, self.color, rect)
-        pygame.draw.rect(surface, Config.COLORS["BLACK"], rect, 2)
-        
-        # Draw name and level
-        font = pygame.font.Font(None, 20)
-        name_text = font.render(self.name, True, Config.COLORS["WHITE"])
-        level_text = font.render(f"Lv{self.level}", True, Config.COLORS["WHITE"])
-        
-        surface.blit(name_text, (x + 5, y + 5))
-        surface.blit(level_text, (x + size - 30, y + 5))
-        
-        # Draw HP bar
-        hp_width = (size - 10) * (self.hp / self.max_hp)
-        pygame.draw.rect(surface, Config.COLORS["RED"], (x + 5, y + size - 15, hp_width, 8))
-
-class PokemonBattle:
-    def __init__(self, player_pokemon, wild_pokemon):
-        self.player_pokemon = player_pokemon
-        self.wild_pokemon = wild_pokemon
-        self.state = "SELECT_MOVE"  # SELECT_MOVE, BATTLE, RESULT
-        self.selected_move = 0
-        self.battle_text = []
-        self.text_timer = 0
-        self.result = None  # WIN, LOSE, CATCH
-    
-    def update(self):
-        if self.state == "BATTLE":
-            self.text_timer += 1
-            if self.text_timer > 120:  # 2 seconds
-                self.state = "SELECT_MOVE"
-                self.text_timer = 0
-                
-                # Check if battle should end
-                if self.wild_pokemon.hp <= 0:
-                    self.result = "WIN"
-                    self.battle_text = [f"{self.wild_pokemon.name} fainted!"]
-                elif self.player_pokemon.hp <= 0:
-                    self.result = "LOSE"
-                    self.battle_text = [f"{self.player_pokemon.name} fainted!"]
-    
-    def select_move(self, move_index):
-        if self.state != "SELECT_MOVE":
-            return
-            
-        self.selected_move = move_index
-        move_name, move_power = self.player_pokemon.moves[move_index]
-        
-        # Player attacks
-        damage = max(1, move_power + self.player_pokemon.attack - self.wild_pokemon.defense)
-        self.wild_pokemon.hp -= damage
-        self.battle_text = [f"{self.player_pokemon.name} used {move_name}!", f"It did {damage} damage!"]
-        
-        # Wild pokemon attacks if still alive
-        if self.wild_pokemon.hp > 0:
-            wild_move_name, wild_move_power = random.choice(self.wild_pokemon.moves)
-            wild_damage = max(1, wild_move_power + self.wild_pokemon.attack - self.player_pokemon.defense)
-            self.player_pokemon.hp -= wild_damage
-            self.battle_text.append(f"{self.wild_pokemon.name} used {wild_move_name}!")
-            self.battle_text.append(f"It did {wild_damage} damage!")
-        
-        self.state = "BATTLE"
-        self.text_timer = 0
-    
-    def try_catch(self):
-        if self.state != "SELECT_MOVE":
-            return
-            
-        # Higher chance to catch if HP is low
-        catch_chance = 0.3 + (1 - self.wild_pokemon.hp / self.wild_pokemon.max_hp) * 0.5
-        if random.random() < catch_chance:
-            self.result = "CATCH"
-            self.battle_text = [f"Caught {self.wild_pokemon.name}!"]
-        else:
-            self.battle_text = [f"Failed to catch {self.wild_pokemon.name}!"]
-            # Wild pokemon attacks
-            wild_move_name, wild_move_power = random.choice(self.wild_pokemon.moves)
-            wild_damage = max(1, wild_move_power + self.wild_pokemon.attack - self.player_pokemon.defense)
-            self.player_pokemon.hp -= wild_damage
-            self.battle_text.append(f"{self.wild_pokemon.name} used {wild_move_name}!")
-            self.battle_text.append(f"It did {wild_damage} damage!")
-        
-        self.state = "BATTLE"
-        self.text_timer = 0
-    
-    def draw(self, surface):
-        # Draw player pokemon
-        self.player_pokemon.draw(surface, 100, 300)
-        
-        # Draw wild pokemon
-        self.wild_pokemon.draw(surface, 500, 100)
-        
-        # Draw battle text
-        font = pygame.font.Font(None, 24)
-        for i, text in enumerate(self.battle_text):
-            text_surface = font.render(text, True, Config.COLORS["WHITE"])
-            surface.blit(text_surface, (50, 400 + i * 30))
-        
-        # Draw move selection if in SELECT_MOVE state
-        if self.state == "SELECT_MOVE":
-            for i, (move_name, move_power) in enumerate(self.player_pokemon.moves):
-                color = Config.COLORS["YELLOW"] if i == self.selected_move else Config.COLORS["WHITE"]
-                move_text = f"{i+1}. {move_name} (Power: {move_power})"
-                text_surface = font.render(move_text, True, color)
-                surface.blit(text_surface, (50, 450 + i * 30))
-            
-            # Draw catch option
-            catch_color = Config.COLORS["YELLOW"] if self.selected_move == len(self.player_pokemon.moves) else Config.COLORS["WHITE"]
-            catch_text = f"{len(self.player_pokemon.moves)+1}. Try to Catch"
-            text_surface = font.render(catch_text, True, catch_color)
-            surface.blit(text_surface, (50, 450 + len(self.player_pokemon.moves) * 30))
+    def draw(self, surface, alpha=1.0):
+        pygame.draw.rect(surface, self.color, self.draw_rect(alpha))
 
 # --- Enhanced Game Engine ---
 class GameEngine:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((Config.WIDTH, Config.HEIGHT))
+    def __init__(self, saves_dir="SAVES", seed=None, input_source=None):
+        # Games draw on self.screen; the render target shows it, scaled to the window if asked
+        self.target = RenderTarget((Config.WIDTH, Config.HEIGHT), Config.SCALED_DISPLAY,
+                                   Config.FULLSCREEN, Config.SMOOTH_SCALING, Config.CRT_MASK)
+        self.screen = self.target.canvas
         pygame.display.set_caption("RETRO ARCADE MEGA COLLECTION - 1980s EDITION")
         self.clock = pygame.time.Clock()
         self.current_state = Config.GAME_STATES["PLAYER_SELECT"]
@@ -1186,59 +477,100 @@ class GameEngine:
         self.score = 0
         self.lives = 3
         self.player_name = ""
-        self.save_system = SaveSystem()
-        
-        # Game objects
-        self.pong_objects = {}
-        self.snake_objects = {}
-        self.breakout_objects = {}
-        self.space_invaders_objects = {}
-        self.tetris_objects = {}
-        self.asteroids_objects = {}
-        self.platformer_objects = {}
-        self.pokemon_objects = {}
+        self.save_system = create_save_system(Config.SAVE_BACKEND, saves_dir)
+        self.last_game = ""
+        self.game_over_rank = None  # ((game, score), (rank, total)) for the game-over screen
+
+        # Fixed-step simulation clock; use self.timestep.ticks instead of pygame.time.get_ticks
+        self.timestep = FixedTimestep(Config.SIM_RATE)
+
+        # Game input comes from input_source (scripted in headless runs);
+        # with a seed, each game's randomness is reproducible
+        self.input = input_source or KeyboardInput()
+        self.seed = seed
+        self.games_started = 0
+
+        # Replay recording: (game state, ReplayWriter) while a game is recorded
+        self.recording_enabled = Config.RECORD_REPLAYS
+        self.replay_dir = os.path.join(saves_dir, "replays")
+        self.recorder = None
+        # Registered games without a built-in state get the next free ids
+        for name in GAMES:
+            if name not in Config.GAME_STATES:
+                Config.GAME_STATES[name] = max(Config.GAME_STATES.values()) + 1
+        self.state_names = {value: name for name, value in Config.GAME_STATES.items()}
+
+        # Per-phase frame timings; run() only instruments frames while enabled
+        self.profiler = FrameProfiler(Config.FPS)
+        self.profiler.enabled = Config.PROFILER
+        self.profile_dir = os.path.join(saves_dir, "profiles")
+
+        # Player data shown by the menus, reloaded only after it changes
+        self.player_data = None
+        self.player_data_version = 0
+
+        # Retained menu screens (widgets and button looks are built once)
+        self.ui = {
+            "PLAYER_SELECT": UIScreen(self.build_player_select_ui),
+            "MAIN_MENU": UIScreen(self.build_menu_ui),
+            "HIGH_SCORES": UIScreen(self.build_high_scores_ui),
+        }
         
-        # 80s style background effect
-        self.stars = [(random.randint(0, Config.WIDTH), random.randint(0, Config.HEIGHT), 
-                      random.randint(1, 3)) for _ in range(100)]
-        self.star_timer = 0
+        # Games (see games/) are imported the first time they are selected;
+        # their objects live on the engine until they are torn down
+        self.game_modules = {}
+        self.active_game = None
+        self.attract_objects = {}
+        self.menu_idle_since = 0
+        self.last_mouse_pos = None
+        
+        # 80s style background effect (starfield + scanlines, composited once)
+        self.background = BackgroundCompositor(Config.WIDTH, Config.HEIGHT, seed=seed)
+
+        # Dirty-rect rendering (Config.DIRTY_RECTS) for games with a static playfield
+        self.renderer = DirtyRectRenderer((Config.WIDTH, Config.HEIGHT))
+        self.dirty_mode = False
+        self.playfield_drawers = {}
+
+        # State -> update and draw hooks. Games add theirs when they are loaded.
+        self.updaters = {
+            Config.GAME_STATES["PLAYER_SELECT"]: self.update_player_select,
+            Config.GAME_STATES["MAIN_MENU"]: self.update_menu,
+            Config.GAME_STATES["HIGH_SCORES"]: self.update_high_scores,
+            Config.GAME_STATES["GAME_OVER"]: self.update_game_over,
+            Config.GAME_STATES["ATTRACT"]: self.update_attract,
+        }
+        self.drawers = {
+            Config.GAME_STATES["PLAYER_SELECT"]: self.draw_player_select,
+            Config.GAME_STATES["MAIN_MENU"]: self.draw_menu,
+            Config.GAME_STATES["HIGH_SCORES"]: self.draw_high_scores,
+            Config.GAME_STATES["GAME_OVER"]: self.draw_game_over,
+            Config.GAME_STATES["ATTRACT"]: self.draw_attract,
+        }
         
     def draw_text(self, text, size, x, y, color=Config.COLORS["WHITE"], centered=True):
-        font = pygame.font.Font(None, size)
-        text_surface = font.render(str(text), True, color)
+        text_surface = text_cache.render(text, size, color)
         if centered:
             text_rect = text_surface.get_rect(center=(x, y))
         else:
             text_rect = text_surface.get_rect(topleft=(x, y))
         self.screen.blit(text_surface, text_rect)
+        self.mark_dirty(text_rect)
         return text_rect
 
+    def mark_dirty(self, *rects):
+        """Report screen regions drawn this frame (only used in dirty-rect mode)."""
+        if self.dirty_mode:
+            self.renderer.mark_all(rects)
+
+    def draw_static_playfield(self, surface):
+        self.background.draw(surface)
+        self.playfield_drawers[self.current_state](surface)
+
     def draw_80s_background(self):
-        # Draw starfield background
-        self.screen.fill(Config.COLORS["BLACK"])
-        
-        # Animate stars
-        self.star_timer += 1
-        if self.star_timer > 5:
-            self.star_timer = 0
-            for i in range(len(self.stars)):
-                x, y, speed = self.stars[i]
-                x -= speed
-                if x < 0:
-                    x = Config.WIDTH
-                    y = random.randint(0, Config.HEIGHT)
-                self.stars[i] = (x, y, speed)
-        
-        # Draw stars with proper RGB color tuples
-        for x, y, speed in self.stars:
-            # Create a proper RGB color tuple
-            brightness = min(255, 150 + speed * 50)  # Ensure brightness doesn't exceed 255
-            color = (int(brightness), int(brightness), int(brightness))  # Convert to integers
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), speed)  # Convert coordinates to integers
-        
-        # Draw scanlines for CRT effect
-        for y in range(0, Config.HEIGHT, 4):
-            pygame.draw.line(self.screen, (0, 0, 0), (0, y), (Config.WIDTH, y), 1)
+        # Animate the starfield; the cached composite is only rebuilt when it moves
+        self.background.update()
+        self.background.draw(self.screen)
 
     def get_boundaries(self):
         return pygame.Rect(50, 50, Config.WIDTH - 100, Config.HEIGHT - 100)
@@ -1253,104 +585,148 @@ class GameEngine:
                         self.current_state = Config.GAME_STATES["MAIN_MENU"]
                     else:
                         return False
-            self.handle_game_specific_events(event)
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                elif event.key == pygame.K_F4 and self.profiler.enabled:
+                    self.export_profile()
+            self.input.handle_event(event)
         return True
 
-    def handle_game_specific_events(self, event):
-        # Placeholder for game-specific event handling
-        pass
+    def sim_rate(self, state=None):
+        """Simulation steps per second for a game state (the current one by default)."""
+        name = self.state_names.get(self.current_state if state is None else state)
+        return Config.SIM_RATES.get(name, Config.SIM_RATE)
+
+    def step(self):
+        """One fixed simulation step."""
+        if self.recorder and self.current_state != self.recorder[0]:
+            self.finish_replay()  # left the game between steps (ESC)
+        self.leave_game()
+        source = self.input  # a game started this step records from the next one
+        self.update()
+        source.next_frame()
+        if self.recorder and self.current_state != self.recorder[0]:
+            self.finish_replay()
+        self.leave_game()
 
     def update(self):
-        if self.current_state == Config.GAME_STATES["PLAYER_SELECT"]:
-            self.update_player_select()
-        elif self.current_state == Config.GAME_STATES["MAIN_MENU"]:
-            self.update_menu()
-        elif self.current_state == Config.GAME_STATES["PONG"]:
-            self.update_pong()
-        elif self.current_state == Config.GAME_STATES["SNAKE"]:
-            self.update_snake()
-        elif self.current_state == Config.GAME_STATES["BREAKOUT"]:
-            self.update_breakout()
-        elif self.current_state == Config.GAME_STATES["SPACE_INVADERS"]:
-            self.update_space_invaders()
-        elif self.current_state == Config.GAME_STATES["TETRIS"]:
-            self.update_tetris()
-        elif self.current_state == Config.GAME_STATES["ASTEROIDS"]:
-            self.update_asteroids()
-        elif self.current_state == Config.GAME_STATES["PLATFORMER"]:
-            self.update_platformer()
-        elif self.current_state == Config.GAME_STATES["POKEMON"]:
-            self.update_pokemon()
-        elif self.current_state == Config.GAME_STATES["HIGH_SCORES"]:
-            self.update_high_scores()
-        elif self.current_state == Config.GAME_STATES["GAME_OVER"]:
-            self.update_game_over()
+        self.updaters[self.current_state]()
 
     def draw(self):
-        self.draw_80s_background()
-        
-        if self.current_state == Config.GAME_STATES["PLAYER_SELECT"]:
-            self.draw_player_select()
-        elif self.current_state == Config.GAME_STATES["MAIN_MENU"]:
-            self.draw_menu()
-        elif self.current_state == Config.GAME_STATES["PONG"]:
-            self.draw_pong()
-        elif self.current_state == Config.GAME_STATES["SNAKE"]:
-            self.draw_snake()
-        elif self.current_state == Config.GAME_STATES["BREAKOUT"]:
-            self.draw_breakout()
-        elif self.current_state == Config.GAME_STATES["SPACE_INVADERS"]:
-            self.draw_space_invaders()
-        elif self.current_state == Config.GAME_STATES["TETRIS"]:
-            self.draw_tetris()
-        elif self.current_state == Config.GAME_STATES["ASTEROIDS"]:
-            self.draw_asteroids()
-        elif self.current_state == Config.GAME_STATES["PLATFORMER"]:
-            self.draw_platformer()
-        elif self.current_state == Config.GAME_STATES["POKEMON"]:
-            self.draw_pokemon()
-        elif self.current_state == Config.GAME_STATES["HIGH_SCORES"]:
-            self.draw_high_scores()
-        elif self.current_state == Config.GAME_STATES["GAME_OVER"]:
-            self.draw_game_over()
-            
-        pygame.display.flip()
+        self.draw_frame()
+        self.present()
+
+    def draw_frame(self):
+        self.dirty_mode = Config.DIRTY_RECTS and self.current_state in self.playfield_drawers
+        if self.dirty_mode:
+            self.renderer.set_static(self.current_state, self.draw_static_playfield)
+            self.renderer.begin(self.screen)
+        else:
+            self.renderer.reset()
+            self.draw_80s_background()
+
+        self.drawers[self.current_state]()
+
+    def present(self):
+        if self.dirty_mode:
+            self.renderer.present(self.target)
+        else:
+            self.target.present()
 
     def run(self):
         running = True
+        frame_time = 0.0
         while running:
+            if self.profiler.enabled:
+                running, frame_time = self.run_profiled_frame(frame_time)
+                continue
+            # Input is read every displayed frame; logic runs in whole fixed steps
             running = self.handle_events()
-            self.update()
+            self.timestep.set_rate(self.sim_rate())
+            self.timestep.advance(frame_time, self.step)
             self.draw()
-            self.clock.tick(Config.FPS)
+            frame_time = self.clock.tick(Config.FPS) / 1000.0
+        self.quit()
+
+    def run_profiled_frame(self, frame_time):
+        """One frame of run() with each phase timed; returns (running, frame_time)."""
+        perf_counter = time.perf_counter
+        state = self.state_names.get(self.current_state, str(self.current_state))
+        dropped = self.timestep.dropped
+        mixer = sound_system.mixer
+        sounds_dropped = mixer.dropped
+        t0 = perf_counter()
+        running = self.handle_events()
+        t1 = perf_counter()
+        self.timestep.set_rate(self.sim_rate())
+        steps = self.timestep.advance(frame_time, self.step)
+        t2 = perf_counter()
+        self.draw_frame()
+        t3 = perf_counter()
+        if self.profiler.enabled:  # F3 may have just switched it off
+            self.mark_dirty(self.profiler.draw_overlay(self.screen, text_cache, state))
+        t4 = perf_counter()
+        self.present()
+        t5 = perf_counter()
+        frame_time = self.clock.tick(Config.FPS) / 1000.0
+        t6 = perf_counter()
+        self.profiler.record(t0, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4, t6 - t5), state, steps,
+                             self.timestep.dropped - dropped, mixer.load(), mixer.dropped - sounds_dropped)
+        return running, frame_time
+
+    def export_profile(self):
+        """Write the profiler timeline as a Chrome trace and a CSV; returns the trace path."""
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(self.profile_dir, f"frames_{stamp}")
+        self.profiler.export_trace(base + ".json")
+        self.profiler.export_csv(base + ".csv")
+        return base + ".json"
+
+    def quit(self):
+        # Write any pending save data before the process exits
+        self.finish_replay()
+        self.save_system.flush()
         pygame.quit()
         sys.exit()
 
+    # Player data
+    def get_player_data(self):
+        """Return the current player's data, loading it only when it has changed."""
+        if self.player_data is None or self.player_data.get("name") != self.player_name:
+            self.player_data = self.save_system.get_player_data(self.player_name)
+        return self.player_data
+
+    def refresh_player_data(self):
+        """Call after the player's saved data changes so menus rebuild."""
+        self.player_data = None
+        self.player_data_version += 1
+
     # Player Select Screen
+    def build_player_select_ui(self, ui):
+        # Buttons: Select User, New User
+        ui.add("select", RetroButton(Config.WIDTH//2 - 190, Config.HEIGHT//2 - 40, 180, 56, "SELECT USER", "CYAN", "YELLOW"))
+        ui.add("new", RetroButton(Config.WIDTH//2 + 10, Config.HEIGHT//2 - 40, 180, 56, "NEW USER", "GREEN", "YELLOW"))
+
     def update_player_select(self):
         mouse_pos = pygame.mouse.get_pos()
         mouse_click = pygame.mouse.get_pressed()[0]
 
-        # Buttons: Select User, New User
-        select_button = RetroButton(Config.WIDTH//2 - 190, Config.HEIGHT//2 - 40, 180, 56, "SELECT USER", "CYAN", "YELLOW")
-        new_button = RetroButton(Config.WIDTH//2 + 10, Config.HEIGHT//2 - 40, 180, 56, "NEW USER", "GREEN", "YELLOW")
-        select_button.check_hover(mouse_pos)
-        new_button.check_hover(mouse_pos)
+        clicked = self.ui["PLAYER_SELECT"].ensure().update(mouse_pos, mouse_click)
 
-        if select_button.is_clicked(mouse_pos, mouse_click):
+        if clicked == "select":
             chosen = self.select_user_menu()
             if chosen:
                 self.player_name = chosen
-                self.save_system.get_player_data(self.player_name)
+                self.refresh_player_data()
                 self.current_state = Config.GAME_STATES["MAIN_MENU"]
 
-        if new_button.is_clicked(mouse_pos, mouse_click):
+        if clicked == "new":
             new_name = self.get_new_user_name()
             if new_name:
                 created = self.save_system.create_user(new_name)
                 if created:
                     self.player_name = new_name
-                    self.save_system.get_player_data(self.player_name)
+                    self.refresh_player_data()
                     self.current_state = Config.GAME_STATES["MAIN_MENU"]
                 else:
                     # creation failed or user exists; simple no-op for now
@@ -1360,13 +736,11 @@ class GameEngine:
         """Text input loop to collect a new username. Returns the string or None if cancelled or duplicate."""
         name = ""
         input_active = True
-        font = pygame.font.Font(None, 36)
 
         while input_active:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_RETURN:
                         if name.strip():
@@ -1386,10 +760,10 @@ class GameEngine:
             input_rect = pygame.Rect(Config.WIDTH//2 - 300, Config.HEIGHT//2 - 20, 600, 56)
             pygame.draw.rect(self.screen, Config.COLORS["BLUE"], input_rect)
             pygame.draw.rect(self.screen, Config.COLORS["WHITE"], input_rect, 2)
-            name_surface = font.render(name, True, Config.COLORS["WHITE"])
+            name_surface = text_cache.render(name, 36, Config.COLORS["WHITE"])
             self.screen.blit(name_surface, (input_rect.x + 10, input_rect.y + 10))
             self.draw_text("Press ENTER to create (ESC to cancel)", 20, Config.WIDTH//2, Config.HEIGHT//2 + 60, "YELLOW")
-            pygame.display.flip()
+            self.target.present()
             self.clock.tick(Config.FPS)
 
         # If username duplicates an existing file, return None so caller can handle
@@ -1417,8 +791,7 @@ class GameEngine:
             mouse_click = pygame.mouse.get_pressed()[0]
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     return None
 
@@ -1436,185 +809,246 @@ class GameEngine:
             if back_button.is_clicked(mouse_pos, mouse_click):
                 return None
 
-            pygame.display.flip()
+            self.target.present()
             self.clock.tick(Config.FPS)
         return None
     # Menu methods
-    def update_menu(self):
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_click = pygame.mouse.get_pressed()[0]
-        
-        player_data = self.save_system.get_player_data(self.player_name)
-        unlocked_games = player_data["unlocked_games"]
-        
+    GAME_LIST = GAMES  # the registry's list, so games registered later show up too
+
+    def build_menu_ui(self, ui):
+        unlocked_games = self.get_player_data()["unlocked_games"]
+
         # Create buttons for unlocked games
-        game_buttons = []
-        game_list = ["PONG", "SNAKE", "BREAKOUT", "SPACE_INVADERS", "TETRIS", "ASTEROIDS", "PLATFORMER", "POKEMON"]
-        for i, game in enumerate(game_list):
+        for i, game in enumerate(self.GAME_LIST):
             if game in unlocked_games:
                 color = "GREEN"
             else:
                 color = "GRAY"
-            
-            button = RetroButton(Config.WIDTH//2 - 100, 150 + i * 50, 200, 40, game, color, "YELLOW")
-            game_buttons.append(button)
-        
+            ui.add(game, RetroButton(Config.WIDTH//2 - 100, 150 + i * 50, 200, 40, game, color, "YELLOW"))
+
         # Other menu buttons
-        other_buttons = [
-            RetroButton(Config.WIDTH//2 - 100, 550, 200, 40, "HIGH SCORES", "PURPLE", "CYAN"),
-            RetroButton(Config.WIDTH//2 - 100, 600, 200, 40, "QUIT", "RED", "ORANGE")
-        ]
-        
-        # Check hover states
-        for button in game_buttons + other_buttons:
-            button.check_hover(mouse_pos)
-        
+        ui.add("HIGH_SCORES", RetroButton(Config.WIDTH//2 - 100, 550, 200, 40, "HIGH SCORES", "PURPLE", "CYAN"))
+        ui.add("QUIT", RetroButton(Config.WIDTH//2 - 100, 600, 200, 40, "QUIT", "RED", "ORANGE"))
+
+    def menu_ui(self):
+        return self.ui["MAIN_MENU"].ensure((self.player_name, self.player_data_version))
+
+    def start_game(self, name, seed=None):
+        """Switch to game `name` with freshly initialized objects.
+
+        `seed` (any string) fixes the game's randomness; by default it comes
+        from the engine seed, or is random when the engine has none.
+        """
+        self.finish_replay()
+        self.games_started += 1
+        if seed is None:
+            if self.seed is None:
+                seed = str(random.getrandbits(64))
+            else:
+                seed = f"{self.seed}:{name}:{self.games_started}"
+        rng.seed(seed)
+        # Shot timers live on the engine; clear them so every game starts alike
+        for attr in ("last_shot", "last_shot_asteroids"):
+            if hasattr(self, attr):
+                delattr(self, attr)
+        self.leave_game()
+        module = self.game_module(name)
+        self.current_state = Config.GAME_STATES[name]
+        self.last_game = name
+        self.active_game = name
+        module.init(self)
+        if self.recording_enabled:
+            self.start_replay(name, seed)
+
+    def game_module(self, name):
+        """Import game `name` the first time it is needed and add its hooks to the dispatch tables."""
+        module = self.game_modules.get(name)
+        if module is None:
+            module = load_game(name)
+            state = Config.GAME_STATES[name]
+            self.updaters[state] = partial(module.update, self)
+            self.drawers[state] = partial(module.draw, self)
+            if hasattr(module, "draw_playfield"):
+                self.playfield_drawers[state] = partial(module.draw_playfield, self)
+            self.game_modules[name] = module
+        return module
+
+    def leave_game(self):
+        """Tear down the active game once the engine is no longer in its state."""
+        if self.active_game and self.current_state != Config.GAME_STATES[self.active_game]:
+            self.game_modules[self.active_game].teardown(self)
+            self.active_game = None
+
+    def start_replay(self, name, seed):
+        os.makedirs(self.replay_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.replay_dir, f"{name.lower()}_{stamp}_{self.games_started}.replay")
+        header = {"game": name, "seed": seed, "sim_rate": self.sim_rate(), "sim_time": self.timestep.time}
+        writer = ReplayWriter(path, header)
+        self.input = RecordingInput(self.input, writer)
+        self.recorder = (self.current_state, writer)
+
+    def finish_replay(self):
+        if self.recorder is None:
+            return
+        writer = self.recorder[1]
+        writer.close({"score": self.score, "rng": rng_fingerprint(rng)})
+        self.input = self.input.source
+        self.recorder = None
+
+    def update_menu(self):
+        mouse_pos = pygame.mouse.get_pos()
+        mouse_click = pygame.mouse.get_pressed()[0]
+
+        # Start the CPU demo once the menu has been left alone long enough
+        if self.player_activity(mouse_pos, mouse_click):
+            self.menu_idle_since = self.timestep.ticks
+        elif Config.ATTRACT_DELAY and self.timestep.ticks - self.menu_idle_since > Config.ATTRACT_DELAY * 1000:
+            self.start_attract()
+            return
+
+        unlocked_games = self.get_player_data()["unlocked_games"]
+        clicked = self.menu_ui().update(mouse_pos, mouse_click)
+
         # Check game selection (only for unlocked games)
-        for i, button in enumerate(game_buttons):
-            if button.is_clicked(mouse_pos, mouse_click) and game_list[i] in unlocked_games:
-                self.current_state = Config.GAME_STATES[game_list[i]]
-                if game_list[i] == "PONG":
-                    self.init_pong()
-                elif game_list[i] == "SNAKE":
-                    self.init_snake()
-                elif game_list[i] == "BREAKOUT":
-                    self.init_breakout()
-                elif game_list[i] == "SPACE_INVADERS":
-                    self.init_space_invaders()
-                elif game_list[i] == "TETRIS":
-                    self.init_tetris()
-                elif game_list[i] == "ASTEROIDS":
-                    self.init_asteroids()
-                elif game_list[i] == "PLATFORMER":
-                    self.init_platformer()
-                elif game_list[i] == "POKEMON":
-                    self.init_pokemon()
-        
+        if clicked in self.GAME_LIST and clicked in unlocked_games:
+            self.start_game(clicked)
+
         # Check other buttons
-        if other_buttons[0].is_clicked(mouse_pos, mouse_click):
+        if clicked == "HIGH_SCORES":
             self.current_state = Config.GAME_STATES["HIGH_SCORES"]
-        elif other_buttons[1].is_clicked(mouse_pos, mouse_click):
-            pygame.quit()
-            sys.exit()
+        elif clicked == "QUIT":
+            self.quit()
 
     def draw_menu(self):
         self.draw_text("RETRO ARCADE MEGA COLLECTION", 48, Config.WIDTH//2, 80, "CYAN")
         self.draw_text(f"Player: {self.player_name}", 24, Config.WIDTH//2, 120, "YELLOW")
-        
-        player_data = self.save_system.get_player_data(self.player_name)
+
+        player_data = self.get_player_data()
         unlocked_games = player_data["unlocked_games"]
-        
-        # Draw game buttons
-        game_list = ["PONG", "SNAKE", "BREAKOUT", "SPACE_INVADERS", "TETRIS", "ASTEROIDS", "PLATFORMER", "POKEMON"]
-        for i, game in enumerate(game_list):
-            if game in unlocked_games:
-                color = "GREEN"
-            else:
-                color = "GRAY"
-            
-            button = RetroButton(Config.WIDTH//2 - 100, 150 + i * 50, 200, 40, game, color, "YELLOW")
-            button.draw(self.screen)
-            
-            # Show lock icon for locked games
+
+        # Draw game and other buttons
+        self.menu_ui().draw(self.screen)
+
+        # Show lock icon for locked games
+        for i, game in enumerate(self.GAME_LIST):
             if game not in unlocked_games:
                 lock_rect = pygame.Rect(Config.WIDTH//2 + 80, 150 + i * 50 + 10, 20, 20)
                 pygame.draw.rect(self.screen, Config.COLORS["YELLOW"], lock_rect)
-        
-        # Draw other buttons
-        other_buttons = [
-            RetroButton(Config.WIDTH//2 - 100, 550, 200, 40, "HIGH SCORES", "PURPLE", "CYAN"),
-            RetroButton(Config.WIDTH//2 - 100, 600, 200, 40, "QUIT", "RED", "ORANGE")
-        ]
-        
-        for button in other_buttons:
-            button.draw(self.screen)
-        
+
         # Draw player stats
         stats_text = f"Total Score: {player_data['total_score']} | Games Played: {player_data['games_played']}"
         self.draw_text(stats_text, 24, Config.WIDTH//2, Config.HEIGHT - 30, "WHITE")
 
+    def player_activity(self, mouse_pos, mouse_click):
+        moved = self.last_mouse_pos is not None and mouse_pos != self.last_mouse_pos
+        self.last_mouse_pos = mouse_pos
+        return bool(self.input.taps()) or mouse_click or moved
+
+    # Attract mode: the Tetris autoplayer (tetris_ai.py) plays until any input
+    def start_attract(self):
+        from tetris_ai import TetrisAI
+        self.attract_objects = {
+            "game": load_game("TETRIS").TetrisGame(),
+            "ai": TetrisAI(beam_width=2),
+            "piece": None,  # the piece the current target was planned for
+            "target": None  # (rotation, x)
+        }
+        self.current_state = Config.GAME_STATES["ATTRACT"]
+
+    def update_attract(self):
+        if self.player_activity(pygame.mouse.get_pos(), pygame.mouse.get_pressed()[0]):
+            self.menu_idle_since = self.timestep.ticks
+            self.current_state = Config.GAME_STATES["MAIN_MENU"]
+            return
+
+        game = self.attract_objects["game"]
+        if game.game_over:
+            self.start_attract()
+            return
+        piece = game.current_piece
+        if self.attract_objects["piece"] is not piece:
+            self.attract_objects["piece"] = piece
+            self.attract_objects["target"] = self.attract_objects["ai"].best_move(
+                game.board, [piece.name, game.next_piece.name])
+
+        # Steer like a player would: rotate, then shift, then drop fast
+        target = self.attract_objects["target"]
+        game.fall_speed = 500
+        if target is None:
+            pass
+        elif piece.rotation != target[0]:
+            game.rotate_piece()
+        elif piece.x != target[1]:
+            game.move(1 if target[1] > piece.x else -1)
+        else:
+            game.fall_speed = 20
+        game.update(self.timestep.ticks)
+
+    def draw_attract(self):
+        game = self.attract_objects["game"]
+        game.draw_grid(self.screen, 200, 50)
+        game.draw(self.screen, 200, 50, grid=False)
+        self.draw_text("DEMO", 48, 3 * Config.WIDTH // 4, 200, "YELLOW")
+        self.draw_text(f"CPU lines: {game.board.lines}", 32, 3 * Config.WIDTH // 4, 260, "CYAN")
+        self.draw_text("PRESS ANY KEY", 32, 3 * Config.WIDTH // 4, 320, "WHITE")
+
     # High Scores Screen
+    def build_high_scores_ui(self, ui):
+        ui.add("back", RetroButton(Config.WIDTH//2 - 100, Config.HEIGHT - 70, 200, 48, "BACK", "BLUE", "CYAN"))
+
     def update_high_scores(self):
         mouse_pos = pygame.mouse.get_pos()
         mouse_click = pygame.mouse.get_pressed()[0]
-        
-        back_button = RetroButton(Config.WIDTH//2 - 100, Config.HEIGHT - 50, 200, 40, "BACK", "BLUE", "CYAN")
-        back_button.check_hover(mouse_pos)
-        
-        if back_button.is_clicked(mouse_pos, mouse_click):
+
+        if self.ui["HIGH_SCORES"].ensure().update(mouse_pos, mouse_click) == "back":
             self.current_state = Config.GAME_STATES["MAIN_MENU"]
-    
+
     def draw_high_scores(self):
         self.draw_text("HIGH SCORES", 64, Config.WIDTH//2, 80, "YELLOW")
     
-        game_list = ["PONG", "SNAKE", "BREAKOUT", "SPACE_INVADERS", "TETRIS", "ASTEROIDS", "PLATFORMER", "POKEMON"]
         x_positions = [120, 320, 520, 720]
 
         # Use SaveSystem aggregation
         all_scores = self.save_system.get_all_high_scores()
 
-        for col, game in enumerate(game_list[:4]):
-            self.draw_text(game, 24, x_positions[col], 150, "CYAN")
+        # Four games to a row
+        for n, game in enumerate(self.GAME_LIST):
+            x = x_positions[n % 4]
+            y = 150 + n // 4 * 200
+            self.draw_text(game, 24, x, y, "CYAN")
             scores = all_scores.get(game, [])
             for i, score in enumerate(scores[:6]):
                 score_text = f"{i+1}. {score['name']}: {score['score']}"
-                self.draw_text(score_text, 20, x_positions[col], 180 + i * 28, "WHITE")
+                self.draw_text(score_text, 20, x, y + 30 + i * 28, "WHITE")
 
-        for col, game in enumerate(game_list[4:]):
-            self.draw_text(game, 24, x_positions[col], 350, "CYAN")
-            scores = all_scores.get(game, [])
-            for i, score in enumerate(scores[:6]):
-                score_text = f"{i+1}. {score['name']}: {score['score']}"
-                self.draw_text(score_text, 20, x_positions[col], 380 + i * 28, "WHITE")
-
-        back_button = RetroButton(Config.WIDTH//2 - 100, Config.HEIGHT - 70, 200, 48, "BACK", "BLUE", "CYAN")
-        back_button.draw(self.screen)
+        self.ui["HIGH_SCORES"].ensure().draw(self.screen)
 
     # Game Over Screen
     def update_game_over(self):
         keys = pygame.key.get_pressed()
         if keys[pygame.K_ESCAPE] or keys[pygame.K_RETURN]:
             # Save score if it's high enough
-            if self.score > 0:
-                # Check if score qualifies for high scores
-                game_name = ""
-                if self.current_state == Config.GAME_STATES["PONG"]:
-                    game_name = "PONG"
-                elif self.current_state == Config.GAME_STATES["SNAKE"]:
-                    game_name = "SNAKE"
-                elif self.current_state == Config.GAME_STATES["BREAKOUT"]:
-                    game_name = "BREAKOUT"
-                elif self.current_state == Config.GAME_STATES["SPACE_INVADERS"]:
-                    game_name = "SPACE_INVADERS"
-                elif self.current_state == Config.GAME_STATES["TETRIS"]:
-                    game_name = "TETRIS"
-                elif self.current_state == Config.GAME_STATES["ASTEROIDS"]:
-                    game_name = "ASTEROIDS"
-                elif self.current_state == Config.GAME_STATES["PLATFORMER"]:
-                    game_name = "PLATFORMER"
-                elif self.current_state == Config.GAME_STATES["POKEMON"]:
-                    game_name = "POKEMON"
-                
-                if game_name:
-                    # Show high score input if score is in top 10
-                    high_scores = self.save_system.data["high_scores"].get(game_name, [])
-                    if len(high_scores) < 10 or self.score > high_scores[-1]["score"]:
-                        self.get_high_score_name(game_name)
-                    else:
-                        self.save_system.update_player_stats(self.player_name, self.score)
+            if self.score > 0 and self.last_game:
+                # Show high score input if score is in top 10
+                if self.save_system.qualifies(self.last_game, self.score):
+                    self.get_high_score_name(self.last_game)
+                else:
+                    # Still logged so rank queries count every score
+                    self.save_system.add_high_score(self.last_game, self.player_name, self.score)
+                    self.save_system.update_player_stats(self.player_name, self.score)
+                self.refresh_player_data()
                 
             self.current_state = Config.GAME_STATES["MAIN_MENU"]
 
     def get_high_score_name(self, game_name):
         name = self.player_name
         input_active = True
-        font = pygame.font.Font(None, 36)
         
         while input_active:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_RETURN:
                         input_active = False
@@ -1636,739 +1070,40 @@ class GameEngine:
             pygame.draw.rect(self.screen, Config.COLORS["WHITE"], input_rect, 2)
             
             # Draw text
-            name_surface = font.render(name, True, Config.COLORS["WHITE"])
+            name_surface = text_cache.render(name, 36, Config.COLORS["WHITE"])
             self.screen.blit(name_surface, (input_rect.x + 10, input_rect.y + 10))
             
             self.draw_text("Press ENTER to continue", 24, Config.WIDTH//2, Config.HEIGHT//2 + 120, "YELLOW")
             
-            pygame.display.flip()
+            self.target.present()
             self.clock.tick(Config.FPS)
         
         # Save high score
         self.save_system.add_high_score(game_name, name, self.score)
         self.save_system.update_player_stats(self.player_name, self.score)
+        self.refresh_player_data()
 
     def draw_game_over(self):
         self.draw_text("GAME OVER", 72, Config.WIDTH//2, Config.HEIGHT//2 - 50, "RED")
         self.draw_text(f"Final Score: {self.score}", 48, Config.WIDTH//2, Config.HEIGHT//2 + 20, "YELLOW")
+        if self.score > 0 and self.last_game:
+            key = (self.last_game, self.score)
+            if self.game_over_rank is None or self.game_over_rank[0] != key:
+                self.game_over_rank = (key, self.save_system.rank_for(*key))
+            rank, total = self.game_over_rank[1]
+            self.draw_text(f"Rank #{rank} of {total}", 28, Config.WIDTH//2, Config.HEIGHT//2 + 60, "CYAN")
         self.draw_text("Press ESC or ENTER to continue", 36, Config.WIDTH//2, Config.HEIGHT//2 + 100, "WHITE")
 
-    # Game initialization methods
-    def init_pong(self):
-        boundaries = self.get_boundaries()
-        self.pong_objects = {
-            "boundaries": boundaries,
-            "paddle1": Paddle(boundaries.left + 10, boundaries.centery - 50, 15, 100, "BLUE", 7),
-            "paddle2": Paddle(boundaries.right - 25, boundaries.centery - 50, 15, 100, "RED", 7),
-            "ball": RoundBall(Config.WIDTH//2, Config.HEIGHT//2, 8, "WHITE", 5)
-        }
-        self.score = 0
-
-    def init_snake(self):
-        boundaries = self.get_boundaries()
-        self.snake_objects = {
-            "boundaries": boundaries,
-            "snake": Snake(),
-            "food": Food(boundaries)
-        }
-        self.score = 0
-
-    def init_breakout(self):
-        boundaries = self.get_boundaries()
-        paddle = Paddle(boundaries.centerx - 50, boundaries.bottom - 20, 100, 15, "BLUE", 8)
-        ball = BreakoutBall(boundaries.centerx, boundaries.bottom - 40, 8, "WHITE", 5)
-
-        # Create bricks
-        bricks = []
-        brick_width = 70
-        brick_height = 20
-        brick_colors = ["RED", "GREEN", "BLUE", "YELLOW", "PURPLE"]
-
-        for row in range(5):
-            for col in range(10):
-                x = boundaries.left + col * (brick_width + 5)
-                y = boundaries.top + row * (brick_height + 5)
-                color = brick_colors[row]
-                bricks.append(Brick(x, y, brick_width, brick_height, color))
-
-        self.breakout_objects = {
-            "boundaries": boundaries,
-            "paddle": paddle,
-            "ball": ball,
-            "bricks": bricks
-        }
-        self.score = 0
-
-    def init_space_invaders(self):
-        boundaries = self.get_boundaries()
-        player = PlayerShip(boundaries.centerx - 25, boundaries.bottom - 40, 50, 30, "GREEN", 5)
-
-        invaders = []
-        invader_size = 30
-        for row in range(5):
-            for col in range(10):
-                x = boundaries.left + col * (invader_size + 10)
-                y = boundaries.top + row * (invader_size + 10)
-                color = "RED" if row % 2 == 0 else "YELLOW"
-                invaders.append(Invader(x, y, invader_size, color))
-
-        self.space_invaders_objects = {
-            "boundaries": boundaries,
-            "player": player,
-            "invaders": invaders,
-            "player_bullets": [],
-            "invader_bullets": [],
- "invader_direction": 1,
-            "invader_speed": 1,
-            "last_invader_shot": pygame.time.get_ticks(),
-            "invader_shot_delay": 1000
-        }
-        self.score = 0
-
-    def init_tetris(self):
-        self.tetris_objects = {
-            "game": TetrisGame(),
-            "last_update": pygame.time.get_ticks()
-        }
-        self.score = 0
-
-    def init_asteroids(self):
-        ship = AsteroidsShip(Config.WIDTH//2, Config.HEIGHT//2)
-        asteroids = [Asteroid(random.randint(0, Config.WIDTH), random.randint(0, Config.HEIGHT), 
-                            random.randint(20, 50), random.uniform(1, 3)) for _ in range(5)]
-        
-        self.asteroids_objects = {
-            "ship": ship,
-            "asteroids": asteroids,
-            "score": 0
-        }
-        self.score = 0
-
-    def init_platformer(self):
-        player = PlatformerPlayer(100, 100)
-        
-        # Create platforms
-        platforms = [
-            Platform(0, Config.HEIGHT - 50, Config.WIDTH, 50),  # Ground
-            Platform(100, 400, 200, 20),
-            Platform(400, 300, 200, 20),
-            Platform(200, 200, 150, 20),
-            Platform(500, 150, 100, 20)
-        ]
-        
-        # Create enemies
-        enemies = [
-            Enemy(300, Config.HEIGHT - 80),
-            Enemy(500, 250),
-            Enemy(150, 350)
-        ]
-        
-        # Create coins
-        coins = [
-            Coin(150, 350),
-            Coin(450, 250),
-            Coin(250, 150),
-            Coin(550, 100)
-        ]
-        
-        self.platformer_objects = {
-            "player": player,
-            "platforms": platforms,
-            "enemies": enemies,
-            "coins": coins,
-            "camera_x": 0
-        }
-        self.score = 0
-
-    def init_pokemon(self):
-        player = PokemonPlayer(Config.WIDTH//2, Config.HEIGHT//2)
-        
-        # Start with a basic pokemon
-        starter_pokemon = Pokemon("CHARMA", "FIRE", 5)
-        player.pokemon.append(starter_pokemon)
-        player.current_pokemon = starter_pokemon
-        
-        self.pokemon_objects = {
-            "player": player,
-            "map_objects": [],
-            "in_battle": False,
-            "battle": None
-        }
-        self.score = 0
-
-
-
-    # Game update methods
-    def update_pong(self):
-        keys = pygame.key.get_pressed()
-        boundaries = self.pong_objects["boundaries"]
-        paddle1 = self.pong_objects["paddle1"]
-        paddle2 = self.pong_objects["paddle2"]
-        ball = self.pong_objects["ball"]
-
-        # Player 1 controls (W/S)
-        if keys[pygame.K_w]:
-            paddle1.move("UP", boundaries)
-        if keys[pygame.K_s]:
-            paddle1.move("DOWN", boundaries)
-
-        # Player 2 controls or AI
-        if self.game_mode == "PVP":
-            if keys[pygame.K_UP]:
-                paddle2.move("UP", boundaries)
-            if keys[pygame.K_DOWN]:
-                paddle2.move("DOWN", boundaries)
-        else:  # AI mode
-            paddle2.ai_move(ball, boundaries)
-
-        # Update ball
-        if ball.update([paddle1, paddle2], boundaries):
-            sound_system.play("beep3")
-
-        # Update score
-        self.score = paddle1.score
-
-        # Check win condition (reduced from 10 to 5 points)
-        if paddle1.score >= 5 or paddle2.score >= 5:
-            # Save score before game over
-            if self.player_name:
-                self.save_system.add_high_score("PONG", self.player_name, self.score)
-            self.current_state = Config.GAME_STATES["GAME_OVER"]    
-
-
-
-
-
-    def draw_pong(self):
-        boundaries = self.pong_objects["boundaries"]
-        paddle1 = self.pong_objects["paddle1"]
-        paddle2 = self.pong_objects["paddle2"]
-        ball = self.pong_objects["ball"]
-
-        # Draw boundaries
-        pygame.draw.rect(self.screen, Config.COLORS["WHITE"], boundaries, 2)
-
-        # Draw center line
-        pygame.draw.line(self.screen, Config.COLORS["WHITE"], (Config.WIDTH//2, boundaries.top), (Config.WIDTH//2, boundaries.bottom), 1)
-
-        # Draw paddles and ball
-        paddle1.draw(self.screen)
-        paddle2.draw(self.screen)
-        ball.draw(self.screen)
-
-        # Draw scores
-        self.draw_text(str(paddle1.score), 48, Config.WIDTH//4, 30)
-        self.draw_text(str(paddle2.score), 48, 3*Config.WIDTH//4, 30)
-
-        # Draw game mode
-        self.draw_text(f"Mode: {self.game_mode}", 24, Config.WIDTH//2, 30)
-
-    def update_snake(self):
-        keys = pygame.key.get_pressed()
-        snake = self.snake_objects["snake"]
-        food = self.snake_objects["food"]
-        boundaries = self.snake_objects["boundaries"]
-
-        # Change direction (prevent 180-degree turns)
-        if keys[pygame.K_UP] and snake.direction != "DOWN":
-            snake.direction = "UP"
-        elif keys[pygame.K_DOWN] and snake.direction != "UP":
-            snake.direction = "DOWN"
-        elif keys[pygame.K_LEFT] and snake.direction != "RIGHT":
-            snake.direction = "LEFT"
-        elif keys[pygame.K_RIGHT] and snake.direction != "LEFT":
-            snake.direction = "RIGHT"
-
-        # Move snake
-        snake.move()
-
-        # Check for collisions
-        if snake.check_collision(boundaries):
-            self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-        # Check if snake ate food
-        if snake.check_food(food):
-            food.respawn()
-            # Make sure food doesn't spawn on snake
-            while any(food.rect.colliderect(segment) for segment in snake.body):
-                food.respawn()
-
-        # Control game speed for snake
-        pygame.time.delay(100)
-
-        # Update score
-        self.score = snake.score
-
-    def draw_snake(self):
-        boundaries = self.snake_objects["boundaries"]
-        snake = self.snake_objects["snake"]
-        food = self.snake_objects["food"]
-
-        # Draw boundaries
-        pygame.draw.rect(self.screen, Config.COLORS["WHITE"], boundaries, 2)
-
-        # Draw snake and food
-        snake.draw(self.screen)
-        food.draw(self.screen)
-
-        # Draw score
-        self.draw_text(f"Score: {snake.score}", 36, Config.WIDTH//2, 30)
-
-    def update_breakout(self):
-        keys = pygame.key.get_pressed()
-        boundaries = self.breakout_objects["boundaries"]
-        paddle = self.breakout_objects["paddle"]
-        ball = self.breakout_objects["ball"]
-        bricks = self.breakout_objects["bricks"]
-
-        # Move paddle
-        if keys[pygame.K_LEFT]:
-            paddle.move("LEFT", boundaries)
-        if keys[pygame.K_RIGHT]:
-            paddle.move("RIGHT", boundaries)
-
-        # Update ball
-        if ball.update(paddle, bricks, boundaries):
-            paddle.score += 10
-
-        # Check if ball is lost
-        if ball.rect.top > boundaries.bottom:
-            ball.reset()
-            paddle.score = max(0, paddle.score - 5)  # Penalty for missing ball
-
-        # Update score
-        self.score = paddle.score
-
-        # Check if all bricks are destroyed
-        if all(brick.destroyed for brick in bricks):
-            self.score += 1000  # Bonus for completing level
-            self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-        # Check if player lost all points
-        if paddle.score < 0:
-            self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-    def draw_breakout(self):
-        boundaries = self.breakout_objects["boundaries"]
-        paddle = self.breakout_objects["paddle"]
-        ball = self.breakout_objects["ball"]
-        bricks = self.breakout_objects["bricks"]
-
-        # Draw boundaries
-        pygame.draw.rect(self.screen, Config.COLORS["WHITE"], boundaries, 2)
-
-        # Draw paddle, ball, and bricks
-        paddle.draw(self.screen)
-        ball.draw(self.screen)
-        for brick in bricks:
-            brick.draw(self.screen)
-
-        # Draw score
-        self.draw_text(f"Score: {paddle.score}", 36, Config.WIDTH//2, 30)
-
-    def update_space_invaders(self):
-        keys = pygame.key.get_pressed()
-        current_time = pygame.time.get_ticks()
-        
-        boundaries = self.space_invaders_objects["boundaries"]
-        player = self.space_invaders_objects["player"]
-        invaders = self.space_invaders_objects["invaders"]
-        player_bullets = self.space_invaders_objects["player_bullets"]
-        invader_bullets = self.space_invaders_objects["invader_bullets"]
-        invader_direction = self.space_invaders_objects["invader_direction"]
-        invader_speed = self.space_invaders_objects["invader_speed"]
-        last_invader_shot = self.space_invaders_objects["last_invader_shot"]
-        invader_shot_delay = self.space_invaders_objects["invader_shot_delay"]
-
-        # Move player
-        if keys[pygame.K_LEFT]:
-            player.move("LEFT", boundaries)
-        if keys[pygame.K_RIGHT]:
-            player.move("RIGHT", boundaries)
-
-        # Shoot bullet
-        if keys[pygame.K_SPACE]:
-            # Limit firing rate
-            if not player_bullets or current_time - getattr(self, 'last_shot', 0) > 500:
-                bullet = Bullet(
-                    player.rect.centerx - 2,
-                    player.rect.top,
-                    4, 10, "CYAN", -7
-                )
-                player_bullets.append(bullet)
-                self.last_shot = current_time
-
-        # Move invaders
-        move_down = False
-        for invader in invaders:
-            if invader.alive:
-                invader.rect.x += invader_direction * invader_speed
-
-                # Check if any invader hits the boundary
-                if (invader.rect.right >= boundaries.right and invader_direction > 0) or \
-                   (invader.rect.left <= boundaries.left and invader_direction < 0):
-                    move_down = True
-
-        # Move invaders down and change direction if needed
-        if move_down:
-            invader_direction *= -1
-            for invader in invaders:
-                if invader.alive:
-                    invader.rect.y += 20
-
-        # Invaders shoot randomly
-        if current_time - last_invader_shot > invader_shot_delay and invaders:
-            # Select a random alive invader to shoot
-            alive_invaders = [inv for inv in invaders if inv.alive]
-            if alive_invaders:
-                shooter = random.choice(alive_invaders)
-                bullet = Bullet(
-                    shooter.rect.centerx - 2,
-                    shooter.rect.bottom,
-                    4, 10, "RED", 5
-                )
-                invader_bullets.append(bullet)
-                self.space_invaders_objects["last_invader_shot"] = current_time
-
-        # Update player bullets
-        for bullet in player_bullets[:]:
-            bullet.update(boundaries)
-            if not bullet.active:
-                player_bullets.remove(bullet)
-                continue
-
-            # Check for collision with invaders
-            for invader in invaders:
-                if invader.alive and bullet.rect.colliderect(invader.rect):
-                    invader.alive = False
-                    bullet.active = False
-                    player.score += 10
-                    if bullet in player_bullets:
-                        player_bullets.remove(bullet)
-                    break
-
-        # Update invader bullets
-        for bullet in invader_bullets[:]:
-            bullet.update(boundaries)
-            if not bullet.active:
-                invader_bullets.remove(bullet)
-                continue
-
-            # Check for collision with player
-            if bullet.rect.colliderect(player.rect):
-                player.lives -= 1
-                bullet.active = False
-                if bullet in invader_bullets:
-                    invader_bullets.remove(bullet)
-
-                if player.lives <= 0:
-                    self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-        # Check if all invaders are destroyed
-        if all(not invader.alive for invader in invaders):
-            player.score += 1000  # Bonus for clearing level
-            self.score = player.score
-            self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-        # Check if invaders reached the bottom
-        for invader in invaders:
-            if invader.alive and invader.rect.bottom >= player.rect.top:
-                self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-        # Update the objects back
-        self.space_invaders_objects.update({
-            "player_bullets": player_bullets,
-            "invader_bullets": invader_bullets,
-            "invader_direction": invader_direction
-        })
-
-        # Update score
-        self.score = player.score
-
-    def draw_space_invaders(self):
-        boundaries = self.space_invaders_objects["boundaries"]
-        player = self.space_invaders_objects["player"]
-        invaders = self.space_invaders_objects["invaders"]
-        player_bullets = self.space_invaders_objects["player_bullets"]
-        invader_bullets = self.space_invaders_objects["invader_bullets"]
-
-        # Draw boundaries
-        pygame.draw.rect(self.screen, Config.COLORS["WHITE"], boundaries, 2)
-
-        # Draw player, invaders, and bullets
-        player.draw(self.screen)
-        for invader in invaders:
-            invader.draw(self.screen)
-        for bullet in player_bullets + invader_bullets:
-            bullet.draw(self.screen)
-
-        # Draw score and lives
-        self.draw_text(f"Score: {player.score}", 36, Config.WIDTH//4, 30)
-        self.draw_text(f"Lives: {player.lives}", 36, 3*Config.WIDTH//4, 30)
-
-    def update_tetris(self):
-        keys = pygame.key.get_pressed()
-        game = self.tetris_objects["game"]
-        current_time = pygame.time.get_ticks()
-
-        # Handle input
-        if keys[pygame.K_LEFT]:
-            game.move(-1)
-        if keys[pygame.K_RIGHT]:
-            game.move(1)
-        if keys[pygame.K_DOWN]:
-            game.fall_speed = 100  # Speed up falling when down is pressed
-        else:
-            game.fall_speed = 500
-
-        if keys[pygame.K_UP]:
-            game.rotate_piece()
-
-        # Update game
-        game.update(current_time)
-
-        # Update score
-        self.score = game.score
-
-        # Check for game over
-        if game.game_over:
-            self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-    def draw_tetris(self):
-        game = self.tetris_objects["game"]
-        
-        # Draw game board
-        game.draw(self.screen, 200, 50)
-        
-        # Draw score and next piece label
-        self.draw_text(f"Score: {game.score}", 36, Config.WIDTH//2, 30)
-        self.draw_text("Next Piece:", 24, 500, 70, "WHITE")
-
-    def update_asteroids(self):
-        keys = pygame.key.get_pressed()
-        ship = self.asteroids_objects["ship"]
-        asteroids = self.asteroids_objects["asteroids"]
-
-        # Handle ship controls
-        if keys[pygame.K_LEFT]:
-            ship.rotate(-1)
-        if keys[pygame.K_RIGHT]:
-            ship.rotate(1)
-        if keys[pygame.K_UP]:
-            ship.accelerate()
-        if keys[pygame.K_DOWN]:
-            ship.decelerate()
-        if keys[pygame.K_SPACE]:
-            if not hasattr(self, 'last_shot_asteroids') or pygame.time.get_ticks() - self.last_shot_asteroids > 200:
-                ship.shoot()
-                self.last_shot_asteroids = pygame.time.get_ticks()
-
-        # Update ship
-        ship.update()
-
-        # Update asteroids
-        for asteroid in asteroids:
-            asteroid.update()
-
-        # Check collisions between bullets and asteroids
-        for bullet in ship.bullets[:]:
-            for asteroid in asteroids[:]:
-                # Simple distance-based collision
-                distance = math.sqrt((bullet['x'] - asteroid.x)**2 + (bullet['y'] - asteroid.y)**2)
-                if distance < asteroid.size:
-                    ship.bullets.remove(bullet)
-                    asteroids.remove(asteroid)
-                    self.asteroids_objects["score"] += 100
-                    
-                    # Create smaller asteroids if the original was large enough
-                    if asteroid.size > 25:
-                        for _ in range(2):
-                            new_asteroid = Asteroid(asteroid.x, asteroid.y, asteroid.size//2, asteroid.speed * 1.5)
-                            asteroids.append(new_asteroid)
-                    break
-
-        # Check collisions between ship and asteroids
-        for asteroid in asteroids:
-            distance = math.sqrt((ship.x - asteroid.x)**2 + (ship.y - asteroid.y)**2)
-            if distance < asteroid.size + 15:  # 15 is roughly the ship size
-                ship.lives -= 1
-                asteroids.remove(asteroid)
-                if ship.lives <= 0:
-                    self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-        # Add new asteroids if there are too few
-        while len(asteroids) < 5:
-            asteroids.append(Asteroid(random.randint(0, Config.WIDTH), random.randint(0, Config.HEIGHT), 
-                                    random.randint(20, 50), random.uniform(1, 3)))
-
-        # Update score
-        self.score = self.asteroids_objects["score"]
-
-    def draw_asteroids(self):
-        ship = self.asteroids_objects["ship"]
-        asteroids = self.asteroids_objects["asteroids"]
-
-        # Draw ship and asteroids
-        ship.draw(self.screen)
-        for asteroid in asteroids:
-            asteroid.draw(self.screen)
-
-        # Draw score and lives
-        self.draw_text(f"Score: {self.asteroids_objects['score']}", 36, Config.WIDTH//4, 30)
-        self.draw_text(f"Lives: {ship.lives}", 36, 3*Config.WIDTH//4, 30)
-
-    def update_platformer(self):
-        keys = pygame.key.get_pressed()
-        player = self.platformer_objects["player"]
-        platforms = self.platformer_objects["platforms"]
-        enemies = self.platformer_objects["enemies"]
-        coins = self.platformer_objects["coins"]
-
-        # Handle input
-        player.velocity.x = 0
-        if keys[pygame.K_LEFT]:
-            player.velocity.x = -player.speed
-            player.facing_right = False
-        if keys[pygame.K_RIGHT]:
-            player.velocity.x = player.speed
-            player.facing_right = True
-        if keys[pygame.K_SPACE]:
-            player.jump()
-
-        # Update game objects
-        still_alive = player.update(platforms, enemies, coins)
-
-        # Update enemies
-        for enemy in enemies:
-            enemy.update(platforms)
-
-        # Update score
-        self.score = player.score
-
-        # Check if game over
-        if not still_alive:
-            self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-        # Check if level complete (all coins collected)
-        if len(coins) == 0:
-            self.score += 1000  # Level completion bonus
-            self.current_state = Config.GAME_STATES["GAME_OVER"]
-
-    def draw_platformer(self):
-        player = self.platformer_objects["player"]
-        platforms = self.platformer_objects["platforms"]
-        enemies = self.platformer_objects["enemies"]
-        coins = self.platformer_objects["coins"]
-
-        # Draw platforms
-        for platform in platforms:
-            platform.draw(self.screen)
-
-        # Draw enemies
-        for enemy in enemies:
-            enemy.draw(self.screen)
-
-        # Draw coins
-        for coin in coins:
-            coin.draw(self.screen)
-
-        # Draw player
-        player.draw(self.screen)
-
-        # Draw HUD
-        self.draw_text(f"Score: {player.score}", 36, 100, 30, "WHITE")
-        self.draw_text(f"Coins: {player.coins}", 36, 300, 30, "YELLOW")
-        self.draw_text(f"Lives: {player.lives}", 36, 500, 30, "RED")
-
-    def update_pokemon(self):
-        keys = pygame.key.get_pressed()
-        player = self.pokemon_objects["player"]
-        
-        if not self.pokemon_objects["in_battle"]:
-            # Handle movement
-            if keys[pygame.K_UP]:
-                player.move("UP", self.get_boundaries())
-            elif keys[pygame.K_DOWN]:
-                player.move("DOWN", self.get_boundaries())
-            elif keys[pygame.K_LEFT]:
-                player.move("LEFT", self.get_boundaries())
-            elif keys[pygame.K_RIGHT]:
-                player.move("RIGHT", self.get_boundaries())
-            
-            # Random encounter
-            if random.random() < 0.01:  # 1% chance per frame
-                wild_pokemon = random.choice([
-                    Pokemon("BULBA", "GRASS", random.randint(3, 7)),
-                    Pokemon("SQUIRT", "WATER", random.randint(3, 7)),
-                    Pokemon("PIKA", "ELECTRIC", random.randint(3, 7))
-                ])
-                self.pokemon_objects["battle"] = PokemonBattle(player.current_pokemon, wild_pokemon)
-                self.pokemon_objects["in_battle"] = True
-        else:
-            # Battle logic
-            battle = self.pokemon_objects["battle"]
-            battle.update()
-            
-            # Handle battle input
-            if keys[pygame.K_1]:
-                battle.selected_move = 0
-            elif keys[pygame.K_2]:
-                battle.selected_move = 1
-            elif keys[pygame.K_3]:
-                battle.selected_move = 2
-            
-            if keys[pygame.K_RETURN]:
-                if battle.selected_move < len(battle.player_pokemon.moves):
-                    battle.select_move(battle.selected_move)
-                else:
-                    battle.try_catch()
-            
-            # Check battle result
-            if battle.result:
-                if battle.result == "WIN":
-                    self.score += battle.wild_pokemon.level * 100
-                    sound_system.play("powerup")
-                elif battle.result == "CATCH":
-                    player.pokemon.append(battle.wild_pokemon)
-                    self.score += battle.wild_pokemon.level * 200
-                    sound_system.play("powerup")
-                
-                self.pokemon_objects["in_battle"] = False
-                # Return to overworld after a short delay
-                pygame.time.delay(1000)
-
-    def draw_pokemon(self):
-        player = self.pokemon_objects["player"]
-        
-        if not self.pokemon_objects["in_battle"]:
-            # Draw overworld
-            player.draw(self.screen)
-            
-            # Draw player stats
-            self.draw_text(f"Pokemon: {len(player.pokemon)}", 24, 100, 30, "WHITE")
-            self.draw_text(f"Badges: {player.badges}", 24, 300, 30, "YELLOW")
-            self.draw_text("Walk around to find Pokemon!", 24, Config.WIDTH//2, Config.HEIGHT - 30, "GREEN")
-        else:
-            # Draw battle
-            battle = self.pokemon_objects["battle"]
-            battle.draw(self.screen)
-            
-            # Draw battle instructions
-            self.draw_text("Use 1-2 to select moves, 3 to catch, ENTER to confirm", 20, Config.WIDTH//2, Config.HEIGHT - 50, "WHITE")
-    
     def draw_player_select(self):
         # Title
         self.draw_text("RETRO ARCADE MEGA COLLECTION", 64, Config.WIDTH//2, 140, "CYAN")
         self.draw_text("1980s EDITION", 48, Config.WIDTH//2, 190, "YELLOW")
 
-        # Draw select/new user buttons (visual only; update_player_select handles hover/click logic)
-        select_button = RetroButton(Config.WIDTH//2 - 190, Config.HEIGHT//2 - 40, 180, 56, "SELECT USER", "CYAN", "YELLOW")
-        new_button = RetroButton(Config.WIDTH//2 + 10, Config.HEIGHT//2 - 40, 180, 56, "NEW USER", "GREEN", "YELLOW")
-        select_button.draw(self.screen)
-        new_button.draw(self.screen)
+        # Draw select/new user buttons (update_player_select handles hover/click logic)
+        self.ui["PLAYER_SELECT"].ensure().draw(self.screen)
 
         # Show currently selected player (if any)
         if self.player_name:
             self.draw_text(f"Current: {self.player_name}", 28, Config.WIDTH//2, Config.HEIGHT//2 + 80, "WHITE")
         else:
-            self.draw_text("No user selected", 28, Config.WIDTH//2, Config.HEIGHT//2 + 80, "GRAY")
\ No newline at end of file
+            self.draw_text("No user selected", 28, Config.WIDTH//2, Config.HEIGHT//2 + 80, "GRAY")
@@ -0,0 +1,52 @@
+"""Game registry.
+
+Each game is a module in this package providing these hooks, each called
+with the GameEngine:
+
+    init(engine)       start a new game, keeping its objects on the engine
+    update(engine)     one fixed simulation step
+    draw(engine)       draw a frame
+    teardown(engine)   drop the game's objects once the player has left it
+
+and optionally draw_playfield(engine, surface), the static layer that
+dirty-rect mode (Config.DIRTY_RECTS) caches and only redraws on demand.
+KEYS lists the keys the game reads, for random input in headless runs.
+
+Games are registered here by name, in menu order, and only imported the
+first time one is selected, so starting the arcade pays for the menus
+alone. A new game is a module plus a register() call: the menus, save
+files, game states and headless runner all read GAMES.
+"""
+import importlib
+
+GAMES = []  # names, in menu order
+MODULES = {}  # name -> module path
+UNLOCK_SCORES = {}  # name -> total score that unlocks it; the others are unlocked from the start
+
+
+def register(name, module, unlock_score=None):
+    if name not in MODULES:
+        GAMES.append(name)
+    MODULES[name] = module
+    if unlock_score is not None:
+        UNLOCK_SCORES[name] = unlock_score
+
+
+def load(name):
+    """The module for game `name`, imported on first use."""
+    return importlib.import_module(MODULES[name])
+
+
+def starters():
+    """Games a new player can pick before unlocking any."""
+    return [name for name in GAMES if name not in UNLOCK_SCORES]
+
+
+register("PONG", "games.pong")
+register("SNAKE", "games.snake")
+register("BREAKOUT", "games.breakout")
+register("SPACE_INVADERS", "games.space_invaders", unlock_score=5000)
+register("TETRIS", "games.tetris", unlock_score=10000)
+register("ASTEROIDS", "games.asteroids", unlock_score=20000)
+register("PLATFORMER", "games.platformer", unlock_score=50000)
+register("POKEMON", "games.pokemon", unlock_score=100000)
@@ -0,0 +1,223 @@
+"""Asteroids: a wrapping ship and pooled asteroids and bullets."""
+import math
+
+import pygame
+
+from broadphase import SpatialHash
+from entities import EntityPool
+from game_engine import Config, rng
+
+# Keys the game reads
+KEYS = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_SPACE]
+
+
+class AsteroidField:
+    """All the asteroids, kept in one EntityPool (radius is the size).
+
+    Each slot also has its 8 outline vertices, relative to the centre, in
+    pool.shape, and its speed in pool.speed. `grid` is the broadphase the
+    bullets are tested against, rebuilt every step.
+    """
+    def __init__(self):
+        self.pool = EntityPool(64, bounds=(0, 0, Config.WIDTH, Config.HEIGHT), wrap=True,
+                               fields={"shape": (8, 2), "speed": ()})
+        self.grid = SpatialHash(64)
+
+    def __len__(self):
+        return self.pool.count
+
+    def spawn(self, x, y, size, speed):
+        angle = rng.uniform(0, 2 * math.pi)
+        i = self.pool.spawn(x, y, math.cos(angle) * speed, math.sin(angle) * speed, radius=size)
+        self.pool.speed[i] = speed
+        shape = self.pool.shape[i]
+        for k in range(8):
+            angle = 2 * math.pi * k / 8
+            distance = size + rng.uniform(-size/3, size/3)
+            shape[k] = (math.cos(angle) * distance, math.sin(angle) * distance)
+        return i
+
+    def spawn_random(self):
+        return self.spawn(rng.randint(0, Config.WIDTH), rng.randint(0, Config.HEIGHT),
+                          rng.randint(20, 50), rng.uniform(1, 3))
+
+    def update(self):
+        self.pool.update()
+
+    def draw(self, surface):
+        pool = self.pool
+        live = pool.indices()
+        outlines = pool.shape[live]
+        outlines[:, :, 0] += pool.x[live, None]
+        outlines[:, :, 1] += pool.y[live, None]
+        for points in outlines.tolist():
+            pygame.draw.polygon(surface, Config.COLORS["WHITE"], points, 2)
+
+
+class AsteroidsShip:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.angle = 0
+        self.speed = 0
+        self.rotation_speed = 5
+        self.acceleration = 0.1
+        self.max_speed = 5
+        self.bullets = EntityPool(16, bounds=(0, 0, Config.WIDTH, Config.HEIGHT), wrap=True)
+        self.lives = 3
+
+    def rotate(self, direction):
+        self.angle += direction * self.rotation_speed
+
+    def accelerate(self):
+        self.speed += self.acceleration
+        if self.speed > self.max_speed:
+            self.speed = self.max_speed
+
+    def decelerate(self):
+        self.speed -= self.acceleration
+        if self.speed < 0:
+            self.speed = 0
+
+    def shoot(self):
+        angle = math.radians(self.angle)
+        self.bullets.spawn(self.x + math.cos(angle) * 20, self.y + math.sin(angle) * 20,
+                           math.cos(angle) * 10, math.sin(angle) * 10, life=60)  # frames
+
+    def update(self):
+        # Update position
+        self.x += math.cos(math.radians(self.angle)) * self.speed
+        self.y += math.sin(math.radians(self.angle)) * self.speed
+        
+        # Wrap around screen
+        if self.x < 0: self.x = Config.WIDTH
+        if self.x > Config.WIDTH: self.x = 0
+        if self.y < 0: self.y = Config.HEIGHT
+        if self.y > Config.HEIGHT: self.y = 0
+        
+        # Move, wrap and expire the bullets in one pass
+        self.bullets.update()
+
+    def draw(self, surface):
+        # Draw ship
+        points = [
+            (self.x + math.cos(math.radians(self.angle)) * 20, 
+             self.y + math.sin(math.radians(self.angle)) * 20),
+            (self.x + math.cos(math.radians(self.angle + 150)) * 15, 
+             self.y + math.sin(math.radians(self.angle + 150)) * 15),
+            (self.x + math.cos(math.radians(self.angle - 150)) * 15, 
+             self.y + math.sin(math.radians(self.angle - 150)) * 15)
+        ]
+        pygame.draw.polygon(surface, Config.COLORS["WHITE"], points, 2)
+        
+        # Draw bullets
+        live = self.bullets.indices()
+        for x, y in zip(self.bullets.x[live].tolist(), self.bullets.y[live].tolist()):
+            pygame.draw.circle(surface, Config.COLORS["WHITE"], (int(x), int(y)), 2)
+
+
+def init(engine):
+    ship = AsteroidsShip(Config.WIDTH//2, Config.HEIGHT//2)
+    asteroids = AsteroidField()
+    for _ in range(5):
+        asteroids.spawn_random()
+
+    engine.asteroids_objects = {
+        "ship": ship,
+        "asteroids": asteroids,
+        "particles": EntityPool(128, bounds=(0, 0, Config.WIDTH, Config.HEIGHT)),
+        "score": 0
+    }
+    engine.score = 0
+
+
+def destroy_asteroid(engine, x, y, size, speed):
+    engine.asteroids_objects["score"] += 100
+
+    # Create smaller asteroids if the original was large enough
+    if size > 25:
+        for _ in range(2):
+            engine.asteroids_objects["asteroids"].spawn(x, y, size//2, speed * 1.5)
+
+    # Debris: a fixed ring of short-lived particles
+    particles = engine.asteroids_objects["particles"]
+    for k in range(12):
+        angle = 2 * math.pi * k / 12
+        particles.spawn(x, y, math.cos(angle) * 2, math.sin(angle) * 2, life=20)
+
+
+def update(engine):
+    keys = engine.input.get_pressed()
+    ship = engine.asteroids_objects["ship"]
+    asteroids = engine.asteroids_objects["asteroids"]
+    particles = engine.asteroids_objects["particles"]
+
+    # Handle ship controls
+    if keys[pygame.K_LEFT]:
+        ship.rotate(-1)
+    if keys[pygame.K_RIGHT]:
+        ship.rotate(1)
+    if keys[pygame.K_UP]:
+        ship.accelerate()
+    if keys[pygame.K_DOWN]:
+        ship.decelerate()
+    if keys[pygame.K_SPACE]:
+        if not hasattr(engine, 'last_shot_asteroids') or engine.timestep.ticks - engine.last_shot_asteroids > 200:
+            ship.shoot()
+            engine.last_shot_asteroids = engine.timestep.ticks
+
+    # Update ship
+    ship.update()
+
+    # Update asteroids and explosion debris
+    asteroids.update()
+    particles.update()
+
+    # Check collisions between bullets and asteroids through the asteroid
+    # grid; each hitting bullet takes the first asteroid still alive.
+    # Fragments spawn afterwards, so they cannot reuse a slot mid-loop.
+    field = asteroids.pool
+    bullets = ship.bullets
+    destroyed = []
+    for shot, i in bullets.contacts(field, asteroids.grid):
+        if bullets.alive[shot] and field.alive[i]:
+            bullets.kill(shot)
+            field.kill(i)
+            destroyed.append((field.x[i], field.y[i], field.radius[i], field.speed[i]))
+    for x, y, size, speed in destroyed:
+        destroy_asteroid(engine, float(x), float(y), float(size), float(speed))
+
+    # Check collisions between ship and asteroids (15 is roughly the ship size)
+    for i in field.overlapping(ship.x, ship.y, 15).tolist():
+        ship.lives -= 1
+        field.kill(i)
+        if ship.lives <= 0:
+            engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+    # Add new asteroids if there are too few
+    while len(asteroids) < 5:
+        asteroids.spawn_random()
+
+    # Update score
+    engine.score = engine.asteroids_objects["score"]
+
+
+def draw(engine):
+    ship = engine.asteroids_objects["ship"]
+    asteroids = engine.asteroids_objects["asteroids"]
+
+    # Draw ship, asteroids and debris
+    ship.draw(engine.screen)
+    asteroids.draw(engine.screen)
+    particles = engine.asteroids_objects["particles"]
+    live = particles.indices()
+    for x, y in zip(particles.x[live].tolist(), particles.y[live].tolist()):
+        engine.screen.fill(Config.COLORS["WHITE"], (x, y, 2, 2))
+
+    # Draw score and lives
+    engine.draw_text(f"Score: {engine.asteroids_objects['score']}", 36, Config.WIDTH//4, 30)
+    engine.draw_text(f"Lives: {ship.lives}", 36, 3*Config.WIDTH//4, 30)
+
+
+def teardown(engine):
+    engine.asteroids_objects = {}
@@ -0,0 +1,301 @@
+"""Breakout with a grid-indexed brick wall (classic or generated, see Config.BREAKOUT_GRID)."""
+import math
+import random
+
+import pygame
+
+from game_engine import Config, Paddle, rng, sound_system
+
+# Keys the game reads
+KEYS = [pygame.K_LEFT, pygame.K_RIGHT]
+
+
+class BreakoutBall:
+    def __init__(self, x, y, radius, color, speed):
+        self.rect = pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
+        self.radius = radius
+        self.color = Config.COLORS[color] if isinstance(color, str) else color
+        self.speed_x = 0
+        self.speed_y = -speed  # Start moving upward
+        self.base_speed = speed
+
+    def reset(self):
+        self.rect.center = (Config.WIDTH // 2, Config.HEIGHT // 2 + 100)
+        self.speed_x = rng.choice([-self.base_speed, self.base_speed])
+        self.speed_y = -self.base_speed  # Always start moving up
+
+    def update(self, paddle, bricks, boundaries):
+        """Move one step; returns the screen rect of the brick broken, if any."""
+        # Brick collision, swept along the whole move so a fast ball cannot pass through a brick
+        broken = None
+        hit = bricks.sweep(self.rect, self.speed_x, self.speed_y)
+        if hit:
+            t, axis, cell = hit
+            self.rect.topleft = (round(self.rect.x + self.speed_x * t), round(self.rect.y + self.speed_y * t))
+            if axis == "x":
+                self.speed_x *= -1
+            else:
+                self.speed_y *= -1
+            broken = bricks.break_cell(cell)
+            sound_system.play("beep3")
+        else:
+            self.rect.x += self.speed_x
+            self.rect.y += self.speed_y
+
+        # Boundary collision
+        if self.rect.left <= boundaries.left or self.rect.right >= boundaries.right:
+            self.speed_x *= -1
+            sound_system.play("beep1")
+
+        if self.rect.top <= boundaries.top:
+            self.speed_y *= -1
+            sound_system.play("beep1")
+
+        # Paddle collision
+        if self.rect.colliderect(paddle.rect):
+            self.speed_y = -abs(self.speed_y)  # Always bounce upward
+            # Adjust angle based on where ball hits paddle
+            relative_intersect_x = (paddle.rect.centerx - self.rect.centerx) / (paddle.rect.width / 2)
+            self.speed_x = -relative_intersect_x * 5
+            sound_system.play("beep2")
+
+        return broken
+
+    def dirty_rect(self):
+        # The drawn circle can reach one pixel past rect
+        return self.rect.inflate(2, 2)
+
+    def draw(self, surface):
+        pygame.draw.circle(surface, self.color, self.rect.center, self.radius)
+
+
+class BrickField:
+    """A wall of bricks on a grid, drawn from a cached surface.
+
+    `layout` is a list of rows, each a list of color names (None for a gap).
+    Brick (col, row) is cell row * cols + col; `alive` is a bytearray over
+    the cells and `remaining` counts the bricks left, so finding the brick
+    under a point is a division and "level cleared" is one comparison. The
+    intact wall is drawn once into `surface`, and break_cell() just cuts a
+    brick out of it.
+    """
+    BLANK = (0, 0, 0)  # colorkey for holes in the cached surface
+
+    def __init__(self, left, top, layout, brick_width, brick_height, gap=5):
+        self.left = left
+        self.top = top
+        self.rows = len(layout)
+        self.cols = max((len(row) for row in layout), default=0)
+        self.brick_width = brick_width
+        self.brick_height = brick_height
+        self.pitch_x = brick_width + gap
+        self.pitch_y = brick_height + gap
+        self.colors = []
+        self.alive = bytearray(self.cols * self.rows)
+        for r in range(self.rows):
+            for c in range(self.cols):
+                name = layout[r][c] if c < len(layout[r]) else None
+                self.colors.append(Config.COLORS[name] if isinstance(name, str) else name)
+                self.alive[r * self.cols + c] = name is not None
+        self.remaining = sum(self.alive)
+        self.rect = pygame.Rect(left, top, max(0, self.cols * self.pitch_x - gap), max(0, self.rows * self.pitch_y - gap))
+
+        self.surface = pygame.Surface(self.rect.size)
+        self.surface.fill(self.BLANK)
+        self.surface.set_colorkey(self.BLANK)
+        white = Config.COLORS["WHITE"]
+        for cell, color in enumerate(self.colors):
+            if self.alive[cell]:
+                rect = self.cell_rect(cell).move(-left, -top)
+                pygame.draw.rect(self.surface, color, rect)
+                pygame.draw.rect(self.surface, white, rect, 1)
+
+    def __len__(self):
+        return self.remaining
+
+    def cell_rect(self, cell):
+        row, col = divmod(cell, self.cols)
+        return pygame.Rect(self.left + col * self.pitch_x, self.top + row * self.pitch_y,
+                           self.brick_width, self.brick_height)
+
+    def cell_at(self, x, y):
+        """Cell of the live brick under point (x, y), or None (gaps between bricks included)."""
+        col, dx = divmod(x - self.left, self.pitch_x)
+        row, dy = divmod(y - self.top, self.pitch_y)
+        if not (0 <= col < self.cols and 0 <= row < self.rows) or dx >= self.brick_width or dy >= self.brick_height:
+            return None
+        cell = int(row) * self.cols + int(col)
+        return cell if self.alive[cell] else None
+
+    def break_cell(self, cell):
+        """Remove a brick; returns its screen rect (the region to repaint)."""
+        rect = self.cell_rect(cell)
+        if self.alive[cell]:
+            self.alive[cell] = 0
+            self.remaining -= 1
+            self.surface.fill(self.BLANK, rect.move(-self.left, -self.top))
+        return rect
+
+    def sweep(self, rect, dx, dy):
+        """First brick hit by `rect` moving (dx, dy) this step.
+
+        Returns (t, axis, cell), where t in [0, 1) is the fraction of the move
+        made before contact and axis is "x" or "y" for the face hit, or None.
+        Only the cells under the swept box are tested, so a fast ball cannot
+        skip over a brick between two frames.
+        """
+        x, y, w, h = rect
+        if not self.remaining or not self.cols:
+            return None
+        c0 = max(0, int((min(x, x + dx) - self.left) // self.pitch_x))
+        c1 = min(self.cols - 1, int((max(x, x + dx) + w - self.left) // self.pitch_x))
+        r0 = max(0, int((min(y, y + dy) - self.top) // self.pitch_y))
+        r1 = min(self.rows - 1, int((max(y, y + dy) + h - self.top) // self.pitch_y))
+        best = None
+        alive = self.alive
+        for row in range(r0, r1 + 1):
+            top = self.top + row * self.pitch_y
+            for col in range(c0, c1 + 1):
+                cell = row * self.cols + col
+                if not alive[cell]:
+                    continue
+                left = self.left + col * self.pitch_x
+                # Ray from the moving rect's corner against the brick grown by its size
+                hit = sweep_box(x, y, dx, dy, left - w, top - h, left + self.brick_width, top + self.brick_height)
+                if hit and (best is None or hit[0] < best[0]):
+                    best = hit + (cell,)
+        return best
+
+    def draw(self, surface):
+        surface.blit(self.surface, self.rect)
+
+
+def sweep_box(x, y, dx, dy, left, top, right, bottom):
+    """(t, axis) where the point (x, y) moving (dx, dy) enters the open box, or None.
+
+    A point already inside reports t = 0 on the "y" axis.
+    """
+    if dx:
+        t1 = (left - x) / dx
+        t2 = (right - x) / dx
+        x_enter, x_exit = (t1, t2) if t1 < t2 else (t2, t1)
+    elif left < x < right:
+        x_enter, x_exit = -math.inf, math.inf
+    else:
+        return None
+    if dy:
+        t1 = (top - y) / dy
+        t2 = (bottom - y) / dy
+        y_enter, y_exit = (t1, t2) if t1 < t2 else (t2, t1)
+    elif top < y < bottom:
+        y_enter, y_exit = -math.inf, math.inf
+    else:
+        return None
+    enter = max(x_enter, y_enter)
+    if enter >= min(x_exit, y_exit) or enter >= 1 or min(x_exit, y_exit) <= 0:
+        return None
+    if enter < 0:
+        return 0.0, "y"
+    return enter, "x" if x_enter > y_enter else "y"
+
+
+def generate_layout(cols, rows, seed=0, fill=0.85):
+    """A random symmetric brick wall with colored bands, for large generated levels."""
+    level_rng = random.Random(seed)
+    bands = ["RED", "ORANGE", "YELLOW", "GREEN", "CYAN", "BLUE", "PURPLE", "PINK"]
+    layout = []
+    for r in range(rows):
+        color = bands[r * len(bands) // rows]
+        half = [color if level_rng.random() < fill else None for _ in range((cols + 1) // 2)]
+        layout.append(half + half[:cols // 2][::-1])
+    return layout
+
+
+def init(engine):
+    boundaries = engine.get_boundaries()
+    paddle = Paddle(boundaries.centerx - 50, boundaries.bottom - 20, 100, 15, "BLUE", 8)
+    ball = BreakoutBall(boundaries.centerx, boundaries.bottom - 40, 8, "WHITE", 5)
+
+    # Create bricks: the classic 10 x 5 wall, or a generated one filling the top half
+    if Config.BREAKOUT_GRID:
+        cols, rows = Config.BREAKOUT_GRID
+        gap = 5 if cols <= 20 else 1
+        brick_width = (boundaries.width - 20 - gap * (cols - 1)) // cols
+        brick_height = min(20, (boundaries.height // 2 - gap * (rows - 1)) // rows)
+        layout = generate_layout(cols, rows, seed=rng.getrandbits(32))
+        bricks = BrickField(boundaries.left + 10, boundaries.top + 10, layout, brick_width, brick_height, gap)
+    else:
+        brick_colors = ["RED", "GREEN", "BLUE", "YELLOW", "PURPLE"]
+        layout = [[color] * 10 for color in brick_colors]
+        bricks = BrickField(boundaries.left, boundaries.top, layout, 70, 20)
+
+    engine.breakout_objects = {
+        "boundaries": boundaries,
+        "paddle": paddle,
+        "ball": ball,
+        "bricks": bricks
+    }
+    engine.score = 0
+
+
+def update(engine):
+    keys = engine.input.get_pressed()
+    boundaries = engine.breakout_objects["boundaries"]
+    paddle = engine.breakout_objects["paddle"]
+    ball = engine.breakout_objects["ball"]
+    bricks = engine.breakout_objects["bricks"]
+
+    # Move paddle
+    if keys[pygame.K_LEFT]:
+        paddle.move("LEFT", boundaries)
+    if keys[pygame.K_RIGHT]:
+        paddle.move("RIGHT", boundaries)
+
+    # Update ball
+    broken = ball.update(paddle, bricks, boundaries)
+    if broken:
+        paddle.score += 10
+        engine.renderer.patch_static(broken, engine.draw_static_playfield)
+
+    # Check if ball is lost
+    if ball.rect.top > boundaries.bottom:
+        ball.reset()
+        paddle.score = max(0, paddle.score - 5)  # Penalty for missing ball
+
+    # Update score
+    engine.score = paddle.score
+
+    # Check if all bricks are destroyed
+    if not bricks.remaining:
+        engine.score += 1000  # Bonus for completing level
+        engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+    # Check if player lost all points
+    if paddle.score < 0:
+        engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+
+def draw_playfield(engine, surface):
+    # Draw boundaries and the remaining bricks
+    pygame.draw.rect(surface, Config.COLORS["WHITE"], engine.breakout_objects["boundaries"], 2)
+    engine.breakout_objects["bricks"].draw(surface)
+
+
+def draw(engine):
+    paddle = engine.breakout_objects["paddle"]
+    ball = engine.breakout_objects["ball"]
+
+    if not engine.dirty_mode:
+        draw_playfield(engine, engine.screen)
+
+    # Draw paddle and ball
+    paddle.draw(engine.screen)
+    ball.draw(engine.screen)
+    engine.mark_dirty(paddle.rect, ball.dirty_rect())
+
+    # Draw score
+    engine.draw_text(f"Score: {paddle.score}", 36, Config.WIDTH//2, 30)
+
+
+def teardown(engine):
+    engine.breakout_objects = {}
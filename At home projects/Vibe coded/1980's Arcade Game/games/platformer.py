@@ -0,0 +1,232 @@
+"""Side-scrolling platformer over a tile map (see tilemap.py and Config.PLATFORMER_LEVEL)."""
+import pygame
+
+from game_engine import Config, rng, sound_system
+from tilemap import ChunkCache, Level, generate_level, load_level
+
+# Keys the game reads
+KEYS = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE]
+
+
+class PlatformerPlayer:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 30, 50)
+        self.start = self.rect.topleft
+        self.velocity = pygame.math.Vector2(0, 0)
+        self.speed = 5
+        self.jump_power = 12
+        self.gravity = 0.5
+        self.is_jumping = False
+        self.facing_right = True
+        self.lives = 3
+        self.score = 0
+        self.coins = 0
+        
+    def update(self, tilemap, enemies, coins):
+        """Move through the level; enemies and coins are the per-chunk lists near the player."""
+        # Apply gravity
+        self.velocity.y += self.gravity
+        
+        # Move, stopping at solid tiles
+        on_ground = False
+        hit_x, hit_y = tilemap.move(self.rect, int(self.velocity.x), int(self.velocity.y))
+        if hit_y:
+            on_ground = self.velocity.y > 0  # landed (otherwise bumped a ceiling)
+            self.velocity.y = 0
+        
+        # Check enemy collisions
+        for chunk in enemies:
+            for enemy in chunk[:]:
+                if self.rect.colliderect(enemy.rect):
+                    # Jumping on enemy
+                    if self.velocity.y > 0 and self.rect.bottom < enemy.rect.top + 10:
+                        chunk.remove(enemy)
+                        self.velocity.y = -self.jump_power * 0.7
+                        self.score += 100
+                        sound_system.play("beep2")
+                    else:
+                        self.lose_life()
+                        sound_system.play("explosion")
+                        return self.lives > 0
+        
+        # Check coin collisions
+        for chunk in coins:
+            for coin in chunk[:]:
+                if self.rect.colliderect(coin.rect):
+                    chunk.remove(coin)
+                    self.coins += 1
+                    self.score += 50
+                    sound_system.play("powerup")
+        
+        # Reset jumping state
+        if on_ground:
+            self.is_jumping = False
+        
+        # Falling out of the level costs a life
+        if self.rect.top > tilemap.height:
+            self.lose_life()
+        
+        return self.lives > 0
+
+    def lose_life(self):
+        self.lives -= 1
+        self.rect.topleft = self.start
+        self.velocity = pygame.math.Vector2(0, 0)
+    
+    def jump(self):
+        if not self.is_jumping:
+            self.velocity.y = -self.jump_power
+            self.is_jumping = True
+            sound_system.play("beep1")
+    
+    def draw(self, surface, camera_x=0):
+        # Draw player as a simple character
+        rect = self.rect.move(-camera_x, 0)
+        color = Config.COLORS["RED"] if self.facing_right else Config.COLORS["PINK"]
+        pygame.draw.rect(surface, color, rect)
+        
+        # Draw eyes
+        eye_x = rect.right - 10 if self.facing_right else rect.left + 10
+        pygame.draw.circle(surface, Config.COLORS["WHITE"], (eye_x, rect.top + 15), 5)
+
+
+class Enemy:
+    def __init__(self, x, y, speed=2):
+        self.rect = pygame.Rect(x, y, 40, 30)
+        self.speed = speed
+        self.direction = 1
+    
+    def update(self, tilemap):
+        # Walk until a wall or the edge of the ground, then turn round
+        hit_x, _ = tilemap.move(self.rect, self.speed * self.direction, 0)
+        tile = tilemap.tile
+        ahead = (self.rect.right if self.direction > 0 else self.rect.left - 1) // tile
+        if hit_x or not tilemap.is_solid(ahead, self.rect.bottom // tile):
+            self.direction *= -1
+    
+    def draw(self, surface, camera_x=0):
+        rect = self.rect.move(-camera_x, 0)
+        pygame.draw.rect(surface, Config.COLORS["GREEN"], rect)
+        # Draw spikes
+        for i in range(3):
+            x = rect.left + 10 + i * 10
+            points = [(x, rect.top), (x + 5, rect.top - 10), (x + 10, rect.top)]
+            pygame.draw.polygon(surface, Config.COLORS["RED"], points)
+
+
+class Coin:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 20, 20)
+    
+    def draw(self, surface, camera_x=0):
+        center = (self.rect.centerx - camera_x, self.rect.centery)
+        pygame.draw.circle(surface, Config.COLORS["YELLOW"], center, 10)
+        pygame.draw.circle(surface, Config.COLORS["ORANGE"], center, 7)
+
+
+def init(engine):
+    if isinstance(Config.PLATFORMER_LEVEL, int):
+        level = Level(generate_level(Config.PLATFORMER_LEVEL, seed=rng.getrandbits(32)))
+    else:
+        level = load_level(Config.PLATFORMER_LEVEL)
+    x, y = level.start
+    player = PlatformerPlayer(x, y - 50)
+
+    # Enemies and coins are kept per chunk so only the ones near the camera are visited
+    enemies = {chunk: [Enemy(x, y - 30) for x, y in spawns] for chunk, spawns in level.enemies.items()}
+    coins = {chunk: [Coin(x + 6, y + 6) for x, y in spawns] for chunk, spawns in level.coins.items()}
+
+    engine.platformer_objects = {
+        "player": player,
+        "tilemap": level.tilemap,
+        "chunks": ChunkCache(level.tilemap, Config.COLORS["BROWN"], Config.WIDTH),
+        "enemies": enemies,
+        "coins": coins,
+        "total_coins": sum(len(chunk) for chunk in coins.values()),
+        "camera_x": 0
+    }
+    engine.score = 0
+
+
+def update(engine):
+    keys = engine.input.get_pressed()
+    player = engine.platformer_objects["player"]
+    tilemap = engine.platformer_objects["tilemap"]
+    enemies = engine.platformer_objects["enemies"]
+    coins = engine.platformer_objects["coins"]
+
+    # Handle input
+    player.velocity.x = 0
+    if keys[pygame.K_LEFT]:
+        player.velocity.x = -player.speed
+        player.facing_right = False
+    if keys[pygame.K_RIGHT]:
+        player.velocity.x = player.speed
+        player.facing_right = True
+    if keys[pygame.K_SPACE]:
+        player.jump()
+
+    # Update the player against the chunks it can touch
+    chunk = tilemap.chunk_of(player.rect.centerx)
+    near = range(chunk - 1, chunk + 2)
+    still_alive = player.update(tilemap, [enemies[c] for c in near if c in enemies],
+                                [coins[c] for c in near if c in coins])
+
+    # Camera follows the player, clamped to the level
+    camera_x = max(0, min(player.rect.centerx - Config.WIDTH // 2, tilemap.width - Config.WIDTH))
+    engine.platformer_objects["camera_x"] = camera_x
+
+    # Update the enemies in and next to the view; ones that walk into another chunk change lists
+    first = tilemap.chunk_of(camera_x) - 1
+    moved = []
+    for c in range(first, tilemap.chunk_of(camera_x + Config.WIDTH) + 2):
+        for enemy in enemies.get(c, ()):
+            enemy.update(tilemap)
+            if tilemap.chunk_of(enemy.rect.x) != c:
+                moved.append((c, enemy))
+    for c, enemy in moved:
+        enemies[c].remove(enemy)
+        enemies.setdefault(tilemap.chunk_of(enemy.rect.x), []).append(enemy)
+
+    # Update score
+    engine.score = player.score
+
+    # Check if game over
+    if not still_alive:
+        engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+    # Check if level complete (all coins collected)
+    if player.coins == engine.platformer_objects["total_coins"]:
+        engine.score += 1000  # Level completion bonus
+        engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+
+def draw(engine):
+    player = engine.platformer_objects["player"]
+    chunks = engine.platformer_objects["chunks"]
+    enemies = engine.platformer_objects["enemies"]
+    coins = engine.platformer_objects["coins"]
+    camera_x = engine.platformer_objects["camera_x"]
+
+    # Draw the level from the cached chunk surfaces
+    chunks.draw(engine.screen, camera_x)
+
+    # Draw the enemies and coins in the visible chunks (and the one to the left, which can overlap it)
+    visible = chunks.visible(camera_x)
+    for c in range(visible.start - 1, visible.stop):
+        for enemy in enemies.get(c, ()):
+            enemy.draw(engine.screen, camera_x)
+        for coin in coins.get(c, ()):
+            coin.draw(engine.screen, camera_x)
+
+    # Draw player
+    player.draw(engine.screen, camera_x)
+
+    # Draw HUD
+    engine.draw_text(f"Score: {player.score}", 36, 100, 30, "WHITE")
+    engine.draw_text(f"Coins: {player.coins}", 36, 300, 30, "YELLOW")
+    engine.draw_text(f"Lives: {player.lives}", 36, 500, 30, "RED")
+
+
+def teardown(engine):
+    engine.platformer_objects = {}
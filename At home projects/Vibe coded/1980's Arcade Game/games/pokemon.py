@@ -0,0 +1,268 @@
+"""Pokemon-like RPG: walk around, meet wild pokemon and battle or catch them."""
+import pygame
+
+from game_engine import Config, rng, sound_system, text_cache
+from pokemon_data import MOVES, SPECIES, STARTER, TYPES, WILD_LEVELS, WILD_SPECIES, catch_chance
+from pokemon_data import damage as move_damage, stats as pokemon_stats
+
+# Keys the game reads
+KEYS = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_RETURN]
+
+
+class PokemonPlayer:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 40, 40)
+        self.speed = 3
+        self.direction = "DOWN"
+        self.pokemon = []
+        self.current_pokemon = None
+        self.badges = 0
+    
+    def move(self, direction, boundaries):
+        self.direction = direction
+        if direction == "UP" and self.rect.top > boundaries.top:
+            self.rect.y -= self.speed
+        elif direction == "DOWN" and self.rect.bottom < boundaries.bottom:
+            self.rect.y += self.speed
+        elif direction == "LEFT" and self.rect.left > boundaries.left:
+            self.rect.x -= self.speed
+        elif direction == "RIGHT" and self.rect.right < boundaries.right:
+            self.rect.x += self.speed
+    
+    def draw(self, surface):
+        # Draw player as a simple character
+        color = Config.COLORS["RED"]
+        pygame.draw.rect(surface, color, self.rect)
+        
+        # Draw face based on direction
+        if self.direction == "UP":
+            pygame.draw.circle(surface, Config.COLORS["BLACK"], (self.rect.centerx, self.rect.top + 10), 5)
+        elif self.direction == "DOWN":
+            pygame.draw.circle(surface, Config.COLORS["BLACK"], (self.rect.centerx, self.rect.bottom - 10), 5)
+        elif self.direction == "LEFT":
+            pygame.draw.circle(surface, Config.COLORS["BLACK"], (self.rect.left + 10, self.rect.centery), 5)
+        elif self.direction == "RIGHT":
+            pygame.draw.circle(surface, Config.COLORS["BLACK"], (self.rect.right - 10, self.rect.centery), 5)
+
+
+class Pokemon:
+    def __init__(self, name, level=5):
+        # Stats and moves come from the species tables in pokemon_data
+        species = SPECIES[name]
+        self.name = name
+        self.type = species["type"]
+        self.level = level
+        self.max_hp, self.attack, self.defense = pokemon_stats(name, level)
+        self.hp = self.max_hp
+        self.moves = [(move, MOVES[move][1]) for move in species["moves"]]
+        self.color = Config.COLORS[TYPES[self.type]]
+    
+    def draw(self, surface, x, y, size=50):
+        rect = pygame.Rect(x, y, size, size)
+        pygame.draw.rect(surface, self.color, rect)
+        pygame.draw.rect(surface, Config.COLORS["BLACK"], rect, 2)
+        
+        # Draw name and level
+        name_text = text_cache.render(self.name, 20, Config.COLORS["WHITE"])
+        level_text = text_cache.render(f"Lv{self.level}", 20, Config.COLORS["WHITE"])
+        
+        surface.blit(name_text, (x + 5, y + 5))
+        surface.blit(level_text, (x + size - 30, y + 5))
+        
+        # Draw HP bar
+        hp_width = (size - 10) * (self.hp / self.max_hp)
+        pygame.draw.rect(surface, Config.COLORS["RED"], (x + 5, y + size - 15, hp_width, 8))
+
+
+class PokemonBattle:
+    def __init__(self, player_pokemon, wild_pokemon):
+        self.player_pokemon = player_pokemon
+        self.wild_pokemon = wild_pokemon
+        self.state = "SELECT_MOVE"  # SELECT_MOVE, BATTLE, RESULT
+        self.selected_move = 0
+        self.battle_text = []
+        self.text_timer = 0
+        self.result = None  # WIN, LOSE, CATCH
+    
+    def update(self):
+        if self.state == "BATTLE":
+            self.text_timer += 1
+            if self.text_timer > 120:  # 2 seconds
+                self.state = "SELECT_MOVE"
+                self.text_timer = 0
+                
+                # Check if battle should end
+                if self.wild_pokemon.hp <= 0:
+                    self.result = "WIN"
+                    self.battle_text = [f"{self.wild_pokemon.name} fainted!"]
+                elif self.player_pokemon.hp <= 0:
+                    self.result = "LOSE"
+                    self.battle_text = [f"{self.player_pokemon.name} fainted!"]
+    
+    def select_move(self, move_index):
+        if self.state != "SELECT_MOVE":
+            return
+            
+        self.selected_move = move_index
+        move_name, move_power = self.player_pokemon.moves[move_index]
+        
+        # Player attacks
+        damage = int(move_damage(move_power, self.player_pokemon.attack, self.wild_pokemon.defense))
+        self.wild_pokemon.hp -= damage
+        self.battle_text = [f"{self.player_pokemon.name} used {move_name}!", f"It did {damage} damage!"]
+        
+        # Wild pokemon attacks if still alive
+        if self.wild_pokemon.hp > 0:
+            self.wild_attacks()
+        
+        self.state = "BATTLE"
+        self.text_timer = 0
+
+    def wild_attacks(self):
+        wild_move_name, wild_move_power = rng.choice(self.wild_pokemon.moves)
+        wild_damage = int(move_damage(wild_move_power, self.wild_pokemon.attack, self.player_pokemon.defense))
+        self.player_pokemon.hp -= wild_damage
+        self.battle_text.append(f"{self.wild_pokemon.name} used {wild_move_name}!")
+        self.battle_text.append(f"It did {wild_damage} damage!")
+    
+    def try_catch(self):
+        if self.state != "SELECT_MOVE":
+            return
+            
+        # Higher chance to catch if HP is low
+        if rng.random() < catch_chance(self.wild_pokemon.hp, self.wild_pokemon.max_hp):
+            self.result = "CATCH"
+            self.battle_text = [f"Caught {self.wild_pokemon.name}!"]
+        else:
+            self.battle_text = [f"Failed to catch {self.wild_pokemon.name}!"]
+            # Wild pokemon attacks
+            self.wild_attacks()
+        
+        self.state = "BATTLE"
+        self.text_timer = 0
+    
+    def draw(self, surface):
+        # Draw player pokemon
+        self.player_pokemon.draw(surface, 100, 300)
+        
+        # Draw wild pokemon
+        self.wild_pokemon.draw(surface, 500, 100)
+        
+        # Draw battle text
+        for i, text in enumerate(self.battle_text):
+            text_surface = text_cache.render(text, 24, Config.COLORS["WHITE"])
+            surface.blit(text_surface, (50, 400 + i * 30))
+        
+        # Draw move selection if in SELECT_MOVE state
+        if self.state == "SELECT_MOVE":
+            for i, (move_name, move_power) in enumerate(self.player_pokemon.moves):
+                color = Config.COLORS["YELLOW"] if i == self.selected_move else Config.COLORS["WHITE"]
+                move_text = f"{i+1}. {move_name} (Power: {move_power})"
+                text_surface = text_cache.render(move_text, 24, color)
+                surface.blit(text_surface, (50, 450 + i * 30))
+            
+            # Draw catch option
+            catch_color = Config.COLORS["YELLOW"] if self.selected_move == len(self.player_pokemon.moves) else Config.COLORS["WHITE"]
+            catch_text = f"{len(self.player_pokemon.moves)+1}. Try to Catch"
+            text_surface = text_cache.render(catch_text, 24, catch_color)
+            surface.blit(text_surface, (50, 450 + len(self.player_pokemon.moves) * 30))
+
+
+def init(engine):
+    player = PokemonPlayer(Config.WIDTH//2, Config.HEIGHT//2)
+    
+    # Start with a basic pokemon
+    starter_pokemon = Pokemon(*STARTER)
+    player.pokemon.append(starter_pokemon)
+    player.current_pokemon = starter_pokemon
+    
+    engine.pokemon_objects = {
+        "player": player,
+        "map_objects": [],
+        "in_battle": False,
+        "battle": None,
+        "battle_ends_at": None  # sim time (ms) to leave a finished battle
+    }
+    engine.score = 0
+
+
+def update(engine):
+    keys = engine.input.get_pressed()
+    player = engine.pokemon_objects["player"]
+    
+    if not engine.pokemon_objects["in_battle"]:
+        # Handle movement
+        if keys[pygame.K_UP]:
+            player.move("UP", engine.get_boundaries())
+        elif keys[pygame.K_DOWN]:
+            player.move("DOWN", engine.get_boundaries())
+        elif keys[pygame.K_LEFT]:
+            player.move("LEFT", engine.get_boundaries())
+        elif keys[pygame.K_RIGHT]:
+            player.move("RIGHT", engine.get_boundaries())
+        
+        # Random encounter
+        if rng.random() < 0.01:  # 1% chance per frame
+            wild_pokemon = rng.choice([Pokemon(name, rng.randint(*WILD_LEVELS)) for name in WILD_SPECIES])
+            engine.pokemon_objects["battle"] = PokemonBattle(player.current_pokemon, wild_pokemon)
+            engine.pokemon_objects["in_battle"] = True
+    elif engine.pokemon_objects["battle_ends_at"] is not None:
+        # Keep the result on screen for a second, then return to the overworld
+        if engine.timestep.ticks >= engine.pokemon_objects["battle_ends_at"]:
+            engine.pokemon_objects["in_battle"] = False
+            engine.pokemon_objects["battle_ends_at"] = None
+    else:
+        # Battle logic
+        battle = engine.pokemon_objects["battle"]
+        battle.update()
+        
+        # Handle battle input
+        if keys[pygame.K_1]:
+            battle.selected_move = 0
+        elif keys[pygame.K_2]:
+            battle.selected_move = 1
+        elif keys[pygame.K_3]:
+            battle.selected_move = 2
+        
+        if keys[pygame.K_RETURN]:
+            if battle.selected_move < len(battle.player_pokemon.moves):
+                battle.select_move(battle.selected_move)
+            else:
+                battle.try_catch()
+        
+        # Check battle result
+        if battle.result:
+            if battle.result == "WIN":
+                engine.score += battle.wild_pokemon.level * 100
+                sound_system.play("powerup")
+            elif battle.result == "CATCH":
+                player.pokemon.append(battle.wild_pokemon)
+                engine.score += battle.wild_pokemon.level * 200
+                sound_system.play("powerup")
+            
+            # Return to overworld after a short delay
+            engine.pokemon_objects["battle_ends_at"] = engine.timestep.ticks + 1000
+
+
+def draw(engine):
+    player = engine.pokemon_objects["player"]
+    
+    if not engine.pokemon_objects["in_battle"]:
+        # Draw overworld
+        player.draw(engine.screen)
+        
+        # Draw player stats
+        engine.draw_text(f"Pokemon: {len(player.pokemon)}", 24, 100, 30, "WHITE")
+        engine.draw_text(f"Badges: {player.badges}", 24, 300, 30, "YELLOW")
+        engine.draw_text("Walk around to find Pokemon!", 24, Config.WIDTH//2, Config.HEIGHT - 30, "GREEN")
+    else:
+        # Draw battle
+        battle = engine.pokemon_objects["battle"]
+        battle.draw(engine.screen)
+        
+        # Draw battle instructions
+        engine.draw_text("Use 1-2 to select moves, 3 to catch, ENTER to confirm", 20, Config.WIDTH//2, Config.HEIGHT - 50, "WHITE")
+
+
+def teardown(engine):
+    engine.pokemon_objects = {}
@@ -0,0 +1,182 @@
+"""Pong: two paddles and a ball, against the CPU or a second player (PVP mode)."""
+import pygame
+
+from game_engine import Config, Paddle, rng, sound_system
+
+# Keys the game reads
+KEYS = [pygame.K_w, pygame.K_s, pygame.K_UP, pygame.K_DOWN]
+
+
+class RoundBall:
+    def __init__(self, x, y, radius, color, speed, step=1.0):
+        self.rect = pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
+        self.radius = radius
+        self.color = Config.COLORS[color] if isinstance(color, str) else color
+        # Speeds are in pixels per 60 Hz frame; each update covers `step` of one
+        self.step = step
+        self.pos = pygame.math.Vector2(self.rect.topleft)
+        self.prev_pos = pygame.math.Vector2(self.pos)
+        self.speed_x = speed * rng.choice([-1, 1])
+        self.speed_y = rng.uniform(-speed/2, speed/2)
+        self.base_speed = speed
+        self.max_speed = speed * 2  # Add maximum speed limit
+
+    def reset(self):
+        # Serve again from the centre after a point
+        self.rect.center = (Config.WIDTH // 2, Config.HEIGHT // 2)
+        self.pos.update(self.rect.topleft)
+        self.prev_pos.update(self.pos)
+        self.speed_x = self.base_speed * rng.choice([-1, 1])
+        self.speed_y = rng.uniform(-self.base_speed/2, self.base_speed/2)
+
+    def sync_rect(self):
+        self.rect.topleft = (round(self.pos.x), round(self.pos.y))
+
+
+    
+    def update(self, paddles, boundaries):
+            # Store previous position for collision check
+            self.prev_pos.update(self.pos)
+            prev_x, prev_y = self.pos
+
+            # Update position
+            self.pos.x += self.speed_x * self.step
+            self.pos.y += self.speed_y * self.step
+            self.sync_rect()
+
+            # Boundary collision
+            if self.rect.top <= boundaries.top or self.rect.bottom >= boundaries.bottom:
+                self.speed_y *= -1
+                self.pos.y = prev_y  # Restore position to prevent sticking
+                self.sync_rect()
+                sound_system.play("beep1")
+
+            # Paddle collision with speed increase
+            for paddle in paddles:
+                if self.rect.colliderect(paddle.rect):
+                    # Restore position to prevent phasing through
+                    self.pos.x = prev_x
+                    self.sync_rect()
+                    
+                    # Increase speed but cap it
+                    speed_multiplier = 1.05  # Reduced from 1.1
+                    new_speed = abs(self.speed_x) * speed_multiplier
+                    if new_speed > self.max_speed:
+                        new_speed = self.max_speed
+                    
+                    self.speed_x = -new_speed if self.speed_x > 0 else new_speed
+                    
+                    # Adjust angle based on where ball hits paddle
+                    relative_intersect_y = (paddle.rect.centery - self.rect.centery) / (paddle.rect.height / 2)
+                    self.speed_y = -relative_intersect_y * 4  # Reduced from 5
+                    sound_system.play("beep2")
+
+            # Score
+            if self.rect.left <= boundaries.left:
+                paddles[1].score += 1
+                self.reset()
+                return True
+            elif self.rect.right >= boundaries.right:
+                paddles[0].score += 1
+                self.reset()
+                return True
+            return False
+
+
+
+    def draw_rect(self, alpha=1.0):
+        pos = self.prev_pos.lerp(self.pos, alpha)
+        return self.rect.move(round(pos.x) - self.rect.x, round(pos.y) - self.rect.y)
+
+    def dirty_rect(self, alpha=1.0):
+        # The drawn circle can reach one pixel past rect
+        return self.draw_rect(alpha).inflate(2, 2)
+
+    def draw(self, surface, alpha=1.0):
+        pygame.draw.circle(surface, self.color, self.draw_rect(alpha).center, self.radius)
+
+
+def init(engine):
+    boundaries = engine.get_boundaries()
+    step = 60 / engine.sim_rate(Config.GAME_STATES["PONG"])  # speeds below are per 60 Hz frame
+    engine.pong_objects = {
+        "boundaries": boundaries,
+        "paddle1": Paddle(boundaries.left + 10, boundaries.centery - 50, 15, 100, "BLUE", 7, step),
+        "paddle2": Paddle(boundaries.right - 25, boundaries.centery - 50, 15, 100, "RED", 7, step),
+        "ball": RoundBall(Config.WIDTH//2, Config.HEIGHT//2, 8, "WHITE", 5, step)
+    }
+    engine.score = 0
+
+
+def update(engine):
+    keys = engine.input.get_pressed()
+    boundaries = engine.pong_objects["boundaries"]
+    paddle1 = engine.pong_objects["paddle1"]
+    paddle2 = engine.pong_objects["paddle2"]
+    ball = engine.pong_objects["ball"]
+    paddle1.begin_step()
+    paddle2.begin_step()
+
+    # Player 1 controls (W/S)
+    if keys[pygame.K_w]:
+        paddle1.move("UP", boundaries)
+    if keys[pygame.K_s]:
+        paddle1.move("DOWN", boundaries)
+
+    # Player 2 controls or AI
+    if engine.game_mode == "PVP":
+        if keys[pygame.K_UP]:
+            paddle2.move("UP", boundaries)
+        if keys[pygame.K_DOWN]:
+            paddle2.move("DOWN", boundaries)
+    else:  # AI mode
+        paddle2.ai_move(ball, boundaries)
+
+    # Update ball
+    if ball.update([paddle1, paddle2], boundaries):
+        sound_system.play("beep3")
+
+    # Update score
+    engine.score = paddle1.score
+
+    # Check win condition (reduced from 10 to 5 points)
+    if paddle1.score >= 5 or paddle2.score >= 5:
+        # The score is saved from the game-over screen
+        engine.current_state = Config.GAME_STATES["GAME_OVER"]    
+
+
+def draw_playfield(engine, surface):
+    boundaries = engine.pong_objects["boundaries"]
+
+    # Draw boundaries
+    pygame.draw.rect(surface, Config.COLORS["WHITE"], boundaries, 2)
+
+    # Draw center line
+    pygame.draw.line(surface, Config.COLORS["WHITE"], (Config.WIDTH//2, boundaries.top), (Config.WIDTH//2, boundaries.bottom), 1)
+
+
+def draw(engine):
+    paddle1 = engine.pong_objects["paddle1"]
+    paddle2 = engine.pong_objects["paddle2"]
+    ball = engine.pong_objects["ball"]
+
+    if not engine.dirty_mode:
+        draw_playfield(engine, engine.screen)
+
+    # Draw paddles and ball between the last two simulation steps
+    alpha = engine.timestep.alpha
+    paddle1.draw(engine.screen, alpha)
+    paddle2.draw(engine.screen, alpha)
+    ball.draw(engine.screen, alpha)
+    engine.mark_dirty(paddle1.draw_rect(alpha), paddle2.draw_rect(alpha), ball.dirty_rect(alpha))
+
+    # Draw scores
+    engine.draw_text(str(paddle1.score), 48, Config.WIDTH//4, 30)
+    engine.draw_text(str(paddle2.score), 48, 3*Config.WIDTH//4, 30)
+
+    # Draw game mode
+    engine.draw_text(f"Mode: {engine.game_mode}", 24, Config.WIDTH//2, 30)
+
+
+def teardown(engine):
+    engine.pong_objects = {}
@@ -0,0 +1,214 @@
+"""Snake on a grid of 20-pixel cells."""
+from collections import deque
+
+import pygame
+
+from game_engine import Config, rng
+
+# Keys the game reads
+KEYS = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+
+
+class Snake:
+    """Snake on a grid of CELL-pixel cells inside the playfield.
+
+    Cells are numbered row * cols + col. The body is a deque of cells (head
+    first) backed by an occupancy bytearray, and the empty cells are kept in
+    `free` (with each cell's position in `free_index`) so they can be added
+    and removed by swapping. Moving, self-collision and food placement are
+    O(1) however long the snake gets.
+    """
+    CELL = 20
+    START = (100, 100)  # top-left of the first segment, in pixels
+    STEPS = {"UP": (0, -1), "DOWN": (0, 1), "LEFT": (-1, 0), "RIGHT": (1, 0)}
+
+    def __init__(self, boundaries):
+        cell = self.CELL
+        # Snap the grid to the start position; only whole cells inside the walls are playable
+        self.left = boundaries.left + (self.START[0] - boundaries.left) % cell
+        self.top = boundaries.top + (self.START[1] - boundaries.top) % cell
+        self.cols = (boundaries.right - self.left) // cell
+        self.rows = (boundaries.bottom - self.top) // cell
+        self.reset()
+
+    def reset(self):
+        size = self.cols * self.rows
+        self.occupied = bytearray(size)
+        self.free = list(range(size))
+        self.free_index = list(range(size))
+        self.body = deque()
+        self.direction = "RIGHT"
+        self.grow = False
+        self.score = 0
+        self.alive = True
+        self.add_head(self.cell_at(*self.START))
+
+    def cell_at(self, x, y):
+        return (y - self.top) // self.CELL * self.cols + (x - self.left) // self.CELL
+
+    def cell_rect(self, cell):
+        row, col = divmod(cell, self.cols)
+        return pygame.Rect(self.left + col * self.CELL, self.top + row * self.CELL, self.CELL, self.CELL)
+
+    def add_head(self, cell):
+        self.occupied[cell] = 1
+        # Swap-remove the cell from the free list
+        i = self.free_index[cell]
+        last = self.free.pop()
+        if last != cell:
+            self.free[i] = last
+            self.free_index[last] = i
+        self.body.appendleft(cell)
+
+    def remove_tail(self):
+        cell = self.body.pop()
+        self.occupied[cell] = 0
+        self.free_index[cell] = len(self.free)
+        self.free.append(cell)
+
+    def move(self):
+        """Step the head one cell; clears `alive` instead if it hits a wall or the body."""
+        row, col = divmod(self.body[0], self.cols)
+        dx, dy = self.STEPS[self.direction]
+        col += dx
+        row += dy
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            self.alive = False
+            return
+        # The tail moves out first, so following it closely is allowed
+        if self.grow:
+            self.grow = False
+        else:
+            self.remove_tail()
+        head = row * self.cols + col
+        if self.occupied[head]:
+            self.alive = False
+            return
+        self.add_head(head)
+
+    def check_collision(self):
+        return not self.alive
+
+    def check_food(self, food):
+        if self.body[0] == food.cell:
+            self.grow = True
+            self.score += 10
+            return True
+        return False
+
+    def random_free_cell(self):
+        """A uniformly chosen empty cell, or None when the snake fills the board."""
+        if not self.free:
+            return None
+        return self.free[rng.randrange(len(self.free))]
+
+    def draw(self, surface):
+        rects = []
+        color = Config.COLORS["GREEN"]
+        for cell in self.body:
+            rect = self.cell_rect(cell)
+            pygame.draw.rect(surface, color, rect)
+            pygame.draw.rect(surface, Config.COLORS["WHITE"], rect, 1)
+            rects.append(rect)
+            color = Config.COLORS["BLUE"]
+        return rects
+
+
+class Food:
+    def __init__(self, snake):
+        self.cell = None
+        self.rect = pygame.Rect(0, 0, Snake.CELL, Snake.CELL)
+        self.respawn(snake)
+
+    def respawn(self, snake):
+        """Move to a random empty cell; cell is None if there is none left."""
+        self.cell = snake.random_free_cell()
+        if self.cell is not None:
+            self.rect = snake.cell_rect(self.cell)
+
+    def draw(self, surface):
+        if self.cell is not None:
+            pygame.draw.rect(surface, Config.COLORS["RED"], self.rect)
+
+
+SNAKE_TURNS = [(pygame.K_UP, "UP"), (pygame.K_DOWN, "DOWN"), (pygame.K_LEFT, "LEFT"), (pygame.K_RIGHT, "RIGHT")]
+
+
+OPPOSITE = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
+
+
+def init(engine):
+    boundaries = engine.get_boundaries()
+    snake = Snake(boundaries)
+    engine.snake_objects = {
+        "boundaries": boundaries,
+        "snake": snake,
+        "food": Food(snake),
+        "turns": []  # queued arrow-key taps
+    }
+    engine.score = 0
+
+
+def update(engine):
+    keys = engine.input.get_pressed()
+    snake = engine.snake_objects["snake"]
+    food = engine.snake_objects["food"]
+
+    # Change direction (prevent 180-degree turns): one latched tap per
+    # step, otherwise whichever arrow is held. Snake only steps 10 times
+    # a second, so taps between steps are queued.
+    turns = engine.snake_objects["turns"]
+    for tap in engine.input.taps():
+        for key, direction in SNAKE_TURNS:
+            if tap == key and len(turns) < 3:
+                turns.append(direction)
+    if turns:
+        wanted = [turns.pop(0)]
+    else:
+        wanted = [direction for key, direction in SNAKE_TURNS if keys[key]]
+    for direction in wanted:
+        if direction != OPPOSITE[snake.direction]:
+            snake.direction = direction
+            break
+
+    # Move snake
+    snake.move()
+
+    # Check for collisions
+    if snake.check_collision():
+        engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+    # Check if snake ate food; the new food goes on a free cell
+    if snake.check_food(food):
+        food.respawn(snake)
+        if food.cell is None:
+            # The snake fills the board
+            engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+    # Update score
+    engine.score = snake.score
+
+
+def draw_playfield(engine, surface):
+    # Draw boundaries
+    pygame.draw.rect(surface, Config.COLORS["WHITE"], engine.snake_objects["boundaries"], 2)
+
+
+def draw(engine):
+    snake = engine.snake_objects["snake"]
+    food = engine.snake_objects["food"]
+
+    if not engine.dirty_mode:
+        draw_playfield(engine, engine.screen)
+
+    # Draw snake and food
+    body_rects = snake.draw(engine.screen)
+    food.draw(engine.screen)
+    engine.mark_dirty(food.rect, *body_rects)
+
+    # Draw score
+    engine.draw_text(f"Score: {snake.score}", 36, Config.WIDTH//2, 30)
+
+
+def teardown(engine):
+    engine.snake_objects = {}
@@ -0,0 +1,288 @@
+"""Space Invaders: waves of a marching formation (see Config.INVADER_WAVES)."""
+import pygame
+
+from entities import EntityPool
+from game_engine import Config, rng
+
+# Keys the game reads
+KEYS = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE]
+
+
+class InvaderFormation:
+    """The invader block as one object: a grid of cells moved by a single offset.
+
+    Invader (col, row) is cell row * cols + col, drawn at (x, y) plus its
+    grid position. Per-column and per-row alive counts keep the bounding
+    box of the live invaders and the bottom invader of each column (the
+    only ones that shoot) up to date as invaders die, so moving, edge and
+    landing checks and picking a shooter do not visit every invader. The
+    formation is drawn once into `surface` and blitted at the offset; a
+    kill cuts the invader out of it.
+    """
+    BLANK = (0, 0, 0)  # colorkey for dead invaders in the cached surface
+
+    def __init__(self, x, y, cols, rows, size=30, spacing=10, colors=("RED", "YELLOW")):
+        self.x = float(x)
+        self.y = float(y)
+        self.cols = cols
+        self.rows = rows
+        self.size = size
+        self.pitch = size + spacing
+        self.alive = bytearray([1]) * (cols * rows)
+        self.count = cols * rows
+        self.column_alive = [rows] * cols
+        self.row_alive = [cols] * rows
+        self.bottom = [rows - 1] * cols  # lowest live row per column (-1 when empty)
+        self.columns = list(range(cols))  # columns with an invader left
+        self.bounds = (0, 0, cols - 1, rows - 1)  # live (first col, first row, last col, last row)
+
+        self.surface = pygame.Surface((cols * self.pitch - spacing, rows * self.pitch - spacing))
+        self.surface.fill(self.BLANK)
+        self.surface.set_colorkey(self.BLANK)
+        for row in range(rows):
+            color = Config.COLORS[colors[row % len(colors)]]
+            for col in range(cols):
+                self.surface.fill(color, (col * self.pitch, row * self.pitch, size, size))
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def rect(self):
+        """Screen bounding box of the live invaders."""
+        c0, r0, c1, r1 = self.bounds
+        return pygame.Rect(round(self.x) + c0 * self.pitch, round(self.y) + r0 * self.pitch,
+                           (c1 - c0) * self.pitch + self.size, (r1 - r0) * self.pitch + self.size)
+
+    def move(self, dx, dy=0):
+        self.x += dx
+        self.y += dy
+
+    def cell_rect(self, cell):
+        row, col = divmod(cell, self.cols)
+        return pygame.Rect(round(self.x) + col * self.pitch, round(self.y) + row * self.pitch, self.size, self.size)
+
+    def hit(self, left, top, width, height):
+        """A live invader overlapping the rect, or None. Only the cells under it are tested."""
+        x = left - round(self.x)
+        y = top - round(self.y)
+        pitch = self.pitch
+        c0, r0 = max(0, int(x // pitch)), max(0, int(y // pitch))
+        c1, r1 = min(self.cols - 1, int((x + width) // pitch)), min(self.rows - 1, int((y + height) // pitch))
+        for row in range(r1, r0 - 1, -1):  # bottom first: bullets come from below
+            for col in range(c0, c1 + 1):
+                cell = row * self.cols + col
+                if self.alive[cell] and x < col * pitch + self.size and col * pitch < x + width \
+                        and y < row * pitch + self.size and row * pitch < y + height:
+                    return cell
+        return None
+
+    def kill(self, cell):
+        if not self.alive[cell]:
+            return
+        row, col = divmod(cell, self.cols)
+        self.alive[cell] = 0
+        self.count -= 1
+        self.surface.fill(self.BLANK, (col * self.pitch, row * self.pitch, self.size, self.size))
+        self.column_alive[col] -= 1
+        self.row_alive[row] -= 1
+        if not self.column_alive[col]:
+            self.bottom[col] = -1
+            self.columns.remove(col)
+        elif self.bottom[col] == row:
+            while not self.alive[self.bottom[col] * self.cols + col]:
+                self.bottom[col] -= 1
+        c0, r0, c1, r1 = self.bounds
+        if self.count and (not self.column_alive[col] and col in (c0, c1) or not self.row_alive[row] and row in (r0, r1)):
+            # An edge column or row emptied: shrink the box
+            while not self.column_alive[c0]:
+                c0 += 1
+            while not self.column_alive[c1]:
+                c1 -= 1
+            while not self.row_alive[r0]:
+                r0 += 1
+            while not self.row_alive[r1]:
+                r1 -= 1
+            self.bounds = (c0, r0, c1, r1)
+
+    def shooter(self, rng):
+        """Cell of a random column's bottom invader, or None when all are dead."""
+        if not self.columns:
+            return None
+        col = rng.choice(self.columns)
+        return self.bottom[col] * self.cols + col
+
+    def draw(self, surface):
+        surface.blit(self.surface, (round(self.x), round(self.y)))
+
+
+class PlayerShip:
+    def __init__(self, x, y, width, height, color, speed):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.color = Config.COLORS[color] if isinstance(color, str) else color
+        self.speed = speed
+        self.lives = 3
+        self.score = 0
+
+    def move(self, direction, boundaries):
+        if direction == "LEFT" and self.rect.left > boundaries.left:
+            self.rect.x -= self.speed
+        if direction == "RIGHT" and self.rect.right < boundaries.right:
+            self.rect.x += self.speed
+
+    def draw(self, surface):
+        pygame.draw.rect(surface, self.color, self.rect)
+
+
+BULLET_SIZE = (4, 10)
+
+
+def init(engine):
+    boundaries = engine.get_boundaries()
+    player = PlayerShip(boundaries.centerx - 25, boundaries.bottom - 40, 50, 30, "GREEN", 5)
+
+    engine.space_invaders_objects = {
+        "boundaries": boundaries,
+        "player": player,
+        "player_bullets": EntityPool(8, bounds=(boundaries.left, boundaries.top, boundaries.right, boundaries.bottom)),
+        "invader_bullets": EntityPool(16, bounds=(boundaries.left, boundaries.top, boundaries.right, boundaries.bottom)),
+        "last_invader_shot": engine.timestep.ticks,
+    }
+    start_invader_wave(engine, 1)
+    engine.score = 0
+
+
+def start_invader_wave(engine, wave):
+    # Each wave adds two columns and a row (up to half the playfield) and moves and shoots faster
+    boundaries = engine.space_invaders_objects["boundaries"]
+    cols = min(10 + 2 * (wave - 1), boundaries.width // 40)
+    rows = min(5 + wave - 1, boundaries.height // 2 // 40)
+    engine.space_invaders_objects.update({
+        "wave": wave,
+        "formation": InvaderFormation(boundaries.left, boundaries.top, cols, rows),
+        "invader_direction": 1,
+        "invader_speed": 1 + 0.5 * (wave - 1),
+        "invader_shot_delay": max(300, 1000 - 150 * (wave - 1)),
+    })
+
+
+def update(engine):
+    keys = engine.input.get_pressed()
+    current_time = engine.timestep.ticks
+    
+    boundaries = engine.space_invaders_objects["boundaries"]
+    player = engine.space_invaders_objects["player"]
+    formation = engine.space_invaders_objects["formation"]
+    player_bullets = engine.space_invaders_objects["player_bullets"]
+    invader_bullets = engine.space_invaders_objects["invader_bullets"]
+    invader_direction = engine.space_invaders_objects["invader_direction"]
+    invader_speed = engine.space_invaders_objects["invader_speed"]
+    last_invader_shot = engine.space_invaders_objects["last_invader_shot"]
+    invader_shot_delay = engine.space_invaders_objects["invader_shot_delay"]
+
+    # Move player
+    if keys[pygame.K_LEFT]:
+        player.move("LEFT", boundaries)
+    if keys[pygame.K_RIGHT]:
+        player.move("RIGHT", boundaries)
+
+    # Shoot bullet
+    if keys[pygame.K_SPACE]:
+        # Limit firing rate
+        if not player_bullets.count or current_time - getattr(engine, 'last_shot', 0) > 500:
+            player_bullets.spawn(player.rect.centerx - 2, player.rect.top, vy=-7)
+            engine.last_shot = current_time
+
+    # Move the formation; at a wall it turns and steps down
+    formation.move(invader_direction * invader_speed)
+    block = formation.rect
+    if (block.right >= boundaries.right and invader_direction > 0) or \
+       (block.left <= boundaries.left and invader_direction < 0):
+        engine.space_invaders_objects["invader_direction"] = -invader_direction
+        formation.move(0, 20)
+
+    # A random column's bottom invader shoots
+    if current_time - last_invader_shot > invader_shot_delay:
+        shooter = formation.shooter(rng)
+        if shooter is not None:
+            rect = formation.cell_rect(shooter)
+            invader_bullets.spawn(rect.centerx - 2, rect.bottom, vy=5)
+            engine.space_invaders_objects["last_invader_shot"] = current_time
+
+    # Move the bullets (ones that leave the playfield expire)
+    player_bullets.update()
+    invader_bullets.update()
+
+    # Player bullets only test the formation cells they overlap
+    for i in player_bullets.indices().tolist():
+        cell = formation.hit(player_bullets.x[i], player_bullets.y[i], *BULLET_SIZE)
+        if cell is not None:
+            formation.kill(cell)
+            player_bullets.kill(i)
+            player.score += 10
+
+    # Check invader bullets for collision with player
+    for i in invader_bullets.indices().tolist():
+        if player.rect.colliderect((invader_bullets.x[i], invader_bullets.y[i], *BULLET_SIZE)):
+            player.lives -= 1
+            invader_bullets.kill(i)
+
+            if player.lives <= 0:
+                engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+    # Clearing a wave brings on the next one, or wins after the last
+    if not formation.count:
+        player.score += 1000  # Bonus for clearing the wave
+        engine.score = player.score
+        wave = engine.space_invaders_objects["wave"]
+        if wave < Config.INVADER_WAVES:
+            start_invader_wave(engine, wave + 1)
+            invader_bullets.clear()
+        else:
+            engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+    # Check if invaders reached the bottom
+    elif formation.rect.bottom >= player.rect.top:
+        engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+    # Update score
+    engine.score = player.score
+
+
+def draw_bullets(engine, pool, color):
+    live = pool.indices()
+    return [pygame.draw.rect(engine.screen, color, (x, y, *BULLET_SIZE))
+            for x, y in zip(pool.x[live].tolist(), pool.y[live].tolist())]
+
+
+def draw_playfield(engine, surface):
+    # Draw boundaries
+    pygame.draw.rect(surface, Config.COLORS["WHITE"], engine.space_invaders_objects["boundaries"], 2)
+
+
+def draw(engine):
+    player = engine.space_invaders_objects["player"]
+    formation = engine.space_invaders_objects["formation"]
+    player_bullets = engine.space_invaders_objects["player_bullets"]
+    invader_bullets = engine.space_invaders_objects["invader_bullets"]
+
+    if not engine.dirty_mode:
+        draw_playfield(engine, engine.screen)
+
+    # Draw player, invaders, and bullets
+    player.draw(engine.screen)
+    formation.draw(engine.screen)
+    bullet_rects = draw_bullets(engine, player_bullets, Config.COLORS["CYAN"])
+    bullet_rects += draw_bullets(engine, invader_bullets, Config.COLORS["RED"])
+    if engine.dirty_mode:
+        engine.mark_dirty(player.rect, formation.rect)
+        engine.mark_dirty(*bullet_rects)
+
+    # Draw score and lives
+    engine.draw_text(f"Score: {player.score}", 36, Config.WIDTH//4, 30)
+    engine.draw_text(f"Lives: {player.lives}", 36, 3*Config.WIDTH//4, 30)
+    engine.draw_text(f"Wave: {engine.space_invaders_objects['wave']}", 36, Config.WIDTH//2, 30)
+
+
+def teardown(engine):
+    engine.space_invaders_objects = {}
@@ -0,0 +1,186 @@
+"""Tetris, drawn over the rules in tetris_core.py. Also played by the attract-mode demo."""
+import pygame
+
+from game_engine import Config, rng
+from tetris_core import PIECES, ROTATIONS, SPAWN_X, TetrisBoard
+
+# Keys the game reads
+KEYS = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_DOWN, pygame.K_UP]
+
+
+class TetrisPiece:
+    def __init__(self, name, x, y):
+        self.name = name
+        self.rotation = 0
+        self.x = x
+        self.y = y
+        self.color = rng.choice(["RED", "GREEN", "BLUE", "YELLOW", "PURPLE", "CYAN", "ORANGE"])
+
+    @property
+    def shape(self):
+        return ROTATIONS[self.name][self.rotation].shape
+
+    def rotate(self):
+        self.rotation = (self.rotation + 1) % 4
+
+    def get_positions(self):
+        x, y = self.x, self.y
+        return [(x + dx, y + dy) for dx, dy in ROTATIONS[self.name][self.rotation].cells]
+
+
+class TetrisGame:
+    """Falling-piece play on a tetris_core.TetrisBoard."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.board = TetrisBoard()
+        self.current_piece = self.new_piece()
+        self.next_piece = self.new_piece()
+        self.game_over = False
+        self.fall_time = 0
+        self.fall_speed = 500  # milliseconds
+        self.board_version = 0  # bumped whenever locked cells change
+
+    @property
+    def score(self):
+        return self.board.score
+
+    def new_piece(self):
+        return TetrisPiece(rng.choice(PIECES), SPAWN_X, 0)
+
+    def valid_move(self, piece, x_offset=0, y_offset=0):
+        return self.board.fits(piece.name, piece.rotation, piece.x + x_offset, piece.y + y_offset)
+
+    def lock_piece(self, piece):
+        self.board.lock(piece.name, piece.rotation, piece.x, piece.y, piece.color)
+        self.game_over = self.board.game_over
+        self.board_version += 1
+
+    def update(self, current_time):
+        if self.game_over:
+            return
+
+        # Move piece down automatically
+        if current_time - self.fall_time > self.fall_speed:
+            self.fall_time = current_time
+            if self.valid_move(self.current_piece, 0, 1):
+                self.current_piece.y += 1
+            else:
+                self.lock_piece(self.current_piece)
+                self.current_piece = self.next_piece
+                self.next_piece = self.new_piece()
+                # Topped out: the new piece has no room
+                if not self.valid_move(self.current_piece):
+                    self.game_over = self.board.game_over = True
+
+    def move(self, dx):
+        if self.valid_move(self.current_piece, dx, 0):
+            self.current_piece.x += dx
+
+    def rotate_piece(self):
+        piece = self.current_piece
+        if self.board.fits(piece.name, (piece.rotation + 1) % 4, piece.x, piece.y):
+            piece.rotate()
+
+    @staticmethod
+    def draw_grid(surface, x, y, cell_size=20):
+        for row in range(20):
+            for col in range(10):
+                rect = pygame.Rect(x + col * cell_size, y + row * cell_size, cell_size, cell_size)
+                pygame.draw.rect(surface, Config.COLORS["WHITE"], rect, 1)
+
+    def piece_rects(self, piece, x, y, cell_size=20):
+        return [pygame.Rect(x + pos_x * cell_size, y + pos_y * cell_size, cell_size, cell_size)
+                for pos_x, pos_y in piece.get_positions()]
+
+    def draw(self, surface, x, y, cell_size=20, grid=True):
+        # Draw board (empty cell outlines are skipped when the grid is pre-rendered)
+        colors = self.board.colors
+        for row in range(20):
+            if not grid and not self.board.rows[row]:
+                continue
+            for col in range(10):
+                if colors[row][col] or grid:
+                    rect = pygame.Rect(x + col * cell_size, y + row * cell_size, cell_size, cell_size)
+                    if colors[row][col]:
+                        pygame.draw.rect(surface, Config.COLORS[colors[row][col]], rect)
+                    pygame.draw.rect(surface, Config.COLORS["WHITE"], rect, 1)
+
+        # Draw current piece
+        if not self.game_over:
+            for pos_x, pos_y in self.current_piece.get_positions():
+                if pos_y >= 0:
+                    rect = pygame.Rect(x + pos_x * cell_size, y + pos_y * cell_size, cell_size, cell_size)
+                    pygame.draw.rect(surface, Config.COLORS[self.current_piece.color], rect)
+                    pygame.draw.rect(surface, Config.COLORS["WHITE"], rect, 1)
+
+        # Draw next piece preview
+        for pos_x, pos_y in self.next_piece.get_positions():
+            rect = pygame.Rect(x + 11 * cell_size + pos_x * cell_size, y + 2 * cell_size + pos_y * cell_size, cell_size, cell_size)
+            pygame.draw.rect(surface, Config.COLORS[self.next_piece.color], rect)
+            pygame.draw.rect(surface, Config.COLORS["WHITE"], rect, 1)
+
+
+def init(engine):
+    engine.tetris_objects = {
+        "game": TetrisGame(),
+        "last_update": engine.timestep.ticks
+    }
+    engine.score = 0
+
+
+def update(engine):
+    keys = engine.input.get_pressed()
+    game = engine.tetris_objects["game"]
+    current_time = engine.timestep.ticks
+
+    # Handle input
+    if keys[pygame.K_LEFT]:
+        game.move(-1)
+    if keys[pygame.K_RIGHT]:
+        game.move(1)
+    if keys[pygame.K_DOWN]:
+        game.fall_speed = 100  # Speed up falling when down is pressed
+    else:
+        game.fall_speed = 500
+
+    if keys[pygame.K_UP]:
+        game.rotate_piece()
+
+    # Update game
+    game.update(current_time)
+
+    # Update score
+    engine.score = game.score
+
+    # Check for game over
+    if game.game_over:
+        engine.current_state = Config.GAME_STATES["GAME_OVER"]
+
+
+def draw_playfield(engine, surface):
+    TetrisGame.draw_grid(surface, 200, 50)
+
+
+def draw(engine):
+    game = engine.tetris_objects["game"]
+
+    if engine.dirty_mode:
+        # Locked cells changed (lock or line clear): repaint the whole board
+        if engine.tetris_objects.get("drawn_board_version") != game.board_version:
+            engine.renderer.restore(engine.screen, (200, 50, 10 * 20, 20 * 20))
+            engine.tetris_objects["drawn_board_version"] = game.board_version
+        engine.mark_dirty(*game.piece_rects(game.current_piece, 200, 50))
+        engine.mark_dirty(*game.piece_rects(game.next_piece, 200 + 11 * 20, 50 + 2 * 20))
+
+    # Draw game board
+    game.draw(engine.screen, 200, 50, grid=not engine.dirty_mode)
+    
+    # Draw score and next piece label
+    engine.draw_text(f"Score: {game.score}", 36, Config.WIDTH//2, 30)
+    engine.draw_text("Next Piece:", 24, 500, 70, "WHITE")
+
+
+def teardown(engine):
+    engine.tetris_objects = {}
@@ -0,0 +1,142 @@
+"""Run the arcade games without a window.
+
+Uses SDL's dummy video and audio drivers, a seeded GameEngine and scripted
+or seeded-random input, and steps a game as fast as it will go. Games that
+end are restarted, so any number of ticks can be run.
+
+    python headless.py [--ticks N] [--seed S] [GAME ...]
+"""
+import array
+import atexit
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game_engine import Config, GameEngine
+from games import GAMES, load as load_game
+from input_sources import RandomInput
+
+
+class RunStats:
+    """Timings and counters from one headless run."""
+    def __init__(self, game, ticks):
+        self.game = game
+        self.ticks = ticks
+        # Raw doubles, so recording a timing does not allocate a float object
+        self.update_times = array.array("d", bytes(8 * ticks))
+        self.draw_times = array.array("d", bytes(8 * ticks))
+        self.elapsed = 0.0
+        self.restarts = 0
+        self.scores = []
+        self.gc_collections = 0
+        self.block_growth = 0
+
+    @staticmethod
+    def percentile(times, fraction):
+        if not times:
+            return 0.0
+        ordered = sorted(times)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def ticks_per_second(self):
+        return self.ticks / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        return {
+            "ticks_per_second": self.ticks_per_second(),
+            "update_p50": self.percentile(self.update_times, 0.5),
+            "update_p99": self.percentile(self.update_times, 0.99),
+            "draw_p50": self.percentile(self.draw_times, 0.5),
+            "draw_p99": self.percentile(self.draw_times, 0.99),
+            "gc_per_1k_ticks": self.gc_collections * 1000 / max(1, self.ticks),
+            "blocks_per_1k_ticks": self.block_growth * 1000 / max(1, self.ticks),
+            "restarts": self.restarts,
+        }
+
+
+_scratch_saves = []
+
+
+def scratch_saves_dir():
+    # One throwaway SAVES folder per process, removed at exit
+    if not _scratch_saves:
+        _scratch_saves.append(tempfile.mkdtemp(prefix="arcade_headless_"))
+        atexit.register(shutil.rmtree, _scratch_saves[0], True)
+    return _scratch_saves[0]
+
+
+def make_engine(seed=0, input_source=None, saves_dir=None):
+    """A GameEngine with throwaway saves, a fixed seed and the given input."""
+    saves_dir = saves_dir or scratch_saves_dir()
+    engine = GameEngine(saves_dir=saves_dir, seed=seed, input_source=input_source)
+    engine.player_name = "HEADLESS"
+    return engine
+
+
+def run_game(game, ticks, seed=0, input_source=None, draw=True, engine=None):
+    """Step `game` for `ticks` simulation steps (drawing after each) and return RunStats."""
+    input_source = input_source or RandomInput(load_game(game).KEYS, seed=seed)
+    engine = engine or make_engine(seed, input_source)
+    engine.input = input_source
+    state = Config.GAME_STATES[game]
+    engine.start_game(game)
+    engine.timestep.set_rate(engine.sim_rate(state))
+    dt = engine.timestep.dt
+    stats = RunStats(game, ticks)
+    perf_counter = time.perf_counter
+    gen0 = gc.get_stats()[0]["collections"]
+    blocks = sys.getallocatedblocks()
+
+    update_times = stats.update_times
+    draw_times = stats.draw_times
+
+    start = perf_counter()
+    for i in range(ticks):
+        t0 = perf_counter()
+        engine.timestep.advance(dt, engine.step)
+        t1 = perf_counter()
+        if draw:
+            engine.draw()
+        t2 = perf_counter()
+        update_times[i] = t1 - t0
+        draw_times[i] = t2 - t1
+        if engine.current_state != state:
+            # Game over (or left the game): record the score and play again
+            stats.scores.append(engine.score)
+            stats.restarts += 1
+            engine.start_game(game)
+    stats.elapsed = perf_counter() - start
+
+    stats.gc_collections = gc.get_stats()[0]["collections"] - gen0
+    stats.block_growth = sys.getallocatedblocks() - blocks
+    stats.scores.append(engine.score)
+    stats.engine = engine
+    return stats
+
+
+def main(argv):
+    ticks = 600
+    seed = 0
+    games = []
+    args = iter(argv)
+    for arg in args:
+        if arg == "--ticks":
+            ticks = int(next(args))
+        elif arg == "--seed":
+            seed = int(next(args))
+        else:
+            games.append(arg.upper())
+    for game in games or GAMES:
+        stats = run_game(game, ticks, seed)
+        print(f"{game:15s} {stats.ticks_per_second():9.0f} ticks/s  {len(stats.scores)} games, best score {max(stats.scores)}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
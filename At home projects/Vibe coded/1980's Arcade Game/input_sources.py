@@ -0,0 +1,103 @@
+import random
+
+import pygame
+
+
+class KeyState:
+    """Held keys, indexable like the result of pygame.key.get_pressed()."""
+    def __init__(self, held=()):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+    def tapped_since(self, previous):
+        """Keys held now but not in `previous`, in key-code order."""
+        return tuple(sorted(self.held - previous.held))
+
+
+class KeyboardInput:
+    """The live keyboard (the engine's default input source).
+
+    Besides the held keys, it latches every key pressed since the last
+    simulation step, so taps shorter than a step are not lost.
+    """
+    def __init__(self):
+        self.pending = []
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            self.pending.append(event.key)
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def taps(self):
+        return self.pending
+
+    def next_frame(self):
+        self.pending = []
+
+
+class ScriptedInput:
+    """Replays a fixed key script.
+
+    `script` is a list of (frame, keys) pairs: from that frame on, exactly
+    `keys` are held, until the next entry. Keys that become held count as
+    taps on that frame. Call next_frame() once per simulation step.
+    """
+    def __init__(self, script):
+        self.script = sorted(((frame, KeyState(keys)) for frame, keys in script), key=lambda item: item[0])
+        self.frame = 0
+        self.index = -1
+        self.state = KeyState()
+        self.current_taps = ()
+        self.next_frame(advance=False)
+
+    def handle_event(self, event):
+        pass
+
+    def get_pressed(self):
+        return self.state
+
+    def taps(self):
+        return self.current_taps
+
+    def next_frame(self, advance=True):
+        if advance:
+            self.frame += 1
+        previous = self.state
+        while self.index + 1 < len(self.script) and self.script[self.index + 1][0] <= self.frame:
+            self.index += 1
+            self.state = self.script[self.index][1]
+        self.current_taps = self.state.tapped_since(previous)
+
+
+class RandomInput:
+    """Seeded key mashing: every `hold` steps a new random subset of `keys` is held."""
+    def __init__(self, keys, seed=0, hold=8):
+        self.keys = list(keys)
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self.frame = 0
+        self.state = KeyState()
+        self.current_taps = ()
+        self.next_frame(advance=False)
+
+    def handle_event(self, event):
+        pass
+
+    def get_pressed(self):
+        return self.state
+
+    def taps(self):
+        return self.current_taps
+
+    def next_frame(self, advance=True):
+        if advance:
+            self.frame += 1
+        self.current_taps = ()
+        if self.frame % self.hold == 0:
+            previous = self.state
+            self.state = KeyState(key for key in self.keys if self.rng.random() < 0.5)
+            self.current_taps = self.state.tapped_since(previous)
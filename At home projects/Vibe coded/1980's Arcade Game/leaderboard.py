@@ -0,0 +1,375 @@
+import bisect
+import heapq
+import json
+import os
+import threading
+from datetime import datetime
+
+LOG_FILE = "scores.log"
+INDEX_FILE = "scores_index.json"
+VIEW_FILE = "global_high_scores.json"
+# JSON files the leaderboard keeps in SAVES/ next to the player profiles
+NON_PROFILE_FILES = {INDEX_FILE, VIEW_FILE}
+
+
+class SortedScores:
+    """Every score of a game, ascending, in blocks of up to 2 * LOAD.
+
+    A plain sorted list pays an O(n) shift for every insort. Here an insert
+    bisects the block maxima, then shifts within one block; a Fenwick tree
+    over the block lengths answers how many scores lie in the blocks below,
+    so both add() and bisect_right() are O(log n + LOAD). The tree is only
+    rebuilt when a block splits, once every LOAD inserts or so.
+    """
+    LOAD = 512
+
+    def __init__(self, scores=()):
+        scores = list(scores)  # already ascending
+        self.blocks = [scores[i:i + self.LOAD] for i in range(0, len(scores), self.LOAD)]
+        self.maxes = [block[-1] for block in self.blocks]
+        self.count = len(scores)
+        self.rebuild()
+
+    def rebuild(self):
+        self.tree = [0] * (len(self.blocks) + 1)
+        for i, block in enumerate(self.blocks, 1):
+            self.tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent < len(self.tree):
+                self.tree[parent] += self.tree[i]
+
+    def add(self, score):
+        self.count += 1
+        if not self.blocks:
+            self.blocks.append([score])
+            self.maxes.append(score)
+            self.rebuild()
+            return
+        i = min(bisect.bisect_left(self.maxes, score), len(self.blocks) - 1)
+        block = self.blocks[i]
+        bisect.insort(block, score)
+        self.maxes[i] = block[-1]
+        if len(block) > 2 * self.LOAD:
+            self.blocks[i:i + 1] = [block[:self.LOAD], block[self.LOAD:]]
+            self.maxes[i:i + 1] = [block[self.LOAD - 1], block[-1]]
+            self.rebuild()
+            return
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += 1
+            i += i & -i
+
+    def bisect_right(self, score):
+        """How many scores are <= score."""
+        i = bisect.bisect_right(self.maxes, score)
+        below = 0
+        k = i
+        while k:
+            below += self.tree[k]
+            k -= k & -k
+        if i < len(self.blocks):
+            below += bisect.bisect_right(self.blocks[i], score)
+        return below
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block
+
+
+class GameBoard:
+    """Scores for one game.
+
+    `top` is a bounded min-heap holding the best `size` entries, so checking
+    whether a score qualifies is O(1) and inserting it O(log size). `scores`
+    keeps every score value in a SortedScores for O(log n) inserts and rank
+    queries.
+    """
+    def __init__(self, size=10):
+        self.size = size
+        self.top = []  # (score, -seq, entry); the root is the entry to evict next
+        self.scores = SortedScores()
+        self.sorted_top = None
+
+    def qualifies(self, score):
+        # Ties with the current last place do not qualify (earlier entries win)
+        return len(self.top) < self.size or score > self.top[0][0]
+
+    def add(self, score, entry, seq):
+        self.scores.add(score)
+        if len(self.top) < self.size:
+            heapq.heappush(self.top, (score, -seq, entry))
+        elif score > self.top[0][0]:
+            heapq.heapreplace(self.top, (score, -seq, entry))
+        else:
+            return False
+        self.sorted_top = None
+        return True
+
+    def rank(self, score):
+        """1-based position this score would take among every recorded score."""
+        return len(self.scores) - self.scores.bisect_right(score) + 1
+
+    def entries(self):
+        if self.sorted_top is None:
+            self.sorted_top = [item[2] for item in sorted(self.top, reverse=True)]
+        return self.sorted_top
+
+
+def histogram(scores):
+    """[score, count] pairs of an ascending score list."""
+    counts = []
+    for score in scores:
+        if counts and counts[-1][0] == score:
+            counts[-1][1] += 1
+        else:
+            counts.append([score, 1])
+    return counts
+
+
+class Leaderboard:
+    """Append-only score log with an in-memory index per game.
+
+    Every submitted score is appended as one JSON line to scores.log.
+    Periodically the index is compacted into scores_index.json (each game's
+    top entries plus a histogram of all its scores): the live log is rotated
+    to scores.log.1 (.2 and on if an interrupted compaction left one), the
+    snapshot is written, then the rotated logs are deleted. Only the copy of
+    the scores and the rotation hold the lock, so add() does not wait on
+    the snapshot. Log records carry a sequence number, so a crash at any
+    point replays each score exactly once.
+
+    A `read_only` leaderboard loads the same way but never writes, so the
+    saves can be read for export() without changing them.
+    """
+    def __init__(self, saves_dir, games, size=10, compact_after=5000, read_only=False):
+        self.saves_dir = saves_dir
+        self.games = list(games)
+        self.size = size
+        self.compact_after = compact_after
+        self.read_only = read_only
+        self.log_path = os.path.join(saves_dir, LOG_FILE)
+        self.index_path = os.path.join(saves_dir, INDEX_FILE)
+        self.view_path = os.path.join(saves_dir, VIEW_FILE)
+        self.lock = threading.RLock()
+        self.compact_lock = threading.Lock()
+        self.boards = {g: GameBoard(size) for g in self.games}
+        self.seq = 0
+        self.snapshot_seq = 0
+        self.log_records = 0
+        self.log_file = None
+        self.compacting = False
+        self.load()
+
+    def board(self, game):
+        if game not in self.boards:
+            self.boards[game] = GameBoard(self.size)
+        return self.boards[game]
+
+    def rotated_logs(self):
+        """Logs rotated out by compactions that have not finished, oldest first."""
+        paths = []
+        while os.path.exists(f"{self.log_path}.{len(paths) + 1}"):
+            paths.append(f"{self.log_path}.{len(paths) + 1}")
+        return paths
+
+    # Loading
+    def load(self):
+        logs = self.rotated_logs() + [self.log_path]
+        fresh = not os.path.exists(self.index_path) and not any(os.path.exists(p) for p in logs)
+        if os.path.exists(self.index_path):
+            self.load_index()
+        for path in logs:
+            if os.path.exists(path):
+                self.replay_log(path)
+        if fresh:
+            self.import_view()
+        if self.log_records > self.compact_after:
+            self.compact()
+
+    def load_index(self):
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.snapshot_seq = self.seq = index.get("seq", 0)
+        for game, data in index.get("games", {}).items():
+            board = self.board(game)
+            board.scores = SortedScores(score for score, count in data.get("histogram", [])
+                                        for _ in range(count))
+            for seq, entry in data.get("top", []):
+                board.top.append((entry["score"], -seq, entry))
+            heapq.heapify(board.top)
+
+    def read_log(self, path):
+        """Yield the records of a log file that are newer than the snapshot."""
+        try:
+            with open(path, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn final line from a crash
+                    if record.get("seq", 0) > self.snapshot_seq:
+                        yield record
+        except OSError:
+            pass
+
+    def replay_log(self, path):
+        for record in self.read_log(path):
+            self.apply(record)
+            self.log_records += 1
+
+    def import_view(self):
+        # One-time migration from the old global_high_scores.json leaderboard
+        try:
+            with open(self.view_path, "r") as f:
+                old = json.load(f).get("high_scores", {})
+        except (OSError, ValueError, AttributeError):
+            return
+        for game, entries in old.items():
+            for entry in entries:
+                self.add(game, entry.get("name", "?"), entry.get("score", 0), entry.get("date"))
+
+    def apply(self, record):
+        self.seq = max(self.seq, record["seq"])
+        entry = {"name": record["name"], "score": record["score"], "date": record["date"]}
+        return self.board(record["game"]).add(record["score"], entry, record["seq"])
+
+    # Queries
+    def qualifies(self, game, score):
+        with self.lock:
+            return self.board(game).qualifies(score)
+
+    def rank(self, game, score):
+        with self.lock:
+            return self.board(game).rank(score)
+
+    def count(self, game):
+        with self.lock:
+            return len(self.board(game).scores)
+
+    def top(self, game):
+        with self.lock:
+            return self.board(game).entries()
+
+    def all_top(self):
+        return {g: self.top(g) for g in self.boards}
+
+    def export(self):
+        """Every recorded score as (game, name, score, date) rows, oldest first.
+
+        Names and dates come from the top lists and the log. Scores that were
+        only kept in a snapshot histogram have lost theirs and are listed
+        last, with name and date None.
+        """
+        with self.lock:
+            entries = {game: {-item[1]: item[2] for item in board.top}
+                       for game, board in self.boards.items()}
+            scores = {game: list(board.scores) for game, board in self.boards.items()}
+        for path in self.rotated_logs() + [self.log_path]:
+            for record in self.read_log(path):
+                entries.setdefault(record["game"], {})[record["seq"]] = record
+        named = []
+        anonymous = []
+        for game, by_seq in entries.items():
+            remaining = {}
+            for score in scores.get(game, []):
+                remaining[score] = remaining.get(score, 0) + 1
+            for seq in sorted(by_seq):
+                entry = by_seq[seq]
+                named.append((game, entry["name"], entry["score"], entry["date"]))
+                remaining[entry["score"]] = remaining.get(entry["score"], 0) - 1
+            anonymous.extend((game, None, score, None)
+                             for score, count in sorted(remaining.items()) for _ in range(max(count, 0)))
+        return named + anonymous
+
+    # Updates
+    def add(self, game, name, score, date=None):
+        """Record a score. Returns True if it entered the game's top list."""
+        with self.lock:
+            self.seq += 1
+            record = {"seq": self.seq, "game": game, "name": name, "score": score,
+                      "date": date or datetime.now().strftime("%Y-%m-%d %H:%M")}
+            self.append(record)
+            entered = self.apply(record)
+            self.log_records += 1
+            if self.log_records > self.compact_after and not self.compacting and not self.read_only:
+                self.compacting = True
+                threading.Thread(target=self.compact, name="LeaderboardCompact", daemon=True).start()
+            return entered
+
+    def append(self, record):
+        if self.read_only:
+            return
+        try:
+            if self.log_file is None:
+                os.makedirs(self.saves_dir, exist_ok=True)
+                self.log_file = open(self.log_path, "a")
+            self.log_file.write(json.dumps(record) + "\n")
+            self.log_file.flush()
+        except OSError:
+            pass  # the score still counts for this session
+
+    def compact(self):
+        """Snapshot the index and the readable top-list view, then drop the old log."""
+        if self.read_only:
+            return False
+        with self.compact_lock:
+            return self._compact()
+
+    def _compact(self):
+        with self.lock:
+            seq = self.seq
+            boards = {game: (list(board.scores), list(board.top)) for game, board in self.boards.items()}
+            try:
+                # New scores go to a fresh log while the snapshot is written
+                if self.log_file is not None:
+                    self.log_file.close()
+                    self.log_file = None
+                rotated = self.rotated_logs()
+                if os.path.exists(self.log_path):
+                    # Logs an earlier compaction did not finish with are kept as they are
+                    rotated.append(f"{self.log_path}.{len(rotated) + 1}")
+                    os.replace(self.log_path, rotated[-1])
+                self.log_records = 0
+            except OSError:
+                self.compacting = False
+                return False
+        games = {}
+        view = {}
+        for game, (scores, top) in boards.items():
+            top.sort(reverse=True)
+            games[game] = {"top": [[-item[1], item[2]] for item in top], "histogram": histogram(scores)}
+            view[game] = [item[2] for item in top]
+        try:
+            write_atomic(self.index_path, json.dumps({"seq": seq, "games": games}))
+            write_atomic(self.view_path, json.dumps({"high_scores": view}, indent=2))
+            # Newest first, so a crash part way leaves .1, .2, ... without a gap
+            for path in reversed(rotated):
+                os.remove(path)
+            with self.lock:
+                self.snapshot_seq = seq
+            return True
+        except OSError:
+            return False
+        finally:
+            self.compacting = False
+
+    def flush(self):
+        with self.lock:
+            pending = self.log_records
+        if pending:
+            self.compact()
+
+
+def write_atomic(path, text):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
@@ -0,0 +1,99 @@
+import pygame
+
+# Effect -> (priority, voice limit, cooldown ms). A higher priority can take
+# the channel of a lower one; the limit caps how many copies play at once
+# (the oldest restarts), and a re-trigger inside the cooldown is dropped.
+EFFECT_RULES = {
+    "beep1": (1, 2, 30),
+    "beep2": (1, 2, 30),
+    "beep3": (1, 2, 30),
+    "explosion": (2, 2, 60),
+    "powerup": (3, 1, 0),
+}
+DEFAULT_RULE = (1, 2, 30)
+
+
+class ChannelPool:
+    """Sound effects played on a fixed pool of mixer channels.
+
+    Every channel's voice is kept as [name, priority, start, end] (ms on
+    `clock`), so play() can count an effect's live voices and pick a
+    channel without asking the mixer. A sound inside its cooldown is
+    dropped, and one at its voice limit restarts its oldest copy.
+    Otherwise it takes a free channel, or the one playing the
+    lowest-priority voice (the oldest among equals) if that is no more
+    important than itself. Heavy scenes keep at most `channels` voices, and
+    the most important sounds always get through.
+    """
+    def __init__(self, channels=8, rules=None, clock=pygame.time.get_ticks):
+        self.rules = EFFECT_RULES if rules is None else rules
+        self.clock = clock
+        pygame.mixer.set_num_channels(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.voices = [None] * channels
+        self.last_played = {}
+        self.lengths = {}  # effect -> length in ms
+        # Counters for the profiler and benchmarks
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+        self.peak = 0
+
+    def play(self, name, sound):
+        """Play `sound` as effect `name` if the rules allow it; returns the Channel or None."""
+        now = self.clock()
+        priority, limit, cooldown = self.rules.get(name, DEFAULT_RULE)
+        last = self.last_played.get(name)
+        if last is not None and now - last < cooldown:
+            self.dropped += 1
+            return None
+
+        free = None
+        victim = None
+        oldest_copy = None
+        copies = 0
+        live = 0
+        for i, voice in enumerate(self.voices):
+            if voice is None or voice[3] <= now:
+                if free is None:
+                    free = i
+                continue
+            live += 1
+            if voice[0] == name:
+                copies += 1
+                if oldest_copy is None or voice[2] < self.voices[oldest_copy][2]:
+                    oldest_copy = i
+            if victim is None or voice[1:3] < self.voices[victim][1:3]:
+                victim = i
+        if copies >= limit:
+            free = oldest_copy
+            self.stolen += 1
+            live -= 1
+        elif free is None:
+            if self.voices[victim][1] > priority:
+                self.dropped += 1
+                return None
+            free = victim
+            self.stolen += 1
+            live -= 1
+
+        length = self.lengths.get(name)
+        if length is None:
+            length = self.lengths[name] = int(sound.get_length() * 1000)
+        channel = self.channels[free]
+        channel.play(sound)
+        self.voices[free] = [name, priority, now, now + length]
+        self.last_played[name] = now
+        self.played += 1
+        self.peak = max(self.peak, live + 1)
+        return channel
+
+    def load(self):
+        """Voices playing now."""
+        now = self.clock()
+        return sum(1 for voice in self.voices if voice is not None and voice[3] > now)
+
+    def stop(self):
+        for channel in self.channels:
+            channel.stop()
+        self.voices = [None] * len(self.channels)
@@ -0,0 +1,60 @@
+"""Pokemon species, moves and battle formulas, without pygame.
+
+Balance lives in these tables: change a number here and both the game and
+battle_sim.py pick it up. The formulas work element-wise on NumPy arrays
+too, so battle_sim.py calls the same functions for a whole batch.
+"""
+import numpy
+
+# Type -> display color (a Config.COLORS name)
+TYPES = {
+    "FIRE": "RED",
+    "WATER": "BLUE",
+    "GRASS": "GREEN",
+    "ELECTRIC": "YELLOW",
+}
+
+# Move -> (type, power)
+MOVES = {
+    "Ember": ("FIRE", 25),
+    "Fire Spin": ("FIRE", 35),
+    "Water Gun": ("WATER", 25),
+    "Bubble": ("WATER", 35),
+    "Vine Whip": ("GRASS", 25),
+    "Razor Leaf": ("GRASS", 35),
+    "Thunder Shock": ("ELECTRIC", 25),
+    "Thunderbolt": ("ELECTRIC", 35),
+}
+
+# Species -> type, moves, and (hp, attack, defense) at level 0
+SPECIES = {
+    "CHARMA": {"type": "FIRE", "moves": ["Ember", "Fire Spin"], "base": (20, 5, 5)},
+    "SQUIRT": {"type": "WATER", "moves": ["Water Gun", "Bubble"], "base": (20, 5, 5)},
+    "BULBA": {"type": "GRASS", "moves": ["Vine Whip", "Razor Leaf"], "base": (20, 5, 5)},
+    "PIKA": {"type": "ELECTRIC", "moves": ["Thunder Shock", "Thunderbolt"], "base": (20, 5, 5)},
+}
+
+# (hp, attack, defense) gained per level
+GROWTH = (5, 1, 1)
+
+STARTER = ("CHARMA", 5)
+WILD_SPECIES = ["BULBA", "SQUIRT", "PIKA"]
+WILD_LEVELS = (3, 7)  # inclusive
+
+# Catch chance rises from CATCH_BASE at full HP by up to CATCH_BONUS as HP falls
+CATCH_BASE = 0.3
+CATCH_BONUS = 0.5
+
+
+def stats(species, level):
+    """(max hp, attack, defense) of a species at a level."""
+    return tuple(base + gain * level for base, gain in zip(SPECIES[species]["base"], GROWTH))
+
+
+def damage(power, attack, defense):
+    """Damage of one hit, at least 1 (a NumPy integer, or an array for arrays)."""
+    return numpy.maximum(1, power + attack - defense)
+
+
+def catch_chance(hp, max_hp):
+    return CATCH_BASE + (1 - hp / max_hp) * CATCH_BONUS
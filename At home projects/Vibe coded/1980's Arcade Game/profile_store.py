@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+
+
+class ProfileStore:
+    """In-memory cache of JSON save files with write-behind persistence.
+
+    Each file is read from disk once; afterwards reads are served from
+    memory. Changed documents are marked dirty and a background thread writes
+    them after a short delay, so a burst of mutations becomes one write.
+    Writes go to a temp file that is fsynced and renamed over the original,
+    so a crash mid-write leaves the previous version intact.
+
+    Code that mutates a cached document should hold `lock` while doing so.
+    """
+    def __init__(self, delay=1.0, indent=2):
+        self.delay = delay
+        self.indent = indent
+        self.lock = threading.RLock()
+        self.io_lock = threading.Lock()  # one writer per temp file at a time
+        self.docs = {}
+        self.dirty = set()
+        self.writes = 0
+        self.errors = 0
+        self.closed = False
+        self.stopping = threading.Event()
+        self.wakeup = threading.Condition(self.lock)
+        self.worker = threading.Thread(target=self.run, name="ProfileStore", daemon=True)
+        self.worker.start()
+
+    def load(self, path):
+        """Return the cached document for path, reading it on first use (None if missing)."""
+        with self.lock:
+            if path in self.docs:
+                return self.docs[path]
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self.lock:
+            # Another thread may have put a newer version meanwhile
+            return self.docs.setdefault(path, data)
+
+    def contains(self, path):
+        with self.lock:
+            return path in self.docs or os.path.exists(path)
+
+    def paths(self):
+        with self.lock:
+            return list(self.docs)
+
+    def put(self, path, data, write_through=False):
+        """Replace the document for path and schedule (or perform) its write."""
+        with self.lock:
+            self.docs[path] = data
+        if write_through:
+            return self.write(path)
+        self.mark_dirty(path)
+        return True
+
+    def mark_dirty(self, path):
+        with self.lock:
+            self.dirty.add(path)
+            self.wakeup.notify()
+
+    def run(self):
+        while True:
+            with self.lock:
+                while not self.dirty and not self.closed:
+                    self.wakeup.wait()
+                if self.closed:
+                    return
+            # Let further mutations coalesce into the same write
+            self.stopping.wait(self.delay)
+            self.flush()
+
+    def flush(self):
+        """Write every dirty document now. Returns False if any write failed."""
+        with self.lock:
+            pending = list(self.dirty)
+            self.dirty.clear()
+        ok = True
+        for path in pending:
+            ok = self.write(path) and ok
+        return ok
+
+    def write(self, path):
+        tmp_path = path + ".tmp"
+        try:
+            # Serialize inside io_lock so an older snapshot never lands after a newer one
+            with self.io_lock:
+                with self.lock:
+                    if path not in self.docs:
+                        return False
+                    text = json.dumps(self.docs[path], indent=self.indent)
+                with open(tmp_path, "w") as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+        except OSError:
+            self.errors += 1
+            with self.lock:
+                self.dirty.add(path)  # try again on the next flush
+            return False
+        self.writes += 1
+        return True
+
+    def close(self):
+        """Flush pending writes and stop the background thread."""
+        with self.lock:
+            self.closed = True
+            self.wakeup.notify()
+        self.stopping.set()
+        self.worker.join(timeout=5)
+        return self.flush()
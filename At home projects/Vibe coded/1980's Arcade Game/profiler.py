@@ -0,0 +1,179 @@
+import csv
+import json
+import os
+from collections import deque
+
+import pygame
+
+PHASES = ["events", "update", "draw", "overlay", "present", "wait"]
+
+
+class FrameProfiler:
+    """Per-phase frame timings for GameEngine.run.
+
+    The engine only calls into the profiler while it is enabled (it runs a
+    separate instrumented loop body), so a disabled profiler costs one
+    attribute check per frame. While enabled it keeps a rolling window for
+    the overlay, per-state frame and dropped-frame counts, the mixer load
+    (voices playing at the end of each frame, and effects the channel pool
+    dropped), and a timeline that export_trace()/export_csv() write to disk.
+    """
+    WINDOW = 240  # frames in the rolling averages and histogram
+    MAX_TIMELINE = 108000  # 30 minutes at 60 FPS
+    HISTOGRAM_MS = [4, 8, 12, 16, 20, 25, 33, 50]  # bucket upper bounds; the last bucket is open
+    OVERLAY_REFRESH = 15  # frames between overlay redraws
+
+    def __init__(self, target_fps=60):
+        self.enabled = False
+        self.target_fps = target_fps
+        self.window = deque(maxlen=self.WINDOW)
+        self.timeline = deque(maxlen=self.MAX_TIMELINE)
+        self.frames = 0
+        self.dropped = 0
+        self.states = {}  # state name -> [frames, dropped]
+        self.sim_dropped = 0  # simulation steps the fixed timestep gave up on
+        self.sounds_dropped = 0  # effects the channel pool refused
+        self.peak_voices = 0
+        self.overlay = None
+        self.overlay_age = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.reset()
+        return self.enabled
+
+    def reset(self):
+        self.window.clear()
+        self.timeline.clear()
+        self.frames = 0
+        self.dropped = 0
+        self.states = {}
+        self.sim_dropped = 0
+        self.sounds_dropped = 0
+        self.peak_voices = 0
+        self.overlay = None
+
+    def budget(self):
+        return 1.0 / self.target_fps if self.target_fps else None
+
+    def record(self, start, durations, state, steps=1, sim_dropped=0, voices=0, sounds_dropped=0):
+        """Add one frame: start time (perf_counter seconds) and one duration per PHASES entry."""
+        self.sim_dropped += sim_dropped
+        self.sounds_dropped += sounds_dropped
+        self.peak_voices = max(self.peak_voices, voices)
+        total = sum(durations)
+        budget = self.budget()
+        dropped = budget is not None and total > budget * 1.5
+        frame = (start, tuple(durations), total, state, steps, dropped, voices)
+        self.window.append(frame)
+        self.timeline.append(frame)
+        self.frames += 1
+        counts = self.states.setdefault(state, [0, 0])
+        counts[0] += 1
+        if dropped:
+            self.dropped += 1
+            counts[1] += 1
+
+    # Rolling statistics
+    def phase_means(self):
+        if not self.window:
+            return {phase: 0.0 for phase in PHASES}
+        count = len(self.window)
+        return {phase: sum(frame[1][i] for frame in self.window) / count for i, phase in enumerate(PHASES)}
+
+    def fps(self):
+        total = sum(frame[2] for frame in self.window)
+        return len(self.window) / total if total else 0.0
+
+    def frame_percentile(self, fraction):
+        if not self.window:
+            return 0.0
+        totals = sorted(frame[2] for frame in self.window)
+        return totals[min(len(totals) - 1, int(len(totals) * fraction))]
+
+    def mean_voices(self):
+        return sum(frame[6] for frame in self.window) / len(self.window) if self.window else 0.0
+
+    def histogram(self):
+        buckets = [0] * (len(self.HISTOGRAM_MS) + 1)
+        for frame in self.window:
+            ms = frame[2] * 1000
+            i = 0
+            while i < len(self.HISTOGRAM_MS) and ms > self.HISTOGRAM_MS[i]:
+                i += 1
+            buckets[i] += 1
+        return buckets
+
+    # Overlay
+    def draw_overlay(self, surface, text_cache, state):
+        """Blit the overlay panel (rebuilt every OVERLAY_REFRESH frames). Returns its rect."""
+        self.overlay_age += 1
+        if self.overlay is None or self.overlay_age >= self.OVERLAY_REFRESH:
+            self.overlay = self.build_overlay(text_cache, state)
+            self.overlay_age = 0
+        return surface.blit(self.overlay, (8, 8))
+
+    def build_overlay(self, text_cache, state):
+        means = self.phase_means()
+        state_frames, state_dropped = self.states.get(state, [0, 0])
+        lines = [
+            f"FPS {self.fps():5.1f}  frame p50 {self.frame_percentile(0.5) * 1000:5.1f} ms"
+            f"  p99 {self.frame_percentile(0.99) * 1000:5.1f} ms",
+            "  ".join(f"{phase} {means[phase] * 1000:.2f}" for phase in PHASES[:3]) + " ms",
+            "  ".join(f"{phase} {means[phase] * 1000:.2f}" for phase in PHASES[3:]) + " ms",
+            f"dropped {self.dropped}/{self.frames}  {state} {state_dropped}/{state_frames}"
+            f"  sim skipped {self.sim_dropped}",
+            f"voices {self.mean_voices():.1f} avg  {self.peak_voices} peak  sfx dropped {self.sounds_dropped}",
+            "F3 hide  F4 export trace",
+        ]
+        line_height = 18
+        hist_height = 40
+        panel = pygame.Surface((330, len(lines) * line_height + hist_height + 16), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        for i, line in enumerate(lines):
+            panel.blit(text_cache.render(line, 18, (0, 255, 0)), (6, 4 + i * line_height))
+
+        # Frame-time histogram: one bar per bucket, height relative to the fullest
+        buckets = self.histogram()
+        top = len(lines) * line_height + 8
+        bar_width = (panel.get_width() - 12) // len(buckets)
+        peak = max(buckets) or 1
+        for i, count in enumerate(buckets):
+            height = int(hist_height * count / peak)
+            color = (0, 255, 0) if i < 4 else (255, 255, 0) if i < 6 else (255, 0, 0)
+            pygame.draw.rect(panel, color, (6 + i * bar_width, top + hist_height - height, bar_width - 2, height))
+        return panel
+
+    # Export
+    def export_trace(self, path):
+        """Write the timeline in Chrome trace-event format (chrome://tracing, Perfetto)."""
+        events = []
+        origin = self.timeline[0][0] if self.timeline else 0.0
+        for start, durations, total, state, steps, dropped, voices in self.timeline:
+            ts = (start - origin) * 1e6
+            events.append({"name": "frame", "ph": "X", "ts": ts, "dur": total * 1e6, "pid": 1, "tid": 1,
+                           "args": {"state": state, "steps": steps, "dropped": dropped, "voices": voices}})
+            for phase, duration in zip(PHASES, durations):
+                events.append({"name": phase, "ph": "X", "ts": ts, "dur": duration * 1e6, "pid": 1, "tid": 2})
+                ts += duration * 1e6
+        write_file(path, lambda f: json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f))
+
+    def export_csv(self, path):
+        """Write the timeline as one CSV row per frame (times in milliseconds)."""
+        def write(f):
+            writer = csv.writer(f)
+            writer.writerow(["start_ms", "state", "steps", "dropped", "voices", "total"] + PHASES)
+            origin = self.timeline[0][0] if self.timeline else 0.0
+            for start, durations, total, state, steps, dropped, voices in self.timeline:
+                writer.writerow([f"{(start - origin) * 1000:.3f}", state, steps, int(dropped), voices,
+                                 f"{total * 1000:.3f}"] + [f"{d * 1000:.3f}" for d in durations])
+        write_file(path, write, newline="")
+
+
+def write_file(path, write, newline=None):
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "w", newline=newline) as f:
+        write(f)
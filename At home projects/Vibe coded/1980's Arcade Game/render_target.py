@@ -0,0 +1,89 @@
+import os
+
+import numpy
+import pygame
+
+# Flags of the last display mode set here. SDL cannot reliably add, drop or
+# resize the SCALED renderer of an existing window, so those get a fresh display.
+_mode_flags = 0
+
+
+def crt_mask(size, scanline=0.7, stripe=0.85, vignette=0.3):
+    """Surface to BLEND_MULT over a frame for a CRT look.
+
+    Every other row is a darker scanline, each column favours red, green or
+    blue in turn like an aperture grille, and the corners fall off.
+    """
+    width, height = size
+    x = numpy.linspace(-1.0, 1.0, width)
+    y = numpy.linspace(-1.0, 1.0, height)
+    shade = 1.0 - vignette * (x[:, None] ** 2 + y[None, :] ** 2) / 2
+    shade[:, 1::2] *= scanline
+    grille = numpy.full((3, 3), stripe)
+    numpy.fill_diagonal(grille, 1.0)
+    rgb = shade[:, :, None] * grille[numpy.arange(width) % 3][:, None, :]
+    mask = pygame.Surface(size)
+    pygame.surfarray.blit_array(mask, (rgb * 255).astype(numpy.uint8))
+    return mask
+
+
+class RenderTarget:
+    """The surface the engine draws on and how each frame reaches the display.
+
+    Everything is drawn on `canvas` at `size` (Config.WIDTH x HEIGHT, the
+    coordinates the games are laid out in). There is no smaller logical
+    resolution: the games' sprites, tiles and fonts are sized in those
+    pixels, and shrinking the finished frame loses their outlines and text.
+    By default the canvas is the display surface itself. With `crt`, a
+    mask built once is multiplied over each frame on the display, so the
+    canvas gets its own surface.
+
+    With `scaled` or `fullscreen` the display uses pygame's SCALED mode:
+    SDL's renderer stretches it to the window or monitor on the GPU (whole
+    pixels in a window, filtered when `smooth`), so the per-frame CPU cost
+    is the same on any display size. SDL maps the mouse back to canvas
+    coordinates.
+    """
+    def __init__(self, size, scaled=False, fullscreen=False, smooth=False, crt=False):
+        self.size = tuple(size)
+        flags = 0
+        if scaled or fullscreen:
+            flags |= pygame.SCALED
+            # Read by SDL when pygame creates the renderer
+            os.environ["SDL_RENDER_SCALE_QUALITY"] = "linear" if smooth else "nearest"
+        if fullscreen:
+            flags |= pygame.FULLSCREEN
+        global _mode_flags
+        if pygame.display.get_surface() is not None and (flags | _mode_flags) & pygame.SCALED:
+            pygame.display.quit()
+            pygame.display.init()
+        _mode_flags = flags
+        self.display = pygame.display.set_mode(self.size, flags)
+        self.mask = crt_mask(self.size).convert() if crt else None
+        if self.mask is None:
+            self.canvas = self.display
+        else:
+            # The mask would darken the canvas again every frame, so it gets its own surface
+            self.canvas = pygame.Surface(self.size).convert()
+
+    @property
+    def direct(self):
+        """True when drawing goes straight to the display."""
+        return self.canvas is self.display
+
+    def compose(self, rects=None):
+        """Copy the canvas to the display surface, only `rects` when given
+        (nothing to do when drawing to it directly)."""
+        if self.direct:
+            return
+        for rect in rects or [self.display.get_rect()]:
+            self.display.blit(self.canvas, rect, rect)
+            self.display.blit(self.mask, rect, rect, special_flags=pygame.BLEND_MULT)
+
+    def present(self, rects=None):
+        """Show the frame; with `rects`, only those canvas regions changed."""
+        self.compose(rects)
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
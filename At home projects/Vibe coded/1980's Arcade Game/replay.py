@@ -0,0 +1,320 @@
+"""Input replays: record a game session and re-simulate it exactly.
+
+A replay file is:
+
+    b"ARCREPLAY1\\n"
+    header length (4 bytes, big-endian) + JSON header
+        {"game", "seed", "sim_rate", "sim_time", "keys"}
+    zlib stream of input records
+    JSON trailer {"ticks", "score", "rng"} (after the end of the zlib stream)
+
+Each tick's input is a bitmask over the header's "keys" (the game's KEYS,
+sorted) plus the keys tapped since the previous tick. Records are delta and run-length encoded: a record is
+varint(run), varint(mask xor), varint(tap count), tap key indices, meaning
+"the previous input repeats for `run` ticks, then the mask changes by the
+xor". A tick with taps always ends a run. Recording and playback both
+stream through zlib in small chunks, so a session never has to fit in
+memory.
+
+    python replay.py play FILE [--realtime] [--draw]
+"""
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+import pygame
+
+import games
+from input_sources import KeyState
+
+MAGIC = b"ARCREPLAY1\n"
+CHUNK = 1 << 16
+
+
+
+def replay_keys(game):
+    """The keys recorded for `game`: every key it reads, in a stable order."""
+    return sorted(set(games.load(game).KEYS))
+
+
+def key_bits(keys):
+    """Bit i of a mask is keys[i]."""
+    return {key: 1 << i for i, key in enumerate(keys)}
+
+
+def encode_keys(keys, bits):
+    mask = 0
+    for key, bit in bits.items():
+        if keys[key]:
+            mask |= bit
+    return mask
+
+
+def decode_keys(mask, bits):
+    return KeyState(key for key, bit in bits.items() if mask & bit)
+
+
+def write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def rng_fingerprint(rng):
+    return hashlib.sha1(repr(rng.getstate()).encode()).hexdigest()[:16]
+
+
+class ReplayWriter:
+    """Streams a session's per-tick input to a replay file."""
+    def __init__(self, path, header):
+        self.path = path
+        self.file = open(path, "wb")
+        self.keys = replay_keys(header["game"])
+        self.bits = key_bits(self.keys)
+        header = dict(header, keys=self.keys)
+        data = json.dumps(header).encode()
+        self.file.write(MAGIC + struct.pack(">I", len(data)) + data)
+        self.compressor = zlib.compressobj(9)
+        self.pending = bytearray()
+        self.mask = 0
+        self.run = 0
+        self.ticks = 0
+
+    def add(self, mask, taps=()):
+        """Record one tick: the held-key mask and the keys tapped since the last tick."""
+        self.ticks += 1
+        if mask == self.mask and not taps:
+            self.run += 1
+            return
+        self.emit(mask ^ self.mask, taps)
+        self.mask = mask
+        # A tapped tick is written whole by its record; otherwise it starts the new run
+        self.run = 0 if taps else 1
+
+    def emit(self, xor, taps):
+        out = self.pending
+        write_varint(out, self.run)
+        write_varint(out, xor)
+        write_varint(out, len(taps))
+        for key in taps:
+            write_varint(out, self.keys.index(key))
+        if len(out) >= 4096:
+            self.file.write(self.compressor.compress(bytes(out)))
+            out.clear()
+
+    def close(self, trailer):
+        if self.file is None:
+            return
+        if self.run:
+            self.emit(0, ())
+        self.file.write(self.compressor.compress(bytes(self.pending)))
+        self.file.write(self.compressor.flush())
+        self.file.write(json.dumps(dict(trailer, ticks=self.ticks)).encode())
+        self.file.close()
+        self.file = None
+
+
+class ReplayReader:
+    """Reads a replay header, then yields (mask, taps) per tick while streaming the file."""
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        if self.file.read(len(MAGIC)) != MAGIC:
+            self.file.close()
+            raise ValueError(f"{path} is not a replay file")
+        (length,) = struct.unpack(">I", self.file.read(4))
+        self.header = json.loads(self.file.read(length))
+        self.keys = self.header["keys"]
+        self.bits = key_bits(self.keys)
+        self.trailer = None
+
+    def chunks(self):
+        decompressor = zlib.decompressobj()
+        while not decompressor.eof:
+            data = self.file.read(CHUNK)
+            if not data:
+                break  # truncated recording: play what there is
+            yield decompressor.decompress(data)
+        tail = decompressor.unused_data + self.file.read()
+        self.file.close()
+        try:
+            self.trailer = json.loads(tail) if tail else None
+        except ValueError:
+            self.trailer = None
+
+    def records(self):
+        buffer = b""
+        pos = 0
+        for chunk in self.chunks():
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            while True:
+                fields, end = self.parse_record(buffer, pos)
+                if fields is None:
+                    break
+                pos = end
+                yield fields
+
+    @staticmethod
+    def parse_record(buffer, pos):
+        fields = []
+        count = None
+        while count is None or len(fields) < 3 + count:
+            value = shift = 0
+            while True:
+                if pos >= len(buffer):
+                    return None, pos
+                byte = buffer[pos]
+                pos += 1
+                value |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            fields.append(value)
+            if len(fields) == 3:
+                count = value
+        return fields, pos
+
+    def __iter__(self):
+        mask = 0
+        for fields in self.records():
+            run, xor, count = fields[:3]
+            for _ in range(run):
+                yield mask, ()
+            mask ^= xor
+            if count:
+                yield mask, tuple(self.keys[i] for i in fields[3:])
+
+
+class RecordingInput:
+    """Wraps an input source and writes what the game saw each tick to a ReplayWriter."""
+    def __init__(self, source, writer):
+        self.source = source
+        self.writer = writer
+        self.state = None
+        self.current_taps = None
+
+    def handle_event(self, event):
+        self.source.handle_event(event)
+
+    def get_pressed(self):
+        if self.state is None:
+            self.state = decode_keys(encode_keys(self.source.get_pressed(), self.writer.bits), self.writer.bits)
+        return self.state
+
+    def taps(self):
+        if self.current_taps is None:
+            self.current_taps = tuple(key for key in self.source.taps() if key in self.writer.bits)
+        return self.current_taps
+
+    def next_frame(self):
+        mask = encode_keys(self.get_pressed(), self.writer.bits)
+        self.writer.add(mask, self.taps())
+        self.state = None
+        self.current_taps = None
+        self.source.next_frame()
+
+
+class ReplayInput:
+    """Input source that plays back a ReplayReader."""
+    def __init__(self, reader):
+        self.reader = reader
+        self.frames = iter(reader)
+        self.ticks = 0
+        self.finished = False
+        self.state = KeyState()
+        self.current_taps = ()
+        self.next_frame(advance=False)
+
+    def handle_event(self, event):
+        pass
+
+    def get_pressed(self):
+        return self.state
+
+    def taps(self):
+        return self.current_taps
+
+    def next_frame(self, advance=True):
+        if advance:
+            self.ticks += 1
+        try:
+            mask, taps = next(self.frames)
+        except StopIteration:
+            self.finished = True
+            self.state = KeyState()
+            self.current_taps = ()
+            return
+        self.state = decode_keys(mask, self.reader.bits)
+        self.current_taps = taps
+
+
+def play(path, realtime=False, draw=False, engine=None):
+    """Re-simulate a replay. Returns (engine, ticks, seconds, matches_recording)."""
+    from game_engine import GameEngine, rng
+
+    reader = ReplayReader(path)
+    source = ReplayInput(reader)
+    header = reader.header
+    scratch = None
+    if engine is None:
+        scratch = tempfile.mkdtemp(prefix="arcade_replay_")
+        engine = GameEngine(saves_dir=scratch, input_source=source)
+    engine.input = source
+    engine.recording_enabled = False
+    # Games read the sim clock while initialising, so set it first
+    engine.timestep.set_rate(header["sim_rate"])
+    engine.timestep.time = header["sim_time"]
+    engine.start_game(header["game"], seed=header["seed"])
+
+    start = time.perf_counter()
+    if realtime:
+        frame_time = 0.0
+        while not source.finished:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    source.finished = True
+            engine.timestep.advance(frame_time, lambda: source.finished or engine.step())
+            engine.draw()
+            frame_time = engine.clock.tick(60) / 1000.0
+    else:
+        dt = engine.timestep.dt
+        while not source.finished:
+            engine.timestep.advance(dt, engine.step)
+            if draw:
+                engine.draw()
+    seconds = time.perf_counter() - start
+    if scratch:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    trailer = reader.trailer
+    matches = (trailer is not None and trailer.get("ticks") == source.ticks
+               and trailer.get("score") == engine.score and trailer.get("rng") == rng_fingerprint(rng))
+    return engine, source.ticks, seconds, matches
+
+
+def main(argv):
+    if len(argv) < 2 or argv[0] != "play":
+        print(__doc__.strip().splitlines()[-1].strip())
+        return 2
+    realtime = "--realtime" in argv
+    if not realtime:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    engine, ticks, seconds, matches = play(argv[1], realtime, draw="--draw" in argv or realtime)
+    recorded = ticks / engine.timestep.rate
+    print(f"{ticks} ticks ({recorded:.1f} s of play) in {seconds:.2f} s"
+          f" ({recorded / seconds if seconds else 0:.0f}x real time), score {engine.score}")
+    print("matches recording" if matches else "DIVERGED from recording")
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
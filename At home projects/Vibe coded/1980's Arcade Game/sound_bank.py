@@ -0,0 +1,66 @@
+import hashlib
+import os
+
+import numpy
+import pygame
+
+import synth
+
+
+class SoundBank:
+    """Named sound effects, synthesized on first use and cached on disk.
+
+    The rendered PCM of every effect is stored as a .npy file whose name
+    includes a hash of its ToneSpec, so changing a spec invalidates only that
+    effect. Later launches memory-map the cached file instead of
+    re-synthesizing it.
+    """
+    def __init__(self, effects=None, cache_dir=os.path.join("SAVES", "sound_cache")):
+        self.effects = dict(synth.EFFECTS if effects is None else effects)
+        self.cache_dir = cache_dir
+        self.sounds = {}
+        self.synthesized = 0  # effects rendered this session (0 on a hot start)
+        self.cache_hits = 0
+
+    def cache_path(self, name):
+        digest = hashlib.sha1(repr(self.effects[name].key()).encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.npy")
+
+    def load_samples(self, name):
+        """Return the PCM array for an effect, from the cache when possible."""
+        path = self.cache_path(name)
+        if os.path.exists(path):
+            try:
+                samples = numpy.load(path, mmap_mode="r")
+                self.cache_hits += 1
+                return samples
+            except (OSError, ValueError):
+                pass  # corrupt cache file, render it again
+
+        samples = synth.render(self.effects[name])
+        self.synthesized += 1
+        self.store(path, samples)
+        return samples
+
+    def store(self, path, samples):
+        # Write to a temp file and rename so a crash never leaves half a cache file
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                numpy.save(f, samples)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # caching is best effort
+
+    def get(self, name):
+        """Return the pygame Sound for an effect, or None if it is unknown."""
+        sound = self.sounds.get(name)
+        if sound is None and name in self.effects:
+            sound = pygame.sndarray.make_sound(numpy.ascontiguousarray(self.load_samples(name)))
+            self.sounds[name] = sound
+        return sound
+
+    def preload(self, names=None):
+        for name in names or self.effects:
+            self.get(name)
@@ -0,0 +1,302 @@
+import glob
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+
+from games import GAMES, UNLOCK_SCORES
+from leaderboard import NON_PROFILE_FILES, Leaderboard
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    name TEXT PRIMARY KEY,
+    created TEXT NOT NULL,
+    unlocked_games TEXT NOT NULL,
+    pokemon_collection TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY REFERENCES users(name),
+    games_played INTEGER NOT NULL DEFAULT 0,
+    total_score INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_game ON scores(game, score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_by_player ON scores(name, game, score DESC, id);
+"""
+
+
+class SQLiteSaveSystem:
+    """SaveSystem backend on a single SQLite database (SAVES/arcade.db).
+
+    Has the same methods as the JSON SaveSystem, so the engine does not care
+    which one it gets (see Config.SAVE_BACKEND). Profiles live in `users`
+    and `stats`; every submitted score is a row in `scores`, and the global
+    and personal top-10 lists and ranks are index range queries over it.
+    The database runs in WAL mode, and all SQL is fixed strings with
+    parameters so sqlite3's statement cache reuses the prepared statements.
+
+    When the database is first created, existing SAVES/*.json profiles are
+    imported (see migrate_json_saves).
+    """
+    TOP_SIZE = 10
+
+    SELECT_USERS = "SELECT name FROM users ORDER BY name"
+    SELECT_USER = ("SELECT u.name, u.created, u.unlocked_games, u.pokemon_collection, "
+                   "s.games_played, s.total_score FROM users u LEFT JOIN stats s ON s.name = u.name "
+                   "WHERE u.name = ?")
+    USER_EXISTS = "SELECT 1 FROM users WHERE name = ?"
+    INSERT_USER = "INSERT OR IGNORE INTO users (name, created, unlocked_games, pokemon_collection) VALUES (?, ?, ?, ?)"
+    UPDATE_USER = "UPDATE users SET unlocked_games = ?, pokemon_collection = ? WHERE name = ?"
+    UPSERT_STATS = ("INSERT INTO stats (name, games_played, total_score) VALUES (?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET games_played = excluded.games_played, "
+                    "total_score = excluded.total_score")
+    INSERT_SCORE = "INSERT INTO scores (game, name, score, date) VALUES (?, ?, ?, ?)"
+    TOP_SCORES = "SELECT name, score, date FROM scores WHERE game = ? ORDER BY score DESC, id LIMIT ?"
+    PLAYER_TOP_SCORES = ("SELECT name, score, date FROM scores WHERE name = ? AND game = ? "
+                         "ORDER BY score DESC, id LIMIT ?")
+    NTH_SCORE = "SELECT score FROM scores WHERE game = ? ORDER BY score DESC, id LIMIT 1 OFFSET ?"
+    COUNT_ABOVE = "SELECT COUNT(*) FROM scores WHERE game = ? AND score > ?"
+    COUNT_SCORES = "SELECT COUNT(*) FROM scores WHERE game = ?"
+    ANY_SCORE = "SELECT 1 FROM scores LIMIT 1"
+
+    def __init__(self, saves_dir="SAVES", db_name="arcade.db", migrate=True):
+        self.saves_dir = saves_dir
+        os.makedirs(self.saves_dir, exist_ok=True)
+        self._games = list(GAMES)
+        self.db_path = os.path.join(self.saves_dir, db_name)
+        new_db = not os.path.exists(self.db_path)
+
+        # The engine is single-threaded, but flush() may run from atexit
+        self.lock = threading.RLock()
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=64)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+        # Loaded profiles, so callers can mutate the dict and save_user() it
+        self.users = {}
+
+        if new_db and migrate:
+            migrate_json_saves(self.saves_dir, self)
+
+    # Users
+    def list_users(self):
+        """Return the sorted list of usernames."""
+        with self.lock:
+            return [row[0] for row in self.db.execute(self.SELECT_USERS)]
+
+    def user_exists(self, name):
+        with self.lock:
+            return name in self.users or self.db.execute(self.USER_EXISTS, (name,)).fetchone() is not None
+
+    def create_user(self, name, created=None):
+        """Create a new user. Returns True on success, False if the user exists."""
+        created = created or datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self.lock, self.db:
+            cursor = self.db.execute(self.INSERT_USER, (name, created, json.dumps(self._games), "[]"))
+            if cursor.rowcount == 0:
+                return False
+            self.db.execute(self.UPSERT_STATS, (name, 0, 0))
+        return True
+
+    def load_user(self, name):
+        """Load a user's data (cached after the first read). Returns dict or None."""
+        with self.lock:
+            if name in self.users:
+                return self.users[name]
+            row = self.db.execute(self.SELECT_USER, (name,)).fetchone()
+            if row is None:
+                return None
+            data = {
+                "name": row[0],
+                "created": row[1],
+                "games_played": row[4] or 0,
+                "total_score": row[5] or 0,
+                "unlocked_games": json.loads(row[2]),
+                "pokemon_collection": json.loads(row[3]),
+                "high_scores": {g: self.player_top(name, g) for g in self._games}
+            }
+            self.users[name] = data
+            return data
+
+    def save_user(self, name, data):
+        """Write a user's profile and stats. Returns True on success."""
+        with self.lock:
+            self.users[name] = data
+            try:
+                with self.db:
+                    self.db.execute(self.INSERT_USER, (name, data.get("created", ""), "[]", "[]"))
+                    self.db.execute(self.UPDATE_USER, (json.dumps(data.get("unlocked_games", [])),
+                                                       json.dumps(data.get("pokemon_collection", [])), name))
+                    self.db.execute(self.UPSERT_STATS, (name, data.get("games_played", 0),
+                                                        data.get("total_score", 0)))
+            except sqlite3.Error:
+                return False
+        return True
+
+    def get_player_data(self, name):
+        """Ensure user exists and return their data dict."""
+        data = self.load_user(name)
+        if data is None:
+            self.create_user(name)
+            data = self.load_user(name)
+        return data
+
+    def update_player_stats(self, name, score):
+        """Update player's overall stats and unlock games when thresholds reached."""
+        with self.lock:
+            user = self.get_player_data(name)
+            user["games_played"] = user.get("games_played", 0) + 1
+            user["total_score"] = user.get("total_score", 0) + score
+
+            # Unlock games based on total score
+            unlocked = set(user.get("unlocked_games", []))
+            for game, threshold in UNLOCK_SCORES.items():
+                if user["total_score"] >= threshold:
+                    unlocked.add(game)
+
+            user["unlocked_games"] = sorted(list(unlocked))
+            self.save_user(name, user)
+
+    # Scores
+    def add_high_score(self, game, player_name, score, date=None):
+        """Record a score for the global leaderboard and the player's list."""
+        if game not in self._games:
+            return
+        with self.lock:
+            user = self.get_player_data(player_name)
+            self.insert_score(game, player_name, score, date)
+            user["high_scores"][game] = self.player_top(player_name, game)
+
+    def insert_score(self, game, name, score, date=None):
+        date = date or datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self.lock, self.db:
+            self.db.execute(self.INSERT_SCORE, (game, name, score, date))
+
+    def player_top(self, name, game):
+        with self.lock:
+            return [{"name": n, "score": s, "date": d}
+                    for n, s, d in self.db.execute(self.PLAYER_TOP_SCORES, (name, game, self.TOP_SIZE))]
+
+    def insert_scores(self, rows):
+        """Insert many (game, name, score, date) rows in one transaction."""
+        with self.lock, self.db:
+            self.db.executemany(self.INSERT_SCORE, rows)
+
+    def has_scores(self):
+        with self.lock:
+            return self.db.execute(self.ANY_SCORE).fetchone() is not None
+
+    def qualifies(self, game, score):
+        """True if score would enter the game's global top 10."""
+        with self.lock:
+            row = self.db.execute(self.NTH_SCORE, (game, self.TOP_SIZE - 1)).fetchone()
+        return row is None or score > row[0]
+
+    def rank_for(self, game, score):
+        """Return (rank, total): where score places among every recorded score."""
+        with self.lock:
+            above = self.db.execute(self.COUNT_ABOVE, (game, score)).fetchone()[0]
+            total = self.db.execute(self.COUNT_SCORES, (game,)).fetchone()[0]
+        return above + 1, total + 1
+
+    def get_all_high_scores(self):
+        """Return the aggregated global high scores dict."""
+        with self.lock:
+            return {g: [{"name": n, "score": s, "date": d}
+                        for n, s, d in self.db.execute(self.TOP_SCORES, (g, self.TOP_SIZE))]
+                    for g in self._games}
+
+    def flush(self):
+        """Every change is committed as it happens; checkpoint the WAL."""
+        with self.lock:
+            try:
+                self.db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except sqlite3.Error:
+                return False
+        return True
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+def migrate_json_saves(saves_dir, target):
+    """Import SAVES/*.json profiles and the JSON leaderboard into an SQLiteSaveSystem.
+
+    Each profile becomes a user with its stats. Every score the JSON
+    leaderboard recorded (snapshot index, score log and top-10 view, see
+    leaderboard.Leaderboard) becomes a score row, so ranks count the same
+    scores on both backends. Scores a snapshot kept without a name are
+    matched to personal high scores where they can be, else imported as
+    "?". Personal high scores the leaderboard never saw are imported too.
+    The leaderboard is only imported into a target without scores, and the
+    JSON files are left in place. Returns the number of users imported.
+    """
+    import_scores = not target.has_scores()
+    personal = {}  # (game, name, score, date) -> count not yet matched to a leaderboard row
+    imported = 0
+    for path in sorted(glob.glob(os.path.join(saves_dir, "*.json"))):
+        if os.path.basename(path) in NON_PROFILE_FILES:
+            continue
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        name = data.get("name") or os.path.splitext(os.path.basename(path))[0]
+        if not target.create_user(name, data.get("created")):
+            continue
+        target.save_user(name, data)
+        for game, entries in data.get("high_scores", {}).items():
+            for entry in entries:
+                key = (game, entry.get("name", name), entry.get("score", 0), entry.get("date", ""))
+                personal[key] = personal.get(key, 0) + 1
+        imported += 1
+
+    rows = []
+    if import_scores:
+        unnamed = None  # (game, score) -> personal scores left for the unnamed rows
+        for game, name, score, date in Leaderboard(saves_dir, GAMES, read_only=True).export():
+            if name is not None:
+                key = (game, name, score, date)
+                if personal.get(key):
+                    personal[key] -= 1
+                rows.append(key)
+                continue
+            if unnamed is None:
+                # Named rows come first, so what is left of `personal` now may be behind these
+                unnamed = {}
+                for key, count in personal.items():
+                    unnamed.setdefault(key[::2], []).extend([key] * count)
+                personal = {}
+            matches = unnamed.get((game, score))
+            rows.append(matches.pop() if matches else (game, "?", score, ""))
+        if unnamed:
+            rows.extend(key for keys in unnamed.values() for key in keys)
+    rows.extend(key for key, count in personal.items() for _ in range(count))
+    target.insert_scores(rows)
+    target.users.clear()  # profiles reload with their imported scores
+    return imported
+
+
+if __name__ == "__main__":
+    # python sqlite_saves.py [saves_dir]  -- one-shot import into saves_dir/arcade.db
+    saves_dir = sys.argv[1] if len(sys.argv) > 1 else "SAVES"
+    if os.path.exists(os.path.join(saves_dir, "arcade.db")):
+        print(f"{saves_dir}/arcade.db already exists; remove it to migrate again")
+        sys.exit(1)
+    saves = SQLiteSaveSystem(saves_dir, migrate=False)
+    count = migrate_json_saves(saves_dir, saves)
+    saves.close()
+    print(f"Imported {count} profiles into {saves.db_path}")
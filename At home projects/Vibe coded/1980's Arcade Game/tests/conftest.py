@@ -0,0 +1,11 @@
+import os
+import sys
+
+# game_engine opens the mixer at import, so SDL's dummy drivers have to be
+# chosen before any test module imports pygame.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# The game modules live one folder up, so a bare `pytest` finds them too
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
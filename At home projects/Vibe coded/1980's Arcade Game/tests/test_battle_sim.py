@@ -0,0 +1,96 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+import numpy
+import game_engine
+from games.pokemon import Pokemon, PokemonBattle
+from battle_sim import NEVER, matchups, policies, simulate, write_csv
+from pokemon_data import WILD_SPECIES, catch_chance, damage
+
+def play_scalar(player, level, wild, wild_level, policy, battles, seed):
+    """Play battles through the game's own PokemonBattle and return (win, catch, lose) rates."""
+    game_engine.rng.seed(seed)
+    move, attacks = policy
+    counts = {"WIN": 0, "CATCH": 0, "LOSE": 0}
+    for _ in range(battles):
+        battle = PokemonBattle(Pokemon(player, level), Pokemon(wild, wild_level))
+        move_index = [name for name, _ in battle.player_pokemon.moves].index(move)
+        turn = 0
+        while True:
+            if turn >= attacks:
+                battle.try_catch()
+            else:
+                battle.select_move(move_index)
+            battle.state = "SELECT_MOVE"
+            if battle.result == "CATCH":
+                break
+            if battle.wild_pokemon.hp <= 0:
+                battle.result = "WIN"
+                break
+            if battle.player_pokemon.hp <= 0:
+                battle.result = "LOSE"
+                break
+            turn += 1
+        counts[battle.result] += 1
+    return counts["WIN"] / battles, counts["CATCH"] / battles, counts["LOSE"] / battles
+
+class TestPokemonTables(unittest.TestCase):
+    def test_species_stats(self):
+        """Test species built from the tables keep the old stats and moves."""
+        charma = Pokemon("CHARMA", 5)
+        self.assertEqual((charma.type, charma.max_hp, charma.hp, charma.attack, charma.defense),
+                         ("FIRE", 45, 45, 10, 10))
+        self.assertEqual(charma.moves, [("Ember", 25), ("Fire Spin", 35)])
+        self.assertEqual(Pokemon("PIKA", 3).color, game_engine.Config.COLORS["YELLOW"])
+
+    def test_formulas_element_wise(self):
+        """Test the battle formulas give the same numbers for scalars and arrays."""
+        self.assertEqual(damage(25, 5, 40), 1)
+        self.assertEqual(damage(numpy.array([25, 35]), 10, numpy.array([40, 8])).tolist(), [1, 37])
+        self.assertEqual(catch_chance(numpy.array([45.0, 0.0]), 45.0).tolist(),
+                         [catch_chance(45, 45), catch_chance(0, 45)])
+
+class TestBattleSim(unittest.TestCase):
+    def test_matchup_grid(self):
+        """Test the grid covers every species, level and policy combination."""
+        grid = matchups(["CHARMA"], range(3, 6), WILD_SPECIES, range(3, 8))
+        self.assertEqual(len(grid), 3 * len(WILD_SPECIES) * 5 * len(policies("CHARMA")))
+
+    def test_deterministic_matchups(self):
+        """Test matchups without randomness end the same way every time."""
+        grid = [("CHARMA", 5, "PIKA", 3, ("Fire Spin", NEVER)), ("CHARMA", 5, "PIKA", 7, ("Ember", NEVER))]
+        results = simulate(grid, 100)
+        self.assertEqual(results["win"].tolist(), [1.0, 0.0])
+        self.assertEqual(results["lose"].tolist(), [0.0, 1.0])
+        self.assertEqual(results["turns"].tolist(), [1.0, 2.0])
+
+    def test_matches_game_rules(self):
+        """Test simulated rates agree with battles played through PokemonBattle."""
+        grid = [("CHARMA", 5, "BULBA", 6, ("Ember", 1)), ("CHARMA", 8, "SQUIRT", 4, ("Ember", 0)),
+                ("CHARMA", 10, "PIKA", 7, ("Ember", NEVER))]
+        results = simulate(grid, 20000, seed=1)
+        for i, matchup in enumerate(grid):
+            win, catch, lose = play_scalar(*matchup, battles=2000, seed=i)
+            self.assertAlmostEqual(results["win"][i], win, delta=0.04)
+            self.assertAlmostEqual(results["catch"][i], catch, delta=0.04)
+            self.assertAlmostEqual(results["lose"][i], lose, delta=0.04)
+            self.assertAlmostEqual(results["win"][i] + results["catch"][i] + results["lose"][i], 1.0)
+
+    def test_csv(self):
+        """Test the CSV report has a row per matchup."""
+        temp = tempfile.mkdtemp()
+        try:
+            grid = matchups(["CHARMA"], [5], ["PIKA"], [4, 5])
+            path = os.path.join(temp, "report", "balance.csv")
+            write_csv(path, grid, simulate(grid, 50))
+            with open(path, newline="") as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(len(rows), 1 + len(grid))
+            self.assertEqual(rows[1][:5], ["CHARMA", "5", "PIKA", "4", "Ember"])
+        finally:
+            shutil.rmtree(temp)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import pygame
+from game_engine import Config, Paddle
+from games.breakout import BreakoutBall, BrickField, generate_layout, sweep_box
+from headless import make_engine
+
+BOUNDARIES = pygame.Rect(50, 50, 924, 668)
+
+def classic_field():
+    return BrickField(50, 50, [["RED"] * 10 for _ in range(5)], 70, 20)
+
+class TestBrickField(unittest.TestCase):
+    def test_layout(self):
+        """Test cells, rects and gaps in the layout."""
+        field = BrickField(100, 100, [["RED", None, "BLUE"], ["GREEN"]], 40, 10, gap=4)
+        self.assertEqual((field.cols, field.rows), (3, 2))
+        self.assertEqual(field.remaining, 3)
+        self.assertEqual(field.cell_rect(2), pygame.Rect(188, 100, 40, 10))
+        self.assertEqual(field.cell_at(100, 100), 0)
+        self.assertIsNone(field.cell_at(145, 105))  # between bricks
+        self.assertIsNone(field.cell_at(150, 105))  # gap in the layout
+        self.assertEqual(field.cell_at(227, 109), 2)
+        self.assertIsNone(field.cell_at(150, 115))  # short row
+        self.assertIsNone(field.cell_at(99, 100))
+
+    def test_break_patches_surface(self):
+        """Test breaking a brick updates the counter and cuts it out of the cached surface."""
+        field = classic_field()
+        self.assertEqual(field.surface.get_at((10, 10))[:3], Config.COLORS["RED"])
+        rect = field.break_cell(0)
+        self.assertEqual(rect, pygame.Rect(50, 50, 70, 20))
+        self.assertEqual(field.remaining, 49)
+        self.assertEqual(field.surface.get_at((10, 10))[:3], BrickField.BLANK)
+        self.assertIsNone(field.cell_at(60, 60))
+        field.break_cell(0)
+        self.assertEqual(field.remaining, 49)
+
+    def test_sweep_stops_tunnelling(self):
+        """Test a ball moving further than a brick is tall in one step still hits it."""
+        field = BrickField(0, 100, [["RED"]], 70, 10)
+        t, axis, cell = field.sweep(pygame.Rect(20, 150, 16, 16), 0, -80)
+        self.assertEqual((axis, cell), ("y", 0))
+        self.assertAlmostEqual(t, 40 / 80)
+        self.assertIsNone(field.sweep(pygame.Rect(20, 150, 16, 16), 0, -30))
+        self.assertEqual(field.sweep(pygame.Rect(-40, 100, 16, 16), 30, 0)[1], "x")
+
+    def test_sweep_box_edges(self):
+        """Test touching boxes only count when moving into them."""
+        self.assertEqual(sweep_box(0, 10, 0, -5, -5, 0, 5, 10), (0.0, "y"))
+        self.assertIsNone(sweep_box(0, 10, 0, 5, -5, 0, 5, 10))
+        self.assertEqual(sweep_box(0, 5, 1, 1, -5, 0, 5, 10), (0.0, "y"))  # starts inside
+
+    def test_ball_bounces_and_breaks(self):
+        """Test the ball breaks the brick it reaches and bounces back."""
+        field = classic_field()
+        paddle = Paddle(462, 698, 100, 15, "BLUE", 8)
+        ball = BreakoutBall(85, 195, 8, "WHITE", 20)
+        broken = ball.update(paddle, field, BOUNDARIES)
+        self.assertEqual(broken, field.cell_rect(40))
+        self.assertEqual(ball.rect.top, 170)
+        self.assertGreater(ball.speed_y, 0)
+        self.assertEqual(field.remaining, 49)
+
+    def test_generated_layout(self):
+        """Test generated walls have the requested size and are mirror symmetric."""
+        layout = generate_layout(101, 60, seed=3)
+        self.assertEqual(len(layout), 60)
+        self.assertTrue(all(len(row) == 101 and row == row[::-1] for row in layout))
+        self.assertEqual(layout, generate_layout(101, 60, seed=3))
+        field = BrickField(60, 60, layout, 8, 5, gap=1)
+        self.assertEqual(field.remaining, sum(cell is not None for row in layout for cell in row))
+
+class TestBreakoutEngine(unittest.TestCase):
+    def tearDown(self):
+        Config.BREAKOUT_GRID = None
+        Config.DIRTY_RECTS = False
+
+    def test_generated_level(self):
+        """Test a large generated wall fits in the playfield and plays."""
+        Config.BREAKOUT_GRID = (120, 60)
+        engine = make_engine(seed=2)
+        engine.start_game("BREAKOUT")
+        field = engine.breakout_objects["bricks"]
+        self.assertEqual((field.cols, field.rows), (120, 60))
+        self.assertTrue(engine.get_boundaries().contains(field.rect))
+        for _ in range(200):
+            engine.step()
+            engine.draw()
+        self.assertLess(field.remaining, sum(field.colors[c] is not None for c in range(len(field.colors))))
+
+    def test_dirty_patch(self):
+        """Test a broken brick is patched out of the cached playfield."""
+        Config.DIRTY_RECTS = True
+        engine = make_engine(seed=1)
+        engine.start_game("BREAKOUT")
+        engine.draw()
+        field = engine.breakout_objects["bricks"]
+        ball = engine.breakout_objects["ball"]
+        ball.rect.topleft = (80, 180)
+        ball.speed_x, ball.speed_y = 0, -20
+        engine.step()
+        engine.draw()
+        self.assertEqual(field.remaining, 49)
+        self.assertEqual(engine.renderer.static.get_at((90, 160)), engine.screen.get_at((90, 160)))
+        self.assertNotEqual(engine.renderer.static.get_at((90, 160))[:3], Config.COLORS["PURPLE"])
+
+if __name__ == "__main__":
+    unittest.main()
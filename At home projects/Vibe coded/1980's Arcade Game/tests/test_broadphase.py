@@ -0,0 +1,52 @@
+import random
+import unittest
+import pygame
+from broadphase import SpatialHash, circle_hits_rect, circles_overlap, compact, swap_remove
+
+class TestSpatialHash(unittest.TestCase):
+    def test_matches_brute_force(self):
+        """Test grid queries find exactly the overlapping rects a full scan finds."""
+        rng = random.Random(3)
+        rects = [pygame.Rect(rng.randint(-50, 1000), rng.randint(-50, 700), rng.randint(1, 90), rng.randint(1, 90))
+                 for _ in range(300)]
+        grid = SpatialHash(32)
+        for _ in range(2):  # the second pass reuses the cleared cells
+            grid.clear()
+            for rect in rects:
+                grid.insert(rect, rect)
+            for _ in range(100):
+                probe = pygame.Rect(rng.randint(0, 1000), rng.randint(0, 700), 20, 20)
+                hits = [rect for rect in grid.query(probe) if rect.colliderect(probe)]
+                expected = [rect for rect in rects if rect.colliderect(probe)]
+                self.assertCountEqual(hits, expected)
+
+    def test_object_reported_once(self):
+        """Test an object spanning many cells is returned once per query."""
+        grid = SpatialHash(10)
+        grid.insert_circle("big", 50, 50, 45)
+        self.assertEqual(grid.query_rect(0, 0, 100, 100), ["big"])
+        self.assertEqual(grid.query_circle(500, 500, 5), [])
+
+    def test_exact_tests(self):
+        """Test the squared-distance circle and circle/rect tests."""
+        self.assertTrue(circles_overlap(0, 0, 5, 6, 0, 2))
+        self.assertFalse(circles_overlap(0, 0, 5, 8, 0, 2))
+        rect = pygame.Rect(10, 10, 10, 10)
+        self.assertTrue(circle_hits_rect(5, 15, 6, rect))
+        self.assertFalse(circle_hits_rect(0, 0, 10, rect))
+
+class TestRemoval(unittest.TestCase):
+    def test_compact_keeps_order(self):
+        items = list(range(10))
+        compact(items, lambda x: x % 3)
+        self.assertEqual(items, [1, 2, 4, 5, 7, 8])
+
+    def test_swap_remove(self):
+        items = ["a", "b", "c", "d"]
+        swap_remove(items, 1)
+        self.assertEqual(items, ["a", "d", "c"])
+        swap_remove(items, 2)
+        self.assertEqual(items, ["a", "d"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import random
+import unittest
+import numpy
+from broadphase import SpatialHash
+from entities import EntityPool
+
+class TestEntityPool(unittest.TestCase):
+    def test_spawn_and_recycle(self):
+        """Test dead slots are reused before the pool grows."""
+        pool = EntityPool(4)
+        slots = [pool.spawn(i, 0) for i in range(4)]
+        self.assertEqual(slots, [0, 1, 2, 3])
+        pool.kill(1)
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(pool.spawn(9, 9), 1)
+        self.assertEqual(pool.capacity, 4)
+        pool.spawn(5, 5)
+        self.assertEqual(pool.capacity, 8)
+        self.assertEqual(pool.x[:5].tolist(), [0, 9, 2, 3, 5])
+
+    def test_lifetime_expiry(self):
+        """Test entities expire after `life` updates."""
+        pool = EntityPool(8)
+        pool.spawn(0, 0, 1, 0, life=3)
+        pool.spawn(0, 0, 1, 0)
+        for _ in range(3):
+            pool.update()
+        self.assertEqual(pool.indices().tolist(), [1])
+        self.assertEqual(pool.x[1], 3)
+
+    def test_wrap_and_bounds(self):
+        """Test wrapping pools wrap and bounded pools expire off-screen entities."""
+        wrapping = EntityPool(4, bounds=(0, 0, 100, 100), wrap=True)
+        wrapping.spawn(98, 1, 5, -3)
+        wrapping.update()
+        self.assertEqual((wrapping.x[0], wrapping.y[0]), (3, 98))
+        bounded = EntityPool(4, bounds=(0, 0, 100, 100))
+        bounded.spawn(50, 5, 0, -10)
+        bounded.update()
+        self.assertEqual(len(bounded), 0)
+
+    def test_collision_queries(self):
+        """Test circle overlap queries only report live entities."""
+        rocks = EntityPool(8)
+        rocks.spawn(0, 0, radius=10)
+        rocks.spawn(50, 0, radius=10)
+        dead = rocks.spawn(5, 0, radius=10)
+        rocks.kill(dead)
+        self.assertEqual(rocks.overlapping(8, 0).tolist(), [0])
+        shots = EntityPool(4)
+        shots.spawn(45, 0)
+        shots.spawn(500, 500)
+        shots.spawn(5, 0, radius=50)
+        self.assertEqual(shots.contacts(rocks, SpatialHash(64)), [(0, 1), (2, 0), (2, 1)])
+
+    def test_contacts_match_full_scan(self):
+        """Test grid contacts find exactly the pairs an all-pairs test finds."""
+        rng = random.Random(5)
+        rocks = EntityPool(8)
+        shots = EntityPool(8)
+        for k in range(300):
+            rocks.spawn(rng.uniform(0, 1024), rng.uniform(0, 768), radius=rng.uniform(10, 50))
+            if k % 3:
+                continue
+            shots.spawn(rng.uniform(0, 1024), rng.uniform(0, 768), radius=rng.choice([0, 2]))
+        for i in range(0, 300, 7):
+            rocks.kill(i)
+        mine, theirs = shots.indices(), rocks.indices()
+        dx = shots.x[mine, None] - rocks.x[theirs]
+        dy = shots.y[mine, None] - rocks.y[theirs]
+        reach = shots.radius[mine, None] + rocks.radius[theirs]
+        rows, cols = numpy.nonzero(dx * dx + dy * dy < reach * reach)
+        expected = list(zip(mine[rows].tolist(), theirs[cols].tolist()))
+        flipped = sorted((j, i) for i, j in expected)
+        for dense_pairs in (EntityPool.DENSE_PAIRS, 0):  # one overlap mask, then the grid
+            with self.subTest(dense_pairs=dense_pairs):
+                shots.DENSE_PAIRS = rocks.DENSE_PAIRS = dense_pairs
+                self.assertEqual(shots.contacts(rocks, SpatialHash(64)), expected)
+                self.assertEqual(rocks.contacts(shots), flipped)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import inspect
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import types
+import unittest
+import pygame
+import games
+from game_engine import Config
+from headless import make_engine
+
+class TestRegistry(unittest.TestCase):
+    def test_games_load_on_first_selection(self):
+        """Test starting the arcade imports no game, and selecting one imports only that game."""
+        code = ("import sys, game_engine, headless; engine = headless.make_engine(); "
+                "before = sorted(m for m in sys.modules if m.startswith('games.')); "
+                "engine.start_game('SNAKE'); "
+                "print(before, sorted(m for m in sys.modules if m.startswith('games.')))")
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+        folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", code], cwd=folder, env=env, capture_output=True,
+                                text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[] ['games.snake']")
+
+    def test_keys_cover_update(self):
+        """Test each game's KEYS lists every key its update() reads."""
+        for name in games.GAMES:
+            module = games.load(name)
+            read = set(re.findall(r"keys\[pygame\.(K_\w+)\]", inspect.getsource(module.update)))
+            with self.subTest(game=name):
+                self.assertLessEqual({getattr(pygame, key) for key in read}, set(module.KEYS))
+
+    def test_registered_game(self):
+        """Test a game registered from outside the engine is dispatched through its hooks."""
+        calls = []
+        module = types.ModuleType("test_games_blank")
+        module.KEYS = []
+        module.init = lambda engine: calls.append("init")
+        module.draw = lambda engine: calls.append("draw")
+        module.teardown = lambda engine: calls.append("teardown")
+        def update(engine):
+            calls.append("update")
+            engine.current_state = Config.GAME_STATES["GAME_OVER"]
+        module.update = update
+        sys.modules[module.__name__] = module
+        games.register("BLANK", module.__name__)
+        temp = tempfile.mkdtemp()
+        try:
+            engine = make_engine(saves_dir=temp)
+            self.assertIn("BLANK", engine.GAME_LIST)
+            engine.start_game("BLANK")
+            self.assertEqual(engine.state_names[engine.current_state], "BLANK")
+            engine.draw_frame()
+            engine.step()
+            engine.step()
+            self.assertEqual(calls, ["init", "draw", "update", "teardown"])
+            self.assertEqual(engine.current_state, Config.GAME_STATES["GAME_OVER"])
+        finally:
+            games.GAMES.remove("BLANK")
+            del games.MODULES["BLANK"]
+            del Config.GAME_STATES["BLANK"]
+            del sys.modules[module.__name__]
+            engine.save_system.flush()
+            shutil.rmtree(temp)
+
+if __name__ == "__main__":
+    unittest.main()
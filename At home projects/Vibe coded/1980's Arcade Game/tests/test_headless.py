@@ -0,0 +1,63 @@
+import unittest
+import pygame
+from headless import GAMES, run_game
+from input_sources import KeyState, RandomInput, ScriptedInput
+
+def fingerprint(stats):
+    engine = stats.engine
+    return (stats.scores, engine.score, engine.timestep.ticks, engine.current_state)
+
+class TestInputSources(unittest.TestCase):
+    def test_scripted_input(self):
+        """Test scripted keys change on the scripted frames."""
+        script = ScriptedInput([(0, [pygame.K_LEFT]), (3, [pygame.K_RIGHT, pygame.K_SPACE]), (5, [])])
+        held = []
+        for _ in range(6):
+            keys = script.get_pressed()
+            held.append((keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_SPACE]))
+            script.next_frame()
+        self.assertEqual(held, [(True, False, False)] * 3 + [(False, True, True)] * 2 + [(False, False, False)])
+
+    def test_random_input_seeded(self):
+        """Test random input repeats for the same seed."""
+        def run(seed):
+            source = RandomInput([pygame.K_a, pygame.K_b], seed=seed, hold=2)
+            out = []
+            for _ in range(50):
+                out.append(source.get_pressed()[pygame.K_a])
+                source.next_frame()
+            return out
+        self.assertEqual(run(1), run(1))
+        self.assertNotEqual(run(1), run(2))
+
+    def test_key_state(self):
+        """Test KeyState indexes like pygame.key.get_pressed()."""
+        keys = KeyState([pygame.K_UP])
+        self.assertTrue(keys[pygame.K_UP])
+        self.assertFalse(keys[pygame.K_DOWN])
+
+class TestHeadlessRuns(unittest.TestCase):
+    def test_every_game_runs(self):
+        """Test all eight games update and draw headless."""
+        for game in GAMES:
+            with self.subTest(game=game):
+                stats = run_game(game, 120, seed=3)
+                self.assertEqual(len(stats.update_times), 120)
+                self.assertGreater(stats.ticks_per_second(), 0)
+
+    def test_deterministic(self):
+        """Test the same seed and input replay identically."""
+        for game in ["SNAKE", "SPACE_INVADERS", "ASTEROIDS", "TETRIS"]:
+            with self.subTest(game=game):
+                first = run_game(game, 600, seed=7, draw=False)
+                second = run_game(game, 600, seed=7, draw=False)
+                self.assertEqual(fingerprint(first), fingerprint(second))
+
+    def test_scripted_snake(self):
+        """Test a scripted snake turns into the wall on schedule."""
+        script = ScriptedInput([(0, []), (2, [pygame.K_UP])])
+        stats = run_game("SNAKE", 30, seed=1, input_source=script, draw=False)
+        self.assertGreaterEqual(stats.restarts, 1)
+
+if __name__ == '__main__':
+    unittest.main()
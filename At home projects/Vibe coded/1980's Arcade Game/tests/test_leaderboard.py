@@ -0,0 +1,228 @@
+import unittest
+import os
+import json
+import random
+import shutil
+import tempfile
+import threading
+import bisect
+from unittest.mock import patch
+import leaderboard
+from leaderboard import GameBoard, Leaderboard, SortedScores
+
+class TestGameBoard(unittest.TestCase):
+    def test_keeps_best_entries(self):
+        """Test the heap keeps the top `size` scores in order."""
+        board = GameBoard(size=10)
+        scores = random.Random(3).sample(range(1000), 200)
+        for seq, score in enumerate(scores, 1):
+            board.add(score, {"score": score}, seq)
+        self.assertEqual([e["score"] for e in board.entries()], sorted(scores, reverse=True)[:10])
+
+    def test_ties_do_not_qualify(self):
+        """Test a score equal to last place does not displace the earlier entry."""
+        board = GameBoard(size=3)
+        for seq, score in enumerate([50, 40, 30], 1):
+            board.add(score, {"name": str(seq), "score": score}, seq)
+        self.assertFalse(board.qualifies(30))
+        self.assertTrue(board.qualifies(31))
+        self.assertFalse(board.add(30, {"name": "late", "score": 30}, 4))
+        self.assertEqual(board.entries()[-1]["name"], "3")
+
+    def test_rank(self):
+        """Test rank counts every recorded score, not just the top list."""
+        board = GameBoard(size=2)
+        for seq, score in enumerate([10, 20, 30, 30, 40], 1):
+            board.add(score, {"score": score}, seq)
+        self.assertEqual(board.rank(50), 1)
+        self.assertEqual(board.rank(30), 2)
+        self.assertEqual(board.rank(25), 4)
+        self.assertEqual(board.rank(5), 6)
+
+class TestSortedScores(unittest.TestCase):
+    def test_matches_sorted_list(self):
+        """Test blocked inserts and rank counts match a plain sorted list through many splits."""
+        rng = random.Random(8)
+        start = sorted(rng.randrange(50) for _ in range(30))
+        scores = SortedScores(start)
+        scores.LOAD = 4
+        expected = list(start)
+        for _ in range(500):
+            score = rng.randrange(-10, 60)
+            scores.add(score)
+            bisect.insort(expected, score)
+            probe = rng.randrange(-20, 70)
+            self.assertEqual(scores.bisect_right(probe), bisect.bisect_right(expected, probe))
+        self.assertEqual(list(scores), expected)
+        self.assertEqual(len(scores), len(expected))
+        self.assertGreater(len(scores.blocks), 50)
+
+class TestLeaderboard(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def open_board(self, **kwargs):
+        return Leaderboard(self.dir, ["PONG", "SNAKE"], **kwargs)
+
+    def test_scores_replayed_from_log(self):
+        """Test scores survive a restart without a compaction."""
+        board = self.open_board()
+        board.add("PONG", "Ann", 30)
+        board.add("PONG", "Bob", 50)
+        board.log_file.close()
+        board = self.open_board()
+        self.assertEqual([e["name"] for e in board.top("PONG")], ["Bob", "Ann"])
+        self.assertEqual(board.count("PONG"), 2)
+
+    def test_compaction_writes_view(self):
+        """Test compaction snapshots the index and the readable top list."""
+        board = self.open_board(compact_after=10 ** 6)
+        for i in range(25):
+            board.add("SNAKE", f"P{i}", i)
+        self.assertTrue(board.compact())
+        self.assertEqual(board.rotated_logs(), [])
+        with open(board.view_path) as f:
+            view = json.load(f)["high_scores"]["SNAKE"]
+        self.assertEqual([e["score"] for e in view], list(range(24, 14, -1)))
+        board = self.open_board()
+        self.assertEqual(board.count("SNAKE"), 25)
+        self.assertEqual(board.rank("SNAKE", 20), 5)
+
+    def test_no_double_count_after_interrupted_compaction(self):
+        """Test a crash after the snapshot but before the old log is removed."""
+        board = self.open_board(compact_after=10 ** 6)
+        for i in range(5):
+            board.add("PONG", "Ann", i + 1)
+        board.log_file.close()
+        board.log_file = None
+        shutil.copy(board.log_path, board.log_path + ".1.keep")
+        board.compact()
+        os.replace(board.log_path + ".1.keep", board.log_path + ".1")
+        board = self.open_board()
+        self.assertEqual(board.count("PONG"), 5)
+        self.assertEqual(len(board.top("PONG")), 5)
+
+    def test_add_during_snapshot(self):
+        """Test scores can be added while a compaction builds and writes its snapshot."""
+        board = self.open_board(compact_after=10 ** 6)
+        for i in range(5):
+            board.add("PONG", "Ann", i)
+        building = threading.Event()
+        release = threading.Event()
+        timed_out = []
+        histogram = leaderboard.histogram
+
+        def slow_histogram(scores):
+            building.set()
+            timed_out.append(not release.wait(5))
+            return histogram(scores)
+        with patch("leaderboard.histogram", slow_histogram):
+            compaction = threading.Thread(target=board.compact)
+            compaction.start()
+            self.assertTrue(building.wait(5))
+            board.add("PONG", "Bob", 50)  # blocks until the timeout if the snapshot holds the lock
+            self.assertEqual(board.rank("PONG", 40), 2)
+            release.set()
+            compaction.join()
+        self.assertFalse(any(timed_out))
+        board.log_file.close()
+        board = self.open_board()
+        self.assertEqual(board.count("PONG"), 6)
+        self.assertEqual(board.top("PONG")[0]["name"], "Bob")
+
+    def test_interrupted_compaction_keeps_rotated_logs(self):
+        """Test a leftover rotated log is kept as is and both are replayed once."""
+        board = self.open_board(compact_after=10 ** 6)
+        for i in range(3):
+            board.add("PONG", "Ann", i)
+        board.log_file.close()
+        board.log_file = None
+        os.replace(board.log_path, board.log_path + ".1")  # crash before the snapshot
+        board = self.open_board(compact_after=10 ** 6)
+        board.add("PONG", "Bob", 9)
+        with patch("leaderboard.write_atomic", side_effect=OSError):
+            self.assertFalse(board.compact())
+        self.assertEqual(board.rotated_logs(), [board.log_path + ".1", board.log_path + ".2"])
+        self.assertEqual(self.open_board().count("PONG"), 4)
+        self.assertTrue(board.compact())
+        self.assertEqual(board.rotated_logs(), [])
+        self.assertEqual(self.open_board().count("PONG"), 4)
+
+    def test_torn_last_line_ignored(self):
+        """Test a partially written final record is skipped."""
+        board = self.open_board()
+        board.add("PONG", "Ann", 10)
+        board.log_file.close()
+        with open(board.log_path, "a") as f:
+            f.write('{"seq": 2, "game": "PO')
+        board = self.open_board()
+        self.assertEqual(board.count("PONG"), 1)
+
+    def test_background_compaction(self):
+        """Test passing the threshold compacts the log."""
+        board = self.open_board(compact_after=20)
+        for i in range(30):
+            board.add("PONG", "Ann", i)
+        board.flush()
+        self.assertEqual(board.log_records, 0)
+        self.assertEqual(self.open_board().count("PONG"), 30)
+
+    def test_imports_old_view(self):
+        """Test an existing global_high_scores.json is migrated once."""
+        old = {"high_scores": {"PONG": [{"name": "Ann", "score": 9, "date": "2024-01-01 10:00"}]}}
+        with open(os.path.join(self.dir, "global_high_scores.json"), "w") as f:
+            json.dump(old, f)
+        board = self.open_board()
+        self.assertEqual(board.top("PONG")[0]["name"], "Ann")
+        board.flush()
+        self.assertEqual(self.open_board().count("PONG"), 1)
+
+    def test_export(self):
+        """Test a read-only board exports every score and writes nothing."""
+        board = self.open_board(size=2, compact_after=10 ** 6)
+        for i in range(5):
+            board.add("PONG", f"P{i}", i * 10)
+        board.compact()
+        board.add("PONG", "Late", 5, "2024-01-01 10:00")
+        board.log_file.close()
+        files = sorted(os.listdir(self.dir))
+        rows = self.open_board(size=2, read_only=True).export()
+        self.assertEqual([row[1:3] for row in rows],
+                         [("P3", 30), ("P4", 40), ("Late", 5), (None, 0), (None, 10), (None, 20)])
+        self.assertEqual(rows[2], ("PONG", "Late", 5, "2024-01-01 10:00"))
+        self.assertEqual(sorted(os.listdir(self.dir)), files)
+
+class TestSaveSystemLeaderboard(unittest.TestCase):
+    def setUp(self):
+        from game_engine import SaveSystem
+        self.dir = tempfile.mkdtemp()
+        self.saves = SaveSystem(self.dir, write_delay=60)
+
+    def tearDown(self):
+        self.saves.store.close()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_high_scores(self):
+        """Test global and personal top lists stay sorted and bounded."""
+        self.saves.create_user("Ann")
+        for score in [5, 80, 20, 80, 1, 60, 70, 30, 90, 10, 40, 50]:
+            self.saves.add_high_score("TETRIS", "Ann", score)
+        top = [e["score"] for e in self.saves.get_all_high_scores()["TETRIS"]]
+        self.assertEqual(top, [90, 80, 80, 70, 60, 50, 40, 30, 20, 10])
+        personal = self.saves.get_player_data("Ann")["high_scores"]["TETRIS"]
+        self.assertEqual([e["score"] for e in personal], top)
+        self.assertFalse(self.saves.qualifies("TETRIS", 10))
+        self.assertEqual(self.saves.rank_for("TETRIS", 75), (4, 13))
+
+    def test_leaderboard_files_not_users(self):
+        """Test the leaderboard snapshot files are not listed as users."""
+        self.saves.create_user("Ann")
+        self.saves.add_high_score("PONG", "Ann", 3)
+        self.saves.flush()
+        self.assertEqual(self.saves.list_users(), ["Ann"])
+
+if __name__ == '__main__':
+    unittest.main()
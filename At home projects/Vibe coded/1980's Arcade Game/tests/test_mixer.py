@@ -0,0 +1,70 @@
+import unittest
+import pygame
+from mixer import ChannelPool
+
+RULES = {"hit": (1, 2, 30), "boom": (2, 2, 60), "bonus": (3, 1, 0)}
+
+def silence(ms):
+    frequency, size, channels = pygame.mixer.get_init()
+    return pygame.mixer.Sound(buffer=bytes(frequency * ms // 1000 * abs(size) // 8 * channels))
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+class TestChannelPool(unittest.TestCase):
+    def setUp(self):
+        pygame.mixer.init()
+        self.clock = Clock()
+        self.short = silence(100)
+        self.long = silence(500)
+
+    def make_pool(self, channels):
+        self.addCleanup(pygame.mixer.set_num_channels, pygame.mixer.get_num_channels())
+        pool = ChannelPool(channels, RULES, self.clock)
+        self.addCleanup(pool.stop)
+        return pool
+
+    def play_at(self, pool, now, name, sound):
+        self.clock.now = now
+        return pool.play(name, sound)
+
+    def test_cooldown_and_voice_limit(self):
+        """Test re-triggers inside the cooldown are dropped and over the voice limit restart the oldest copy."""
+        pool = self.make_pool(8)
+        first = self.play_at(pool, 0, "hit", self.short)
+        self.assertIsNotNone(first)
+        self.assertIsNone(self.play_at(pool, 10, "hit", self.short))
+        second = self.play_at(pool, 40, "hit", self.short)
+        self.assertNotEqual(second, first)
+        self.assertEqual(self.play_at(pool, 80, "hit", self.short), first)  # two copies still playing
+        self.assertEqual(pool.load(), 2)
+        self.assertEqual(self.play_at(pool, 150, "hit", self.short), second)  # free again
+        self.assertEqual(pool.load(), 2)
+        self.assertEqual((pool.played, pool.dropped, pool.stolen, pool.peak), (4, 1, 1, 2))
+
+    def test_priority_stealing(self):
+        """Test a full pool gives important sounds the least important, oldest channel."""
+        pool = self.make_pool(2)
+        self.play_at(pool, 0, "boom", self.long)
+        self.play_at(pool, 60, "boom", self.long)
+        self.assertIsNone(self.play_at(pool, 70, "hit", self.short))
+        self.assertEqual(self.play_at(pool, 80, "bonus", self.short), pool.channels[0])
+        self.assertEqual([voice[0] for voice in pool.voices], ["bonus", "boom"])
+        self.assertEqual((pool.stolen, pool.dropped), (1, 1))
+
+    def test_bounded_load(self):
+        """Test a burst of effects never plays more voices than there are channels."""
+        pool = self.make_pool(4)
+        for frame in range(120):
+            for name in ("hit", "boom", "hit", "bonus" if frame % 30 == 0 else "hit"):
+                self.play_at(pool, frame * 16, name, self.long)
+            self.assertLessEqual(pool.load(), 4)
+        self.assertEqual(pool.peak, 4)
+        self.assertEqual(pygame.mixer.get_num_channels(), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+from unittest.mock import patch
+from profile_store import ProfileStore
+
+class TestProfileStore(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "Ann.json")
+        self.store = ProfileStore(delay=0.05)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def read_disk(self):
+        with open(self.path) as f:
+            return json.load(f)
+
+    def test_reads_served_from_memory(self):
+        """Test a file is read from disk only once."""
+        self.store.put(self.path, {"score": 1}, write_through=True)
+        store = ProfileStore()
+        first = store.load(self.path)
+        with open(self.path, "w") as f:
+            json.dump({"score": 99}, f)
+        self.assertIs(store.load(self.path), first)
+        self.assertEqual(first["score"], 1)
+        store.close()
+
+    def test_missing_file(self):
+        """Test loading a missing file returns None."""
+        self.assertIsNone(self.store.load(self.path))
+        self.assertFalse(self.store.contains(self.path))
+
+    def test_mutations_coalesce(self):
+        """Test many mutations are flushed as a single write."""
+        data = {"score": 0}
+        for i in range(100):
+            data["score"] = i
+            self.store.put(self.path, data)
+        self.assertTrue(self.store.flush())
+        self.assertEqual(self.store.writes, 1)
+        self.assertEqual(self.read_disk()["score"], 99)
+
+    def test_background_flush(self):
+        """Test dirty documents are written by the background thread."""
+        self.store.put(self.path, {"score": 7})
+        deadline = time.time() + 2
+        while not os.path.exists(self.path) and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.read_disk()["score"], 7)
+
+    def test_failed_write_keeps_old_file(self):
+        """Test a failing rename leaves the previous version intact and retries later."""
+        self.store.put(self.path, {"score": 1}, write_through=True)
+        with patch("profile_store.os.replace", side_effect=OSError("disk full")):
+            self.store.put(self.path, {"score": 2})
+            self.assertFalse(self.store.flush())
+        self.assertEqual(self.read_disk()["score"], 1)
+        self.assertTrue(self.store.flush())
+        self.assertEqual(self.read_disk()["score"], 2)
+
+    def test_crash_mid_write(self):
+        """Test a process killed while writing leaves a valid previous save."""
+        code = (
+            "import os, sys\n"
+            "from profile_store import ProfileStore\n"
+            "store = ProfileStore()\n"
+            "store.put(sys.argv[1], {'score': 1}, write_through=True)\n"
+            "os.fsync = lambda fd: os._exit(3)\n"
+            "store.put(sys.argv[1], {'score': 2, 'padding': 'x' * 100000}, write_through=True)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code, self.path],
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(self.read_disk(), {"score": 1})
+
+class TestSaveSystemWriteBehind(unittest.TestCase):
+    def setUp(self):
+        from game_engine import SaveSystem
+        self.dir = tempfile.mkdtemp()
+        self.saves = SaveSystem(self.dir, write_delay=60)
+
+    def tearDown(self):
+        self.saves.store.close()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_stats_written_on_flush(self):
+        """Test stat updates stay in memory until flush()."""
+        self.saves.create_user("Ann")
+        for _ in range(5):
+            self.saves.update_player_stats("Ann", 100)
+        with open(os.path.join(self.dir, "Ann.json")) as f:
+            self.assertEqual(json.load(f)["games_played"], 0)
+        self.assertEqual(self.saves.get_player_data("Ann")["games_played"], 5)
+        self.saves.flush()
+        with open(os.path.join(self.dir, "Ann.json")) as f:
+            self.assertEqual(json.load(f)["total_score"], 500)
+
+    def test_list_users_ignores_temp_files(self):
+        """Test leftover temp files are not listed as users."""
+        self.saves.create_user("Ann")
+        open(os.path.join(self.dir, "Bob.json.tmp"), "w").close()
+        self.assertEqual(self.saves.list_users(), ["Ann"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from headless import make_engine
+from profiler import PHASES, FrameProfiler
+
+def frame(ms):
+    # Spread a frame time evenly over the phases (durations in seconds)
+    return [ms / 1000 / len(PHASES)] * len(PHASES)
+
+class TestFrameProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = FrameProfiler(60)
+        self.profiler.toggle()
+        self.temp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp, ignore_errors=True)
+
+    def test_rolling_stats(self):
+        """Test FPS, phase means and the histogram over the window."""
+        for i in range(300):
+            self.profiler.record(i / 60, frame(10), "PONG")
+        self.assertEqual(len(self.profiler.window), FrameProfiler.WINDOW)
+        self.assertAlmostEqual(self.profiler.fps(), 100.0)
+        self.assertAlmostEqual(sum(self.profiler.phase_means().values()), 0.010)
+        self.assertEqual(self.profiler.histogram()[2], FrameProfiler.WINDOW)
+
+    def test_dropped_frames_per_state(self):
+        """Test frames well over budget count as dropped, per state."""
+        self.profiler.record(0.0, frame(16), "PONG")
+        self.profiler.record(0.1, frame(40), "PONG")
+        self.profiler.record(0.2, frame(40), "TETRIS", sim_dropped=2)
+        self.assertEqual(self.profiler.dropped, 2)
+        self.assertEqual(self.profiler.states, {"PONG": [2, 1], "TETRIS": [1, 1]})
+        self.assertEqual(self.profiler.sim_dropped, 2)
+
+    def test_mixer_load(self):
+        """Test voices and dropped sound effects are tracked and exported per frame."""
+        self.profiler.record(0.0, frame(10), "BREAKOUT", voices=2, sounds_dropped=3)
+        self.profiler.record(0.1, frame(10), "BREAKOUT", voices=6, sounds_dropped=1)
+        self.assertEqual((self.profiler.peak_voices, self.profiler.sounds_dropped), (6, 4))
+        self.assertAlmostEqual(self.profiler.mean_voices(), 4.0)
+        path = os.path.join(self.temp, "voices.csv")
+        self.profiler.export_csv(path)
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row["voices"] for row in rows], ["2", "6"])
+
+    def test_export(self):
+        """Test the Chrome trace and CSV hold every frame and phase."""
+        for i in range(5):
+            self.profiler.record(i / 60, frame(12), "SNAKE", steps=1)
+        trace_path = os.path.join(self.temp, "out", "trace.json")
+        csv_path = os.path.join(self.temp, "out", "trace.csv")
+        self.profiler.export_trace(trace_path)
+        self.profiler.export_csv(csv_path)
+        with open(trace_path) as f:
+            events = json.load(f)["traceEvents"]
+        self.assertEqual(len(events), 5 * (1 + len(PHASES)))
+        self.assertEqual({event["ph"] for event in events}, {"X"})
+        with open(csv_path, newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0][-len(PHASES):], PHASES)
+        self.assertEqual(len(rows), 6)
+
+    def test_engine_frame(self):
+        """Test a profiled engine frame records every phase and draws the overlay."""
+        engine = make_engine(seed=1)
+        engine.profile_dir = os.path.join(self.temp, "profiles")
+        engine.profiler.toggle()
+        engine.start_game("SNAKE")
+        for _ in range(3):
+            running, frame_time = engine.run_profiled_frame(1 / 60)
+        self.assertTrue(running)
+        self.assertEqual(engine.profiler.frames, 3)
+        self.assertEqual(engine.profiler.states, {"SNAKE": [3, engine.profiler.dropped]})
+        self.assertIsNotNone(engine.profiler.overlay)
+        self.assertTrue(os.path.exists(engine.export_profile()))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import pygame
+from game_engine import Config
+from headless import make_engine
+import render_target
+from render_target import RenderTarget, crt_mask
+
+SIZE = (Config.WIDTH, Config.HEIGHT)
+
+class TestRenderTarget(unittest.TestCase):
+    def test_direct(self):
+        """Test the default target draws straight onto the display."""
+        target = RenderTarget(SIZE)
+        self.assertTrue(target.direct)
+        self.assertIs(target.canvas, pygame.display.get_surface())
+        target.present([pygame.Rect(0, 0, 10, 10)])
+
+    def test_scaled(self):
+        """Test a SCALED target still draws at the canvas size, straight to the display."""
+        target = RenderTarget(SIZE, scaled=True)
+        self.assertTrue(target.direct)
+        self.assertEqual(target.display.get_size(), SIZE)
+        self.assertTrue(render_target._mode_flags & pygame.SCALED)
+        target.canvas.fill((255, 0, 0), (512, 384, 64, 64))
+        target.present()
+        self.assertEqual(target.display.get_at((530, 400))[:3], (255, 0, 0))
+
+    def test_crt_mask(self):
+        """Test the CRT mask darkens scanlines and corners and is built once."""
+        mask = crt_mask((64, 48))
+        center = mask.get_at((32, 24))
+        self.assertLess(mask.get_at((32, 25)).g, center.g)
+        self.assertLess(mask.get_at((0, 0)).g, mask.get_at((33, 24)).g)
+        target = RenderTarget(SIZE, crt=True)
+        self.assertFalse(target.direct)
+        cached = target.mask
+        target.canvas.fill((255, 255, 255))
+        target.present()
+        target.present()
+        self.assertIs(target.mask, cached)
+        self.assertEqual(target.canvas.get_at((512, 385)).g, 255)
+        self.assertGreater(target.display.get_at((512, 384)).g, target.display.get_at((512, 385)).g)
+
+    def test_crt_dirty_rects(self):
+        """Test a CRT target composes only the dirty rects it is given."""
+        target = RenderTarget(SIZE, crt=True)
+        target.canvas.fill((255, 255, 255))
+        target.present()
+        target.canvas.fill((0, 0, 0))
+        target.present([pygame.Rect(100, 100, 20, 20), (300, 300, 10, 10)])
+        self.assertEqual(target.display.get_at((110, 110))[:3], (0, 0, 0))
+        self.assertEqual(target.display.get_at((305, 305))[:3], (0, 0, 0))
+        self.assertEqual(target.display.get_at((200, 200)), target.mask.get_at((200, 200)))
+
+class TestEngineRenderTarget(unittest.TestCase):
+    def tearDown(self):
+        Config.CRT_MASK = False
+        Config.DIRTY_RECTS = False
+
+    def test_crt_engine(self):
+        """Test the engine draws every frame through the CRT mask, with dirty rects too."""
+        Config.CRT_MASK = True
+        Config.DIRTY_RECTS = True
+        engine = make_engine(seed=2)
+        self.assertEqual(engine.screen.get_size(), SIZE)
+        self.assertIsNot(engine.screen, engine.target.display)
+        engine.start_game("BREAKOUT")
+        for _ in range(3):
+            engine.step()
+            engine.draw()
+        paddle = engine.breakout_objects["paddle"].rect
+        shown = engine.target.display.get_at(paddle.center)
+        mask = engine.target.mask.get_at(paddle.center)
+        self.assertEqual(shown.r, engine.screen.get_at(paddle.center).r * (mask.r + 1) // 256)
+
+if __name__ == "__main__":
+    unittest.main()
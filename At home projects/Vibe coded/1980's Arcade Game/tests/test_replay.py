@@ -0,0 +1,86 @@
+import unittest
+import os
+import random
+import shutil
+import tempfile
+import replay
+from games import load as load_game
+from headless import make_engine, run_game
+from input_sources import RandomInput
+from replay import ReplayReader, ReplayWriter, play, replay_keys
+
+class TestReplayFormat(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "test.replay")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Test masks and taps come back tick for tick across small read chunks."""
+        rng = random.Random(5)
+        keys = replay_keys("POKEMON")
+        ticks = []
+        mask = 0
+        for _ in range(5000):
+            if rng.random() < 0.05:
+                mask = rng.getrandbits(len(keys))
+            taps = tuple(rng.sample(keys, 2)) if rng.random() < 0.02 else ()
+            ticks.append((mask, taps))
+        writer = ReplayWriter(self.path, {"game": "POKEMON", "seed": "1", "sim_rate": 120, "sim_time": 0.0})
+        for mask, taps in ticks:
+            writer.add(mask, taps)
+        writer.close({"score": 3, "rng": "x"})
+        with patch_chunk(7):
+            reader = ReplayReader(self.path)
+            self.assertEqual(list(reader), ticks)
+        self.assertEqual(reader.trailer, {"score": 3, "rng": "x", "ticks": 5000})
+        self.assertEqual(reader.header["game"], "POKEMON")
+        self.assertEqual(reader.header["keys"], keys)
+        self.assertLess(os.path.getsize(self.path), 5000)
+
+    def test_not_a_replay(self):
+        """Test other files are rejected."""
+        with open(self.path, "wb") as f:
+            f.write(b"hello")
+        with self.assertRaises(ValueError):
+            ReplayReader(self.path)
+
+class patch_chunk:
+    def __init__(self, size):
+        self.size = size
+
+    def __enter__(self):
+        self.old = replay.CHUNK
+        replay.CHUNK = self.size
+
+    def __exit__(self, *exc):
+        replay.CHUNK = self.old
+
+class TestRecordAndPlay(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_playback_matches(self):
+        """Test recorded sessions re-simulate to the same score and RNG state."""
+        for game in ["PONG", "SNAKE", "SPACE_INVADERS", "TETRIS", "ASTEROIDS", "POKEMON"]:
+            with self.subTest(game=game):
+                source = RandomInput(load_game(game).KEYS, seed=11)
+                engine = make_engine(seed=11, input_source=source)
+                engine.recording_enabled = True
+                engine.replay_dir = os.path.join(self.dir, game)
+                run_game(game, 900, seed=11, input_source=source, draw=False, engine=engine)
+                engine.finish_replay()
+                files = sorted(os.listdir(engine.replay_dir))
+                self.assertTrue(files)
+                for name in files:
+                    _, ticks, _, matches = play(os.path.join(engine.replay_dir, name), engine=make_engine())
+                    self.assertTrue(matches, name)
+                    self.assertGreater(ticks, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import pygame
+from games.snake import Food, Snake
+
+BOUNDARIES = pygame.Rect(60, 60, 100, 80)  # a 5 x 4 cell board, starting at column 2, row 2
+
+class TestSnake(unittest.TestCase):
+    def setUp(self):
+        self.snake = Snake(BOUNDARIES)
+
+    def check_free_list(self):
+        snake = self.snake
+        self.assertEqual(sorted(snake.free), [c for c in range(len(snake.occupied)) if not snake.occupied[c]])
+        self.assertEqual(sorted(snake.body), [c for c in range(len(snake.occupied)) if snake.occupied[c]])
+        for i, cell in enumerate(snake.free):
+            self.assertEqual(snake.free_index[cell], i)
+
+    def test_grid(self):
+        """Test the grid lines up with the start cell and stays inside the walls."""
+        snake = self.snake
+        self.assertEqual((snake.cols, snake.rows), (5, 4))
+        self.assertEqual(snake.cell_rect(snake.body[0]).topleft, Snake.START)
+        self.assertTrue(BOUNDARIES.contains(snake.cell_rect(snake.cols * snake.rows - 1)))
+
+    def test_move_and_grow(self):
+        """Test moving keeps the length and growing adds one segment."""
+        snake = self.snake
+        start = snake.body[0]
+        snake.move()
+        self.assertEqual(list(snake.body), [start + 1])
+        snake.grow = True
+        snake.direction = "DOWN"
+        snake.move()
+        self.assertEqual(list(snake.body), [start + 1 + snake.cols, start + 1])
+        self.assertTrue(snake.alive)
+        self.check_free_list()
+
+    def test_wall_and_self_collision(self):
+        """Test running into a wall or the body ends the game."""
+        snake = self.snake
+        for _ in range(2):
+            snake.move()
+        self.assertTrue(snake.alive)
+        snake.move()
+        self.assertFalse(snake.alive)
+
+        snake.reset()
+        for direction in ["RIGHT", "DOWN", "LEFT", "UP"]:
+            snake.grow = True
+            snake.direction = direction
+            snake.move()
+        self.assertFalse(snake.alive)
+
+    def test_food_fills_board(self):
+        """Test food always lands on a free cell until the board is full."""
+        snake = self.snake
+        # Grow a snake along a serpentine path through every cell
+        path = []
+        for row in range(snake.rows):
+            cols = range(snake.cols) if row % 2 == 0 else reversed(range(snake.cols))
+            path.extend(row * snake.cols + col for col in cols)
+        snake.reset()
+        snake.body.clear()
+        snake.occupied[snake.cell_at(*Snake.START)] = 0
+        snake.free = list(range(len(snake.occupied)))
+        snake.free_index = list(range(len(snake.occupied)))
+        food = Food(snake)
+        for cell in path[:-1]:
+            self.assertFalse(snake.occupied[food.cell])
+            snake.add_head(cell)
+            food.respawn(snake)
+        self.assertEqual(food.cell, path[-1])
+        snake.add_head(path[-1])
+        food.respawn(snake)
+        self.assertIsNone(food.cell)
+        self.check_free_list()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import shutil
+import tempfile
+import numpy
+import pygame
+import synth
+from sound_bank import SoundBank
+
+class TestSoundBank(unittest.TestCase):
+    def setUp(self):
+        pygame.mixer.init()
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_lazy_synthesis(self):
+        """Test nothing is synthesized until an effect is requested."""
+        bank = SoundBank(cache_dir=self.cache_dir)
+        self.assertEqual(bank.synthesized, 0)
+        self.assertIsNotNone(bank.get("beep1"))
+        self.assertEqual(bank.synthesized, 1)
+        bank.get("beep1")
+        self.assertEqual(bank.synthesized, 1)
+
+    def test_hot_start_uses_cache(self):
+        """Test a second bank loads every effect from disk without synthesis."""
+        SoundBank(cache_dir=self.cache_dir).preload()
+        bank = SoundBank(cache_dir=self.cache_dir)
+        bank.preload()
+        self.assertEqual(bank.synthesized, 0)
+        self.assertEqual(bank.cache_hits, len(synth.EFFECTS))
+        self.assertTrue(numpy.array_equal(bank.load_samples("explosion"), synth.render(synth.EFFECTS["explosion"])))
+
+    def test_changed_spec_invalidates(self):
+        """Test changing a spec changes its cache file."""
+        bank = SoundBank(cache_dir=self.cache_dir)
+        other = SoundBank({"beep1": synth.ToneSpec(100, 880)}, cache_dir=self.cache_dir)
+        self.assertNotEqual(bank.cache_path("beep1"), other.cache_path("beep1"))
+
+    def test_corrupt_cache_is_rendered_again(self):
+        """Test a corrupt cache file falls back to synthesis."""
+        bank = SoundBank(cache_dir=self.cache_dir)
+        with open(bank.cache_path("beep2"), "w") as f:
+            f.write("not numpy")
+        self.assertEqual(len(bank.load_samples("beep2")), synth.n_samples(synth.EFFECTS["beep2"]))
+        self.assertEqual(bank.synthesized, 1)
+
+    def test_unknown_effect(self):
+        """Test unknown names return None."""
+        self.assertIsNone(SoundBank(cache_dir=self.cache_dir).get("kazoo"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+import pygame
+from game_engine import Config
+from games.space_invaders import InvaderFormation
+from headless import make_engine
+
+class TestInvaderFormation(unittest.TestCase):
+    def setUp(self):
+        self.formation = InvaderFormation(50, 50, 4, 3)  # 30 px invaders, 40 px apart
+
+    def test_move_and_bounds(self):
+        """Test moving shifts the bounding box and dead edge columns shrink it."""
+        formation = self.formation
+        formation.move(5, 20)
+        self.assertEqual(formation.rect, pygame.Rect(55, 70, 150, 110))
+        for row in range(3):
+            formation.kill(row * 4 + 3)
+        self.assertEqual(formation.rect, pygame.Rect(55, 70, 110, 110))
+        formation.kill(4 + 1)  # an inner invader leaves the box alone
+        self.assertEqual(formation.rect.width, 110)
+        for col in range(3):
+            formation.kill(8 + col)
+        self.assertEqual(formation.rect.bottom, 70 + 70)
+        self.assertEqual(formation.count, 12 - 3 - 1 - 3)
+
+    def test_shooters_are_bottom_invaders(self):
+        """Test only each column's lowest live invader shoots."""
+        formation = self.formation
+        formation.kill(8)
+        formation.kill(4)
+        formation.kill(9)
+        rng = random.Random(0)
+        shooters = {formation.shooter(rng) for _ in range(200)}
+        self.assertEqual(shooters, {0, 5, 10, 11})
+        for cell in (0, 1, 5, 2, 6, 10, 3, 7, 11):
+            formation.kill(cell)
+        self.assertEqual(formation.count, 0)
+        self.assertIsNone(formation.shooter(rng))
+
+    def test_hit(self):
+        """Test a bullet rect finds the live invader it overlaps, lowest first."""
+        formation = self.formation
+        self.assertEqual(formation.hit(60, 95, 4, 10), 4)
+        self.assertEqual(formation.hit(60, 75, 4, 20), 4)  # spans rows 0 and 1
+        self.assertIsNone(formation.hit(82, 60, 4, 10))  # in the gap between columns
+        formation.kill(4)
+        self.assertEqual(formation.hit(60, 75, 4, 20), 0)
+        self.assertIsNone(formation.hit(60, 200, 4, 10))
+
+    def test_surface(self):
+        """Test killing an invader cuts it out of the cached surface."""
+        formation = self.formation
+        self.assertEqual(formation.surface.get_at((45, 5))[:3], Config.COLORS["RED"])
+        formation.kill(1)
+        self.assertEqual(formation.surface.get_at((45, 5))[:3], InvaderFormation.BLANK)
+
+class TestSpaceInvadersEngine(unittest.TestCase):
+    def test_next_wave(self):
+        """Test clearing a wave starts a bigger one."""
+        engine = make_engine(seed=1)
+        engine.start_game("SPACE_INVADERS")
+        formation = engine.space_invaders_objects["formation"]
+        for cell in range(formation.cols * formation.rows):
+            formation.kill(cell)
+        engine.step()
+        objects = engine.space_invaders_objects
+        self.assertEqual(objects["wave"], 2)
+        self.assertEqual((objects["formation"].cols, objects["formation"].rows), (12, 6))
+        self.assertEqual(engine.score, 1000)
+        self.assertEqual(engine.state_names[engine.current_state], "SPACE_INVADERS")
+
+    def test_formation_turns_at_wall(self):
+        """Test the formation steps down and turns when it reaches a wall."""
+        engine = make_engine(seed=1)
+        engine.start_game("SPACE_INVADERS")
+        objects = engine.space_invaders_objects
+        top = objects["formation"].rect.top
+        while objects["invader_direction"] > 0:
+            engine.step()
+        self.assertEqual(objects["formation"].rect.top, top + 20)
+        self.assertGreaterEqual(objects["formation"].rect.right, objects["boundaries"].right)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+import os
+import json
+import random
+import shutil
+import sqlite3
+import tempfile
+from sqlite_saves import SQLiteSaveSystem, migrate_json_saves
+
+class TestSQLiteSaveSystem(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.saves = SQLiteSaveSystem(self.dir)
+
+    def tearDown(self):
+        self.saves.close()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def reopen(self):
+        self.saves.close()
+        self.saves = SQLiteSaveSystem(self.dir)
+
+    def test_wal_mode(self):
+        """Test the database runs in write-ahead-log mode."""
+        mode = self.saves.db.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_users(self):
+        """Test creating and listing users."""
+        self.assertTrue(self.saves.create_user("Zed"))
+        self.assertTrue(self.saves.create_user("Ann"))
+        self.assertFalse(self.saves.create_user("Ann"))
+        self.reopen()
+        self.assertEqual(self.saves.list_users(), ["Ann", "Zed"])
+        self.assertTrue(self.saves.user_exists("Zed"))
+        self.assertFalse(self.saves.user_exists("Bob"))
+
+    def test_stats_persist(self):
+        """Test stat updates and unlocks survive a restart."""
+        self.saves.create_user("Ann")
+        self.saves.get_player_data("Ann")["unlocked_games"] = ["PONG"]
+        self.saves.update_player_stats("Ann", 6000)
+        self.reopen()
+        data = self.saves.get_player_data("Ann")
+        self.assertEqual(data["games_played"], 1)
+        self.assertEqual(data["total_score"], 6000)
+        self.assertEqual(data["unlocked_games"], ["PONG", "SPACE_INVADERS"])
+
+    def test_high_scores(self):
+        """Test global and personal lists, qualification and rank."""
+        for score in [5, 80, 20, 80, 1, 60, 70, 30, 90, 10, 40, 50]:
+            self.saves.add_high_score("TETRIS", "Ann", score)
+        self.saves.add_high_score("TETRIS", "Bob", 85)
+        top = self.saves.get_all_high_scores()["TETRIS"]
+        self.assertEqual([e["score"] for e in top], [90, 85, 80, 80, 70, 60, 50, 40, 30, 20])
+        personal = self.saves.get_player_data("Ann")["high_scores"]["TETRIS"]
+        self.assertEqual([e["score"] for e in personal], [90, 80, 80, 70, 60, 50, 40, 30, 20, 10])
+        self.assertFalse(self.saves.qualifies("TETRIS", 20))
+        self.assertTrue(self.saves.qualifies("TETRIS", 21))
+        self.assertTrue(self.saves.qualifies("PONG", 1))
+        self.assertEqual(self.saves.rank_for("TETRIS", 75), (5, 14))
+        self.assertEqual(self.saves.list_users(), ["Ann", "Bob"])
+
+class TestMigration(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        ann = {"name": "Ann", "created": "2024-01-01 10:00", "games_played": 3, "total_score": 12000,
+               "unlocked_games": ["PONG", "TETRIS"], "pokemon_collection": ["Pikachu"],
+               "high_scores": {"PONG": [{"name": "Ann", "score": 7, "date": "2024-01-02 10:00"}]}}
+        glob = {"high_scores": {"PONG": [{"name": "Gone", "score": 9, "date": "2024-01-01 12:00"},
+                                         {"name": "Ann", "score": 7, "date": "2024-01-02 10:00"}]}}
+        for name, data in [("Ann", ann), ("global_high_scores", glob)]:
+            with open(os.path.join(self.dir, name + ".json"), "w") as f:
+                json.dump(data, f)
+        with open(os.path.join(self.dir, "broken.json"), "w") as f:
+            f.write("{")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_imported_on_first_open(self):
+        """Test JSON profiles and leaderboard entries are imported once."""
+        saves = SQLiteSaveSystem(self.dir)
+        self.assertEqual(saves.list_users(), ["Ann"])
+        data = saves.get_player_data("Ann")
+        self.assertEqual(data["total_score"], 12000)
+        self.assertEqual(data["pokemon_collection"], ["Pikachu"])
+        self.assertEqual([e["score"] for e in data["high_scores"]["PONG"]], [7])
+        self.assertEqual([e["name"] for e in saves.get_all_high_scores()["PONG"]], ["Gone", "Ann"])
+        saves.close()
+        saves = SQLiteSaveSystem(self.dir)
+        self.assertEqual(len(saves.get_all_high_scores()["PONG"]), 2)
+        saves.close()
+
+    def test_migrate_skips_existing_users(self):
+        """Test running the migrator again does not duplicate profiles."""
+        saves = SQLiteSaveSystem(self.dir)
+        self.assertEqual(migrate_json_saves(self.dir, saves), 0)
+        saves.close()
+        db = sqlite3.connect(os.path.join(self.dir, "arcade.db"))
+        self.assertEqual(db.execute("SELECT COUNT(*) FROM users").fetchone()[0], 1)
+        self.assertEqual(db.execute("SELECT COUNT(*) FROM scores").fetchone()[0], 2)
+        db.close()
+
+class TestLeaderboardMigration(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_score_log_imported(self):
+        """Test every score the JSON leaderboard recorded is imported, not just its top 10."""
+        from game_engine import SaveSystem
+        saves = SaveSystem(self.dir, write_delay=60)
+        saves.leaderboard.compact_after = 10 ** 6
+        rng = random.Random(4)
+        for i in range(40):
+            saves.add_high_score("TETRIS", ["Ann", "Bob"][i % 2], rng.randrange(1000))
+        saves.flush()  # the snapshot keeps names only for the top 10
+        for i in range(15):
+            saves.add_high_score("TETRIS", "Ann", rng.randrange(1000))
+        probes = [0, 250, 500, 999]
+        ranks = [saves.rank_for("TETRIS", score) for score in probes]
+        top = saves.get_all_high_scores()["TETRIS"]
+        personal = saves.get_player_data("Ann")["high_scores"]["TETRIS"]
+        saves.store.flush()
+        saves.store.close()
+        saves.leaderboard.log_file.close()
+        files = sorted(os.listdir(self.dir))
+
+        migrated = SQLiteSaveSystem(self.dir)
+        self.assertEqual([migrated.rank_for("TETRIS", score) for score in probes], ranks)
+        self.assertEqual(ranks[0][1], 56)
+        self.assertEqual(migrated.get_all_high_scores()["TETRIS"], top)
+        self.assertEqual(migrated.get_player_data("Ann")["high_scores"]["TETRIS"], personal)
+        migrated.close()
+        self.assertEqual(sorted(f for f in os.listdir(self.dir) if not f.startswith("arcade.db")), files)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import random
+import unittest
+from tetris_ai import TetrisAI, children, features, play
+from tetris_core import FULL_ROW, HEIGHT, PIECES, TetrisBoard
+
+class TestTetrisAI(unittest.TestCase):
+    def test_features(self):
+        """Test height, holes and bumpiness on a small stack."""
+        rows = [0] * HEIGHT
+        rows[HEIGHT - 1] = 0b0000000111
+        rows[HEIGHT - 2] = 0b0000000101
+        rows[HEIGHT - 3] = 0b0000000010
+        # Columns 0-2 are 2, 3 and 2 high; column 0 has no hole, column 1 has one
+        self.assertEqual(features(rows), (7, 1, 1 + 1 + 2))
+
+    def test_children_match_board(self):
+        """Test search placements land and clear lines exactly like TetrisBoard."""
+        rng = random.Random(5)
+        board = TetrisBoard(colors=False)
+        for _ in range(60):
+            piece = rng.choice(PIECES)
+            options = list(children(board.rows, piece))
+            if not options:
+                break
+            for rotation, x, rows, cleared in options:
+                trial = board.copy()
+                self.assertEqual(trial.simulate([(piece, rotation, x)]), 1)
+                self.assertEqual((trial.rows, trial.lines - board.lines), (rows, cleared))
+            rotation, x, _, _ = rng.choice(options)
+            board.simulate([(piece, rotation, x)])
+
+    def test_plays_well(self):
+        """Test the beam search clears lines and survives a few hundred pieces."""
+        placed, lines, games = play(300, seed=2, beam_width=2, preview=1)
+        self.assertEqual((placed, games), (300, 1))
+        self.assertGreater(lines, 100)
+
+    def test_process_pool(self):
+        """Test the process pool picks the same greedy move as the serial search."""
+        board = TetrisBoard(colors=False)
+        board.rows[HEIGHT - 1] = FULL_ROW & ~0b1111
+        serial = TetrisAI(beam_width=1)
+        pooled = TetrisAI(beam_width=1, workers=2)
+        try:
+            for piece in PIECES:
+                self.assertEqual(pooled.best_move(board, [piece]), serial.best_move(board, [piece]))
+            self.assertEqual(serial.best_move(board, ["I"]), (0, 0))
+        finally:
+            pooled.close()
+
+if __name__ == "__main__":
+    unittest.main()
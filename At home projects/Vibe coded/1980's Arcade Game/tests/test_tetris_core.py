@@ -0,0 +1,61 @@
+import unittest
+from tetris_core import FULL_ROW, HEIGHT, PIECES, ROTATIONS, WIDTH, TetrisBoard
+
+class TestRotations(unittest.TestCase):
+    def test_rotation_tables(self):
+        """Test every piece has 4 states of 4 cells that cycle back to the spawn shape."""
+        for name in PIECES:
+            states = ROTATIONS[name]
+            self.assertEqual(len(states), 4)
+            for state in states:
+                self.assertEqual(len(state.cells), 4)
+                self.assertEqual(len(state.masks_at), WIDTH - state.width + 1)
+        self.assertEqual(ROTATIONS["T"][1].shape, [[0, 1], [1, 1], [0, 1]])
+
+class TestTetrisBoard(unittest.TestCase):
+    def test_fits(self):
+        """Test walls, floor and locked cells block a piece."""
+        board = TetrisBoard()
+        self.assertTrue(board.fits("I", 0, 6, 0))
+        self.assertFalse(board.fits("I", 0, 7, 0))
+        self.assertFalse(board.fits("I", 0, -1, 0))
+        self.assertFalse(board.fits("I", 1, 0, HEIGHT - 3))
+        board.rows[HEIGHT - 1] = 1 << 4
+        self.assertFalse(board.fits("O", 0, 3, HEIGHT - 2))
+        self.assertEqual(board.drop_y("O", 0, 3), HEIGHT - 3)
+
+    def test_line_clear_and_score(self):
+        """Test full rows are removed, the rest shift down and lines score."""
+        board = TetrisBoard()
+        for row in range(HEIGHT - 2, HEIGHT):
+            board.rows[row] = FULL_ROW & ~0b11
+            for col in range(2, WIDTH):
+                board.colors[row][col] = "RED"
+        board.rows[HEIGHT - 3] = 1 << 9
+        board.colors[HEIGHT - 3][9] = "BLUE"
+        self.assertEqual(board.lock("O", 0, 0, board.drop_y("O", 0, 0), "GREEN"), 2)
+        self.assertEqual(board.score, 300)
+        self.assertEqual(board.rows[HEIGHT - 1], 1 << 9)
+        self.assertEqual(board.colors[HEIGHT - 1][9], "BLUE")
+        self.assertEqual(sum(board.rows[:HEIGHT - 1]), 0)
+
+    def test_simulate(self):
+        """Test batch placement on a copy matches piece-by-piece play."""
+        board = TetrisBoard()
+        moves = [("I", 0, 0), ("I", 0, 4), ("O", 0, 8)]
+        trial = board.copy()
+        self.assertEqual(trial.simulate(moves), 3)
+        self.assertEqual((trial.lines, trial.score), (1, 100))
+        self.assertEqual(trial.rows[HEIGHT - 1], 0b1100000000)
+        self.assertEqual(board.rows, [0] * HEIGHT)
+        self.assertIsNone(trial.colors)
+
+    def test_top_out(self):
+        """Test simulate stops when a piece no longer fits at the spawn row."""
+        board = TetrisBoard(colors=False)
+        placed = board.simulate([("I", 1, 0)] * 10)
+        self.assertEqual(placed, 5)
+        self.assertTrue(board.game_over)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from text_cache import TextCache, split_digits
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.cache = TextCache()
+
+    def test_static_label_renders_once(self):
+        """Test a repeated label is served from the cache."""
+        first = self.cache.render("HIGH SCORES", 24, (255, 255, 255))
+        second = self.cache.render("HIGH SCORES", 24, (255, 255, 255))
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.glyph_renders, 1)
+
+    def test_changing_score_reuses_glyphs(self):
+        """Test only new digits are rasterized when a score changes."""
+        self.cache.render("Score: 10", 36, "WHITE")
+        renders = self.cache.glyph_renders
+        self.cache.render("Score: 11", 36, "WHITE")
+        self.assertEqual(self.cache.glyph_renders, renders)
+        self.cache.render("Score: 12", 36, "WHITE")
+        self.assertEqual(self.cache.glyph_renders, renders + 1)
+
+    def test_budget_evicts_oldest(self):
+        """Test the cache stays inside its memory budget."""
+        cache = TextCache(budget_bytes=20000)
+        for i in range(50):
+            cache.render(f"label {i}", 24, (255, 0, 0))
+        self.assertLessEqual(cache.used_bytes, 20000)
+        self.assertGreater(cache.evictions, 0)
+
+    def test_split_digits(self):
+        """Test text is split into plain runs and single digits."""
+        self.assertEqual(split_digits("Lv12"), ["Lv", "1", "2"])
+        self.assertEqual(split_digits("1. Ann: 5"), ["1", ". Ann: ", "5"])
+        self.assertEqual(split_digits("PONG"), ["PONG"])
+
+if __name__ == '__main__':
+    unittest.main()
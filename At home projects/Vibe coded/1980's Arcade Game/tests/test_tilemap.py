@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pygame
+from game_engine import Config
+from games.platformer import Enemy
+from headless import make_engine
+from tilemap import CHUNK, TILE, ChunkCache, Level, TileMap, generate_level, load_level
+
+LINES = [
+    "          ",
+    "   ###    ",
+    " P    o E ",
+    "##########",
+]
+
+class TestTileMap(unittest.TestCase):
+    def setUp(self):
+        self.tilemap = TileMap(LINES)
+
+    def test_grid(self):
+        """Test solid tiles, and that columns outside the map count as walls."""
+        tilemap = self.tilemap
+        self.assertEqual((tilemap.cols, tilemap.rows), (10, 4))
+        self.assertTrue(tilemap.is_solid(3, 1))
+        self.assertFalse(tilemap.is_solid(2, 1))
+        self.assertTrue(tilemap.is_solid(-1, 0))
+        self.assertTrue(tilemap.is_solid(10, 0))
+        self.assertFalse(tilemap.is_solid(0, 4))
+        self.assertEqual(tilemap.solid_rects(pygame.Rect(90, 40, 40, 40)),
+                         [pygame.Rect(96, 32, 32, 32), pygame.Rect(128, 32, 32, 32)])
+
+    def test_move(self):
+        """Test moving stops flush against solid tiles on each axis."""
+        tilemap = self.tilemap
+        rect = pygame.Rect(40, 60, 20, 30)
+        self.assertEqual(tilemap.move(rect, 0, 10), (False, True))
+        self.assertEqual(rect.bottom, 3 * TILE)
+        rect = pygame.Rect(100, 70, 20, 20)
+        self.assertEqual(tilemap.move(rect, 0, -20), (False, True))
+        self.assertEqual(rect.top, 2 * TILE)
+        rect = pygame.Rect(60, 40, 20, 20)
+        self.assertEqual(tilemap.move(rect, 30, 0), (True, False))
+        self.assertEqual(rect.right, 3 * TILE)
+
+    def test_enemy_turns_at_ledge_and_wall(self):
+        """Test enemies patrol between walls and the edges of the ground."""
+        tilemap = TileMap(["#      #", "#  ##  #", "########"])
+        enemy = Enemy(3 * TILE, TILE - 30)  # standing on the ledge in row 1
+        for _ in range(30):
+            enemy.update(tilemap)
+            self.assertTrue(3 * TILE <= enemy.rect.centerx <= 5 * TILE)
+        enemy = Enemy(TILE, 2 * TILE - 30)  # on the ground
+        for _ in range(200):
+            enemy.update(tilemap)
+            self.assertTrue(TILE <= enemy.rect.left and enemy.rect.right <= 7 * TILE)
+
+class TestLevels(unittest.TestCase):
+    def test_spawns(self):
+        """Test the player start and the coins and enemies, bucketed by chunk."""
+        level = Level(LINES)
+        self.assertEqual(level.start, (TILE, 3 * TILE))
+        self.assertEqual(level.coins, {0: [(6 * TILE, 2 * TILE)]})
+        self.assertEqual(level.enemies, {0: [(8 * TILE, 3 * TILE)]})
+
+    def test_load_file(self):
+        """Test levels load from files, by path or from the levels folder."""
+        temp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp, "small.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(LINES) + "\n")
+            self.assertEqual(load_level(path).tilemap.solid, TileMap(LINES).solid)
+        finally:
+            shutil.rmtree(temp)
+        level = load_level("level1.txt")
+        self.assertEqual(level.tilemap.height, Config.HEIGHT)
+        self.assertGreater(level.tilemap.width, Config.WIDTH)
+        self.assertTrue(level.coins and level.enemies)
+
+    def test_generated(self):
+        """Test generated levels are the requested width with a start and coins."""
+        lines = generate_level(2000, seed=4)
+        level = Level(lines)
+        self.assertEqual(level.tilemap.cols, 2000)
+        self.assertEqual(level.start, (TILE, 22 * TILE))
+        self.assertGreater(sum(len(coins) for coins in level.coins.values()), 50)
+        self.assertEqual(lines, generate_level(2000, seed=4))
+
+class TestChunkCache(unittest.TestCase):
+    def test_streaming(self):
+        """Test only chunks on screen and beside it stay cached as the camera moves."""
+        tilemap = TileMap(generate_level(20 * CHUNK, seed=1))
+        cache = ChunkCache(tilemap, Config.COLORS["BROWN"], Config.WIDTH)
+        screen = pygame.Surface((Config.WIDTH, Config.HEIGHT))
+        cache.draw(screen, 0)
+        self.assertEqual(sorted(cache.surfaces), [0, 1, 2])
+        camera_x = 10 * tilemap.chunk_width + 100
+        cache.draw(screen, camera_x)
+        self.assertEqual(sorted(cache.surfaces), [9, 10, 11, 12, 13])
+        self.assertEqual(cache.evicted, 3)
+        col = next(c for c in range(11 * CHUNK, 12 * CHUNK) if tilemap.is_solid(c, 22))
+        self.assertEqual(screen.get_at((col * TILE - camera_x + 5, 22 * TILE + 5))[:3], Config.COLORS["BROWN"])
+
+class TestPlatformerEngine(unittest.TestCase):
+    def tearDown(self):
+        Config.PLATFORMER_LEVEL = "level1.txt"
+
+    def test_camera_follows(self):
+        """Test the camera scrolls with the player and stays inside a wide generated level."""
+        Config.PLATFORMER_LEVEL = 3000
+        engine = make_engine(seed=3)
+        engine.start_game("PLATFORMER")
+        objects = engine.platformer_objects
+        player = objects["player"]
+        player.rect.x = 40 * TILE
+        engine.step()
+        self.assertEqual(objects["camera_x"], player.rect.centerx - Config.WIDTH // 2)
+        player.rect.x = 3000 * TILE - 40
+        engine.step()
+        self.assertEqual(objects["camera_x"], objects["tilemap"].width - Config.WIDTH)
+        engine.draw()
+        self.assertLessEqual(len(objects["chunks"].surfaces), 4)
+
+if __name__ == "__main__":
+    unittest.main()
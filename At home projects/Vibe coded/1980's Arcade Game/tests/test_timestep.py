@@ -0,0 +1,38 @@
+import unittest
+from timestep import FixedTimestep
+
+class TestFixedTimestep(unittest.TestCase):
+    def test_steps_at_rate(self):
+        """Test the step count follows the rate, not the frame rate."""
+        for rate, fps in [(10, 60), (120, 60), (60, 144), (60, 30)]:
+            with self.subTest(rate=rate, fps=fps):
+                clock = FixedTimestep(rate)
+                calls = []
+                for _ in range(fps * 2):
+                    clock.advance(1.0 / fps, lambda: calls.append(clock.ticks))
+                self.assertEqual(len(calls), rate * 2)
+                self.assertEqual(calls[-1], 2000)
+
+    def test_alpha(self):
+        """Test alpha is the fraction of a step left in the accumulator."""
+        clock = FixedTimestep(10)
+        self.assertEqual(clock.advance(0.25, lambda: None), 2)
+        self.assertAlmostEqual(clock.alpha, 0.5)
+
+    def test_stall_is_not_caught_up(self):
+        """Test a long stall runs at most max_steps and drops the rest."""
+        clock = FixedTimestep(60, max_steps=8)
+        self.assertEqual(clock.advance(10.0, lambda: None), 8)
+        self.assertEqual(clock.dropped, 7)
+        self.assertLess(clock.accumulator, clock.dt)
+
+    def test_rate_change(self):
+        """Test switching rate keeps at most one step of backlog."""
+        clock = FixedTimestep(120)
+        clock.advance(0.004, lambda: None)
+        clock.set_rate(10)
+        self.assertEqual(clock.advance(0.05, lambda: None), 0)
+        self.assertEqual(clock.advance(0.05, lambda: None), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+"""Tetris autoplayer: heuristic beam search over tetris_core boards.
+
+A board is scored on aggregate column height, covered holes, bumpiness
+(height differences between neighbouring columns) and lines cleared.
+best_move() tries every placement of the current piece, keeps the
+`beam_width` best boards, extends them with each known upcoming piece in
+turn, and returns the first placement on the path to the best final
+board. With `workers`, the subtrees under each first placement are
+searched in a process pool.
+
+It also runs as a soak test, playing random games headlessly and
+reporting placements per second:
+
+    python tetris_ai.py [--pieces N] [--workers W] [--beam B] [--preview P] [--seed S]
+"""
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+from tetris_core import (FULL_ROW, HEIGHT, PIECES, ROTATIONS, ROW_COLUMNS, WIDTH, TetrisBoard, column_tops,
+                         landing_y)
+
+WEIGHTS = {"height": -0.510066, "lines": 0.760666, "holes": -0.35663, "bumpiness": -0.184483}
+
+# Rotation indices with distinct shapes (O has 1, I/S/Z have 2), so no placement is tried twice
+DISTINCT_ROTATIONS = {}
+for _name, _states in ROTATIONS.items():
+    _shapes = []
+    DISTINCT_ROTATIONS[_name] = []
+    for _i, _state in enumerate(_states):
+        if _state.shape not in _shapes:
+            _shapes.append(_state.shape)
+            DISTINCT_ROTATIONS[_name].append(_i)
+
+ROW_FILLED = [len(columns) for columns in ROW_COLUMNS]
+
+
+def features(rows):
+    """(aggregate height, holes, bumpiness) of a board, in one pass over its rows."""
+    tops = [HEIGHT] * WIDTH
+    covered = 0
+    filled = 0
+    for r, row in enumerate(rows):
+        if row:
+            filled += ROW_FILLED[row]
+            top = row & ~covered
+            if top:
+                for c in ROW_COLUMNS[top]:
+                    tops[c] = r
+                covered |= row
+    height = 0
+    bumpiness = 0
+    previous = tops[0]
+    for top in tops:
+        height += HEIGHT - top
+        bumpiness += abs(top - previous)
+        previous = top
+    # Every cell under a column's top is either filled or a hole
+    return height, height - filled, bumpiness
+
+
+def evaluate(rows, lines, weights=WEIGHTS):
+    height, holes, bumpiness = features(rows)
+    return (weights["height"] * height + weights["lines"] * lines
+            + weights["holes"] * holes + weights["bumpiness"] * bumpiness)
+
+
+def children(rows, piece):
+    """(rotation, x, rows after the drop, lines cleared) for every placement of `piece`.
+
+    Works on bare row lists and lands pieces from the column tops, so a
+    whole level of the search costs one column_tops() call per board.
+    """
+    tops = column_tops(rows)
+    for rotation in DISTINCT_ROTATIONS[piece]:
+        state = ROTATIONS[piece][rotation]
+        for x, masks in enumerate(state.masks_at):
+            y = landing_y(state, x, tops)
+            if y < 0:
+                continue
+            child = rows[:]
+            full = 0
+            for mask in masks:
+                child[y] |= mask
+                if child[y] == FULL_ROW:
+                    full += 1
+                y += 1
+            if full:
+                child = [0] * full + [row for row in child if row != FULL_ROW]
+            yield rotation, x, child, full
+
+
+def beam_search(beam, pieces, beam_width, weights=WEIGHTS):
+    """Extend a beam of (value, rows, lines, first move) with each piece in turn; returns the best entry."""
+    for piece in pieces:
+        level = []
+        for _, node, lines, first in beam:
+            for rotation, x, child, cleared in children(node, piece):
+                total = lines + cleared
+                level.append((evaluate(child, total, weights), child, total, first or (rotation, x)))
+        if not level:
+            break  # nothing fits: keep the previous level
+        level.sort(key=itemgetter(0), reverse=True)
+        beam = level[:beam_width]
+    return beam[0]
+
+
+def search(rows, pieces, beam_width, weights=WEIGHTS):
+    """(value, (rotation, x)) of the best placement of pieces[0]; (None, None) if nothing fits."""
+    value, _, _, move = beam_search([(0.0, rows, 0, None)], pieces, beam_width, weights)
+    return (value, move) if move else (None, None)
+
+
+def subtree_value(job):
+    # Process-pool worker: best value reachable after one fixed first placement
+    rows, pieces, rotation, x, beam_width, weights = job
+    for placed in children(rows, pieces[0]):
+        if placed[:2] == (rotation, x):
+            _, _, child, cleared = placed
+            break
+    start = (evaluate(child, cleared, weights), child, cleared, (rotation, x))
+    return beam_search([start], pieces[1:], beam_width, weights)[0]
+
+
+class TetrisAI:
+    """Chooses placements for a TetrisBoard given the current and upcoming pieces."""
+    def __init__(self, beam_width=4, workers=0, weights=WEIGHTS):
+        self.beam_width = beam_width
+        self.weights = weights
+        self.pool = ProcessPoolExecutor(workers) if workers > 1 else None
+
+    def best_move(self, board, pieces):
+        """(rotation, x) for pieces[0], or None when it cannot be placed."""
+        if self.pool is None:
+            return search(board.rows, pieces, self.beam_width, self.weights)[1]
+        first = [(rotation, x) for rotation, x, _, _ in children(board.rows, pieces[0])]
+        if not first:
+            return None
+        jobs = [(board.rows, pieces, rotation, x, self.beam_width, self.weights) for rotation, x in first]
+        values = list(self.pool.map(subtree_value, jobs, chunksize=max(1, len(jobs) // 16)))
+        return first[values.index(max(values))]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+
+def play(pieces, seed=0, beam_width=4, preview=1):
+    """Play random games until `pieces` pieces are placed. Returns (placed, lines, games)."""
+    rng = random.Random(seed)
+    ai = TetrisAI(beam_width)
+    queue = [rng.choice(PIECES) for _ in range(preview + 1)]
+    board = TetrisBoard(colors=False)
+    placed = lines = 0
+    games = 1
+    while placed < pieces:
+        move = ai.best_move(board, queue)
+        if move is None:
+            # Topped out: start a new game
+            lines += board.lines
+            board = TetrisBoard(colors=False)
+            games += 1
+            continue
+        rotation, x = move
+        state = ROTATIONS[queue[0]][rotation]
+        board.lock(queue[0], rotation, x, landing_y(state, x, board.column_tops()))
+        placed += 1
+        queue = queue[1:] + [rng.choice(PIECES)]
+    return placed, lines + board.lines, games
+
+
+def _play_job(args):
+    return play(*args)
+
+
+def soak(pieces, workers=1, seed=0, beam_width=4, preview=1):
+    """Play `pieces` pieces over `workers` processes. Returns (placed, lines, games, seconds)."""
+    start = time.perf_counter()
+    if workers > 1:
+        share = -(-pieces // workers)
+        jobs = [(share, seed + i, beam_width, preview) for i in range(workers)]
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_play_job, jobs))
+    else:
+        results = [play(pieces, seed, beam_width, preview)]
+    seconds = time.perf_counter() - start
+    placed, lines, games = (sum(values) for values in zip(*results))
+    return placed, lines, games, seconds
+
+
+def main(argv):
+    options = {"--pieces": 2000, "--workers": os.cpu_count() or 1, "--beam": 4, "--preview": 1, "--seed": 0}
+    args = iter(argv)
+    for arg in args:
+        if arg not in options:
+            print(__doc__.strip().splitlines()[-1].strip())
+            return 2
+        options[arg] = int(next(args))
+    placed, lines, games, seconds = soak(options["--pieces"], options["--workers"], options["--seed"],
+                                         options["--beam"], options["--preview"])
+    print(f"{placed} pieces in {seconds:.1f} s ({placed / seconds:.0f} placements/s, "
+          f"{options['--workers']} workers), {games} games, {lines} lines ({lines / games:.0f} per game)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
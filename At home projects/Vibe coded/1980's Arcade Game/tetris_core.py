@@ -0,0 +1,174 @@
+"""Tetris rules on a bitboard, without pygame.
+
+Each board row is an int with bit c set when column c is filled, so a
+collision test is one AND per piece row and a full line is
+`row == FULL_ROW`. All 7 pieces have their 4 rotation states precomputed
+(row masks already shifted to every column, plus cell offsets), so moving
+or rotating a piece builds nothing. Cell colors live in a parallel array
+that only drawing reads; boards copied for search can skip it.
+"""
+WIDTH = 10
+HEIGHT = 20
+FULL_ROW = (1 << WIDTH) - 1
+LINE_SCORES = [0, 100, 300, 500, 800]
+
+PIECES = ["I", "O", "T", "L", "J", "S", "Z"]
+SHAPES = {
+    "I": [[1, 1, 1, 1]],
+    "O": [[1, 1], [1, 1]],
+    "T": [[1, 1, 1], [0, 1, 0]],
+    "L": [[1, 1, 1], [1, 0, 0]],
+    "J": [[1, 1, 1], [0, 0, 1]],
+    "S": [[0, 1, 1], [1, 1, 0]],
+    "Z": [[1, 1, 0], [0, 1, 1]],
+}
+SPAWN_X = 3
+
+
+class Rotation:
+    """One rotation state of a piece, relative to the top-left of its bounding box."""
+    def __init__(self, shape):
+        self.shape = shape
+        self.width = len(shape[0])
+        self.height = len(shape)
+        self.cells = tuple((x, y) for y, row in enumerate(shape) for x, cell in enumerate(row) if cell)
+        # bottoms[dx]: rows from the box top to just below the lowest cell in column dx
+        self.bottoms = tuple(max(y for x, y in self.cells if x == dx) + 1 for dx in range(self.width))
+        masks = [sum(1 << x for x, cell in enumerate(row) if cell) for row in shape]
+        # masks_at[x][r]: row r's mask with the piece's left edge at column x
+        self.masks_at = [tuple(mask << x for mask in masks) for x in range(WIDTH - self.width + 1)]
+
+
+def rotations(shape):
+    states = []
+    for _ in range(4):
+        states.append(Rotation(shape))
+        # Transpose the shape matrix and reverse each row to rotate 90 degrees clockwise
+        shape = [list(row) for row in zip(*shape[::-1])]
+    return states
+
+
+ROTATIONS = {name: rotations(shape) for name, shape in SHAPES.items()}
+
+
+class TetrisBoard:
+    """Locked cells and score. Pieces are (name, rotation index, x, y)."""
+    def __init__(self, colors=True):
+        self.rows = [0] * HEIGHT
+        self.colors = [[None] * WIDTH for _ in range(HEIGHT)] if colors else None
+        self.score = 0
+        self.lines = 0
+        self.game_over = False
+
+    def copy(self, colors=False):
+        board = TetrisBoard(colors=False)
+        board.rows = self.rows[:]
+        if colors and self.colors is not None:
+            board.colors = [row[:] for row in self.colors]
+        board.score = self.score
+        board.lines = self.lines
+        board.game_over = self.game_over
+        return board
+
+    def fits(self, piece, rotation, x, y):
+        state = ROTATIONS[piece][rotation]
+        if x < 0 or x > WIDTH - state.width or y + state.height > HEIGHT:
+            return False
+        rows = self.rows
+        for mask in state.masks_at[x]:
+            if y >= 0 and rows[y] & mask:
+                return False
+            y += 1
+        return True
+
+    def column_tops(self):
+        """Row of the highest filled cell in each column (HEIGHT when empty)."""
+        return column_tops(self.rows)
+
+    def drop_y(self, piece, rotation, x, y=0):
+        """Lowest y the piece reaches falling straight down from y (which must fit)."""
+        while self.fits(piece, rotation, x, y + 1):
+            y += 1
+        return y
+
+    def lock(self, piece, rotation, x, y, color=None):
+        """Add the piece to the board, clear full lines and score them.
+
+        Returns the number of lines cleared; a piece locked above the top
+        ends the game instead.
+        """
+        state = ROTATIONS[piece][rotation]
+        if y < 0:
+            self.game_over = True
+            return 0
+        rows = self.rows
+        for r, mask in enumerate(state.masks_at[x]):
+            rows[y + r] |= mask
+        if self.colors is not None:
+            for dx, dy in state.cells:
+                self.colors[y + dy][x + dx] = color
+
+        full = 0
+        for r in range(y, y + state.height):
+            if rows[r] == FULL_ROW:
+                full += 1
+        if full:
+            self.clear_lines(full)
+        self.lines += full
+        self.score += LINE_SCORES[full]
+        return full
+
+    def clear_lines(self, count):
+        # Compact the surviving rows downwards, then add empty rows on top
+        keep = [i for i, row in enumerate(self.rows) if row != FULL_ROW]
+        self.rows = [0] * count + [self.rows[i] for i in keep]
+        if self.colors is not None:
+            self.colors = [[None] * WIDTH for _ in range(count)] + [self.colors[i] for i in keep]
+
+    def simulate(self, moves):
+        """Hard-drop a batch of (piece, rotation, x) placements from the spawn row.
+
+        Stops at the first placement that does not fit (ending the game).
+        Returns how many pieces were placed; score and lines accumulate on
+        the board. Call it on a copy() to try out a sequence.
+        """
+        placed = 0
+        for piece, rotation, x in moves:
+            if self.game_over or not self.fits(piece, rotation, x, 0):
+                self.game_over = True
+                break
+            self.lock(piece, rotation, x, self.drop_y(piece, rotation, x))
+            placed += 1
+        return placed
+
+
+# ROW_COLUMNS[mask]: the columns filled in a row mask
+ROW_COLUMNS = [tuple(c for c in range(WIDTH) if mask >> c & 1) for mask in range(1 << WIDTH)]
+
+
+def column_tops(rows):
+    tops = [HEIGHT] * WIDTH
+    covered = 0
+    for r, row in enumerate(rows):
+        top = row & ~covered
+        if top:
+            for c in ROW_COLUMNS[top]:
+                tops[c] = r
+            covered |= row
+            if covered == FULL_ROW:
+                break
+    return tops
+
+
+def landing_y(state, x, tops):
+    """Where a piece in rotation `state` dropped straight down column x comes to rest.
+
+    `tops` is column_tops() of the board: a straight drop stops on the
+    highest cell of each column. Negative when the stack is too high for it.
+    """
+    y = HEIGHT
+    for dx, bottom in enumerate(state.bottoms):
+        stop = tops[x + dx] - bottom
+        if stop < y:
+            y = stop
+    return y
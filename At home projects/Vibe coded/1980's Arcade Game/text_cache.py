@@ -0,0 +1,117 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class FontRegistry:
+    """Shares one pygame Font object per (name, size)."""
+    def __init__(self, name=None):
+        self.name = name
+        self.fonts = {}
+
+    def get(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(self.name, size)
+            self.fonts[size] = font
+        return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (text, size, color).
+
+    Strings containing digits are assembled from cached runs of plain text
+    and single-digit glyphs, so a score going from 1290 to 1300 blits cached
+    glyphs instead of rasterizing the whole label again. The cache is bounded
+    by the pixel memory of the surfaces it holds.
+    """
+    def __init__(self, fonts=None, budget_bytes=8 * 1024 * 1024, antialias=True):
+        self.fonts = fonts or FontRegistry()
+        self.budget_bytes = budget_bytes
+        self.antialias = antialias
+        self.entries = OrderedDict()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.glyph_renders = 0  # calls into font.render
+
+    def render(self, text, size, color):
+        text = str(text)
+        key = (text, size, color)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        segments = split_digits(text)
+        if len(segments) > 1:
+            surface = self.compose(segments, size, color)
+        else:
+            surface = self.rasterize(text, size, color)
+        self.store(key, surface)
+        return surface
+
+    def rasterize(self, text, size, color):
+        self.glyph_renders += 1
+        return self.fonts.get(size).render(text, self.antialias, color)
+
+    def compose(self, segments, size, color):
+        pieces = [self.render(segment, size, color) for segment in segments]
+        width = sum(piece.get_width() for piece in pieces)
+        height = max(piece.get_height() for piece in pieces)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for piece in pieces:
+            # MAX keeps each glyph's own alpha instead of blending it onto the clear surface
+            surface.blit(piece, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += piece.get_width()
+        return surface
+
+    def store(self, key, surface):
+        size = surface_bytes(surface)
+        if size > self.budget_bytes:
+            return
+        self.entries[key] = surface
+        self.used_bytes += size
+        while self.used_bytes > self.budget_bytes:
+            _, old = self.entries.popitem(last=False)
+            self.used_bytes -= surface_bytes(old)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.used_bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes": self.used_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "glyph_renders": self.glyph_renders,
+        }
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def split_digits(text):
+    """Split text into runs of non-digits and single digits: "Lv12" -> ["Lv", "1", "2"]."""
+    segments = []
+    run = ""
+    for ch in text:
+        if ch.isdigit():
+            if run:
+                segments.append(run)
+                run = ""
+            segments.append(ch)
+        else:
+            run += ch
+    if run:
+        segments.append(run)
+    return segments
@@ -0,0 +1,198 @@
+"""Tile-map levels for the platformer.
+
+A level is a text file with one character per TILE x TILE tile:
+
+    #   solid ground
+    o   coin
+    E   enemy (standing on the tile below)
+    P   player start (feet on the tile below)
+    anything else is empty space
+
+The solid tiles go into a flat bytearray, so the tiles around a rect are
+found by index arithmetic rather than by testing every platform. The level
+is split into CHUNK-tile-wide columns: ChunkCache renders a chunk to a
+surface when the camera nears it and drops it once the camera has moved
+on, and Level keeps its spawns per chunk, so a level thousands of tiles
+wide costs the same per frame as a single screen.
+"""
+import os
+import random
+
+import pygame
+
+TILE = 32
+CHUNK = 16  # tiles per chunk column
+LEVEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels")
+
+
+class TileMap:
+    """Static collision grid. Columns outside the map count as walls."""
+    def __init__(self, lines, tile=TILE):
+        self.tile = tile
+        self.rows = len(lines)
+        self.cols = max((len(line) for line in lines), default=0)
+        self.solid = bytearray(self.cols * self.rows)
+        for row, line in enumerate(lines):
+            for col, char in enumerate(line):
+                if char == "#":
+                    self.solid[row * self.cols + col] = 1
+        self.width = self.cols * tile
+        self.height = self.rows * tile
+        self.chunk_width = CHUNK * tile
+        self.chunks = -(-self.cols // CHUNK)
+
+    def is_solid(self, col, row):
+        if col < 0 or col >= self.cols:
+            return True
+        if row < 0 or row >= self.rows:
+            return False
+        return self.solid[row * self.cols + col] == 1
+
+    def chunk_of(self, x):
+        return int(x // self.chunk_width)
+
+    def solid_rects(self, rect):
+        """Rects of the solid tiles overlapping rect (only its neighborhood is looked at)."""
+        tile = self.tile
+        rects = []
+        for row in range(rect.top // tile, (rect.bottom - 1) // tile + 1):
+            for col in range(rect.left // tile, (rect.right - 1) // tile + 1):
+                if self.is_solid(col, row):
+                    rects.append(pygame.Rect(col * tile, row * tile, tile, tile))
+        return rects
+
+    def move(self, rect, dx, dy):
+        """Move rect by (dx, dy) one axis at a time, stopping at solid tiles.
+
+        Returns (hit_x, hit_y): whether the move was blocked on each axis.
+        """
+        hit_x = hit_y = False
+        if dx:
+            rect.x += dx
+            for tile in self.solid_rects(rect):
+                if dx > 0:
+                    rect.right = tile.left
+                else:
+                    rect.left = tile.right
+                hit_x = True
+        if dy:
+            rect.y += dy
+            for tile in self.solid_rects(rect):
+                if dy > 0:
+                    rect.bottom = tile.top
+                else:
+                    rect.top = tile.bottom
+                hit_y = True
+        return hit_x, hit_y
+
+
+class ChunkCache:
+    """Renders the visible chunks of a TileMap to cached surfaces and blits them."""
+    BLANK = (0, 0, 0)  # colorkey for empty tiles
+
+    def __init__(self, tilemap, color, view_width):
+        self.tilemap = tilemap
+        self.color = color
+        self.view_width = view_width
+        self.surfaces = {}
+        self.built = 0
+        self.evicted = 0
+
+    def visible(self, camera_x):
+        """Range of the chunks on screen at camera_x."""
+        first = max(0, self.tilemap.chunk_of(camera_x))
+        last = min(self.tilemap.chunks - 1, self.tilemap.chunk_of(camera_x + self.view_width - 1))
+        return range(first, last + 1)
+
+    def update(self, camera_x):
+        """Build the chunks on screen (and one either side); drop the rest."""
+        visible = self.visible(camera_x)
+        keep = range(max(0, visible.start - 1), min(self.tilemap.chunks, visible.stop + 1))
+        for chunk in [chunk for chunk in self.surfaces if chunk not in keep]:
+            del self.surfaces[chunk]
+            self.evicted += 1
+        for chunk in keep:
+            if chunk not in self.surfaces:
+                self.surfaces[chunk] = self.build(chunk)
+                self.built += 1
+
+    def build(self, chunk):
+        tilemap = self.tilemap
+        tile = tilemap.tile
+        surface = pygame.Surface((tilemap.chunk_width, tilemap.height))
+        surface.fill(self.BLANK)
+        first = chunk * CHUNK
+        for row in range(tilemap.rows):
+            start = row * tilemap.cols
+            for col in range(first, min(first + CHUNK, tilemap.cols)):
+                if tilemap.solid[start + col]:
+                    surface.fill(self.color, ((col - first) * tile, row * tile, tile, tile))
+        # Chunks never change once built, so run-length encode the empty space away
+        surface.set_colorkey(self.BLANK, pygame.RLEACCEL)
+        return surface
+
+    def draw(self, surface, camera_x):
+        self.update(camera_x)
+        width = self.tilemap.chunk_width
+        for chunk in self.visible(camera_x):
+            surface.blit(self.surfaces[chunk], (chunk * width - round(camera_x), 0))
+
+
+class Level:
+    """A parsed level: its TileMap plus spawn points bucketed by chunk.
+
+    `coins` and `enemies` map a chunk index to a list of (x, y) pixel
+    positions (the top-left of a coin's tile, the bottom-left of an
+    enemy's). `start` is where the player's feet go.
+    """
+    def __init__(self, lines, tile=TILE):
+        self.tilemap = TileMap(lines, tile)
+        self.start = (tile, (self.tilemap.rows - 1) * tile)
+        self.coins = {}
+        self.enemies = {}
+        for row, line in enumerate(lines):
+            for col, char in enumerate(line):
+                x, y = col * tile, row * tile
+                chunk = col // CHUNK
+                if char == "o":
+                    self.coins.setdefault(chunk, []).append((x, y))
+                elif char == "E":
+                    self.enemies.setdefault(chunk, []).append((x, y + tile))
+                elif char == "P":
+                    self.start = (x, y + tile)
+
+
+def load_level(name):
+    """Read a level file (a bare name is looked up in levels/)."""
+    path = name if os.path.dirname(name) else os.path.join(LEVEL_DIR, name)
+    with open(path) as f:
+        lines = [line.rstrip("\n") for line in f]
+    return Level(lines)
+
+
+def generate_level(cols, seed=0, rows=24):
+    """Lines of a random level `cols` tiles wide: ground with gaps, floating ledges, coins and enemies."""
+    level_rng = random.Random(seed)
+    grid = [[" "] * cols for _ in range(rows)]
+    ground = rows - 2
+    col = 0
+    while col < cols:
+        run = level_rng.randint(6, 20)
+        for c in range(col, min(cols, col + run)):
+            grid[ground][c] = grid[ground + 1][c] = "#"
+        if col and level_rng.random() < 0.5:
+            grid[ground - 1][min(col + run // 2, cols - 1)] = "E"
+        col += run
+        if col > 8:
+            col += level_rng.randint(2, 4)  # a gap to jump
+    for col in range(4, cols - 6, 9):
+        if level_rng.random() < 0.6:
+            row = level_rng.randint(ground - 4, ground - 3)  # within a jump of the ground
+            width = level_rng.randint(3, 6)
+            for c in range(col, col + width):
+                grid[row][c] = "#"
+            grid[row - 1][col + width // 2] = "o"
+    for c in range(4):
+        grid[ground][c] = grid[ground + 1][c] = "#"
+    grid[ground - 1][1] = "P"
+    return ["".join(row).rstrip() for row in grid]
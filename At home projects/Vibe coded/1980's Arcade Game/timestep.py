@@ -0,0 +1,51 @@
+class FixedTimestep:
+    """Fixed-step simulation clock driven by variable frame times.
+
+    Each rendered frame adds its real duration to an accumulator, and the
+    simulation is stepped in whole `dt` increments until the accumulator is
+    drained, so game logic runs at `rate` Hz whatever the display does. The
+    remainder is exposed as `alpha` (0..1) so drawing can interpolate between
+    the last two simulation states.
+    """
+    MAX_FRAME = 0.25  # a longer stall (window drag, breakpoint) is not caught up
+    EPSILON = 1e-9  # so 60 frames of 1/60 s make exactly 60 steps despite rounding
+
+    def __init__(self, rate=60, max_steps=8):
+        self.max_steps = max_steps
+        self.time = 0.0  # simulated seconds
+        self.steps = 0
+        self.dropped = 0
+        self.accumulator = 0.0
+        self.set_rate(rate)
+
+    def set_rate(self, rate):
+        if rate != getattr(self, "rate", None):
+            self.rate = rate
+            self.dt = 1.0 / rate
+            self.accumulator = min(self.accumulator, self.dt)
+
+    @property
+    def ticks(self):
+        """Simulated time in milliseconds (replaces pygame.time.get_ticks in game logic)."""
+        return int(round(self.time * 1000))
+
+    @property
+    def alpha(self):
+        return min(1.0, max(0.0, self.accumulator / self.dt))
+
+    def advance(self, frame_time, step):
+        """Add frame_time seconds and call step() once per due simulation step."""
+        self.accumulator += min(frame_time, self.MAX_FRAME)
+        steps = 0
+        while self.accumulator >= self.dt - self.EPSILON:
+            if steps == self.max_steps:
+                # Too far behind to catch up: drop the backlog instead of spiralling
+                self.dropped += int(self.accumulator / self.dt)
+                self.accumulator %= self.dt
+                break
+            self.accumulator -= self.dt
+            self.time += self.dt
+            self.steps += 1
+            steps += 1
+            step()
+        return steps